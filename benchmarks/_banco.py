@@ -0,0 +1,39 @@
+import sqlite3
+from pathlib import Path
+
+from src.models.sqlite.settings.connection import DBConnectionHandler
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "init" / "schema.sql"
+
+
+def criar_banco(caminho: Path, pragma_profile: str = "padrao") -> DBConnectionHandler:
+    """Cria um banco a partir de init/schema.sql e retorna um handler conectado."""
+    with sqlite3.connect(caminho) as conn:
+        conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+
+    handler = DBConnectionHandler(f"sqlite:///{caminho}", pragma_profile=pragma_profile)
+    handler.connect_to_db()
+    return handler
+
+
+def popular_pessoas_fisicas(caminho: Path, quantidade: int) -> None:
+    linhas = (
+        (
+            500000,
+            30,
+            f"Cliente {i}",
+            f"bench-{i}",
+            f"cliente{i}@bench.com",
+            "Bench",
+            100000,
+        )
+        for i in range(quantidade)
+    )
+    with sqlite3.connect(caminho) as conn:
+        conn.executemany(
+            "INSERT INTO pessoa_fisica "
+            "(renda_mensal_centavos, idade, nome_completo, celular, email, "
+            "categoria, saldo_centavos) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            linhas,
+        )
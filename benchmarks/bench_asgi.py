@@ -0,0 +1,141 @@
+"""
+Benchmark do app ASGI contra o servidor Flask com threads, sob concorrência.
+
+Cada servidor roda em um processo próprio sobre o mesmo banco temporário
+(DATABASE_URL) e recebe REQUISICOES GETs de listagem, com CONCORRENCIA
+conexões abertas ao mesmo tempo:
+
+    flask  - app.run(threaded=True), como o run.py: uma thread por conexão
+    asgi   - uvicorn com o AsgiApp (run_asgi.py): um event loop
+
+O cliente é um asyncio simples (uma conexão por requisição). Mostra
+requisições/s, latência p50/p99 e o pico de threads do processo servidor.
+
+    python -m benchmarks.bench_asgi
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ._banco import criar_banco, popular_pessoas_fisicas
+
+PESSOAS = 10_000
+REQUISICOES = 3_000
+CONCORRENCIA = 1_000
+CAMINHO = "/fisica?limit=20"
+
+SERVIDORES = {
+    "flask": [
+        sys.executable,
+        "-c",
+        "from src.main.server.server import app; "
+        "app.run(port={porta}, threaded=True)",
+    ],
+    "asgi": [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "src.main.server.asgi_server:app",
+        "--port",
+        "{porta}",
+        "--log-level",
+        "warning",
+    ],
+}
+
+
+async def _requisitar(porta: int) -> float:
+    inicio = time.perf_counter()
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+    escritor.write(
+        f"GET {CAMINHO} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode()
+    )
+    await escritor.drain()
+    resposta = await leitor.read()
+    escritor.close()
+    await escritor.wait_closed()
+    if not resposta.startswith(b"HTTP/1.1 200"):
+        raise RuntimeError(resposta[:200])
+    return time.perf_counter() - inicio
+
+
+async def _carga(porta: int):
+    semaforo = asyncio.Semaphore(CONCORRENCIA)
+
+    async def _uma():
+        async with semaforo:
+            return await _requisitar(porta)
+
+    inicio = time.perf_counter()
+    latencias = await asyncio.gather(*(_uma() for _ in range(REQUISICOES)))
+    return time.perf_counter() - inicio, sorted(latencias)
+
+
+def _threads(pid: int) -> int:
+    with open(f"/proc/{pid}/status", encoding="utf-8") as status:
+        for linha in status:
+            if linha.startswith("Threads:"):
+                return int(linha.split()[1])
+    return 0
+
+
+async def _medir(processo, porta: int):
+    pico = _threads(processo.pid)
+    carga = asyncio.ensure_future(_carga(porta))
+    while not carga.done():
+        pico = max(pico, _threads(processo.pid))
+        await asyncio.sleep(0.01)
+    tempo, latencias = carga.result()
+    return tempo, latencias, pico
+
+
+def _aguardar(porta: int) -> None:
+    for _ in range(100):
+        try:
+            asyncio.run(_requisitar(porta))
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Servidor na porta {porta} não respondeu")
+
+
+def main():
+    print(f"{REQUISICOES} GET {CAMINHO}, {CONCORRENCIA} conexões simultâneas")
+    print(f"{'servidor':<10}{'req/s':>8}{'p50 ms':>9}{'p99 ms':>9}{'threads':>9}")
+    raiz = Path(__file__).resolve().parent.parent
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = Path(diretorio) / "asgi.db"
+        criar_banco(caminho).get_engine().dispose()
+        popular_pessoas_fisicas(caminho, PESSOAS)
+        ambiente = dict(os.environ, DATABASE_URL=f"sqlite:///{caminho}")
+
+        for porta, (nome, comando) in enumerate(SERVIDORES.items(), start=3101):
+            processo = subprocess.Popen(  # pylint: disable=consider-using-with
+                [parte.format(porta=porta) for parte in comando],
+                cwd=raiz,
+                env=ambiente,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                _aguardar(porta)
+                tempo, latencias, threads = asyncio.run(_medir(processo, porta))
+            finally:
+                processo.terminate()
+                processo.wait()
+
+            p50 = latencias[len(latencias) // 2] * 1e3
+            p99 = latencias[int(len(latencias) * 0.99)] * 1e3
+            print(
+                f"{nome:<10}{REQUISICOES / tempo:>8.0f}{p50:>9.1f}{p99:>9.1f}"
+                f"{threads:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
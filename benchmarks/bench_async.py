@@ -0,0 +1,113 @@
+"""
+Benchmark de 1.000 consultas concorrentes de saldo e cadastro.
+
+Compara o repositório asyncio (um event loop, asyncio.gather sobre o
+PessoaFisicaAsyncRepository) com o síncrono atendido por um pool de
+threads, como faria um servidor WSGI com N threads:
+
+    async        - CONCORRENCIA corrotinas em 1 thread
+    threads N    - ThreadPoolExecutor(N) com o PessoaFisicaRepository
+
+Cada rodada dispara CONCORRENCIA requisições, metade obter_saldo e metade
+buscar_por_id, sobre um banco com PESSOAS pessoas físicas.
+
+    python -m benchmarks.bench_async
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.models.sqlite.repositories.pessoa_fisica_async_repository import (
+    PessoaFisicaAsyncRepository,
+)
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.settings.async_connection import AsyncDBConnectionHandler
+
+from ._banco import criar_banco, popular_pessoas_fisicas
+
+PESSOAS = 10_000
+CONCORRENCIA = 1_000
+RODADAS = 3
+THREADS = (8, 32, 128)
+
+
+def _ids():
+    passo = PESSOAS // (CONCORRENCIA // 2)
+    return list(range(1, PESSOAS, passo))[: CONCORRENCIA // 2]
+
+
+async def _rodada_async(repository, ids) -> float:
+    inicio = time.perf_counter()
+    await asyncio.gather(
+        *(repository.obter_saldo(pessoa_id) for pessoa_id in ids),
+        *(repository.buscar_por_id(pessoa_id) for pessoa_id in ids),
+    )
+    return time.perf_counter() - inicio
+
+
+async def medir_async(caminho: Path, ids):
+    """Tempo da melhor rodada e threads vivas com o pool aberto.
+
+    O aiosqlite roda cada conexão em uma thread própria, então as threads
+    do modo async são a do event loop mais uma por conexão do pool.
+    """
+    handler = AsyncDBConnectionHandler(f"sqlite:///{caminho}")
+    await handler.connect_to_db()
+    repository = PessoaFisicaAsyncRepository(handler)
+    try:
+        tempos = [await _rodada_async(repository, ids) for _ in range(RODADAS)]
+        threads = threading.active_count()
+    finally:
+        await handler.dispose()
+    return min(tempos), threads
+
+
+def medir_threads(handler, ids, threads: int) -> float:
+    repository = PessoaFisicaRepository(handler)
+    tempos = []
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for _ in range(RODADAS):
+            inicio = time.perf_counter()
+            futuros = [executor.submit(repository.obter_saldo, i) for i in ids]
+            futuros += [executor.submit(repository.buscar_por_id, i) for i in ids]
+            for futuro in futuros:
+                futuro.result()
+            tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def main():
+    ids = _ids()
+    print(
+        f"{CONCORRENCIA} requisições concorrentes, {PESSOAS} pessoas, melhor de {RODADAS}"
+    )
+    print(f"{'modo':<14}{'threads':>9}{'req/s':>10}{'ms/rodada':>12}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = Path(diretorio) / "async.db"
+        handler = criar_banco(caminho)
+        popular_pessoas_fisicas(caminho, PESSOAS)
+
+        linhas = []
+        tempo, threads = asyncio.run(medir_async(caminho, ids))
+        linhas.append(("async", threads, tempo))
+        for threads in THREADS:
+            linhas.append(
+                (f"threads {threads}", threads, medir_threads(handler, ids, threads))
+            )
+
+        for nome, threads, tempo in linhas:
+            print(
+                f"{nome:<14}{threads:>9}{CONCORRENCIA / tempo:>10.0f}{tempo * 1e3:>12.1f}"
+            )
+
+        handler.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark de escrita: custo do trigger que reescrevia atualizado_em.
+
+Compara dois bancos criados a partir de init/schema.sql, um deles com o
+antigo trigger AFTER UPDATE recriado (TRIGGER_ANTIGO):
+
+    depositos  - depositar_dinheiro, um commit por operação
+    lote orm   - UPDATEs de saldo em CONTAS linhas numa única transação,
+                 pelo mesmo caminho do ORM (onupdate preenche atualizado_em)
+    lote sql   - o mesmo lote com executemany direto no sqlite3, para
+                 isolar o custo de escrita do SQLite do overhead do ORM
+
+`linhas gravadas` é o total_changes() do SQLite no lote sql: com o trigger,
+cada UPDATE grava a linha duas vezes.
+
+    python -m benchmarks.bench_atualizado_em
+"""
+
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import update
+
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+from ._banco import criar_banco, popular_pessoas_fisicas
+
+CONTAS = 50_000
+DEPOSITOS = 3_000
+VALOR = Decimal("1.00")
+TRIGGER_ANTIGO = """
+CREATE TRIGGER atualizar_pessoa_fisica_timestamp
+AFTER UPDATE ON pessoa_fisica
+FOR EACH ROW
+BEGIN
+    UPDATE pessoa_fisica SET atualizado_em = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+"""
+
+
+def preparar(caminho: Path, com_trigger: bool):
+    handler = criar_banco(caminho, "throughput")
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("DELETE FROM pessoa_fisica")
+        if com_trigger:
+            conn.executescript(TRIGGER_ANTIGO)
+    popular_pessoas_fisicas(caminho, CONTAS)
+    return handler
+
+
+def ids_das_contas(caminho: Path) -> list:
+    with sqlite3.connect(caminho) as conn:
+        return [linha[0] for linha in conn.execute("SELECT id FROM pessoa_fisica")]
+
+
+def medir_depositos(handler, ids: list) -> float:
+    repository = PessoaFisicaRepository(handler)
+    sorteio = random.Random(7)
+    inicio = time.perf_counter()
+    for _ in range(DEPOSITOS):
+        repository.depositar_dinheiro(sorteio.choice(ids), VALOR)
+    return DEPOSITOS / (time.perf_counter() - inicio)
+
+
+def medir_lote_orm(handler, ids: list) -> float:
+    with handler as database:
+        session = database.session
+        inicio = time.perf_counter()
+        for pessoa_id in ids:
+            session.execute(
+                update(PessoaFisicaTable)
+                .where(PessoaFisicaTable.id == pessoa_id)
+                .values(saldo=PessoaFisicaTable.saldo + VALOR)
+                .execution_options(synchronize_session=False)
+            )
+        session.commit()
+    return CONTAS / (time.perf_counter() - inicio)
+
+
+def medir_lote_sql(caminho: Path, ids: list) -> tuple:
+    agora = datetime.utcnow().isoformat(" ")
+    with sqlite3.connect(caminho) as conn:
+        inicio = time.perf_counter()
+        conn.executemany(
+            "UPDATE pessoa_fisica SET saldo_centavos = saldo_centavos + 100, "
+            "atualizado_em = ? WHERE id = ?",
+            ((agora, pessoa_id) for pessoa_id in ids),
+        )
+        conn.commit()
+        duracao = time.perf_counter() - inicio
+        gravadas = conn.total_changes
+    return CONTAS / duracao, gravadas
+
+
+def main():
+    print(f"{CONTAS} contas, {DEPOSITOS} depósitos, perfil throughput")
+    print(
+        f"{'schema':<14}{'depósitos/s':>13}{'lote orm/s':>12}"
+        f"{'lote sql/s':>12}{'linhas gravadas':>17}"
+    )
+    with tempfile.TemporaryDirectory() as diretorio:
+        for nome, com_trigger in (("com trigger", True), ("sem trigger", False)):
+            caminho = Path(diretorio) / f"{nome}.db"
+            handler = preparar(caminho, com_trigger)
+            ids = ids_das_contas(caminho)
+            depositos = medir_depositos(handler, ids)
+            lote_orm = medir_lote_orm(handler, ids)
+            handler.get_engine().dispose()
+            lote_sql, gravadas = medir_lote_sql(caminho, ids)
+            print(
+                f"{nome:<14}{depositos:>13.0f}{lote_orm:>12.0f}"
+                f"{lote_sql:>12.0f}{gravadas:>17}"
+            )
+
+
+if __name__ == "__main__":
+    main()
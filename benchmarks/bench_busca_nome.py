@@ -0,0 +1,120 @@
+"""
+Benchmark da busca por nome em pessoa_fisica: LIKE '%termo%' vs FTS5.
+
+Popula QUANTIDADE_PESSOAS pessoas com nomes sorteados (os triggers de
+init/schema.sql alimentam o índice FTS5 durante a carga) e mede, para cada
+termo, o tempo da primeira página de resultados:
+
+    like  - WHERE nome_completo LIKE '%termo%' ORDER BY id: varre a tabela,
+            o índice de nome_completo não serve para curinga à esquerda
+    fts5  - buscar_por_nome: MATCH no índice FTS5, ordenado por relevância
+
+    python -m benchmarks.bench_busca_nome
+"""
+
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from src.controllers.fisica_listar_controller import COLUNAS_LISTAGEM
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+from ._banco import criar_banco
+
+QUANTIDADE_PESSOAS = 1_000_000
+LIMITE = 50
+REPETICOES = 5
+PRENOMES = (
+    "Ana Bruno Carla Daniel Eduarda Felipe Gabriela Heitor Isabela João Larissa "
+    "Marcos Natália Otávio Paula Rafael Sabrina Thiago Vitória Wagner"
+).split()
+SOBRENOMES = (
+    "Silva Santos Oliveira Souza Rodrigues Ferreira Alves Pereira Lima Gomes "
+    "Costa Ribeiro Martins Carvalho Almeida Lopes Soares Fernandes Vieira Barbosa"
+).split()
+TERMOS = {
+    "comum": "silva",
+    "dois prefixos": "gab carv",
+    "raro": "Zuleica",
+    "inexistente": "Xavantes",
+}
+
+
+def popular(caminho: Path) -> float:
+    sorteio = random.Random(42)
+
+    def nome(i):
+        if i == QUANTIDADE_PESSOAS // 2:
+            return "Zuleica Ramalho"
+        return (
+            f"{sorteio.choice(PRENOMES)} {sorteio.choice(SOBRENOMES)} "
+            f"{sorteio.choice(SOBRENOMES)}"
+        )
+
+    linhas = (
+        (500000, 30, nome(i), f"bench-{i}", f"cliente{i}@bench.com", "Bench", 100000)
+        for i in range(QUANTIDADE_PESSOAS)
+    )
+    inicio = time.perf_counter()
+    with sqlite3.connect(caminho) as conn:
+        conn.executemany(
+            "INSERT INTO pessoa_fisica "
+            "(renda_mensal_centavos, idade, nome_completo, celular, email, "
+            "categoria, saldo_centavos) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            linhas,
+        )
+    return time.perf_counter() - inicio
+
+
+def via_like(conn: sqlite3.Connection, termo: str) -> int:
+    colunas = ", ".join(
+        f"{coluna}_centavos" if coluna in ("renda_mensal", "saldo") else coluna
+        for coluna in COLUNAS_LISTAGEM
+    )
+    return len(
+        conn.execute(
+            f"SELECT {colunas} FROM pessoa_fisica "
+            "WHERE nome_completo LIKE ? ORDER BY id LIMIT ?",
+            (f"%{termo}%", LIMITE),
+        ).fetchall()
+    )
+
+
+def via_fts(repository: PessoaFisicaRepository, termo: str) -> int:
+    return len(repository.buscar_por_nome(termo, COLUNAS_LISTAGEM, LIMITE))
+
+
+def medir(funcao, alvo, termo: str) -> tuple:
+    melhor = float("inf")
+    for _ in range(REPETICOES):
+        inicio = time.perf_counter()
+        linhas = funcao(alvo, termo)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000, linhas
+
+
+def main():
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = Path(diretorio) / "busca.db"
+        handler = criar_banco(caminho, "throughput")
+        carga = popular(caminho)
+        repository = PessoaFisicaRepository(handler)
+
+        print(f"{QUANTIDADE_PESSOAS} pessoas, carga com FTS5: {carga:.1f}s")
+        print(f"primeira página ({LIMITE} linhas), melhor de {REPETICOES}")
+        print(f"{'termo':<16}{'like (ms)':>12}{'fts5 (ms)':>12}{'linhas':>8}")
+        with sqlite3.connect(caminho) as conn:
+            for rotulo, termo in TERMOS.items():
+                tempo_like, _ = medir(via_like, conn, termo)
+                tempo_fts, linhas = medir(via_fts, repository, termo)
+                print(f"{rotulo:<16}{tempo_like:>12.2f}{tempo_fts:>12.2f}{linhas:>8}")
+        handler.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Microbenchmark do custo por requisição de montar as views.
+
+Compara o AppContainer (views montadas uma vez no registro dos blueprints)
+com o comportamento anterior, em que cada requisição chamava o composer e
+criava repositório, controller e view de novo (PorRequisicao):
+
+    composer  - só a obtenção da view, fora do Flask
+    GET       - GET /fisica?limit=1 pelo test client, banco com seeds
+
+    python -m benchmarks.bench_container
+"""
+
+import importlib
+import tempfile
+import time
+from pathlib import Path
+
+from flask import Flask
+
+from src.main.composer import container as container_module
+from src.main.routes.pessoa_fisica_routes import pessoa_fisica_route_bp
+from src.main.routes.pessoa_juridica_routes import pessoa_juridica_route_bp
+
+from ._banco import criar_banco
+
+OBTENCOES = 200_000
+REQUISICOES = 3_000
+RODADAS = 3
+
+
+class PorRequisicao:
+    """Mesma interface do AppContainer, montando a view a cada acesso."""
+
+    def __getattr__(self, nome):
+        return getattr(container_module, f"{nome}_composer")()
+
+
+def medir_obtencao(fonte) -> float:
+    inicio = time.perf_counter()
+    for _ in range(OBTENCOES):
+        _ = fonte.fisica_listar
+    return (time.perf_counter() - inicio) / OBTENCOES * 1e6
+
+
+def medir_requisicoes(app: Flask) -> float:
+    """Melhor de RODADAS, para descontar o aquecimento da primeira rodada."""
+    cliente = app.test_client()
+    tempos = []
+    for _ in range(RODADAS):
+        inicio = time.perf_counter()
+        for _ in range(REQUISICOES):
+            cliente.get("/fisica?limit=1")
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos) / REQUISICOES * 1e6
+
+
+def apontar_composers(handler) -> None:
+    """Os composers leem o handler global do módulo; aponta para o temporário."""
+    for nome in dir(container_module):
+        if nome.endswith("_composer"):
+            modulo = importlib.import_module(getattr(container_module, nome).__module__)
+            modulo.db_connection_handler = handler
+
+
+def main():
+    print(f"{OBTENCOES} obtenções da view, {RODADAS}x{REQUISICOES} requisições")
+    print(f"{'views':<16}{'composer µs':>13}{'GET µs':>10}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        handler = criar_banco(Path(diretorio) / "container.db")
+        apontar_composers(handler)
+
+        app = Flask(__name__)
+        app.register_blueprint(pessoa_fisica_route_bp)
+        app.register_blueprint(pessoa_juridica_route_bp)
+        montado = app.extensions[container_module.EXTENSAO]
+
+        for nome, fonte in (
+            ("container", montado),
+            ("por requisição", PorRequisicao()),
+        ):
+            app.extensions[container_module.EXTENSAO] = fonte
+            obtencao = medir_obtencao(fonte)
+            requisicao = medir_requisicoes(app)
+            print(f"{nome:<16}{obtencao:>13.2f}{requisicao:>10.1f}")
+
+        handler.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark de CPU do caminho de criação de uma pessoa física, sem banco.
+
+    schema  - como nas rotas: fisica_criar_validator (bytes) e o schema
+              validado direto para PessoaFisicaCriarController.criar
+    dict    - o controller recebe model_dump() e valida de novo, como a
+              chamada direta; equivale às duas passagens de antes
+
+O repositório é um stub em memória, para medir só validação e formatação.
+O tempo é de CPU do processo (time.process_time), por criação.
+
+    python -m benchmarks.bench_criar
+"""
+
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.controllers.fisica_criar_controller import PessoaFisicaCriarController
+from src.validators.fisica_criar_validator import fisica_criar_validator
+from src.views.http_types.http_request import HttpRequest
+
+CRIACOES = 30_000
+CORPO = json.dumps(
+    {
+        "nome_completo": "Cliente Número 1",
+        "email": "cliente1@bench.com",
+        "celular": "(11) 98765-4321",
+        "idade": 30,
+        "renda_mensal": "5000.25",
+        "categoria": "Bench",
+        "saldo": "1500.50",
+    }
+).encode()
+
+
+class RepositorioEmMemoria:
+    def __init__(self) -> None:
+        self.ultimo_id = 0
+
+    def criar_pessoa(self, pessoa_data: dict):
+        self.ultimo_id += 1
+        agora = datetime.utcnow()
+        return SimpleNamespace(
+            id=self.ultimo_id, criado_em=agora, atualizado_em=agora, **pessoa_data
+        )
+
+
+def medir(controller, revalidar: bool) -> float:
+    inicio = time.process_time()
+    for _ in range(CRIACOES):
+        pessoa = fisica_criar_validator(HttpRequest(raw_body=CORPO))
+        controller.criar(pessoa.model_dump() if revalidar else pessoa)
+    return (time.process_time() - inicio) / CRIACOES * 1e6
+
+
+def main():
+    controller = PessoaFisicaCriarController(RepositorioEmMemoria())
+    print(f"{CRIACOES} criações, repositório em memória")
+    print(f"{'controller recebe':<20}{'CPU µs/criação':>16}")
+    for nome, revalidar in (("schema", False), ("dict (revalida)", True)):
+        print(f"{nome:<20}{medir(controller, revalidar):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark de cadastro: criar_pessoa por linha vs criar_pessoas_em_lote.
+
+Cada criar_pessoa faz seu próprio commit (um fsync por linha no perfil
+"durable"); o lote faz um commit só, com INSERTs de vários registros.
+
+    python -m benchmarks.bench_criar_lote
+"""
+
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+from ._banco import criar_banco
+
+QUANTIDADE = 2_000
+PERFIL = "durable"
+
+
+def pessoas(prefixo: str) -> list:
+    return [
+        {
+            "nome_completo": f"Cliente {i}",
+            "email": f"{prefixo}{i}@bench.com",
+            "celular": f"{prefixo}-{i}",
+            "idade": 30,
+            "renda_mensal": Decimal("5000.00"),
+            "categoria": "Bench",
+            "saldo": Decimal("0.00"),
+        }
+        for i in range(QUANTIDADE)
+    ]
+
+
+def por_linha(repository: PessoaFisicaRepository) -> None:
+    for pessoa in pessoas("linha"):
+        repository.criar_pessoa(pessoa)
+
+
+def em_lote(repository: PessoaFisicaRepository) -> None:
+    repository.criar_pessoas_em_lote(pessoas("lote"))
+
+
+def main():
+    print(f"{QUANTIDADE} cadastros, perfil {PERFIL}")
+    print(f"{'caminho':<10}{'tempo (s)':>12}{'linhas/s':>12}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        for nome, funcao in (("por_linha", por_linha), ("lote", em_lote)):
+            handler = criar_banco(Path(diretorio) / f"{nome}.db", PERFIL)
+            repository = PessoaFisicaRepository(handler)
+            inicio = time.perf_counter()
+            funcao(repository)
+            duracao = time.perf_counter() - inicio
+            print(f"{nome:<10}{duracao:>12.2f}{QUANTIDADE / duracao:>12.0f}")
+            handler.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main()
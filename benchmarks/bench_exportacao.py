@@ -0,0 +1,71 @@
+"""
+Benchmark de memória da exportação de pessoas físicas.
+
+Compara o pico de memória (tracemalloc) de serializar a tabela inteira a
+partir de listar_todas com o de percorrê-la via iterar_todas (yield_per),
+para tamanhos crescentes de tabela. O pico de iterar_todas deve ficar
+estável; o de listar_todas cresce com o número de linhas.
+
+    python -m benchmarks.bench_exportacao
+"""
+
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.controllers.fisica_exportar_controller import PessoaFisicaExportarController
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+from ._banco import criar_banco, popular_pessoas_fisicas
+
+TAMANHOS = (10_000, 50_000, 200_000)
+
+
+def listar_tudo(repository: PessoaFisicaRepository) -> int:
+    pessoas = repository.listar_todas()
+    corpo = json.dumps(
+        [{"id": p.id, "nome": p.nome_completo, "saldo": str(p.saldo)} for p in pessoas]
+    )
+    return len(corpo)
+
+
+def exportar_streaming(repository: PessoaFisicaRepository) -> int:
+    total = 0
+    for registro in PessoaFisicaExportarController(repository).exportar():
+        total += len(json.dumps(registro, default=str)) + 1
+    return total
+
+
+def medir(funcao, repository) -> tuple:
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    funcao(repository)
+    duracao = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duracao, pico / 1024 / 1024
+
+
+def main():
+    print(f"{'linhas':>8}{'modo':>12}{'tempo (s)':>12}{'pico (MB)':>12}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        for tamanho in TAMANHOS:
+            caminho = Path(diretorio) / f"{tamanho}.db"
+            handler = criar_banco(caminho)
+            popular_pessoas_fisicas(caminho, tamanho)
+            repository = PessoaFisicaRepository(handler)
+            for nome, funcao in (
+                ("listar", listar_tudo),
+                ("streaming", exportar_streaming),
+            ):
+                duracao, pico = medir(funcao, repository)
+                print(f"{tamanho:>8}{nome:>12}{duracao:>12.2f}{pico:>12.1f}")
+            handler.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark de escrita: custo dos índices duplicados de email e celular.
+
+Compara dois bancos criados a partir de init/schema.sql, um deles com os
+índices removidos pela migração 006 recriados (INDICES_ANTIGOS):
+
+    lote    - CONTAS inserts com executemany numa única transação
+    criar   - criar_pessoa, um commit por conta
+
+`tamanho` é o arquivo do banco depois do lote, já com o checkpoint do WAL.
+
+    python -m benchmarks.bench_indices_redundantes
+"""
+
+import sqlite3
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+from ._banco import criar_banco, popular_pessoas_fisicas
+
+CONTAS = 200_000
+CRIACOES = 3_000
+INDICES_ANTIGOS = """
+CREATE INDEX idx_pessoa_fisica_email ON pessoa_fisica(email);
+CREATE INDEX idx_pessoa_fisica_celular ON pessoa_fisica(celular);
+"""
+
+
+def preparar(caminho: Path, com_indices: bool):
+    handler = criar_banco(caminho, "throughput")
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("DELETE FROM pessoa_fisica")
+        if com_indices:
+            conn.executescript(INDICES_ANTIGOS)
+    return handler
+
+
+def medir_lote(caminho: Path) -> float:
+    inicio = time.perf_counter()
+    popular_pessoas_fisicas(caminho, CONTAS)
+    return CONTAS / (time.perf_counter() - inicio)
+
+
+def medir_criacoes(handler) -> float:
+    repository = PessoaFisicaRepository(handler)
+    inicio = time.perf_counter()
+    for i in range(CRIACOES):
+        repository.criar_pessoa(
+            {
+                "renda_mensal": Decimal("5000.00"),
+                "idade": 30,
+                "nome_completo": f"Novo Cliente {i}",
+                "celular": f"novo-{i}",
+                "email": f"novo{i}@bench.com",
+                "categoria": "Bench",
+                "saldo": Decimal("0"),
+            }
+        )
+    return CRIACOES / (time.perf_counter() - inicio)
+
+
+def tamanho_mb(caminho: Path) -> float:
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return caminho.stat().st_size / 1024 / 1024
+
+
+def main():
+    print(f"{CONTAS} contas em lote, {CRIACOES} criações, perfil throughput")
+    print(f"{'schema':<16}{'lote/s':>10}{'tamanho MB':>12}{'criar/s':>10}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        for nome, com_indices in (("com duplicados", True), ("sem duplicados", False)):
+            caminho = Path(diretorio) / f"{nome}.db"
+            handler = preparar(caminho, com_indices)
+            lote = medir_lote(caminho)
+            tamanho = tamanho_mb(caminho)
+            criacoes = medir_criacoes(handler)
+            handler.get_engine().dispose()
+            print(f"{nome:<16}{lote:>10.0f}{tamanho:>12.1f}{criacoes:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
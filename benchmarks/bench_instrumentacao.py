@@ -0,0 +1,111 @@
+"""
+Custo da instrumentação de SQL por requisição (Server-Timing).
+
+Dois modos, alternados rodada a rodada:
+
+    sem - listeners do engine removidos e sem os hooks do Flask
+    com - como no server.py: listeners do DBConnectionHandler e
+          registrar_server_timing(app)
+
+    comando - SELECT 1 repetido em uma conexão, dentro de uma medição
+    GET     - requisições pelo test client do Flask, banco com seeds
+
+    python -m benchmarks.bench_instrumentacao
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from flask import Flask
+from sqlalchemy import event, text
+
+from src.main.routes.pessoa_fisica_routes import pessoa_fisica_route_bp
+from src.main.routes.pessoa_juridica_routes import pessoa_juridica_route_bp
+from src.main.server.json_provider import criar_json_provider
+from src.main.server.server_timing import registrar_server_timing
+from src.models.sqlite.settings import instrumentacao
+
+from ._banco import criar_banco
+from .bench_container import apontar_composers
+
+REQUISICOES = 3_000
+COMANDOS = 100_000
+RODADAS = 5
+CAMINHOS = ("/fisica?limit=1", "/fisica/relatorio")
+
+
+def criar_app(com_instrumentacao: bool) -> Flask:
+    app = Flask(__name__)
+    app.json = criar_json_provider(app)
+    if com_instrumentacao:
+        registrar_server_timing(app)
+    app.register_blueprint(pessoa_fisica_route_bp)
+    app.register_blueprint(pessoa_juridica_route_bp)
+    return app
+
+
+def medir(cliente, caminho: str) -> float:
+    """µs por requisição em uma rodada."""
+    inicio = time.perf_counter()
+    for _ in range(REQUISICOES):
+        cliente.get(caminho)
+    return (time.perf_counter() - inicio) / REQUISICOES * 1e6
+
+
+def medir_comando(engine) -> float:
+    """µs por comando em uma rodada."""
+    token = instrumentacao.iniciar_medicao()
+    with engine.connect() as conn:
+        consulta = text("SELECT 1")
+        inicio = time.perf_counter()
+        for _ in range(COMANDOS):
+            conn.execute(consulta)
+        tempo = time.perf_counter() - inicio
+    instrumentacao.encerrar_medicao(token)
+    return tempo / COMANDOS * 1e6
+
+
+def remover_listeners(engine) -> None:
+    # pylint: disable=protected-access
+    for nome, funcao in (
+        ("before_cursor_execute", instrumentacao._antes_de_executar),
+        ("after_cursor_execute", instrumentacao._depois_de_executar),
+    ):
+        event.remove(engine, nome, funcao)
+
+
+def main():
+    print(f"{RODADAS} rodadas, µs por comando/requisição (melhor rodada)")
+    print(f"{'medida':<24}{'sem':>8}{'com':>8}{'custo':>8}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        handler = criar_banco(Path(diretorio) / "instrumentacao.db")
+        apontar_composers(handler)
+        engine = handler.get_engine()
+
+        clientes = {com: criar_app(com).test_client() for com in (False, True)}
+
+        # Rodadas alternadas entre os modos; fica a melhor de cada um
+        resultados = {}
+        for _ in range(RODADAS):
+            for com, cliente in clientes.items():
+                if com:
+                    instrumentacao.instalar_instrumentacao(engine)
+                else:
+                    remover_listeners(engine)
+                medidas = {"SELECT 1 (comando)": medir_comando(engine)}
+                for caminho in CAMINHOS:
+                    medidas[f"GET {caminho}"] = medir(cliente, caminho)
+                for nome, tempo in medidas.items():
+                    chave = (nome, com)
+                    resultados[chave] = min(resultados.get(chave, tempo), tempo)
+
+        for caminho in ["SELECT 1 (comando)"] + [f"GET {c}" for c in CAMINHOS]:
+            sem, com = resultados[(caminho, False)], resultados[(caminho, True)]
+            print(f"{caminho:<24}{sem:>8.2f}{com:>8.2f}{com - sem:>8.2f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
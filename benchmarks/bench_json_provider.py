@@ -0,0 +1,67 @@
+"""
+Benchmark de serialização das respostas: DefaultJSONProvider x OrjsonProvider.
+
+Monta o corpo de uma listagem com LINHAS pessoas físicas, no formato de
+PessoaFisicaListarController (renda_mensal e saldo como Decimal), e mede
+app.json.response(), o que o jsonify das rotas chama. O tempo é de CPU do
+processo (time.process_time), por resposta.
+
+    python -m benchmarks.bench_json_provider
+"""
+
+import time
+from decimal import Decimal
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.main.server.json_provider import OrjsonProvider
+
+LINHAS = 10_000
+REPETICOES = 30
+
+
+def corpo_listagem() -> dict:
+    return {
+        "data": {
+            "type": "Pessoa Física",
+            "count": LINHAS,
+            "attributes": [
+                {
+                    "nome_completo": f"Cliente Número {i}",
+                    "email": f"cliente{i}@bench.com",
+                    "celular": f"9{i:08d}",
+                    "idade": 18 + i % 60,
+                    "renda_mensal": Decimal(f"{5000 + i}.25"),
+                    "categoria": "Categoria A",
+                    "saldo": Decimal(f"{i}.50"),
+                }
+                for i in range(LINHAS)
+            ],
+            "next_cursor": LINHAS,
+        }
+    }
+
+
+def medir(app: Flask, corpo: dict) -> tuple:
+    with app.app_context():
+        tamanho = len(app.json.response(corpo).data)
+        inicio = time.process_time()
+        for _ in range(REPETICOES):
+            app.json.response(corpo)
+        return (time.process_time() - inicio) / REPETICOES * 1000, tamanho
+
+
+def main():
+    corpo = corpo_listagem()
+    print(f"listagem com {LINHAS} linhas, {REPETICOES} respostas")
+    print(f"{'provider':<22}{'CPU ms/resposta':>17}{'bytes':>10}")
+    for provider in (DefaultJSONProvider, OrjsonProvider):
+        app = Flask(__name__)
+        app.json = provider(app)
+        cpu, tamanho = medir(app, corpo)
+        print(f"{provider.__name__:<22}{cpu:>17.2f}{tamanho:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Custo das métricas do /metrics no caminho da requisição.
+
+    registrar - MetricasHttp.registrar() (contadores por thread) contra a
+                mesma contagem sob um único lock, com 1 e 8 threads
+    GET       - requisições pelo test client do Flask, sem e com
+                registrar_metricas(app), alternadas rodada a rodada
+    scrape    - GET /metrics depois da carga
+
+    python -m benchmarks.bench_metricas
+"""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from flask import Flask
+
+from src.main.routes.pessoa_fisica_routes import pessoa_fisica_route_bp
+from src.main.routes.pessoa_juridica_routes import pessoa_juridica_route_bp
+from src.main.server.json_provider import criar_json_provider
+from src.main.server.metricas import MetricasHttp, metricas_http, registrar_metricas
+from src.models.cache.cache_lru_ttl import cache_contas
+
+from ._banco import criar_banco
+from .bench_container import apontar_composers
+
+REGISTROS = 200_000
+REQUISICOES = 3_000
+RODADAS = 5
+CAMINHO = "/fisica?limit=1"
+
+
+class MetricasComLock(MetricasHttp):
+    """A mesma contagem, com todas as threads disputando um único lock."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__lock = threading.Lock()
+
+    def registrar(self, metodo: str, rota: str, status: int, duracao: float) -> None:
+        with self.__lock:
+            super().registrar(metodo, rota, status, duracao)
+
+
+def medir_registrar(metricas: MetricasHttp, threads: int) -> float:
+    """ns por chamada, somando todas as threads."""
+    por_thread = REGISTROS // threads
+
+    def trabalhar():
+        for i in range(por_thread):
+            metricas.registrar("GET", "/fisica", 200, i * 1e-6)
+
+    trabalhadores = [threading.Thread(target=trabalhar) for _ in range(threads)]
+    inicio = time.perf_counter()
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    for trabalhador in trabalhadores:
+        trabalhador.join()
+    return (time.perf_counter() - inicio) / (por_thread * threads) * 1e9
+
+
+def criar_app(com_metricas: bool, handler) -> Flask:
+    app = Flask(__name__)
+    app.json = criar_json_provider(app)
+    if com_metricas:
+        registrar_metricas(app, handler, cache_contas)
+    app.register_blueprint(pessoa_fisica_route_bp)
+    app.register_blueprint(pessoa_juridica_route_bp)
+    return app
+
+
+def medir_get(cliente, caminho: str, requisicoes: int) -> float:
+    """µs por requisição em uma rodada."""
+    inicio = time.perf_counter()
+    for _ in range(requisicoes):
+        cliente.get(caminho)
+    return (time.perf_counter() - inicio) / requisicoes * 1e6
+
+
+def main():
+    print(f"registrar(), {REGISTROS} chamadas, ns por chamada")
+    print(f"{'threads':<10}{'por thread':>12}{'lock unico':>12}")
+    for threads in (1, 8):
+        por_thread = min(medir_registrar(MetricasHttp(), threads) for _ in range(3))
+        com_lock = min(medir_registrar(MetricasComLock(), threads) for _ in range(3))
+        print(f"{threads:<10}{por_thread:>12.0f}{com_lock:>12.0f}")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        handler = criar_banco(Path(diretorio) / "metricas.db")
+        apontar_composers(handler)
+        clientes = {com: criar_app(com, handler).test_client() for com in (False, True)}
+
+        resultados = {}
+        for _ in range(RODADAS):
+            for com, cliente in clientes.items():
+                tempo = medir_get(cliente, CAMINHO, REQUISICOES)
+                resultados[com] = min(resultados.get(com, tempo), tempo)
+
+        print(f"\nGET {CAMINHO}, {RODADAS}x{REQUISICOES}, µs por requisição")
+        print(f"{'sem':>8}{'com':>8}{'custo':>8}")
+        sem, com = resultados[False], resultados[True]
+        print(f"{sem:>8.1f}{com:>8.1f}{com - sem:>8.1f}")
+
+        scrape = medir_get(clientes[True], "/metrics", 200)
+        print(f"\nGET /metrics: {scrape:.0f} µs")
+
+        metricas_http.limpar()
+        handler.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark das operações de saldo (depósito, saque e consulta de saldo).
+
+Em uma conta, executa OPERACOES depósitos de R$ 0,10 intercalados com
+saques de R$ 0,03 e consultas de saldo, e mede operações por segundo. No
+fim compara o saldo gravado com o esperado, calculado em Decimal: qualquer
+diferença é erro de arredondamento acumulado pelo armazenamento.
+
+    python -m benchmarks.bench_operacoes_saldo
+"""
+
+import sqlite3
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+from ._banco import criar_banco
+
+OPERACOES = 5_000
+DEPOSITO = Decimal("0.10")
+SAQUE = Decimal("0.03")
+PESSOA_ID = 1
+COLUNA_SALDO = PessoaFisicaTable.saldo.property.columns[0].name
+
+
+def main():
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = Path(diretorio) / "saldo.db"
+        handler = criar_banco(caminho, "throughput")
+        repository = PessoaFisicaRepository(handler)
+        saldo_inicial = Decimal(repository.obter_saldo(PESSOA_ID))
+
+        inicio = time.perf_counter()
+        for _ in range(OPERACOES):
+            repository.depositar_dinheiro(PESSOA_ID, DEPOSITO)
+            repository.sacar_dinheiro(PESSOA_ID, SAQUE)
+            repository.obter_saldo(PESSOA_ID)
+        duracao = time.perf_counter() - inicio
+
+        esperado = saldo_inicial + OPERACOES * (DEPOSITO - SAQUE)
+        gravado = repository.obter_saldo(PESSOA_ID)
+        with sqlite3.connect(caminho) as conn:
+            bruto = conn.execute(
+                f"SELECT {COLUNA_SALDO} FROM pessoa_fisica WHERE id = ?", (PESSOA_ID,)
+            ).fetchone()[0]
+        handler.get_engine().dispose()
+
+    print(f"{OPERACOES} x (depósito + saque + saldo), perfil throughput")
+    print(f"operações/s: {3 * OPERACOES / duracao:.0f}")
+    print(f"saldo esperado: {esperado}")
+    print(f"saldo gravado:  {gravado!r}")
+    print(f"valor bruto no SQLite ({COLUNA_SALDO}): {bruto!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Memória dos workers do servidor de produção com e sem gc.freeze.
+
+Sobe o ServidorProducao (run_producao.py) com WORKERS workers sobre um
+banco temporário, faz REQUISICOES GETs de listagem e soma, por worker, a
+memória privada (Private_Clean + Private_Dirty) e o PSS lidos de
+/proc/<pid>/smaps_rollup:
+
+    freeze      - configuração padrão (gc.freeze antes de cada fork)
+    sem freeze  - mesmo servidor, com o hook pre_fork vazio
+
+Quanto menor a memória privada, mais páginas do app importado no mestre
+continuam compartilhadas entre os workers.
+
+    python -m benchmarks.bench_producao
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ._banco import criar_banco, popular_pessoas_fisicas
+
+PESSOAS = 10_000
+WORKERS = 4
+REQUISICOES = 2_000
+CAMINHOS = ("/fisica?limit=50", "/fisica/relatorio", "/fisica/busca?q=cliente")
+
+SERVIDOR = (
+    "from src.main.server.producao import ServidorProducao\n"
+    "opcoes = {{'bind': '127.0.0.1:{porta}', 'workers': {workers}, "
+    "'loglevel': 'warning'}}\n"
+    "if {sem_freeze}:\n"
+    "    opcoes['pre_fork'] = lambda server, worker: None\n"
+    "ServidorProducao(opcoes).run()\n"
+)
+
+
+async def _requisitar(porta: int, caminho: str) -> None:
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+    escritor.write(
+        f"GET {caminho} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode()
+    )
+    await escritor.drain()
+    await leitor.read()
+    escritor.close()
+    await escritor.wait_closed()
+
+
+async def _carga(porta: int) -> None:
+    semaforo = asyncio.Semaphore(32)
+
+    async def _uma(i):
+        async with semaforo:
+            await _requisitar(porta, CAMINHOS[i % len(CAMINHOS)])
+
+    await asyncio.gather(*(_uma(i) for i in range(REQUISICOES)))
+
+
+def _aguardar(porta: int) -> None:
+    for _ in range(100):
+        try:
+            asyncio.run(_requisitar(porta, CAMINHOS[0]))
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Servidor na porta {porta} não respondeu")
+
+
+def _workers(pid_mestre: int):
+    caminho = Path(f"/proc/{pid_mestre}/task/{pid_mestre}/children")
+    return [int(pid) for pid in caminho.read_text(encoding="utf-8").split()]
+
+
+def _memoria_kb(pid: int):
+    """(privada, pss) em kB."""
+    campos = {}
+    with open(f"/proc/{pid}/smaps_rollup", encoding="utf-8") as smaps:
+        for linha in smaps:
+            partes = linha.split()
+            if len(partes) == 3 and partes[2] == "kB":
+                campos[partes[0].rstrip(":")] = int(partes[1])
+    return campos["Private_Clean"] + campos["Private_Dirty"], campos["Pss"]
+
+
+def medir(raiz: Path, ambiente, porta: int, sem_freeze: bool):
+    codigo = SERVIDOR.format(porta=porta, workers=WORKERS, sem_freeze=sem_freeze)
+    processo = subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, "-c", codigo],
+        cwd=raiz,
+        env=ambiente,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _aguardar(porta)
+        asyncio.run(_carga(porta))
+        memorias = [_memoria_kb(pid) for pid in _workers(processo.pid)]
+    finally:
+        processo.terminate()
+        processo.wait()
+    return [sum(valores) / len(memorias) / 1024 for valores in zip(*memorias)]
+
+
+def main():
+    print(f"{WORKERS} workers, {REQUISICOES} requisições, média por worker")
+    print(f"{'modo':<12}{'privada MB':>12}{'PSS MB':>10}")
+    raiz = Path(__file__).resolve().parent.parent
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = Path(diretorio) / "producao.db"
+        criar_banco(caminho).get_engine().dispose()
+        popular_pessoas_fisicas(caminho, PESSOAS)
+        ambiente = dict(os.environ, DATABASE_URL=f"sqlite:///{caminho}")
+
+        for porta, (nome, sem_freeze) in enumerate(
+            (("freeze", False), ("sem freeze", True)), start=3201
+        ):
+            privada, pss = medir(raiz, ambiente, porta, sem_freeze)
+            print(f"{nome:<12}{privada:>12.1f}{pss:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark do caminho de leitura da listagem: ORM vs projeção Core.
+
+Lê QUANTIDADE_PESSOAS linhas de pessoa_fisica e monta os dicts da listagem
+de duas formas:
+
+    orm       - listar_pagina: instâncias PessoaFisicaTable (identity map)
+    projecao  - listar_projecao: Rows só com as colunas da listagem
+
+Tempo e memória são medidos em execuções separadas, porque o tracemalloc
+distorce o tempo.
+
+    python -m benchmarks.bench_projecao
+"""
+
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.controllers.fisica_listar_controller import COLUNAS_LISTAGEM
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+from ._banco import criar_banco, popular_pessoas_fisicas
+
+QUANTIDADE_PESSOAS = 100_000
+REPETICOES = 3
+
+
+def formatar(linhas) -> list:
+    return [
+        {coluna: getattr(linha, coluna) for coluna in COLUNAS_LISTAGEM}
+        for linha in linhas
+    ]
+
+
+def via_orm(repository: PessoaFisicaRepository) -> int:
+    return len(formatar(repository.listar_pagina(QUANTIDADE_PESSOAS)))
+
+
+def via_projecao(repository: PessoaFisicaRepository) -> int:
+    linhas = repository.listar_projecao(COLUNAS_LISTAGEM, QUANTIDADE_PESSOAS)
+    return len(formatar(linhas))
+
+
+def medir_tempo(funcao, repository) -> float:
+    melhor = float("inf")
+    for _ in range(REPETICOES):
+        inicio = time.perf_counter()
+        linhas = funcao(repository)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return linhas / melhor
+
+
+def medir_memoria(funcao, repository) -> float:
+    tracemalloc.start()
+    funcao(repository)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pico / 1024 / 1024
+
+
+def main():
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = Path(diretorio) / "projecao.db"
+        handler = criar_banco(caminho)
+        popular_pessoas_fisicas(caminho, QUANTIDADE_PESSOAS)
+        repository = PessoaFisicaRepository(handler)
+
+        print(f"{QUANTIDADE_PESSOAS} linhas, melhor de {REPETICOES}")
+        print(f"{'caminho':<10}{'linhas/s':>12}{'pico (MB)':>12}")
+        for nome, funcao in (("orm", via_orm), ("projecao", via_projecao)):
+            print(
+                f"{nome:<10}"
+                f"{medir_tempo(funcao, repository):>12.0f}"
+                f"{medir_memoria(funcao, repository):>12.1f}"
+            )
+        handler.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main()
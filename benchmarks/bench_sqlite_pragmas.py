@@ -0,0 +1,87 @@
+"""
+Benchmark de concorrência leitura/escrita por perfil de PRAGMA.
+
+Um writer faz depósitos enquanto leitores executam listar_todas, por
+DURACAO segundos. No perfil "padrao" (rollback journal) cada escrita
+bloqueia os leitores; nos perfis WAL leitores e writer rodam em paralelo.
+
+    python -m benchmarks.bench_sqlite_pragmas
+"""
+
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+from ._banco import criar_banco, popular_pessoas_fisicas
+
+PERFIS = ("padrao", "durable", "throughput")
+QUANTIDADE_PESSOAS = 2_000
+LEITORES = 4
+DURACAO = 5.0
+
+
+def executar(perfil: str, diretorio: Path) -> dict:
+    caminho = diretorio / f"{perfil}.db"
+    handler = criar_banco(caminho, pragma_profile=perfil)
+    popular_pessoas_fisicas(caminho, QUANTIDADE_PESSOAS)
+    repository = PessoaFisicaRepository(handler)
+
+    contadores = {"leituras": 0, "escritas": 0, "erros": 0}
+    lock = threading.Lock()
+    fim = time.perf_counter() + DURACAO
+
+    def writer():
+        pessoa_id = 1
+        while time.perf_counter() < fim:
+            try:
+                repository.depositar_dinheiro(pessoa_id, Decimal("1.00"))
+                with lock:
+                    contadores["escritas"] += 1
+            except Exception:
+                with lock:
+                    contadores["erros"] += 1
+            pessoa_id = pessoa_id % QUANTIDADE_PESSOAS + 1
+
+    def leitor():
+        while time.perf_counter() < fim:
+            try:
+                repository.listar_todas()
+                with lock:
+                    contadores["leituras"] += 1
+            except Exception:
+                with lock:
+                    contadores["erros"] += 1
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=leitor) for _ in range(LEITORES)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    handler.get_engine().dispose()
+    return contadores
+
+
+def main():
+    print(f"{QUANTIDADE_PESSOAS} pessoas, 1 writer, {LEITORES} leitores, {DURACAO}s")
+    print(f"{'perfil':<12}{'escritas/s':>12}{'leituras/s':>12}{'erros':>8}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        for perfil in PERFIS:
+            resultado = executar(perfil, Path(diretorio))
+            print(
+                f"{perfil:<12}"
+                f"{resultado['escritas'] / DURACAO:>12.1f}"
+                f"{resultado['leituras'] / DURACAO:>12.1f}"
+                f"{resultado['erros']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
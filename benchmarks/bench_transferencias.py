@@ -0,0 +1,104 @@
+"""
+Benchmark de transferências sob contenção.
+
+Compara, com THREADS threads disputando poucas contas, o caminho antigo
+(sacar_dinheiro + depositar_dinheiro, duas transações) com transferir
+(uma transação). Ao final confere se o total em conta foi preservado.
+
+    python -m benchmarks.bench_transferencias
+"""
+
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from src.models.dinheiro import para_reais
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+from ._banco import criar_banco, popular_pessoas_fisicas
+
+CONTAS = 8
+THREADS = 8
+DURACAO = 5.0
+VALOR = Decimal("1.00")
+
+
+def encadeado(repository, origem, destino):
+    repository.sacar_dinheiro(origem, VALOR)
+    repository.depositar_dinheiro(destino, VALOR)
+
+
+def transferir(repository, origem, destino):
+    repository.transferir(origem, destino, VALOR)
+
+
+def total_em_conta(caminho: Path) -> Decimal:
+    with sqlite3.connect(caminho) as conn:
+        centavos = conn.execute(
+            "SELECT SUM(saldo_centavos) FROM pessoa_fisica"
+        ).fetchone()[0]
+    return para_reais(centavos)
+
+
+def executar(nome, operacao, diretorio: Path) -> dict:
+    caminho = diretorio / f"{nome}.db"
+    handler = criar_banco(caminho, pragma_profile="throughput")
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("DELETE FROM pessoa_fisica")
+    popular_pessoas_fisicas(caminho, CONTAS)
+    ids = [
+        linha[0]
+        for linha in sqlite3.connect(caminho).execute("SELECT id FROM pessoa_fisica")
+    ]
+    total_inicial = total_em_conta(caminho)
+
+    repository = PessoaFisicaRepository(handler)
+    contadores = {"ok": 0, "erros": 0}
+    lock = threading.Lock()
+    fim = time.perf_counter() + DURACAO
+
+    def worker(seed):
+        aleatorio = random.Random(seed)
+        while time.perf_counter() < fim:
+            origem, destino = aleatorio.sample(ids, 2)
+            try:
+                operacao(repository, origem, destino)
+                chave = "ok"
+            except Exception:
+                chave = "erros"
+            with lock:
+                contadores[chave] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    handler.get_engine().dispose()
+    contadores["diferenca_total"] = total_em_conta(caminho) - total_inicial
+    return contadores
+
+
+def main():
+    print(f"{CONTAS} contas, {THREADS} threads, {DURACAO}s, perfil throughput")
+    print(f"{'caminho':<12}{'transf/s':>10}{'erros':>8}{'dif. total':>12}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        for nome, operacao in (("encadeado", encadeado), ("transferir", transferir)):
+            resultado = executar(nome, operacao, Path(diretorio))
+            print(
+                f"{nome:<12}"
+                f"{resultado['ok'] / DURACAO:>10.1f}"
+                f"{resultado['erros']:>8}"
+                f"{resultado['diferenca_total']:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark de validação dos corpos de POST /fisica e POST /fisica/batch.
+
+    json + **kwargs  - caminho anterior: request.json (json.loads) e depois
+                       PessoaFisicaCriarSchema(**body)
+    dict             - fisica_criar_validator com o corpo já parseado
+    bytes            - fisica_criar_validator com raw_body: parse e validação
+                       no pydantic-core (model_validate_json)
+
+O lote tem ITENS_LOTE pessoas e passa por fisica_criar_lote_validator.
+
+    python -m benchmarks.bench_validacao
+"""
+
+import json
+import time
+
+from src.validators.fisica_criar_validator import (
+    PessoaFisicaCriarSchema,
+    fisica_criar_lote_validator,
+    fisica_criar_validator,
+)
+from src.views.http_types.http_request import HttpRequest
+
+VALIDACOES = 30_000
+ITENS_LOTE = 1_000
+LOTES = 20
+
+
+def pessoa(i: int) -> dict:
+    return {
+        "nome_completo": f"Cliente Número {i}",
+        "email": f"cliente{i}@bench.com",
+        "celular": f"(11) 9{i:04d}-{i:04d}",
+        "idade": 30,
+        "renda_mensal": "5000.25",
+        "categoria": "Bench",
+        "saldo": 1500.5,
+    }
+
+
+def por_segundo(funcao, repeticoes: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return repeticoes / (time.perf_counter() - inicio)
+
+
+def main():
+    corpo = json.dumps(pessoa(1)).encode()
+    lote = json.dumps([pessoa(i) for i in range(ITENS_LOTE)]).encode()
+
+    casos = {
+        "json + **kwargs": (
+            lambda: PessoaFisicaCriarSchema(**json.loads(corpo)).model_dump(),
+            lambda: fisica_criar_lote_validator(HttpRequest(body=json.loads(lote))),
+        ),
+        "dict": (
+            lambda: fisica_criar_validator(HttpRequest(body=json.loads(corpo))),
+            lambda: fisica_criar_lote_validator(HttpRequest(body=json.loads(lote))),
+        ),
+        "bytes": (
+            lambda: fisica_criar_validator(HttpRequest(raw_body=corpo)),
+            lambda: fisica_criar_lote_validator(HttpRequest(raw_body=lote)),
+        ),
+    }
+
+    print(f"{VALIDACOES} corpos, {LOTES} lotes de {ITENS_LOTE} itens")
+    print(f"{'caminho':<18}{'validações/s':>14}{'itens de lote/s':>17}")
+    for nome, (unico, em_lote) in casos.items():
+        validacoes = por_segundo(unico, VALIDACOES)
+        itens = por_segundo(em_lote, LOTES) * ITENS_LOTE
+        print(f"{nome:<18}{validacoes:>14.0f}{itens:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
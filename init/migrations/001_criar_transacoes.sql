@@ -0,0 +1,31 @@
+-- Migração 001: cria o livro-razão usado por realizar_extrato.
+-- Uso: sqlite3 storage.db < init/migrations/001_criar_transacoes.sql
+
+-- Tabela: Transações (livro-razão append-only de débitos e créditos)
+CREATE TABLE IF NOT EXISTS transacoes(
+    id INTEGER PRIMARY KEY,
+    conta_tipo TEXT NOT NULL,
+    conta_id INTEGER NOT NULL,
+    tipo TEXT NOT NULL CHECK(tipo IN ('debito', 'credito')),
+    operacao TEXT NOT NULL,
+    valor REAL NOT NULL CHECK(valor > 0),
+    contraparte_tipo TEXT,
+    contraparte_id INTEGER,
+    criado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Índice do extrato: conta + período, paginado por (criado_em, id)
+CREATE INDEX IF NOT EXISTS idx_transacoes_conta_data ON transacoes(conta_tipo, conta_id, criado_em, id);
+
+-- Triggers que garantem que o livro-razão é somente inserção
+CREATE TRIGGER IF NOT EXISTS transacoes_bloquear_update
+BEFORE UPDATE ON transacoes
+BEGIN
+    SELECT RAISE(ABORT, 'transacoes é append-only');
+END;
+
+CREATE TRIGGER IF NOT EXISTS transacoes_bloquear_delete
+BEFORE DELETE ON transacoes
+BEGIN
+    SELECT RAISE(ABORT, 'transacoes é append-only');
+END;
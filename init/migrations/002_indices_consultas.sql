@@ -0,0 +1,13 @@
+-- Migração 002: índices das consultas por categoria, saldo, faturamento e idade.
+-- Uso: sqlite3 storage.db < init/migrations/002_indices_consultas.sql
+
+-- pessoa_fisica: buscar_por_categoria, buscar_com_saldo_maior_que
+CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_categoria ON pessoa_fisica(categoria);
+CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_saldo ON pessoa_fisica(saldo);
+
+-- pessoa_juridica: buscar_por_categoria, buscar_por_saldo_maior_que,
+-- buscar_com_faturamento_maior_que, buscar_por_idade_empresa
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_categoria ON pessoa_juridica(categoria);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_saldo ON pessoa_juridica(saldo);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_faturamento ON pessoa_juridica(faturamento);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_idade ON pessoa_juridica(idade);
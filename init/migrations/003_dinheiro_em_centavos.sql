@@ -0,0 +1,142 @@
+-- Migração 003: valores monetários passam de REAL para centavos inteiros.
+-- Uso: sqlite3 storage.db < init/migrations/003_dinheiro_em_centavos.sql
+--
+-- O SQLite não altera o tipo de uma coluna que está em CHECK ou índice, então
+-- cada tabela é recriada: cria a nova, copia convertendo (ROUND(x * 100)),
+-- preserva o contador do AUTOINCREMENT, remove a antiga e renomeia.
+-- Índices e triggers da tabela antiga somem no DROP e são recriados no fim.
+
+BEGIN;
+
+-- pessoa_fisica
+CREATE TABLE pessoa_fisica_nova(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    renda_mensal_centavos INTEGER NOT NULL CHECK(renda_mensal_centavos >= 0),
+    idade INTEGER NOT NULL CHECK(idade >= 18),
+    nome_completo TEXT NOT NULL,
+    celular TEXT NOT NULL UNIQUE,
+    email TEXT NOT NULL UNIQUE,
+    categoria TEXT NOT NULL,
+    saldo_centavos INTEGER NOT NULL DEFAULT 0 CHECK(saldo_centavos >= 0),
+    criado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO pessoa_fisica_nova (
+    id, renda_mensal_centavos, idade, nome_completo, celular, email,
+    categoria, saldo_centavos, criado_em, atualizado_em
+)
+SELECT
+    id, CAST(ROUND(renda_mensal * 100) AS INTEGER), idade, nome_completo,
+    celular, email, categoria, CAST(ROUND(saldo * 100) AS INTEGER),
+    criado_em, atualizado_em
+FROM pessoa_fisica;
+
+UPDATE sqlite_sequence
+SET seq = (SELECT seq FROM sqlite_sequence WHERE name = 'pessoa_fisica')
+WHERE name = 'pessoa_fisica_nova'
+  AND EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'pessoa_fisica');
+
+DROP TABLE pessoa_fisica;
+ALTER TABLE pessoa_fisica_nova RENAME TO pessoa_fisica;
+
+-- pessoa_juridica
+CREATE TABLE pessoa_juridica_nova(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    faturamento_centavos INTEGER NOT NULL CHECK(faturamento_centavos >= 0),
+    idade INTEGER NOT NULL CHECK(idade >= 0),
+    nome_fantasia TEXT NOT NULL,
+    celular TEXT NOT NULL UNIQUE,
+    email_corporativo TEXT NOT NULL UNIQUE,
+    categoria TEXT NOT NULL,
+    saldo_centavos INTEGER NOT NULL DEFAULT 0 CHECK(saldo_centavos >= 0),
+    criado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO pessoa_juridica_nova (
+    id, faturamento_centavos, idade, nome_fantasia, celular, email_corporativo,
+    categoria, saldo_centavos, criado_em, atualizado_em
+)
+SELECT
+    id, CAST(ROUND(faturamento * 100) AS INTEGER), idade, nome_fantasia,
+    celular, email_corporativo, categoria, CAST(ROUND(saldo * 100) AS INTEGER),
+    criado_em, atualizado_em
+FROM pessoa_juridica;
+
+UPDATE sqlite_sequence
+SET seq = (SELECT seq FROM sqlite_sequence WHERE name = 'pessoa_juridica')
+WHERE name = 'pessoa_juridica_nova'
+  AND EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'pessoa_juridica');
+
+DROP TABLE pessoa_juridica;
+ALTER TABLE pessoa_juridica_nova RENAME TO pessoa_juridica;
+
+-- transacoes (os triggers append-only caem junto com a tabela antiga)
+CREATE TABLE transacoes_nova(
+    id INTEGER PRIMARY KEY,
+    conta_tipo TEXT NOT NULL,
+    conta_id INTEGER NOT NULL,
+    tipo TEXT NOT NULL CHECK(tipo IN ('debito', 'credito')),
+    operacao TEXT NOT NULL,
+    valor_centavos INTEGER NOT NULL CHECK(valor_centavos > 0),
+    contraparte_tipo TEXT,
+    contraparte_id INTEGER,
+    criado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO transacoes_nova (
+    id, conta_tipo, conta_id, tipo, operacao, valor_centavos,
+    contraparte_tipo, contraparte_id, criado_em
+)
+SELECT
+    id, conta_tipo, conta_id, tipo, operacao, CAST(ROUND(valor * 100) AS INTEGER),
+    contraparte_tipo, contraparte_id, criado_em
+FROM transacoes;
+
+DROP TABLE transacoes;
+ALTER TABLE transacoes_nova RENAME TO transacoes;
+
+-- Índices
+CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_email ON pessoa_fisica(email);
+CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_celular ON pessoa_fisica(celular);
+CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_categoria ON pessoa_fisica(categoria);
+CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_saldo ON pessoa_fisica(saldo_centavos);
+
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_email ON pessoa_juridica(email_corporativo);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_celular ON pessoa_juridica(celular);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_categoria ON pessoa_juridica(categoria);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_saldo ON pessoa_juridica(saldo_centavos);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_faturamento ON pessoa_juridica(faturamento_centavos);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_idade ON pessoa_juridica(idade);
+
+CREATE INDEX IF NOT EXISTS idx_transacoes_conta_data ON transacoes(conta_tipo, conta_id, criado_em, id);
+
+-- Triggers
+CREATE TRIGGER IF NOT EXISTS atualizar_pessoa_fisica_timestamp
+AFTER UPDATE ON pessoa_fisica
+FOR EACH ROW
+BEGIN
+    UPDATE pessoa_fisica SET atualizado_em = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS atualizar_pessoa_juridica_timestamp
+AFTER UPDATE ON pessoa_juridica
+FOR EACH ROW
+BEGIN
+    UPDATE pessoa_juridica SET atualizado_em = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS transacoes_bloquear_update
+BEFORE UPDATE ON transacoes
+BEGIN
+    SELECT RAISE(ABORT, 'transacoes é append-only');
+END;
+
+CREATE TRIGGER IF NOT EXISTS transacoes_bloquear_delete
+BEFORE DELETE ON transacoes
+BEGIN
+    SELECT RAISE(ABORT, 'transacoes é append-only');
+END;
+
+COMMIT;
@@ -0,0 +1,68 @@
+-- Migração 004: busca textual por nome (FTS5) em pessoa_fisica e pessoa_juridica.
+-- Uso: sqlite3 storage.db < init/migrations/004_busca_por_nome.sql
+--
+-- Cria os índices FTS5 e os triggers de sincronização, e depois indexa as
+-- linhas já existentes com o comando 'rebuild'.
+
+-- Busca textual por nome (FTS5 com conteúdo externo: o índice guarda só os
+-- tokens, o texto continua em pessoa_fisica). Os triggers mantêm o índice
+-- sincronizado; o de UPDATE só dispara quando nome_completo muda.
+CREATE VIRTUAL TABLE IF NOT EXISTS pessoa_fisica_busca USING fts5(
+    nome_completo,
+    content='pessoa_fisica',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS pessoa_fisica_busca_insert
+AFTER INSERT ON pessoa_fisica
+BEGIN
+    INSERT INTO pessoa_fisica_busca(rowid, nome_completo) VALUES (NEW.id, NEW.nome_completo);
+END;
+
+CREATE TRIGGER IF NOT EXISTS pessoa_fisica_busca_delete
+AFTER DELETE ON pessoa_fisica
+BEGIN
+    INSERT INTO pessoa_fisica_busca(pessoa_fisica_busca, rowid, nome_completo) VALUES ('delete', OLD.id, OLD.nome_completo);
+END;
+
+CREATE TRIGGER IF NOT EXISTS pessoa_fisica_busca_update
+AFTER UPDATE OF nome_completo ON pessoa_fisica
+BEGIN
+    INSERT INTO pessoa_fisica_busca(pessoa_fisica_busca, rowid, nome_completo) VALUES ('delete', OLD.id, OLD.nome_completo);
+    INSERT INTO pessoa_fisica_busca(rowid, nome_completo) VALUES (NEW.id, NEW.nome_completo);
+END;
+
+-- Busca textual por nome (FTS5 com conteúdo externo: o índice guarda só os
+-- tokens, o texto continua em pessoa_juridica). Os triggers mantêm o índice
+-- sincronizado; o de UPDATE só dispara quando nome_fantasia muda.
+CREATE VIRTUAL TABLE IF NOT EXISTS pessoa_juridica_busca USING fts5(
+    nome_fantasia,
+    content='pessoa_juridica',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS pessoa_juridica_busca_insert
+AFTER INSERT ON pessoa_juridica
+BEGIN
+    INSERT INTO pessoa_juridica_busca(rowid, nome_fantasia) VALUES (NEW.id, NEW.nome_fantasia);
+END;
+
+CREATE TRIGGER IF NOT EXISTS pessoa_juridica_busca_delete
+AFTER DELETE ON pessoa_juridica
+BEGIN
+    INSERT INTO pessoa_juridica_busca(pessoa_juridica_busca, rowid, nome_fantasia) VALUES ('delete', OLD.id, OLD.nome_fantasia);
+END;
+
+CREATE TRIGGER IF NOT EXISTS pessoa_juridica_busca_update
+AFTER UPDATE OF nome_fantasia ON pessoa_juridica
+BEGIN
+    INSERT INTO pessoa_juridica_busca(pessoa_juridica_busca, rowid, nome_fantasia) VALUES ('delete', OLD.id, OLD.nome_fantasia);
+    INSERT INTO pessoa_juridica_busca(rowid, nome_fantasia) VALUES (NEW.id, NEW.nome_fantasia);
+END;
+
+INSERT INTO pessoa_fisica_busca(pessoa_fisica_busca) VALUES ('rebuild');
+INSERT INTO pessoa_juridica_busca(pessoa_juridica_busca) VALUES ('rebuild');
@@ -0,0 +1,11 @@
+-- Migração 005: remove os triggers que reescreviam atualizado_em.
+-- Uso: sqlite3 storage.db < init/migrations/005_remover_trigger_atualizado_em.sql
+--
+-- O trigger AFTER UPDATE emitia um segundo UPDATE na mesma linha a cada
+-- alteração (saldo, cadastro), gravando a linha e os índices duas vezes.
+-- atualizado_em passa a ser preenchido só pela aplicação, pelo onupdate das
+-- entidades, no mesmo UPDATE que altera a linha. Quem alterar as tabelas
+-- com SQL direto deve preencher atualizado_em no próprio UPDATE.
+
+DROP TRIGGER IF EXISTS atualizar_pessoa_fisica_timestamp;
+DROP TRIGGER IF EXISTS atualizar_pessoa_juridica_timestamp;
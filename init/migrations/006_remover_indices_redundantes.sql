@@ -0,0 +1,16 @@
+-- Migração 006: remove índices apontados pela auditoria de índices.
+-- Uso: sqlite3 storage.db < init/migrations/006_remover_indices_redundantes.sql
+--
+-- Gerada por: python -m src.models.sqlite.auditoria_indices --migracao
+
+-- duplicado: mesmas colunas do índice único sqlite_autoindex_pessoa_fisica_1
+DROP INDEX IF EXISTS idx_pessoa_fisica_celular;
+
+-- duplicado: mesmas colunas do índice único sqlite_autoindex_pessoa_fisica_2
+DROP INDEX IF EXISTS idx_pessoa_fisica_email;
+
+-- duplicado: mesmas colunas do índice único sqlite_autoindex_pessoa_juridica_1
+DROP INDEX IF EXISTS idx_pessoa_juridica_celular;
+
+-- duplicado: mesmas colunas do índice único sqlite_autoindex_pessoa_juridica_2
+DROP INDEX IF EXISTS idx_pessoa_juridica_email;
@@ -1,67 +1,147 @@
+-- Valores monetários são guardados em centavos inteiros (colunas *_centavos).
+-- atualizado_em é preenchido pela aplicação (onupdate das entidades), sem
+-- trigger: um trigger AFTER UPDATE reescreveria a linha a cada UPDATE.
+
 -- Tabela: Pessoas Físicas (clientes individuais)
 CREATE TABLE IF NOT EXISTS pessoa_fisica(
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    renda_mensal REAL NOT NULL CHECK(renda_mensal >= 0),
+    renda_mensal_centavos INTEGER NOT NULL CHECK(renda_mensal_centavos >= 0),
     idade INTEGER NOT NULL CHECK(idade >= 18),
     nome_completo TEXT NOT NULL,
     celular TEXT NOT NULL UNIQUE,
     email TEXT NOT NULL UNIQUE,
     categoria TEXT NOT NULL,
-    saldo REAL NOT NULL DEFAULT 0.0 CHECK(saldo >= 0),
+    saldo_centavos INTEGER NOT NULL DEFAULT 0 CHECK(saldo_centavos >= 0),
     criado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     atualizado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
--- Índices para performance em pessoa_fisica
-CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_email ON pessoa_fisica(email);
-CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_celular ON pessoa_fisica(celular);
+-- Índices para performance em pessoa_fisica (email e celular já têm o
+-- índice implícito do UNIQUE)
+CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_categoria ON pessoa_fisica(categoria);
+CREATE INDEX IF NOT EXISTS idx_pessoa_fisica_saldo ON pessoa_fisica(saldo_centavos);
+
+-- Busca textual por nome (FTS5 com conteúdo externo: o índice guarda só os
+-- tokens, o texto continua em pessoa_fisica). Os triggers mantêm o índice
+-- sincronizado; o de UPDATE só dispara quando nome_completo muda.
+CREATE VIRTUAL TABLE IF NOT EXISTS pessoa_fisica_busca USING fts5(
+    nome_completo,
+    content='pessoa_fisica',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS pessoa_fisica_busca_insert
+AFTER INSERT ON pessoa_fisica
+BEGIN
+    INSERT INTO pessoa_fisica_busca(rowid, nome_completo) VALUES (NEW.id, NEW.nome_completo);
+END;
+
+CREATE TRIGGER IF NOT EXISTS pessoa_fisica_busca_delete
+AFTER DELETE ON pessoa_fisica
+BEGIN
+    INSERT INTO pessoa_fisica_busca(pessoa_fisica_busca, rowid, nome_completo) VALUES ('delete', OLD.id, OLD.nome_completo);
+END;
 
--- Trigger para atualizar automaticamente o campo atualizado_em em pessoa_fisica
-CREATE TRIGGER IF NOT EXISTS atualizar_pessoa_fisica_timestamp
-AFTER UPDATE ON pessoa_fisica
-FOR EACH ROW
+CREATE TRIGGER IF NOT EXISTS pessoa_fisica_busca_update
+AFTER UPDATE OF nome_completo ON pessoa_fisica
 BEGIN
-    UPDATE pessoa_fisica SET atualizado_em = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    INSERT INTO pessoa_fisica_busca(pessoa_fisica_busca, rowid, nome_completo) VALUES ('delete', OLD.id, OLD.nome_completo);
+    INSERT INTO pessoa_fisica_busca(rowid, nome_completo) VALUES (NEW.id, NEW.nome_completo);
 END;
 
 -- Tabela: Pessoas Jurídicas (empresas)
 CREATE TABLE IF NOT EXISTS pessoa_juridica(
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    faturamento REAL NOT NULL CHECK(faturamento >= 0),
+    faturamento_centavos INTEGER NOT NULL CHECK(faturamento_centavos >= 0),
     idade INTEGER NOT NULL CHECK(idade >= 0),
     nome_fantasia TEXT NOT NULL,
     celular TEXT NOT NULL UNIQUE,
     email_corporativo TEXT NOT NULL UNIQUE,
     categoria TEXT NOT NULL,
-    saldo REAL NOT NULL DEFAULT 0.0 CHECK(saldo >= 0),
+    saldo_centavos INTEGER NOT NULL DEFAULT 0 CHECK(saldo_centavos >= 0),
     criado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     atualizado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Índices para performance em pessoa_juridica
-CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_email ON pessoa_juridica(email_corporativo);
-CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_celular ON pessoa_juridica(celular);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_categoria ON pessoa_juridica(categoria);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_saldo ON pessoa_juridica(saldo_centavos);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_faturamento ON pessoa_juridica(faturamento_centavos);
+CREATE INDEX IF NOT EXISTS idx_pessoa_juridica_idade ON pessoa_juridica(idade);
+
+-- Busca textual por nome (FTS5 com conteúdo externo: o índice guarda só os
+-- tokens, o texto continua em pessoa_juridica). Os triggers mantêm o índice
+-- sincronizado; o de UPDATE só dispara quando nome_fantasia muda.
+CREATE VIRTUAL TABLE IF NOT EXISTS pessoa_juridica_busca USING fts5(
+    nome_fantasia,
+    content='pessoa_juridica',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS pessoa_juridica_busca_insert
+AFTER INSERT ON pessoa_juridica
+BEGIN
+    INSERT INTO pessoa_juridica_busca(rowid, nome_fantasia) VALUES (NEW.id, NEW.nome_fantasia);
+END;
 
--- Trigger para atualizar automaticamente o campo atualizado_em em pessoa_juridica
-CREATE TRIGGER IF NOT EXISTS atualizar_pessoa_juridica_timestamp
-AFTER UPDATE ON pessoa_juridica
-FOR EACH ROW
+CREATE TRIGGER IF NOT EXISTS pessoa_juridica_busca_delete
+AFTER DELETE ON pessoa_juridica
 BEGIN
-    UPDATE pessoa_juridica SET atualizado_em = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    INSERT INTO pessoa_juridica_busca(pessoa_juridica_busca, rowid, nome_fantasia) VALUES ('delete', OLD.id, OLD.nome_fantasia);
 END;
 
-INSERT INTO pessoa_fisica (renda_mensal, idade, nome_completo, celular, email, categoria, saldo) VALUES
-(85000.00, 38, 'Harvey Specter', '555-1001', 'hervey.specter@personhardman.com', 'Socio Senior', 2500000.00),
-(45000.00, 28, 'Mike Ross', '555-1002', 'mike.ross@personhardman.com', 'Associado', 1500000.00),
-(75000.00, 42, 'Jessica Person', '555-1003', 'jessica.person@personhardman.com', 'Socia Gerente', 500000.00),
-(55000.00, 35, 'Louis Litt', '555-1004', 'louis.litt@pearsonhardman.com', 'Sócio Júnior', 800000.00),
-(35000.00, 32, 'Rachel Zane', '555-1005', 'rachel.zane@pearsonhardman.com', 'Paralegal', 120000.00),
-(40000.00, 34, 'Donna Paulsen', '555-1006', 'donna.paulsen@pearsonhardman.com', 'Secretária Executiva', 200000.00);
-
-INSERT INTO pessoa_juridica (faturamento, idade, nome_fantasia, celular, email_corporativo, categoria, saldo) VALUES
-(50000000.00, 25, 'Pearson Hardman', '555-2001', 'contato@pearsonhardman.com', 'Escritório de Advocacia', 120000000.00),
-(35000000.00, 18, 'Pearson Specter', '555-2002', 'contato@pearsonspecter.com', 'Escritório de Advocacia', 85000000.00),
-(40000000.00, 20, 'Pearson Specter Litt', '555-2003', 'contato@psl.com', 'Escritório de Advocacia', 95000000.00),
-(25000000.00, 15, 'Zane Specter Litt', '555-2004', 'contato@zsl.com', 'Escritório de Advocacia', 60000000.00),
-(80000000.00, 30, 'Darby International', '555-2005', 'contato@darbyintl.com', 'Escritório Internacional', 200000000.00),
-(15000000.00, 8, 'Rand Corporation', '555-2006', 'contato@randcorp.com', 'Cliente Corporativo', 500000000.00);
+CREATE TRIGGER IF NOT EXISTS pessoa_juridica_busca_update
+AFTER UPDATE OF nome_fantasia ON pessoa_juridica
+BEGIN
+    INSERT INTO pessoa_juridica_busca(pessoa_juridica_busca, rowid, nome_fantasia) VALUES ('delete', OLD.id, OLD.nome_fantasia);
+    INSERT INTO pessoa_juridica_busca(rowid, nome_fantasia) VALUES (NEW.id, NEW.nome_fantasia);
+END;
+
+-- Tabela: Transações (livro-razão append-only de débitos e créditos)
+CREATE TABLE IF NOT EXISTS transacoes(
+    id INTEGER PRIMARY KEY,
+    conta_tipo TEXT NOT NULL,
+    conta_id INTEGER NOT NULL,
+    tipo TEXT NOT NULL CHECK(tipo IN ('debito', 'credito')),
+    operacao TEXT NOT NULL,
+    valor_centavos INTEGER NOT NULL CHECK(valor_centavos > 0),
+    contraparte_tipo TEXT,
+    contraparte_id INTEGER,
+    criado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Índice do extrato: conta + período, paginado por (criado_em, id)
+CREATE INDEX IF NOT EXISTS idx_transacoes_conta_data ON transacoes(conta_tipo, conta_id, criado_em, id);
+
+-- Triggers que garantem que o livro-razão é somente inserção
+CREATE TRIGGER IF NOT EXISTS transacoes_bloquear_update
+BEFORE UPDATE ON transacoes
+BEGIN
+    SELECT RAISE(ABORT, 'transacoes é append-only');
+END;
+
+CREATE TRIGGER IF NOT EXISTS transacoes_bloquear_delete
+BEFORE DELETE ON transacoes
+BEGIN
+    SELECT RAISE(ABORT, 'transacoes é append-only');
+END;
+
+INSERT INTO pessoa_fisica (renda_mensal_centavos, idade, nome_completo, celular, email, categoria, saldo_centavos) VALUES
+(8500000, 38, 'Harvey Specter', '555-1001', 'hervey.specter@personhardman.com', 'Socio Senior', 250000000),
+(4500000, 28, 'Mike Ross', '555-1002', 'mike.ross@personhardman.com', 'Associado', 150000000),
+(7500000, 42, 'Jessica Person', '555-1003', 'jessica.person@personhardman.com', 'Socia Gerente', 50000000),
+(5500000, 35, 'Louis Litt', '555-1004', 'louis.litt@pearsonhardman.com', 'Sócio Júnior', 80000000),
+(3500000, 32, 'Rachel Zane', '555-1005', 'rachel.zane@pearsonhardman.com', 'Paralegal', 12000000),
+(4000000, 34, 'Donna Paulsen', '555-1006', 'donna.paulsen@pearsonhardman.com', 'Secretária Executiva', 20000000);
+
+INSERT INTO pessoa_juridica (faturamento_centavos, idade, nome_fantasia, celular, email_corporativo, categoria, saldo_centavos) VALUES
+(5000000000, 25, 'Pearson Hardman', '555-2001', 'contato@pearsonhardman.com', 'Escritório de Advocacia', 12000000000),
+(3500000000, 18, 'Pearson Specter', '555-2002', 'contato@pearsonspecter.com', 'Escritório de Advocacia', 8500000000),
+(4000000000, 20, 'Pearson Specter Litt', '555-2003', 'contato@psl.com', 'Escritório de Advocacia', 9500000000),
+(2500000000, 15, 'Zane Specter Litt', '555-2004', 'contato@zsl.com', 'Escritório de Advocacia', 6000000000),
+(8000000000, 30, 'Darby International', '555-2005', 'contato@darbyintl.com', 'Escritório Internacional', 20000000000),
+(1500000000, 8, 'Rand Corporation', '555-2006', 'contato@randcorp.com', 'Cliente Corporativo', 50000000000);
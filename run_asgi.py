@@ -0,0 +1,6 @@
+import uvicorn
+
+from src.main.server.asgi_server import app
+
+if __name__ == "__main__":
+    uvicorn.run(app, host="0.0.0.0", port=3000)
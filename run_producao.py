@@ -0,0 +1,4 @@
+from src.main.server.producao import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from typing import Dict, List, Optional
+
+from sqlalchemy.engine import Row
+
+from src.controllers.fisica_listar_controller import COLUNAS_LISTAGEM
+from src.controllers.interfaces.fisica_buscar_controller import (
+    PessoaFisicaBuscarControllerInterface,
+)
+from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.models.sqlite.interfaces.pessoa_fisica_repository import (
+    PessoaFisicaRepositoryInterface,
+)
+
+
+class PessoaFisicaBuscarController(PessoaFisicaBuscarControllerInterface):
+    def __init__(self, repository: PessoaFisicaRepositoryInterface) -> None:
+        self.__repository = repository
+
+    def buscar(self, termo: str, limite: int = 50, deslocamento: int = 0) -> Dict:
+        try:
+            pessoas = self.__repository.buscar_por_nome(
+                termo, COLUNAS_LISTAGEM, limite + 1, deslocamento
+            )
+        except ValueError as e:
+            raise HttpBadRequestError(message=str(e), name="Bad Request") from e
+
+        # Busca uma linha a mais só para saber se existe próxima página
+        next_cursor = deslocamento + limite if len(pessoas) > limite else None
+        return formatar_busca(pessoas[:limite], next_cursor)
+
+
+def formatar_busca(pessoas: List[Row], next_cursor: Optional[int]) -> Dict:
+    return {
+        "data": {
+            "type": "Pessoa Física",
+            "count": len(pessoas),
+            "attributes": [
+                {
+                    "id": pessoa.id,
+                    "nome_completo": pessoa.nome_completo,
+                    "email": pessoa.email,
+                    "celular": pessoa.celular,
+                    "idade": pessoa.idade,
+                    "renda_mensal": pessoa.renda_mensal,
+                    "categoria": pessoa.categoria,
+                    "saldo": pessoa.saldo,
+                }
+                for pessoa in pessoas
+            ],
+            "next_cursor": next_cursor,
+        }
+    }
@@ -0,0 +1,53 @@
+from typing import Dict, Optional
+
+from src.controllers.fisica_buscar_controller import formatar_busca
+from src.controllers.fisica_listar_controller import COLUNAS_LISTAGEM, formatar_pagina
+from src.controllers.fisica_relatorio_controller import formatar_relatorio
+from src.controllers.interfaces.fisica_consulta_async_controller import (
+    PessoaFisicaConsultaAsyncControllerInterface,
+)
+from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.errors.error_types.http_not_found import HttpNotFoundError
+from src.models.sqlite.interfaces.pessoa_fisica_async_repository import (
+    PessoaFisicaAsyncRepositoryInterface,
+)
+
+
+class PessoaFisicaConsultaAsyncController(PessoaFisicaConsultaAsyncControllerInterface):
+    """
+    Listagem, busca por nome e relatório sobre o repositório assíncrono.
+
+    Mesmas regras e mesmo formato de resposta dos controllers síncronos
+    (formatar_pagina, formatar_busca e formatar_relatorio).
+    """
+
+    def __init__(self, repository: PessoaFisicaAsyncRepositoryInterface) -> None:
+        self.__repository = repository
+
+    async def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
+        pessoas = await self.__repository.listar_projecao(
+            COLUNAS_LISTAGEM, limite + 1, apos_id
+        )
+        if not pessoas and apos_id is None:
+            raise HttpNotFoundError(
+                message="Nenhuma Pessoa Física Cadastrada", name="Not Found"
+            )
+
+        # Busca uma linha a mais só para saber se existe próxima página
+        next_cursor = pessoas[limite - 1].id if len(pessoas) > limite else None
+        return formatar_pagina(pessoas[:limite], next_cursor)
+
+    async def buscar(self, termo: str, limite: int = 50, deslocamento: int = 0) -> Dict:
+        try:
+            pessoas = await self.__repository.buscar_por_nome(
+                termo, COLUNAS_LISTAGEM, limite + 1, deslocamento
+            )
+        except ValueError as e:
+            raise HttpBadRequestError(message=str(e), name="Bad Request") from e
+
+        next_cursor = deslocamento + limite if len(pessoas) > limite else None
+        return formatar_busca(pessoas[:limite], next_cursor)
+
+    async def relatorio_por_categoria(self) -> Dict:
+        linhas = await self.__repository.relatorio_por_categoria()
+        return formatar_relatorio(linhas)
@@ -0,0 +1,30 @@
+from typing import Dict, Iterator
+
+from src.controllers.interfaces.fisica_exportar_controller import (
+    PessoaFisicaExportarControllerInterface,
+)
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+from src.models.sqlite.interfaces.pessoa_fisica_repository import (
+    PessoaFisicaRepositoryInterface,
+)
+
+
+class PessoaFisicaExportarController(PessoaFisicaExportarControllerInterface):
+    def __init__(self, repository: PessoaFisicaRepositoryInterface) -> None:
+        self.__repository = repository
+
+    def exportar(self) -> Iterator[Dict]:
+        for pessoa in self.__repository.iterar_todas():
+            yield self.__format_item(pessoa)
+
+    def __format_item(self, pessoa: PessoaFisicaTable) -> Dict:
+        return {
+            "id": pessoa.id,
+            "nome_completo": pessoa.nome_completo,
+            "email": pessoa.email,
+            "celular": pessoa.celular,
+            "idade": pessoa.idade,
+            "renda_mensal": pessoa.renda_mensal,
+            "categoria": pessoa.categoria,
+            "saldo": pessoa.saldo,
+        }
@@ -1,47 +1,67 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from sqlalchemy.engine import Row
 
 from src.controllers.interfaces.fisica_listar_controller import (
     PessoaFisicaListarControllerInterface,
 )
 from src.errors.error_types.http_not_found import HttpNotFoundError
-from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
 from src.models.sqlite.interfaces.pessoa_fisica_repository import (
     PessoaFisicaRepositoryInterface,
 )
 
+# Colunas lidas do banco: id (cursor) + campos de formatar_pagina
+COLUNAS_LISTAGEM = (
+    "id",
+    "nome_completo",
+    "email",
+    "celular",
+    "idade",
+    "renda_mensal",
+    "categoria",
+    "saldo",
+)
+
 
 class PessoaFisicaListarController(PessoaFisicaListarControllerInterface):
     def __init__(self, repository: PessoaFisicaRepositoryInterface) -> None:
         self.__repository = repository
 
-    def listar(self) -> Dict:
-        pessoas = self.__find_all_pessoas_in_db()
-        return self.__format_response(pessoas)
+    def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
+        pessoas = self.__find_pagina_in_db(limite, apos_id)
 
-    def __find_all_pessoas_in_db(self) -> List[PessoaFisicaTable]:
-        pessoas = self.__repository.listar_todas()
-        if not pessoas:
+        # Busca uma linha a mais só para saber se existe próxima página
+        next_cursor = pessoas[limite - 1].id if len(pessoas) > limite else None
+        return formatar_pagina(pessoas[:limite], next_cursor)
+
+    def __find_pagina_in_db(self, limite: int, apos_id: Optional[int]) -> List[Row]:
+        pessoas = self.__repository.listar_projecao(
+            COLUNAS_LISTAGEM, limite + 1, apos_id
+        )
+        if not pessoas and apos_id is None:
             raise HttpNotFoundError(
                 message="Nenhuma Pessoa Física Cadastrada", name="Not Found"
             )
         return pessoas
 
-    def __format_response(self, pessoas: List[PessoaFisicaTable]) -> Dict:
-        return {
-            "data": {
-                "type": "Pessoa Física",
-                "count": len(pessoas),
-                "attributes": [
-                    {
-                        "nome_completo": pessoa.nome_completo,
-                        "email": pessoa.email,
-                        "celular": pessoa.celular,
-                        "idade": pessoa.idade,
-                        "renda_mensal": pessoa.renda_mensal,
-                        "categoria": pessoa.categoria,
-                        "saldo": pessoa.saldo,
-                    }
-                    for pessoa in pessoas
-                ],
-            }
+
+def formatar_pagina(pessoas: List[Row], next_cursor: Optional[int]) -> Dict:
+    return {
+        "data": {
+            "type": "Pessoa Física",
+            "count": len(pessoas),
+            "attributes": [
+                {
+                    "nome_completo": pessoa.nome_completo,
+                    "email": pessoa.email,
+                    "celular": pessoa.celular,
+                    "idade": pessoa.idade,
+                    "renda_mensal": pessoa.renda_mensal,
+                    "categoria": pessoa.categoria,
+                    "saldo": pessoa.saldo,
+                }
+                for pessoa in pessoas
+            ],
+            "next_cursor": next_cursor,
         }
+    }
@@ -0,0 +1,37 @@
+from typing import Dict, List
+
+from sqlalchemy.engine import Row
+
+from src.controllers.interfaces.fisica_relatorio_controller import (
+    PessoaFisicaRelatorioControllerInterface,
+)
+from src.models.sqlite.interfaces.pessoa_fisica_repository import (
+    PessoaFisicaRepositoryInterface,
+)
+
+
+class PessoaFisicaRelatorioController(PessoaFisicaRelatorioControllerInterface):
+    def __init__(self, repository: PessoaFisicaRepositoryInterface) -> None:
+        self.__repository = repository
+
+    def relatorio_por_categoria(self) -> Dict:
+        linhas = self.__repository.relatorio_por_categoria()
+        return formatar_relatorio(linhas)
+
+
+def formatar_relatorio(linhas: List[Row]) -> Dict:
+    return {
+        "data": {
+            "type": "Relatório Pessoa Física",
+            "count": len(linhas),
+            "attributes": [
+                {
+                    "categoria": linha.categoria,
+                    "quantidade": linha.quantidade,
+                    "saldo_total": linha.saldo_total,
+                    "renda_mensal_media": linha.renda_mensal_media,
+                }
+                for linha in linhas
+            ],
+        }
+    }
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Union
+
+from src.validators.fisica_criar_validator import PessoaFisicaCriarSchema
 
 
 class PessoaFisicaCriarControllerInterface(ABC):
 
     @abstractmethod
-    def criar(self, pessoa_data: Dict):
+    def criar(self, pessoa_data: Union[PessoaFisicaCriarSchema, Dict]):
         pass
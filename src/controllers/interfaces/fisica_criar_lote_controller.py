@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Union
+
+from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.validators.fisica_criar_validator import PessoaFisicaCriarSchema
+
+
+class PessoaFisicaCriarLoteControllerInterface(ABC):
+
+    @abstractmethod
+    def criar_lote(
+        self, itens: List[Union[PessoaFisicaCriarSchema, Dict, HttpBadRequestError]]
+    ) -> Dict:
+        pass
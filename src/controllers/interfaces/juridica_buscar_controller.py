@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+
+
+class PessoaJuridicaBuscarControllerInterface(ABC):
+
+    @abstractmethod
+    def buscar(self, termo: str, limite: int = 50, deslocamento: int = 0) -> Dict:
+        pass
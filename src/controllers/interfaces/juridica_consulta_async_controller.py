@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+
+class PessoaJuridicaConsultaAsyncControllerInterface(ABC):
+
+    @abstractmethod
+    async def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
+        pass
+
+    @abstractmethod
+    async def buscar(self, termo: str, limite: int = 50, deslocamento: int = 0) -> Dict:
+        pass
+
+    @abstractmethod
+    async def relatorio_por_categoria(self) -> Dict:
+        pass
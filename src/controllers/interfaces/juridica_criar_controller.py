@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Union
+
+from src.validators.juridica_criar_validator import PessoaJuridicaCriarSchema
 
 
 class PessoaJuridicaCriarControllerInterface(ABC):
 
     @abstractmethod
-    def criar(self, pessoa_data: Dict):
+    def criar(self, pessoa_data: Union[PessoaJuridicaCriarSchema, Dict]):
         pass
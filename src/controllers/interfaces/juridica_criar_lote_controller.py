@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Union
+
+from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.validators.juridica_criar_validator import PessoaJuridicaCriarSchema
+
+
+class PessoaJuridicaCriarLoteControllerInterface(ABC):
+
+    @abstractmethod
+    def criar_lote(
+        self, itens: List[Union[PessoaJuridicaCriarSchema, Dict, HttpBadRequestError]]
+    ) -> Dict:
+        pass
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator
+
+
+class PessoaJuridicaExportarControllerInterface(ABC):
+
+    @abstractmethod
+    def exportar(self) -> Iterator[Dict]:
+        pass
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Optional
 
 
 class PessoaJuridicaListarControllerInterface(ABC):
 
     @abstractmethod
-    def listar(self) -> Dict:
+    def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
         pass
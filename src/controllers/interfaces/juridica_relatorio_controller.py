@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+
+
+class PessoaJuridicaRelatorioControllerInterface(ABC):
+
+    @abstractmethod
+    def relatorio_por_categoria(self) -> Dict:
+        pass
@@ -1,33 +1,37 @@
-import re
-from typing import Dict
+from typing import Dict, Union
 
 from sqlalchemy.exc import IntegrityError
 
 from src.controllers.interfaces.juridica_criar_controller import (
     PessoaJuridicaCriarControllerInterface,
 )
-from src.errors.error_types.http_bad_request import HttpBadRequestError
 from src.errors.error_types.http_unprocessable_entity import (
     HttpUnprocessableEntityError,
 )
 from src.models.sqlite.interfaces.pessoa_juridica_repository import (
     PessoaJuridicaRepositoryInterface,
 )
+from src.validators.juridica_criar_validator import (
+    PessoaJuridicaCriarSchema,
+    validar_pessoa_juridica,
+)
 
 
 class PessoaJuridicaCriarControler(PessoaJuridicaCriarControllerInterface):
     def __init__(self, repository: PessoaJuridicaRepositoryInterface):
         self.__repository = repository
 
-    def criar(self, pessoa_data: Dict) -> Dict:
+    def criar(self, pessoa_data: Union[PessoaJuridicaCriarSchema, Dict]) -> Dict:
+        """
+        O schema que vem do validator já foi validado e não passa por uma
+        segunda checagem; um dict (chamada direta) é validado por
+        validar_pessoa_juridica.
+        """
+        pessoa = validar_pessoa_juridica(pessoa_data)
         try:
-            self.__validate_all_exists(pessoa_data)
-            self.__validate_values(pessoa_data)
-            pessoa_criada = self.__insert_pessoa_in_db(pessoa_data)
+            pessoa_criada = self.__insert_pessoa_in_db(pessoa.model_dump())
             return self.__format_response(pessoa_criada)
 
-        except ValueError as e:
-            raise HttpBadRequestError(message=str(e), name="Bad Request") from e
         except IntegrityError as e:
             error_msg = str(e.orig)
             if (
@@ -48,63 +52,6 @@ class PessoaJuridicaCriarControler(PessoaJuridicaCriarControllerInterface):
                 message="Dados duplicados no sistema", name="Unprocessable Entity"
             ) from e
 
-    def __validate_all_exists(self, pessoa_data: Dict):
-        campos_obrigatorios = [
-            "nome_fantasia",
-            "email_corporativo",
-            "celular",
-            "categoria",
-            "faturamento",
-            "idade",
-            "saldo",
-        ]
-
-        for campo in campos_obrigatorios:
-            if campo not in pessoa_data:
-                raise ValueError(f"Campo '{campo}' é obrigatório")
-
-            valor = pessoa_data[campo]
-            if valor is None:
-                raise ValueError(f"Campo '{campo}' não pode ser nulo")
-
-            if isinstance(valor, str) and valor.strip() == "":
-                raise ValueError(f"Campo '{campo}' não pode ser vazio")
-
-    def __validate_values(self, pessoa_data: Dict) -> None:
-        # Idade da empresa
-        if not isinstance(pessoa_data["idade"], int):
-            raise ValueError("Idade da empresa deve ser um número inteiro")
-        if pessoa_data["idade"] < 0:
-            raise ValueError("Idade da empresa não deve ser negativa")
-        if pessoa_data["idade"] > 200:
-            raise ValueError("Idade da empresa inválida")
-
-        # Email corporativo
-        email = pessoa_data["email_corporativo"]
-        padrao_email = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(padrao_email, email):
-            raise ValueError("Email corporativo inválido")
-
-        # Celular
-        celular = str(pessoa_data["celular"]).strip()
-        celular_limpo = re.sub(r"\D", "", celular)
-        if len(celular_limpo) not in [10, 11]:
-            raise ValueError("Celular deve ter 10 ou 11 dígitos")
-
-        # Valores monetários
-        try:
-            faturamento = float(pessoa_data["faturamento"])
-            saldo = float(pessoa_data["saldo"])
-        except (ValueError, TypeError) as exc:
-            raise ValueError(
-                "O faturamento e o saldo deve ser valores numéricos válidos"
-            ) from exc
-
-        if faturamento < 0:
-            raise ValueError("O faturamento não pode ser um valor negativo")
-        if saldo < 0:
-            raise ValueError("O saldo não pode ser um valor negativo")
-
     def __insert_pessoa_in_db(self, pessoa_data: Dict):
         return self.__repository.criar_empresa(pessoa_data)
 
@@ -0,0 +1,106 @@
+from typing import Dict, List, Union
+
+from sqlalchemy.exc import IntegrityError
+
+from src.controllers.interfaces.juridica_criar_lote_controller import (
+    PessoaJuridicaCriarLoteControllerInterface,
+)
+from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.errors.error_types.http_error import HttpError
+from src.errors.error_types.http_unprocessable_entity import (
+    HttpUnprocessableEntityError,
+)
+from src.models.sqlite.interfaces.pessoa_juridica_repository import (
+    PessoaJuridicaRepositoryInterface,
+)
+from src.validators.juridica_criar_validator import (
+    PessoaJuridicaCriarSchema,
+    validar_pessoa_juridica,
+)
+
+MENSAGENS_INTEGRIDADE = {
+    "UNIQUE constraint failed: pessoa_juridica.email_corporativo": "Email corporativo já cadastrado no sistema",
+    "UNIQUE constraint failed: pessoa_juridica.celular": "Celular já cadastrado no sistema",
+}
+
+
+class PessoaJuridicaCriarLoteController(PessoaJuridicaCriarLoteControllerInterface):
+    def __init__(self, repository: PessoaJuridicaRepositoryInterface):
+        self.__repository = repository
+
+    def criar_lote(
+        self, itens: List[Union[PessoaJuridicaCriarSchema, Dict, HttpBadRequestError]]
+    ) -> Dict:
+        """
+        Recebe a saída do validator de lote: o schema validado ou o erro de
+        validação de cada item (um dict avulso passa pelo schema aqui). Os
+        itens válidos vão para o banco em uma única chamada; o resultado de
+        cada item sai na posição original.
+        """
+        itens = [self.__validar(item) for item in itens]
+        validos = [
+            (indice, item)
+            for indice, item in enumerate(itens)
+            if not isinstance(item, HttpError)
+        ]
+        inseridos = (
+            self.__repository.criar_empresas_em_lote(
+                [item.model_dump() for _, item in validos]
+            )
+            if validos
+            else []
+        )
+
+        resultados: List[Dict] = [
+            self.__format_erro(indice, item)
+            for indice, item in enumerate(itens)
+            if isinstance(item, HttpError)
+        ]
+        for (indice, _), inserido in zip(validos, inseridos):
+            if isinstance(inserido, IntegrityError):
+                resultados.append(
+                    self.__format_erro(indice, self.__erro_integridade(inserido))
+                )
+            else:
+                resultados.append({"index": indice, "status": 201, "id": inserido})
+        resultados.sort(key=lambda resultado: resultado["index"])
+
+        return self.__format_response(resultados)
+
+    def __validar(self, item):
+        """Mesmo contrato de juridica_criar_controller: dicts passam pelo schema."""
+        if isinstance(item, HttpError):
+            return item
+        try:
+            return validar_pessoa_juridica(item)
+        except HttpBadRequestError as error:
+            return error
+
+    def __erro_integridade(self, error: IntegrityError) -> HttpError:
+        error_msg = str(error.orig)
+        for restricao, mensagem in MENSAGENS_INTEGRIDADE.items():
+            if restricao in error_msg:
+                return HttpUnprocessableEntityError(
+                    message=mensagem, name="Unprocessable Entity"
+                )
+        return HttpUnprocessableEntityError(
+            message="Dados duplicados no sistema", name="Unprocessable Entity"
+        )
+
+    def __format_erro(self, indice: int, error: HttpError) -> Dict:
+        return {
+            "index": indice,
+            "status": error.status_code,
+            "errors": [{"title": error.name, "detail": error.message}],
+        }
+
+    def __format_response(self, resultados: List[Dict]) -> Dict:
+        criados = sum(1 for resultado in resultados if resultado["status"] == 201)
+        return {
+            "data": {
+                "type": "Pessoa Jurídica",
+                "count": criados,
+                "total": len(resultados),
+                "results": resultados,
+            }
+        }
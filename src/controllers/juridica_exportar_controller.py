@@ -0,0 +1,30 @@
+from typing import Dict, Iterator
+
+from src.controllers.interfaces.juridica_exportar_controller import (
+    PessoaJuridicaExportarControllerInterface,
+)
+from src.models.sqlite.entities.pessoa_juridica import PessoaJuridicaTable
+from src.models.sqlite.interfaces.pessoa_juridica_repository import (
+    PessoaJuridicaRepositoryInterface,
+)
+
+
+class PessoaJuridicaExportarController(PessoaJuridicaExportarControllerInterface):
+    def __init__(self, repository: PessoaJuridicaRepositoryInterface) -> None:
+        self.__repository = repository
+
+    def exportar(self) -> Iterator[Dict]:
+        for empresa in self.__repository.iterar_todas():
+            yield self.__format_item(empresa)
+
+    def __format_item(self, empresa: PessoaJuridicaTable) -> Dict:
+        return {
+            "id": empresa.id,
+            "nome_fantasia": empresa.nome_fantasia,
+            "email_corporativo": empresa.email_corporativo,
+            "celular": empresa.celular,
+            "idade": empresa.idade,
+            "faturamento": empresa.faturamento,
+            "categoria": empresa.categoria,
+            "saldo": empresa.saldo,
+        }
@@ -1,47 +1,67 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from sqlalchemy.engine import Row
 
 from src.controllers.interfaces.juridica_listar_controller import (
     PessoaJuridicaListarControllerInterface,
 )
 from src.errors.error_types.http_not_found import HttpNotFoundError
-from src.models.sqlite.entities.pessoa_juridica import PessoaJuridicaTable
 from src.models.sqlite.interfaces.pessoa_juridica_repository import (
     PessoaJuridicaRepositoryInterface,
 )
 
+# Colunas lidas do banco: id (cursor) + campos de formatar_pagina
+COLUNAS_LISTAGEM = (
+    "id",
+    "nome_fantasia",
+    "email_corporativo",
+    "celular",
+    "idade",
+    "faturamento",
+    "categoria",
+    "saldo",
+)
+
 
 class PessoaJuridicaListarController(PessoaJuridicaListarControllerInterface):
     def __init__(self, repository: PessoaJuridicaRepositoryInterface) -> None:
         self.__repository = repository
 
-    def listar(self) -> Dict:
-        pessoas = self.__find_all_pessoa_in_db()
-        return self.__format_response(pessoas)
+    def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
+        pessoas = self.__find_pagina_in_db(limite, apos_id)
 
-    def __find_all_pessoa_in_db(self) -> List[PessoaJuridicaTable]:
-        pessoas = self.__repository.listar_todas()
-        if not pessoas:
+        # Busca uma linha a mais só para saber se existe próxima página
+        next_cursor = pessoas[limite - 1].id if len(pessoas) > limite else None
+        return formatar_pagina(pessoas[:limite], next_cursor)
+
+    def __find_pagina_in_db(self, limite: int, apos_id: Optional[int]) -> List[Row]:
+        pessoas = self.__repository.listar_projecao(
+            COLUNAS_LISTAGEM, limite + 1, apos_id
+        )
+        if not pessoas and apos_id is None:
             raise HttpNotFoundError(
                 message="Nenhuma Pessoa Jurídica Cadastrada", name="Not Found"
             )
         return pessoas
 
-    def __format_response(self, pessoas: List[PessoaJuridicaTable]) -> Dict:
-        return {
-            "data": {
-                "type": "Pessoa Jurídica",
-                "count": len(pessoas),
-                "attributes": [
-                    {
-                        "nome_fantasia": pessoa.nome_fantasia,
-                        "email_corporativo": pessoa.email_corporativo,
-                        "celular": pessoa.celular,
-                        "idade": pessoa.idade,
-                        "faturamento": pessoa.faturamento,
-                        "categoria": pessoa.categoria,
-                        "saldo": pessoa.saldo,
-                    }
-                    for pessoa in pessoas
-                ],
-            }
+
+def formatar_pagina(pessoas: List[Row], next_cursor: Optional[int]) -> Dict:
+    return {
+        "data": {
+            "type": "Pessoa Jurídica",
+            "count": len(pessoas),
+            "attributes": [
+                {
+                    "nome_fantasia": pessoa.nome_fantasia,
+                    "email_corporativo": pessoa.email_corporativo,
+                    "celular": pessoa.celular,
+                    "idade": pessoa.idade,
+                    "faturamento": pessoa.faturamento,
+                    "categoria": pessoa.categoria,
+                    "saldo": pessoa.saldo,
+                }
+                for pessoa in pessoas
+            ],
+            "next_cursor": next_cursor,
         }
+    }
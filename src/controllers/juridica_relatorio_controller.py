@@ -0,0 +1,39 @@
+from typing import Dict, List
+
+from sqlalchemy.engine import Row
+
+from src.controllers.interfaces.juridica_relatorio_controller import (
+    PessoaJuridicaRelatorioControllerInterface,
+)
+from src.models.sqlite.interfaces.pessoa_juridica_repository import (
+    PessoaJuridicaRepositoryInterface,
+)
+
+
+class PessoaJuridicaRelatorioController(PessoaJuridicaRelatorioControllerInterface):
+    def __init__(self, repository: PessoaJuridicaRepositoryInterface) -> None:
+        self.__repository = repository
+
+    def relatorio_por_categoria(self) -> Dict:
+        linhas = self.__repository.relatorio_por_categoria()
+        return formatar_relatorio(linhas)
+
+
+def formatar_relatorio(linhas: List[Row]) -> Dict:
+    return {
+        "data": {
+            "type": "Relatório Pessoa Jurídica",
+            "count": len(linhas),
+            "attributes": [
+                {
+                    "categoria": linha.categoria,
+                    "quantidade": linha.quantidade,
+                    "saldo_total": linha.saldo_total,
+                    "faturamento_medio": linha.faturamento_medio,
+                    "faturamento_minimo": linha.faturamento_minimo,
+                    "faturamento_maximo": linha.faturamento_maximo,
+                }
+                for linha in linhas
+            ],
+        }
+    }
@@ -0,0 +1,75 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.controllers.fisica_buscar_controller import PessoaFisicaBuscarController
+from src.controllers.fisica_listar_controller import COLUNAS_LISTAGEM
+from src.errors.error_types.http_bad_request import HttpBadRequestError
+
+
+def _pessoa(pessoa_id, nome):
+    return SimpleNamespace(
+        id=pessoa_id,
+        nome_completo=nome,
+        email=f"pessoa{pessoa_id}@gmail.com",
+        celular="32903191239",
+        idade=30,
+        renda_mensal=Decimal("5000.00"),
+        categoria="Cliente",
+        saldo=Decimal("100.00"),
+    )
+
+
+class MockPessoaFisicaRepository:
+    def __init__(self, pessoas):
+        self.pessoas = pessoas
+        self.chamadas = []
+
+    def buscar_por_nome(self, termo, colunas, limite, deslocamento=0):
+        self.chamadas.append((termo, colunas, limite, deslocamento))
+        if not termo.strip():
+            raise ValueError("Informe ao menos uma palavra para a busca")
+        return self.pessoas[deslocamento : deslocamento + limite]
+
+
+def test_buscar_com_proxima_pagina():
+    pessoas = [_pessoa(i, f"Harvey {i}") for i in range(1, 4)]
+    repository = MockPessoaFisicaRepository(pessoas)
+    controller = PessoaFisicaBuscarController(repository)  # type: ignore
+
+    response = controller.buscar("harv", limite=2)
+
+    assert repository.chamadas == [("harv", COLUNAS_LISTAGEM, 3, 0)]
+    assert response["data"]["count"] == 2
+    assert response["data"]["next_cursor"] == 2
+    assert response["data"]["attributes"][0]["id"] == 1
+    assert response["data"]["attributes"][0]["nome_completo"] == "Harvey 1"
+
+
+def test_buscar_ultima_pagina():
+    pessoas = [_pessoa(i, f"Harvey {i}") for i in range(1, 4)]
+    controller = PessoaFisicaBuscarController(
+        MockPessoaFisicaRepository(pessoas)  # type: ignore
+    )
+
+    response = controller.buscar("harv", limite=2, deslocamento=2)
+
+    assert response["data"]["count"] == 1
+    assert response["data"]["next_cursor"] is None
+
+
+def test_buscar_sem_resultados():
+    controller = PessoaFisicaBuscarController(MockPessoaFisicaRepository([]))  # type: ignore
+
+    response = controller.buscar("ninguem")
+
+    assert response["data"]["count"] == 0
+    assert response["data"]["attributes"] == []
+
+
+def test_buscar_termo_invalido():
+    controller = PessoaFisicaBuscarController(MockPessoaFisicaRepository([]))  # type: ignore
+
+    with pytest.raises(HttpBadRequestError):
+        controller.buscar("   ")
@@ -5,6 +5,7 @@ import pytest
 
 from src.controllers.fisica_criar_controller import PessoaFisicaCriarController
 from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.validators.fisica_criar_validator import PessoaFisicaCriarSchema
 
 
 class MockPessoaFisica:  # pylint: disable=too-many-instance-attributes
@@ -72,4 +73,22 @@ def test_criar_error():
     with pytest.raises(HttpBadRequestError) as exc_info:
         controller.criar(pessoa_data)
 
-    assert "Email inválido" in str(exc_info.value)
+    assert exc_info.value.message.startswith("email: ")
+
+
+def test_criar_nao_revalida_schema_ja_validado():
+    # model_construct não valida: o controller confia no schema recebido
+    pessoa = PessoaFisicaCriarSchema.model_construct(
+        nome_completo="Dr. Shaun Murphy",
+        email="sem-validacao",
+        celular="1",
+        idade=25,
+        renda_mensal=Decimal("250000"),
+        categoria="A",
+        saldo=Decimal("45000000"),
+    )
+
+    controller = PessoaFisicaCriarController(MockPessoaFisicaRepository())  # type: ignore
+    response = controller.criar(pessoa)
+
+    assert response["data"]["attributes"]["email"] == "sem-validacao"
@@ -0,0 +1,117 @@
+from unittest.mock import Mock
+
+from sqlalchemy.exc import IntegrityError
+
+from src.controllers.fisica_criar_lote_controller import PessoaFisicaCriarLoteController
+from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.validators.fisica_criar_validator import PessoaFisicaCriarSchema
+
+
+def _integrity_error(mensagem):
+    return IntegrityError("INSERT", {}, Exception(mensagem))
+
+
+def _pessoa(nome):
+    return PessoaFisicaCriarSchema(
+        nome_completo=nome,
+        email=f"{nome.lower()}@gmail.com",
+        celular="11987654321",
+        idade=30,
+        renda_mensal="1000.00",
+        categoria="A",
+        saldo="0",
+    )
+
+
+def test_criar_lote_resultados_por_item():
+    repository = Mock()
+    repository.criar_pessoas_em_lote.return_value = [
+        10,
+        _integrity_error("UNIQUE constraint failed: pessoa_fisica.email"),
+        _integrity_error("UNIQUE constraint failed: pessoa_fisica.celular"),
+    ]
+    controller = PessoaFisicaCriarLoteController(repository)
+    itens = [
+        _pessoa("Ana"),
+        HttpBadRequestError(message="idade: muito baixa", name="Bad Request"),
+        _pessoa("Bia"),
+        _pessoa("Caio"),
+    ]
+
+    response = controller.criar_lote(itens)
+
+    repository.criar_pessoas_em_lote.assert_called_once_with(
+        [
+            _pessoa("Ana").model_dump(),
+            _pessoa("Bia").model_dump(),
+            _pessoa("Caio").model_dump(),
+        ]
+    )
+    assert response == {
+        "data": {
+            "type": "Pessoa Física",
+            "count": 1,
+            "total": 4,
+            "results": [
+                {"index": 0, "status": 201, "id": 10},
+                {
+                    "index": 1,
+                    "status": 400,
+                    "errors": [
+                        {"title": "Bad Request", "detail": "idade: muito baixa"}
+                    ],
+                },
+                {
+                    "index": 2,
+                    "status": 422,
+                    "errors": [
+                        {
+                            "title": "Unprocessable Entity",
+                            "detail": "Email já cadastrado no sistema",
+                        }
+                    ],
+                },
+                {
+                    "index": 3,
+                    "status": 422,
+                    "errors": [
+                        {
+                            "title": "Unprocessable Entity",
+                            "detail": "Celular já cadastrado no sistema",
+                        }
+                    ],
+                },
+            ],
+        }
+    }
+
+
+def test_criar_lote_sem_itens_validos_nao_acessa_banco():
+    repository = Mock()
+    controller = PessoaFisicaCriarLoteController(repository)
+
+    response = controller.criar_lote(
+        [HttpBadRequestError(message="email: inválido", name="Bad Request")]
+    )
+
+    repository.criar_pessoas_em_lote.assert_not_called()
+    assert response["data"]["count"] == 0
+    assert response["data"]["total"] == 1
+
+
+def test_criar_lote_valida_dicts_de_chamadas_diretas():
+    repository = Mock()
+    repository.criar_pessoas_em_lote.return_value = [10]
+    controller = PessoaFisicaCriarLoteController(repository)
+
+    response = controller.criar_lote(
+        [_pessoa("Ana").model_dump(), {"nome_completo": "Bia"}]
+    )
+
+    repository.criar_pessoas_em_lote.assert_called_once_with(
+        [_pessoa("Ana").model_dump()]
+    )
+    resultados = response["data"]["results"]
+    assert resultados[0] == {"index": 0, "status": 201, "id": 10}
+    assert resultados[1]["status"] == 400
+    assert "email" in resultados[1]["errors"][0]["detail"]
@@ -0,0 +1,52 @@
+import types
+from decimal import Decimal
+
+from src.controllers.fisica_exportar_controller import PessoaFisicaExportarController
+
+
+class MockPessoaFisicaRepository:
+    def __init__(self, quantidade):
+        self.quantidade = quantidade
+        self.consumidas = 0
+
+    def iterar_todas(self, tamanho_lote=1000):
+        for i in range(1, self.quantidade + 1):
+            self.consumidas += 1
+            yield types.SimpleNamespace(
+                id=i,
+                nome_completo=f"Pessoa {i}",
+                email=f"pessoa{i}@gmail.com",
+                celular=f"8890000000{i}",
+                idade=30,
+                renda_mensal=Decimal("1000"),
+                categoria="A",
+                saldo=Decimal("100"),
+            )
+
+
+def test_exportar_formata_registros():
+    controller = PessoaFisicaExportarController(MockPessoaFisicaRepository(2))  # type: ignore
+
+    registros = list(controller.exportar())
+
+    assert registros[0] == {
+        "id": 1,
+        "nome_completo": "Pessoa 1",
+        "email": "pessoa1@gmail.com",
+        "celular": "88900000001",
+        "idade": 30,
+        "renda_mensal": Decimal("1000"),
+        "categoria": "A",
+        "saldo": Decimal("100"),
+    }
+    assert [registro["id"] for registro in registros] == [1, 2]
+
+
+def test_exportar_e_preguicoso():
+    repository = MockPessoaFisicaRepository(1000)
+    controller = PessoaFisicaExportarController(repository)  # type: ignore
+
+    registros = controller.exportar()
+    next(registros)
+
+    assert repository.consumidas == 1
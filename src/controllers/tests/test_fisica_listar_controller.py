@@ -2,14 +2,26 @@ from decimal import Decimal
 
 import pytest
 
-from src.controllers.fisica_listar_controller import PessoaFisicaListarController
+from src.controllers.fisica_listar_controller import (
+    COLUNAS_LISTAGEM,
+    PessoaFisicaListarController,
+)
 from src.errors.error_types.http_not_found import HttpNotFoundError
 
 
-class MockPessoaFisica:
+class MockPessoaFisica:  # pylint: disable=too-many-instance-attributes
     def __init__(
-        self, nome_completo, email, celular, idade, renda_mensal, categoria, saldo
+        self,
+        nome_completo,
+        email,
+        celular,
+        idade,
+        renda_mensal,
+        categoria,
+        saldo,
+        id=None,  # pylint: disable=redefined-builtin
     ) -> None:
+        self.id = id
         self.nome_completo = nome_completo
         self.email = email
         self.celular = celular
@@ -23,7 +35,7 @@ class MockPessoaFisicaRepository:
     def __init__(self, retornar_vazio=False):
         self.retornar_vazio = retornar_vazio
 
-    def listar_todas(self):
+    def listar_projecao(self, colunas, limite, apos_id=None):
         if self.retornar_vazio:
             return []
 
@@ -60,6 +72,7 @@ def test_listar_sucesso():
                     "saldo": Decimal("2000000"),
                 },
             ],
+            "next_cursor": None,
         }
     }
 
@@ -77,7 +90,7 @@ def test_listar_nao_encontrado():
 
 def test_listar_multiplas_pessoas():
     class MockRepositoryMultiplo:
-        def listar_todas(self):
+        def listar_projecao(self, colunas, limite, apos_id=None):
             return [
                 MockPessoaFisica(
                     nome_completo="Dr. Neil Melendez",
@@ -106,3 +119,45 @@ def test_listar_multiplas_pessoas():
     assert len(response["data"]["attributes"]) == 2
     assert response["data"]["attributes"][0]["nome_completo"] == "Dr. Neil Melendez"
     assert response["data"]["attributes"][1]["nome_completo"] == "Dr.ª Claire Browne"
+
+
+def test_listar_pagina_com_proximo_cursor():
+    class MockRepositoryPaginado:
+        def __init__(self):
+            self.chamadas = []
+
+        def listar_projecao(self, colunas, limite, apos_id=None):
+            self.chamadas.append((colunas, limite, apos_id))
+            pessoas = []
+            for i in range(1, 6):
+                pessoa = MockPessoaFisica(
+                    nome_completo=f"Pessoa {i}",
+                    email=f"pessoa{i}@gmail.com",
+                    celular=f"8890000000{i}",
+                    idade=30,
+                    renda_mensal=Decimal("1000"),
+                    categoria="A",
+                    saldo=Decimal("100"),
+                    id=i,
+                )
+                pessoas.append(pessoa)
+            return pessoas[:limite]
+
+    repository = MockRepositoryPaginado()
+    controller = PessoaFisicaListarController(repository)  # type: ignore
+
+    response = controller.listar(limite=2, apos_id=10)
+
+    assert repository.chamadas == [(COLUNAS_LISTAGEM, 3, 10)]
+    assert response["data"]["count"] == 2
+    assert response["data"]["next_cursor"] == 2
+
+
+def test_listar_pagina_apos_o_fim():
+    controller = PessoaFisicaListarController(MockPessoaFisicaRepository(retornar_vazio=True))  # type: ignore
+
+    response = controller.listar(limite=10, apos_id=99)
+
+    assert response["data"]["count"] == 0
+    assert response["data"]["attributes"] == []
+    assert response["data"]["next_cursor"] is None
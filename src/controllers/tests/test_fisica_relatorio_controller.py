@@ -0,0 +1,52 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from src.controllers.fisica_relatorio_controller import PessoaFisicaRelatorioController
+
+
+class MockPessoaFisicaRepository:
+    def __init__(self, linhas):
+        self.linhas = linhas
+
+    def relatorio_por_categoria(self):
+        return self.linhas
+
+
+def test_relatorio_por_categoria():
+    repository = MockPessoaFisicaRepository(
+        [
+            SimpleNamespace(
+                categoria="Associado",
+                quantidade=2,
+                saldo_total=Decimal("3000.00"),
+                renda_mensal_media=Decimal("4500.00"),
+            )
+        ]
+    )
+    controller = PessoaFisicaRelatorioController(repository)  # type: ignore
+
+    response = controller.relatorio_por_categoria()
+
+    assert response == {
+        "data": {
+            "type": "Relatório Pessoa Física",
+            "count": 1,
+            "attributes": [
+                {
+                    "categoria": "Associado",
+                    "quantidade": 2,
+                    "saldo_total": Decimal("3000.00"),
+                    "renda_mensal_media": Decimal("4500.00"),
+                }
+            ],
+        }
+    }
+
+
+def test_relatorio_sem_contas():
+    controller = PessoaFisicaRelatorioController(MockPessoaFisicaRepository([]))  # type: ignore
+
+    response = controller.relatorio_por_categoria()
+
+    assert response["data"]["count"] == 0
+    assert response["data"]["attributes"] == []
@@ -72,4 +72,4 @@ def test_criar_error():
     with pytest.raises(HttpBadRequestError) as exc_info:
         controller.criar(pessoa_data)
 
-    assert "Email corporativo inválido" in str(exc_info.value)
+    assert exc_info.value.message.startswith("email_corporativo: ")
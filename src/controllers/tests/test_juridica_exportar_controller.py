@@ -0,0 +1,37 @@
+import types
+from decimal import Decimal
+
+from src.controllers.juridica_exportar_controller import (
+    PessoaJuridicaExportarController,
+)
+
+
+class MockPessoaJuridicaRepository:
+    def iterar_todas(self, tamanho_lote=1000):
+        yield types.SimpleNamespace(
+            id=7,
+            nome_fantasia="Vivo Keyd Stars",
+            email_corporativo="vivokeydstars@gmail.com",
+            celular="(55) 9 0808-2112",
+            idade=8,
+            faturamento=Decimal("590000"),
+            categoria="League of Legends",
+            saldo=Decimal("1100000"),
+        )
+
+
+def test_exportar_formata_registros():
+    controller = PessoaJuridicaExportarController(MockPessoaJuridicaRepository())  # type: ignore
+
+    assert list(controller.exportar()) == [
+        {
+            "id": 7,
+            "nome_fantasia": "Vivo Keyd Stars",
+            "email_corporativo": "vivokeydstars@gmail.com",
+            "celular": "(55) 9 0808-2112",
+            "idade": 8,
+            "faturamento": Decimal("590000"),
+            "categoria": "League of Legends",
+            "saldo": Decimal("1100000"),
+        }
+    ]
@@ -6,7 +6,7 @@ from src.controllers.juridica_listar_controller import PessoaJuridicaListarContr
 from src.errors.error_types.http_not_found import HttpNotFoundError
 
 
-class MockPessoaJuridica:
+class MockPessoaJuridica:  # pylint: disable=too-many-instance-attributes
     def __init__(
         self,
         nome_fantasia,
@@ -16,7 +16,9 @@ class MockPessoaJuridica:
         faturamento,
         categoria,
         saldo,
+        id=None,  # pylint: disable=redefined-builtin
     ):
+        self.id = id
         self.nome_fantasia = nome_fantasia
         self.email_corporativo = email_corporativo
         self.celular = celular
@@ -30,7 +32,7 @@ class MockPessoaJuridicaRepository:
     def __init__(self, retornar_vazio=False):
         self.retornar_vazio = retornar_vazio
 
-    def listar_todas(self):
+    def listar_projecao(self, colunas, limite, apos_id=None):
         if self.retornar_vazio:
             return []
 
@@ -67,6 +69,7 @@ def test_listar_sucesso():
                     "saldo": Decimal("450000000"),
                 }
             ],
+            "next_cursor": None,
         }
     }
 
@@ -84,7 +87,7 @@ def test_nao_encontrado():
 
 def test_listar_multiplas_pessoas():
     class MockRepositoryMultiplo:
-        def listar_todas(self):
+        def listar_projecao(self, colunas, limite, apos_id=None):
             return [
                 MockPessoaJuridica(
                     nome_fantasia="Hospital Sírio-Libanês",
@@ -118,3 +121,30 @@ def test_listar_multiplas_pessoas():
         response["data"]["attributes"][1]["nome_fantasia"]
         == "Hospital Alemão Oswaldo Cruz"
     )
+
+
+def test_listar_pagina_com_proximo_cursor():
+    class MockRepositoryPaginado:
+        def listar_projecao(self, colunas, limite, apos_id=None):
+            empresas = []
+            for i in range(apos_id + 1, apos_id + 4):
+                empresa = MockPessoaJuridica(
+                    nome_fantasia=f"Empresa {i}",
+                    email_corporativo=f"empresa{i}@gmail.com",
+                    celular=f"8870000000{i}",
+                    idade=5,
+                    faturamento=Decimal("1000"),
+                    categoria="A",
+                    saldo=Decimal("100"),
+                    id=i,
+                )
+                empresas.append(empresa)
+            return empresas[:limite]
+
+    controller = PessoaJuridicaListarController(MockRepositoryPaginado())  # type: ignore
+
+    response = controller.listar(limite=2, apos_id=4)
+
+    assert response["data"]["count"] == 2
+    assert response["data"]["attributes"][0]["nome_fantasia"] == "Empresa 5"
+    assert response["data"]["next_cursor"] == 6
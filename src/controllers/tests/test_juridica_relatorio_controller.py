@@ -0,0 +1,38 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from src.controllers.juridica_relatorio_controller import (
+    PessoaJuridicaRelatorioController,
+)
+
+
+class MockPessoaJuridicaRepository:
+    def relatorio_por_categoria(self):
+        return [
+            SimpleNamespace(
+                categoria="Saúde",
+                quantidade=3,
+                saldo_total=Decimal("900.00"),
+                faturamento_medio=Decimal("200.00"),
+                faturamento_minimo=Decimal("100.00"),
+                faturamento_maximo=Decimal("300.00"),
+            )
+        ]
+
+
+def test_relatorio_por_categoria():
+    controller = PessoaJuridicaRelatorioController(MockPessoaJuridicaRepository())  # type: ignore
+
+    response = controller.relatorio_por_categoria()
+
+    assert response["data"]["type"] == "Relatório Pessoa Jurídica"
+    assert response["data"]["attributes"] == [
+        {
+            "categoria": "Saúde",
+            "quantidade": 3,
+            "saldo_total": Decimal("900.00"),
+            "faturamento_medio": Decimal("200.00"),
+            "faturamento_minimo": Decimal("100.00"),
+            "faturamento_maximo": Decimal("300.00"),
+        }
+    ]
@@ -0,0 +1,39 @@
+from src.controllers.fisica_consulta_async_controller import (
+    PessoaFisicaConsultaAsyncController,
+)
+from src.controllers.juridica_consulta_async_controller import (
+    PessoaJuridicaConsultaAsyncController,
+)
+from src.models.sqlite.repositories.pessoa_fisica_async_repository import (
+    PessoaFisicaAsyncRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_async_repository import (
+    PessoaJuridicaAsyncRepository,
+)
+from src.views.consulta_async_views import (
+    BuscarAsyncViews,
+    ListarAsyncViews,
+    RelatorioAsyncViews,
+)
+
+
+class AsyncAppContainer:
+    """
+    Views assíncronas do app ASGI, montadas uma única vez sobre o
+    AsyncDBConnectionHandler. Os nomes seguem os do AppContainer.
+    """
+
+    def __init__(self, db_connection) -> None:
+        fisica = PessoaFisicaConsultaAsyncController(
+            PessoaFisicaAsyncRepository(db_connection)
+        )
+        self.fisica_listar = ListarAsyncViews(fisica)
+        self.fisica_buscar = BuscarAsyncViews(fisica)
+        self.fisica_relatorio = RelatorioAsyncViews(fisica)
+
+        juridica = PessoaJuridicaConsultaAsyncController(
+            PessoaJuridicaAsyncRepository(db_connection)
+        )
+        self.juridica_listar = ListarAsyncViews(juridica)
+        self.juridica_buscar = BuscarAsyncViews(juridica)
+        self.juridica_relatorio = RelatorioAsyncViews(juridica)
@@ -0,0 +1,54 @@
+from flask import Flask, current_app
+
+from src.main.composer.fisica_buscar_composer import fisica_buscar_composer
+from src.main.composer.fisica_criar_composer import fisica_criar_composer
+from src.main.composer.fisica_criar_lote_composer import fisica_criar_lote_composer
+from src.main.composer.fisica_exportar_composer import fisica_exportar_composer
+from src.main.composer.fisica_listar_composer import fisica_listar_composer
+from src.main.composer.fisica_relatorio_composer import fisica_relatorio_composer
+from src.main.composer.juridica_buscar_composer import juridica_buscar_composer
+from src.main.composer.juridica_criar_composer import juridica_criar_composer
+from src.main.composer.juridica_criar_lote_composer import juridica_criar_lote_composer
+from src.main.composer.juridica_exportar_composer import juridica_exportar_composer
+from src.main.composer.juridica_listar_composer import juridica_listar_composer
+from src.main.composer.juridica_relatorio_composer import juridica_relatorio_composer
+
+EXTENSAO = "banking_container"
+
+
+class AppContainer:  # pylint: disable=too-many-instance-attributes
+    """
+    Views da API montadas uma única vez por processo.
+
+    Repositórios, controllers e views não guardam estado de requisição, então
+    podem ser compartilhados entre threads. O único recurso por requisição é
+    a sessão do banco, que o DBConnectionHandler já isola por thread
+    (scoped_session) dentro de cada bloco `with`.
+    """
+
+    def __init__(self) -> None:
+        self.fisica_criar = fisica_criar_composer()
+        self.fisica_criar_lote = fisica_criar_lote_composer()
+        self.fisica_listar = fisica_listar_composer()
+        self.fisica_buscar = fisica_buscar_composer()
+        self.fisica_exportar = fisica_exportar_composer()
+        self.fisica_relatorio = fisica_relatorio_composer()
+
+        self.juridica_criar = juridica_criar_composer()
+        self.juridica_criar_lote = juridica_criar_lote_composer()
+        self.juridica_listar = juridica_listar_composer()
+        self.juridica_buscar = juridica_buscar_composer()
+        self.juridica_exportar = juridica_exportar_composer()
+        self.juridica_relatorio = juridica_relatorio_composer()
+
+
+def registrar_container(app: Flask) -> AppContainer:
+    """Cria o container de `app` no primeiro registro; depois só o retorna."""
+    if EXTENSAO not in app.extensions:
+        app.extensions[EXTENSAO] = AppContainer()
+    return app.extensions[EXTENSAO]
+
+
+def container() -> AppContainer:
+    """Container da aplicação que está atendendo a requisição atual."""
+    return current_app.extensions[EXTENSAO]
@@ -0,0 +1,17 @@
+from src.controllers.fisica_buscar_controller import PessoaFisicaBuscarController
+from src.models.sqlite.repositories.pessoa_fisica_cache_repository import (
+    PessoaFisicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.settings.connection import db_connection_handler
+from src.views.fisica_buscar_views import PessoaFisicaBuscarViews
+
+
+def fisica_buscar_composer():
+    model = PessoaFisicaCacheRepository(PessoaFisicaRepository(db_connection_handler))
+    controller = PessoaFisicaBuscarController(model)
+    view = PessoaFisicaBuscarViews(controller)
+
+    return view
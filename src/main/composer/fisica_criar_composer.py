@@ -1,4 +1,7 @@
 from src.controllers.fisica_criar_controller import PessoaFisicaCriarController
+from src.models.sqlite.repositories.pessoa_fisica_cache_repository import (
+    PessoaFisicaCacheRepository,
+)
 from src.models.sqlite.repositories.pessoa_fisica_repository import (
     PessoaFisicaRepository,
 )
@@ -7,7 +10,7 @@ from src.views.fisica_criar_views import PessoaFisicaCriarView
 
 
 def fisica_criar_composer():
-    model = PessoaFisicaRepository(db_connection_handler)
+    model = PessoaFisicaCacheRepository(PessoaFisicaRepository(db_connection_handler))
     controller = PessoaFisicaCriarController(model)
     view = PessoaFisicaCriarView(controller)
 
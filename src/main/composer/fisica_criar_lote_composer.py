@@ -0,0 +1,17 @@
+from src.controllers.fisica_criar_lote_controller import PessoaFisicaCriarLoteController
+from src.models.sqlite.repositories.pessoa_fisica_cache_repository import (
+    PessoaFisicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.settings.connection import db_connection_handler
+from src.views.fisica_criar_lote_views import PessoaFisicaCriarLoteView
+
+
+def fisica_criar_lote_composer():
+    model = PessoaFisicaCacheRepository(PessoaFisicaRepository(db_connection_handler))
+    controller = PessoaFisicaCriarLoteController(model)
+    view = PessoaFisicaCriarLoteView(controller)
+
+    return view
@@ -0,0 +1,17 @@
+from src.controllers.fisica_exportar_controller import PessoaFisicaExportarController
+from src.models.sqlite.repositories.pessoa_fisica_cache_repository import (
+    PessoaFisicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.settings.connection import db_connection_handler
+from src.views.fisica_exportar_views import PessoaFisicaExportarViews
+
+
+def fisica_exportar_composer():
+    model = PessoaFisicaCacheRepository(PessoaFisicaRepository(db_connection_handler))
+    controller = PessoaFisicaExportarController(model)
+    view = PessoaFisicaExportarViews(controller)
+
+    return view
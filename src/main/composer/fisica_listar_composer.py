@@ -1,4 +1,7 @@
 from src.controllers.fisica_listar_controller import PessoaFisicaListarController
+from src.models.sqlite.repositories.pessoa_fisica_cache_repository import (
+    PessoaFisicaCacheRepository,
+)
 from src.models.sqlite.repositories.pessoa_fisica_repository import (
     PessoaFisicaRepository,
 )
@@ -7,7 +10,7 @@ from src.views.fisica_listar_views import PessoaFisicaListarViews
 
 
 def fisica_listar_composer():
-    model = PessoaFisicaRepository(db_connection_handler)
+    model = PessoaFisicaCacheRepository(PessoaFisicaRepository(db_connection_handler))
     controller = PessoaFisicaListarController(model)
     view = PessoaFisicaListarViews(controller)
 
@@ -0,0 +1,17 @@
+from src.controllers.fisica_relatorio_controller import PessoaFisicaRelatorioController
+from src.models.sqlite.repositories.pessoa_fisica_cache_repository import (
+    PessoaFisicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.settings.connection import db_connection_handler
+from src.views.fisica_relatorio_views import PessoaFisicaRelatorioViews
+
+
+def fisica_relatorio_composer():
+    model = PessoaFisicaCacheRepository(PessoaFisicaRepository(db_connection_handler))
+    controller = PessoaFisicaRelatorioController(model)
+    view = PessoaFisicaRelatorioViews(controller)
+
+    return view
@@ -0,0 +1,19 @@
+from src.controllers.juridica_buscar_controller import PessoaJuridicaBuscarController
+from src.models.sqlite.repositories.pessoa_juridica_cache_repository import (
+    PessoaJuridicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+from src.models.sqlite.settings.connection import db_connection_handler
+from src.views.juridica_buscar_views import PessoaJuridicaBuscarViews
+
+
+def juridica_buscar_composer():
+    model = PessoaJuridicaCacheRepository(
+        PessoaJuridicaRepository(db_connection_handler)
+    )
+    controller = PessoaJuridicaBuscarController(model)
+    view = PessoaJuridicaBuscarViews(controller)
+
+    return view
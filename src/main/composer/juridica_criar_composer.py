@@ -1,4 +1,7 @@
 from src.controllers.juridica_criar_controller import PessoaJuridicaCriarControler
+from src.models.sqlite.repositories.pessoa_juridica_cache_repository import (
+    PessoaJuridicaCacheRepository,
+)
 from src.models.sqlite.repositories.pessoa_juridica_repository import (
     PessoaJuridicaRepository,
 )
@@ -7,7 +10,9 @@ from src.views.juridica_criar_views import PessoaJuridicaCriarViews
 
 
 def juridica_criar_composer():
-    model = PessoaJuridicaRepository(db_connection_handler)
+    model = PessoaJuridicaCacheRepository(
+        PessoaJuridicaRepository(db_connection_handler)
+    )
     controller = PessoaJuridicaCriarControler(model)
     view = PessoaJuridicaCriarViews(controller)
 
@@ -0,0 +1,21 @@
+from src.controllers.juridica_criar_lote_controller import (
+    PessoaJuridicaCriarLoteController,
+)
+from src.models.sqlite.repositories.pessoa_juridica_cache_repository import (
+    PessoaJuridicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+from src.models.sqlite.settings.connection import db_connection_handler
+from src.views.juridica_criar_lote_views import PessoaJuridicaCriarLoteView
+
+
+def juridica_criar_lote_composer():
+    model = PessoaJuridicaCacheRepository(
+        PessoaJuridicaRepository(db_connection_handler)
+    )
+    controller = PessoaJuridicaCriarLoteController(model)
+    view = PessoaJuridicaCriarLoteView(controller)
+
+    return view
@@ -0,0 +1,21 @@
+from src.controllers.juridica_exportar_controller import (
+    PessoaJuridicaExportarController,
+)
+from src.models.sqlite.repositories.pessoa_juridica_cache_repository import (
+    PessoaJuridicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+from src.models.sqlite.settings.connection import db_connection_handler
+from src.views.juridica_exportar_views import PessoaJuridicaExportarViews
+
+
+def juridica_exportar_composer():
+    model = PessoaJuridicaCacheRepository(
+        PessoaJuridicaRepository(db_connection_handler)
+    )
+    controller = PessoaJuridicaExportarController(model)
+    view = PessoaJuridicaExportarViews(controller)
+
+    return view
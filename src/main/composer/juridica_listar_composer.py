@@ -1,4 +1,7 @@
 from src.controllers.juridica_listar_controller import PessoaJuridicaListarController
+from src.models.sqlite.repositories.pessoa_juridica_cache_repository import (
+    PessoaJuridicaCacheRepository,
+)
 from src.models.sqlite.repositories.pessoa_juridica_repository import (
     PessoaJuridicaRepository,
 )
@@ -7,7 +10,9 @@ from src.views.juridica_listar_views import PessoaJuridicaListaView
 
 
 def juridica_listar_composer():
-    model = PessoaJuridicaRepository(db_connection_handler)
+    model = PessoaJuridicaCacheRepository(
+        PessoaJuridicaRepository(db_connection_handler)
+    )
     controller = PessoaJuridicaListarController(model)
     view = PessoaJuridicaListaView(controller)
 
@@ -0,0 +1,21 @@
+from src.controllers.juridica_relatorio_controller import (
+    PessoaJuridicaRelatorioController,
+)
+from src.models.sqlite.repositories.pessoa_juridica_cache_repository import (
+    PessoaJuridicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+from src.models.sqlite.settings.connection import db_connection_handler
+from src.views.juridica_relatorio_views import PessoaJuridicaRelatorioViews
+
+
+def juridica_relatorio_composer():
+    model = PessoaJuridicaCacheRepository(
+        PessoaJuridicaRepository(db_connection_handler)
+    )
+    controller = PessoaJuridicaRelatorioController(model)
+    view = PessoaJuridicaRelatorioViews(controller)
+
+    return view
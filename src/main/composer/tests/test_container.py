@@ -0,0 +1,73 @@
+import importlib
+from unittest.mock import Mock
+
+import pytest
+from flask import Flask
+
+from src.main.composer import container as container_module
+from src.main.composer import fisica_listar_composer
+from src.main.composer.container import EXTENSAO, AppContainer, container
+from src.main.routes.pessoa_fisica_routes import pessoa_fisica_route_bp
+from src.main.routes.pessoa_juridica_routes import pessoa_juridica_route_bp
+from src.models.sqlite.repositories.pessoa_fisica_cache_repository import (
+    PessoaFisicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_cache_repository import (
+    PessoaJuridicaCacheRepository,
+)
+from src.views.fisica_listar_views import PessoaFisicaListarViews
+
+
+def _criar_app():
+    app = Flask(__name__)
+    app.register_blueprint(pessoa_fisica_route_bp)
+    app.register_blueprint(pessoa_juridica_route_bp)
+    return app
+
+
+def test_um_container_por_app_compartilhado_pelos_blueprints():
+    app = _criar_app()
+
+    assert isinstance(app.extensions[EXTENSAO], AppContainer)
+    assert _criar_app().extensions[EXTENSAO] is not app.extensions[EXTENSAO]
+
+
+def test_views_sao_montadas_uma_unica_vez(monkeypatch):
+    composer = Mock(wraps=fisica_listar_composer.fisica_listar_composer)
+    monkeypatch.setattr(container_module, "fisica_listar_composer", composer)
+    app = _criar_app()
+
+    with app.test_request_context():
+        primeira = container().fisica_listar
+        segunda = container().fisica_listar
+
+    assert isinstance(primeira, PessoaFisicaListarViews)
+    assert primeira is segunda
+    composer.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "nome",
+    [
+        f"{tipo}_{acao}"
+        for tipo in ("fisica", "juridica")
+        for acao in ("criar", "criar_lote", "listar", "buscar", "exportar", "relatorio")
+    ],
+)
+def test_composers_usam_o_repositorio_com_cache(monkeypatch, nome):
+    modulo = importlib.import_module(f"src.main.composer.{nome}_composer")
+    # PessoaJuridicaCriarControler é escrito com um "l" só
+    controller = next(
+        atributo
+        for atributo in vars(modulo)
+        if atributo.endswith(("Controller", "Controler"))
+    )
+    classe = Mock()
+    monkeypatch.setattr(modulo, controller, classe)
+
+    getattr(modulo, f"{nome}_composer")()
+
+    (repository,), _ = classe.call_args
+    assert isinstance(
+        repository, (PessoaFisicaCacheRepository, PessoaJuridicaCacheRepository)
+    )
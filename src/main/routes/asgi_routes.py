@@ -0,0 +1,32 @@
+from typing import Dict, NamedTuple, Tuple
+
+
+class Rota(NamedTuple):
+    """
+    Rota do app ASGI: nome da view nos containers e como ela é atendida.
+
+    assincrona - view do AsyncAppContainer, chamada direto no event loop;
+                 as demais são do AppContainer e rodam em uma thread
+    ndjson     - o body da resposta é um gerador transmitido como NDJSON
+    """
+
+    view: str
+    assincrona: bool = False
+    ndjson: bool = False
+
+
+# Mesmas rotas dos blueprints pessoa_fisica_routes e pessoa_juridica_routes
+ROTAS_ASGI: Dict[Tuple[str, str], Rota] = {
+    ("POST", "/fisica"): Rota("fisica_criar"),
+    ("POST", "/fisica/batch"): Rota("fisica_criar_lote"),
+    ("GET", "/fisica"): Rota("fisica_listar", assincrona=True),
+    ("GET", "/fisica/busca"): Rota("fisica_buscar", assincrona=True),
+    ("GET", "/fisica/exportar"): Rota("fisica_exportar", ndjson=True),
+    ("GET", "/fisica/relatorio"): Rota("fisica_relatorio", assincrona=True),
+    ("POST", "/juridica"): Rota("juridica_criar"),
+    ("POST", "/juridica/batch"): Rota("juridica_criar_lote"),
+    ("GET", "/juridica"): Rota("juridica_listar", assincrona=True),
+    ("GET", "/juridica/busca"): Rota("juridica_buscar", assincrona=True),
+    ("GET", "/juridica/exportar"): Rota("juridica_exportar", ndjson=True),
+    ("GET", "/juridica/relatorio"): Rota("juridica_relatorio", assincrona=True),
+}
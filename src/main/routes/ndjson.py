@@ -0,0 +1,33 @@
+from typing import Dict, Iterable, Iterator
+
+from flask import Response, current_app, stream_with_context
+
+from src.errors.error_handler import handle_errors
+
+LINHAS_POR_BLOCO = 500
+
+
+def resposta_ndjson(registros: Iterable[Dict]) -> Response:
+    """
+    Transmite `registros` como NDJSON (um objeto JSON por linha).
+
+    As linhas são agrupadas em blocos de LINHAS_POR_BLOCO antes de ir para o
+    servidor WSGI, para não gerar uma escrita no socket por registro. Se algo
+    falhar no meio da exportação o status 200 já foi enviado, então o erro
+    vai como última linha, no mesmo formato de handle_errors.
+    """
+
+    def gerar() -> Iterator[str]:
+        bloco = []
+        try:
+            for registro in registros:
+                bloco.append(current_app.json.dumps(registro))
+                if len(bloco) >= LINHAS_POR_BLOCO:
+                    yield "\n".join(bloco) + "\n"
+                    bloco = []
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            bloco.append(current_app.json.dumps(handle_errors(exception).body))
+        if bloco:
+            yield "\n".join(bloco) + "\n"
+
+    return Response(stream_with_context(gerar()), mimetype="application/x-ndjson")
@@ -1,18 +1,31 @@
 from flask import Blueprint, jsonify, request
 
 from src.errors.error_handler import handle_errors
-from src.main.composer.fisica_criar_composer import fisica_criar_composer
-from src.main.composer.fisica_listar_composer import fisica_listar_composer
+from src.main.composer.container import container, registrar_container
+from src.main.routes.ndjson import resposta_ndjson
 from src.views.http_types.http_request import HttpRequest
 
 pessoa_fisica_route_bp = Blueprint("pessoa_fisica_routes", __name__)
+pessoa_fisica_route_bp.record_once(lambda state: registrar_container(state.app))
 
 
 @pessoa_fisica_route_bp.route("/fisica", methods=["POST"])
 def criar_pessoa_fisica():
     try:
-        view = fisica_criar_composer()
-        http_request = HttpRequest(body=request.json)
+        view = container().fisica_criar
+        http_request = HttpRequest(raw_body=request.get_data())
+        http_response = view.handle(http_request)
+        return jsonify(http_response.body), http_response.status_code
+    except Exception as exception:
+        http_response = handle_errors(exception)
+        return jsonify(http_response.body), http_response.status_code
+
+
+@pessoa_fisica_route_bp.route("/fisica/batch", methods=["POST"])
+def criar_pessoa_fisica_lote():
+    try:
+        view = container().fisica_criar_lote
+        http_request = HttpRequest(raw_body=request.get_data())
         http_response = view.handle(http_request)
         return jsonify(http_response.body), http_response.status_code
     except Exception as exception:
@@ -23,7 +36,45 @@ def criar_pessoa_fisica():
 @pessoa_fisica_route_bp.route("/fisica", methods=["GET"])
 def listar_pessoa_fisica():
     try:
-        view = fisica_listar_composer()
+        view = container().fisica_listar
+        http_request = HttpRequest(param=request.args.to_dict())
+        http_response = view.handle(http_request)
+        return jsonify(http_response.body), http_response.status_code
+    except Exception as exception:
+        http_response = handle_errors(exception)
+        return jsonify(http_response.body), http_response.status_code
+
+
+@pessoa_fisica_route_bp.route("/fisica/busca", methods=["GET"])
+def buscar_pessoa_fisica():
+    try:
+        view = container().fisica_buscar
+        http_request = HttpRequest(param=request.args.to_dict())
+        http_response = view.handle(http_request)
+        return jsonify(http_response.body), http_response.status_code
+    except Exception as exception:
+        http_response = handle_errors(exception)
+        return jsonify(http_response.body), http_response.status_code
+
+
+@pessoa_fisica_route_bp.route("/fisica/exportar", methods=["GET"])
+def exportar_pessoa_fisica():
+    try:
+        view = container().fisica_exportar
+        http_request = HttpRequest()
+        http_response = view.handle(http_request)
+        if http_response.status_code != 200:
+            return jsonify(http_response.body), http_response.status_code
+        return resposta_ndjson(http_response.body)
+    except Exception as exception:
+        http_response = handle_errors(exception)
+        return jsonify(http_response.body), http_response.status_code
+
+
+@pessoa_fisica_route_bp.route("/fisica/relatorio", methods=["GET"])
+def relatorio_pessoa_fisica():
+    try:
+        view = container().fisica_relatorio
         http_request = HttpRequest()
         http_response = view.handle(http_request)
         return jsonify(http_response.body), http_response.status_code
@@ -1,18 +1,31 @@
 from flask import Blueprint, jsonify, request
 
 from src.errors.error_handler import handle_errors
-from src.main.composer.juridica_criar_composer import juridica_criar_composer
-from src.main.composer.juridica_listar_composer import juridica_listar_composer
+from src.main.composer.container import container, registrar_container
+from src.main.routes.ndjson import resposta_ndjson
 from src.views.http_types.http_request import HttpRequest
 
 pessoa_juridica_route_bp = Blueprint("pessoa_juridica_routes", __name__)
+pessoa_juridica_route_bp.record_once(lambda state: registrar_container(state.app))
 
 
 @pessoa_juridica_route_bp.route("/juridica", methods=["POST"])
 def criar_pessoa_juridica():
     try:
-        view = juridica_criar_composer()
-        http_request = HttpRequest(body=request.json)
+        view = container().juridica_criar
+        http_request = HttpRequest(raw_body=request.get_data())
+        http_response = view.handle(http_request)
+        return jsonify(http_response.body), http_response.status_code
+    except Exception as exception:
+        http_response = handle_errors(exception)
+        return jsonify(http_response.body), http_response.status_code
+
+
+@pessoa_juridica_route_bp.route("/juridica/batch", methods=["POST"])
+def criar_pessoa_juridica_lote():
+    try:
+        view = container().juridica_criar_lote
+        http_request = HttpRequest(raw_body=request.get_data())
         http_response = view.handle(http_request)
         return jsonify(http_response.body), http_response.status_code
     except Exception as exception:
@@ -23,7 +36,45 @@ def criar_pessoa_juridica():
 @pessoa_juridica_route_bp.route("/juridica", methods=["GET"])
 def listar_pessoa_juridica():
     try:
-        view = juridica_listar_composer()
+        view = container().juridica_listar
+        http_request = HttpRequest(param=request.args.to_dict())
+        http_response = view.handle(http_request)
+        return jsonify(http_response.body), http_response.status_code
+    except Exception as exception:
+        http_response = handle_errors(exception)
+        return jsonify(http_response.body), http_response.status_code
+
+
+@pessoa_juridica_route_bp.route("/juridica/busca", methods=["GET"])
+def buscar_pessoa_juridica():
+    try:
+        view = container().juridica_buscar
+        http_request = HttpRequest(param=request.args.to_dict())
+        http_response = view.handle(http_request)
+        return jsonify(http_response.body), http_response.status_code
+    except Exception as exception:
+        http_response = handle_errors(exception)
+        return jsonify(http_response.body), http_response.status_code
+
+
+@pessoa_juridica_route_bp.route("/juridica/exportar", methods=["GET"])
+def exportar_pessoa_juridica():
+    try:
+        view = container().juridica_exportar
+        http_request = HttpRequest()
+        http_response = view.handle(http_request)
+        if http_response.status_code != 200:
+            return jsonify(http_response.body), http_response.status_code
+        return resposta_ndjson(http_response.body)
+    except Exception as exception:
+        http_response = handle_errors(exception)
+        return jsonify(http_response.body), http_response.status_code
+
+
+@pessoa_juridica_route_bp.route("/juridica/relatorio", methods=["GET"])
+def relatorio_pessoa_juridica():
+    try:
+        view = container().juridica_relatorio
         http_request = HttpRequest()
         http_response = view.handle(http_request)
         return jsonify(http_response.body), http_response.status_code
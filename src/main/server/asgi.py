@@ -0,0 +1,257 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Generator, List, Tuple
+from urllib.parse import parse_qsl
+
+from src.errors.error_handler import handle_errors
+from src.main.composer.async_container import AsyncAppContainer
+from src.main.composer.container import AppContainer
+from src.main.routes.asgi_routes import ROTAS_ASGI, Rota
+from src.main.routes.ndjson import LINHAS_POR_BLOCO
+from src.main.server.json_provider import serializar_json
+from src.models.sqlite.settings.async_connection import async_db_connection_handler
+from src.views.http_types.http_request import HttpRequest
+from src.views.http_types.http_response import HttpResponse
+
+Cabecalhos = List[Tuple[bytes, bytes]]
+
+# Access-Control-Allow-Methods do flask-cors com as opções padrão
+METODOS_CORS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+_NDJSON = (b"content-type", b"application/x-ndjson")
+
+
+class AsgiApp:
+    """
+    A API como aplicação ASGI, para rodar em um servidor como o uvicorn.
+
+    Atende as mesmas rotas e devolve o mesmo JSON do app Flask, com HEAD
+    nas rotas GET e os cabeçalhos do CORS(app) do server.py. Listagem,
+    busca e relatório usam as views assíncronas (AsyncAppContainer), então
+    as consultas em andamento não ocupam uma thread cada. Cadastro, lote e
+    exportação continuam nas views síncronas do AppContainer, chamadas em
+    uma thread fora do event loop.
+
+    O engine assíncrono é aberto no startup do lifespan e descartado no
+    shutdown; o DBConnectionHandler síncrono é conectado por quem cria o app
+    (ver asgi_server.py).
+    """
+
+    def __init__(self, async_db_connection=None) -> None:
+        self.__async_db_connection = async_db_connection or async_db_connection_handler
+        self.__views = AppContainer()
+        self.__views_async = AsyncAppContainer(self.__async_db_connection)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self.__lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self.__http(scope, receive, send)
+
+    async def iniciar(self) -> None:
+        await self.__async_db_connection.connect_to_db()
+
+    async def encerrar(self) -> None:
+        await self.__async_db_connection.dispose()
+
+    async def __lifespan(self, receive, send) -> None:
+        while True:
+            mensagem = await receive()
+            if mensagem["type"] == "lifespan.startup":
+                try:
+                    await self.iniciar()
+                except RuntimeError as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif mensagem["type"] == "lifespan.shutdown":
+                await self.encerrar()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def __http(self, scope, receive, send) -> None:
+        metodo, caminho = scope["method"], scope["path"]
+        cabecalhos = _cabecalhos_cors(scope)
+        if metodo == "HEAD":
+            # Como no Flask: a rota GET responde, só sem o corpo
+            send = _sem_corpo(send)
+
+        permitidos = _metodos_permitidos(caminho)
+        if metodo == "OPTIONS" and permitidos:
+            await _enviar_vazio(send, cabecalhos + [(b"allow", permitidos)])
+            return
+
+        rota = ROTAS_ASGI.get(("GET" if metodo == "HEAD" else metodo, caminho))
+        if rota is None:
+            if permitidos:
+                status, titulo = 405, "Method Not Allowed"
+                cabecalhos = cabecalhos + [(b"allow", permitidos)]
+            else:
+                status, titulo = 404, "Not Found"
+            corpo = {"errors": [{"title": titulo, "detail": f"{metodo} {caminho}"}]}
+            await _enviar_json(send, HttpResponse(status, corpo), cabecalhos)
+            return
+
+        if metodo == "POST":
+            http_request = HttpRequest(raw_body=await _ler_corpo(receive))
+        else:
+            http_request = HttpRequest(param=_parametros(scope["query_string"]))
+
+        http_response = await self.__atender(rota, http_request)
+        if rota.ndjson and http_response.status_code == 200 and metodo == "HEAD":
+            await asyncio.to_thread(http_response.body.close)
+            await _enviar_vazio(send, cabecalhos + [_NDJSON])
+        elif rota.ndjson and http_response.status_code == 200:
+            await _enviar_ndjson(send, http_response.body, cabecalhos)
+        else:
+            await _enviar_json(send, http_response, cabecalhos)
+
+    async def __atender(self, rota: Rota, http_request: HttpRequest) -> HttpResponse:
+        if rota.assincrona:
+            view = getattr(self.__views_async, rota.view)
+            return await view.handle(http_request)
+
+        view = getattr(self.__views, rota.view)
+        if rota.ndjson:
+            # handle só cria o gerador; a leitura acontece em _enviar_ndjson
+            return view.handle(http_request)
+        return await asyncio.to_thread(view.handle, http_request)
+
+
+def _parametros(query_string: bytes) -> Dict[str, str]:
+    """
+    Query string como o request.args.to_dict() do Flask: 1º valor de cada
+    chave, com bytes fora de %XX (o curl manda "José" assim) lidos em UTF-8.
+    """
+    param: Dict[str, str] = {}
+    for chave, valor in parse_qsl(
+        query_string.decode("utf-8", "replace"), keep_blank_values=True
+    ):
+        param.setdefault(chave, valor)
+    return param
+
+
+async def _ler_corpo(receive) -> bytes:
+    partes = []
+    while True:
+        mensagem = await receive()
+        partes.append(mensagem.get("body", b""))
+        if not mensagem.get("more_body", False):
+            return b"".join(partes)
+
+
+def _metodos_permitidos(caminho: str) -> bytes:
+    """Header Allow do caminho (vazio se não existe): HEAD vem junto com GET."""
+    metodos = {m for m, c in ROTAS_ASGI if c == caminho}
+    if not metodos:
+        return b""
+    if "GET" in metodos:
+        metodos.add("HEAD")
+    return ", ".join(sorted(metodos | {"OPTIONS"})).encode()
+
+
+def _cabecalhos_cors(scope) -> Cabecalhos:
+    """
+    Os cabeçalhos do CORS(app) do server.py (flask-cors com as opções
+    padrão): sem Origin, "*"; com Origin, a própria origem e Vary: Origin.
+    Em OPTIONS com Access-Control-Request-Method, também os métodos e os
+    cabeçalhos pedidos.
+    """
+    pedido = dict(scope["headers"])
+    origem = pedido.get(b"origin")
+    if origem is None:
+        cabecalhos = [(b"access-control-allow-origin", b"*")]
+    else:
+        cabecalhos = [(b"access-control-allow-origin", origem), (b"vary", b"Origin")]
+
+    metodo_pedido = pedido.get(b"access-control-request-method", b"").upper()
+    if (
+        scope["method"] == "OPTIONS"
+        and metodo_pedido
+        and metodo_pedido in METODOS_CORS.split(b", ")
+    ):
+        pedidos = pedido.get(b"access-control-request-headers")
+        if pedidos:
+            nomes = sorted(nome.strip() for nome in pedidos.split(b","))
+            cabecalhos.append((b"access-control-allow-headers", b", ".join(nomes)))
+        cabecalhos.append((b"access-control-allow-methods", METODOS_CORS))
+    return cabecalhos
+
+
+def _sem_corpo(send):
+    """`send` que descarta o corpo da resposta, para HEAD."""
+
+    async def enviar(mensagem):
+        if mensagem["type"] == "http.response.body":
+            mensagem = {"type": "http.response.body", "body": b""}
+        await send(mensagem)
+
+    return enviar
+
+
+async def _enviar_vazio(send, cabecalhos: Cabecalhos) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": cabecalhos})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _enviar_json(send, http_response: HttpResponse, cabecalhos: Cabecalhos):
+    corpo = serializar_json(http_response.body)
+    await send(
+        {
+            "type": "http.response.start",
+            "status": http_response.status_code,
+            "headers": cabecalhos
+            + [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(corpo)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": corpo})
+
+
+async def _enviar_ndjson(
+    send, registros: Generator[Dict, None, None], cabecalhos: Cabecalhos
+):
+    """
+    Transmite `registros` em blocos de LINHAS_POR_BLOCO linhas, como a
+    resposta_ndjson do Flask.
+
+    O gerador do repositório síncrono guarda a sessão da thread em que
+    começou, então todo ele (inclusive o close) roda em uma única thread.
+    """
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": cabecalhos + [_NDJSON],
+        }
+    )
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        fim = False
+        while not fim:
+            bloco, fim = await loop.run_in_executor(executor, _proximo_bloco, registros)
+            if bloco:
+                await send(
+                    {"type": "http.response.body", "body": bloco, "more_body": True}
+                )
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        await loop.run_in_executor(executor, registros.close)
+        executor.shutdown(wait=False)
+
+
+def _proximo_bloco(registros: Generator[Dict, None, None]) -> Tuple[bytes, bool]:
+    """Até LINHAS_POR_BLOCO linhas NDJSON e se o gerador terminou."""
+    linhas: List[bytes] = []
+    try:
+        for registro in registros:
+            linhas.append(serializar_json(registro))
+            if len(linhas) >= LINHAS_POR_BLOCO:
+                return b"".join(linhas), False
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        # O status 200 já foi enviado: o erro vai como última linha
+        linhas.append(serializar_json(handle_errors(exception).body))
+    return b"".join(linhas), True
@@ -0,0 +1,6 @@
+from src.main.server.asgi import AsgiApp
+from src.models.sqlite.settings.connection import db_connection_handler
+
+db_connection_handler.connect_to_db()
+
+app = AsgiApp()
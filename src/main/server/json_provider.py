@@ -0,0 +1,85 @@
+import json
+from decimal import Decimal
+from typing import Any
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson é opcional
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Tipos que o orjson não serializa sozinho."""
+    if isinstance(obj, Decimal):
+        # Texto, como no provider padrão do Flask: sem passar por float
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Provider JSON do Flask sobre o orjson.
+
+    Mantém o formato do DefaultJSONProvider nas respostas: Decimal como
+    texto, chaves ordenadas (sort_keys) e indentação em modo debug. As
+    diferenças são as do orjson: datetime/date saem em ISO 8601 e o texto
+    vai em UTF-8, sem escapar caracteres não ASCII.
+    """
+
+    def _opcoes(self, indentar: bool = False) -> int:
+        opcoes = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            opcoes |= orjson.OPT_SORT_KEYS
+        if indentar:
+            opcoes |= orjson.OPT_INDENT_2
+        return opcoes
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            # Argumentos do json.dumps (cls, separators...) ficam com o padrão
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=self._opcoes()).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indentar = (self.compact is None and self._app.debug) or self.compact is False
+        corpo = orjson.dumps(
+            obj,
+            default=_default,
+            option=self._opcoes(indentar) | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(corpo, mimetype=self.mimetype)
+
+
+def criar_json_provider(app: Flask) -> JSONProvider:
+    """OrjsonProvider quando o orjson está instalado; senão, o padrão do Flask."""
+    if orjson is None:
+        return DefaultJSONProvider(app)
+    return OrjsonProvider(app)
+
+
+def serializar_json(obj: Any) -> bytes:
+    """
+    Corpo JSON no formato das respostas do Flask (chaves ordenadas, com
+    quebra de linha no fim), para quem responde fora dele, como o app ASGI.
+    """
+    if orjson is None:
+        texto = json.dumps(obj, default=DefaultJSONProvider.default, sort_keys=True)
+        return (texto + "\n").encode()
+    return orjson.dumps(
+        obj,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SORT_KEYS
+        | orjson.OPT_APPEND_NEWLINE,
+    )
@@ -0,0 +1,289 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+from flask import Flask, Response, g, jsonify, request
+
+from src.models.cache.cache_lru_ttl import CacheLRUTTL, cache_contas
+from src.models.sqlite.settings.connection import (
+    DBConnectionHandler,
+    db_connection_handler,
+)
+from src.models.sqlite.settings.instrumentacao import estatisticas_sql
+
+# Limites (em segundos) dos buckets do histograma de latência. Começa em 1 ms
+# porque as rotas de leitura respondem na casa de 1 ms com o banco local.
+LIMITES_LATENCIA = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _ContadoresThread:
+    """Contadores de uma única thread: só ela escreve, sem lock."""
+
+    __slots__ = ("thread", "requisicoes", "buckets", "somas")
+
+    def __init__(self) -> None:
+        self.thread = threading.current_thread()
+        # (método, rota, status) -> requisições
+        self.requisicoes: Dict[Tuple[str, str, int], int] = {}
+        # (método, rota) -> contagem por bucket (o último é o +Inf), não cumulativa
+        self.buckets: Dict[Tuple[str, str], List[int]] = {}
+        # (método, rota) -> soma das durações
+        self.somas: Dict[Tuple[str, str], float] = {}
+
+    def registrar(self, metodo: str, rota: str, status: int, duracao: float) -> None:
+        chave = (metodo, rota, status)
+        self.requisicoes[chave] = self.requisicoes.get(chave, 0) + 1
+
+        chave = (metodo, rota)
+        buckets = self.buckets.get(chave)
+        if buckets is None:
+            buckets = self.buckets[chave] = [0] * (len(LIMITES_LATENCIA) + 1)
+        buckets[bisect_left(LIMITES_LATENCIA, duracao)] += 1
+        self.somas[chave] = self.somas.get(chave, 0.0) + duracao
+
+    def somar_em(self, destino: "_ContadoresThread") -> None:
+        # dict(...) e list(...) copiam de uma vez sob o GIL, então a cópia
+        # não quebra se a thread dona registrar algo no meio
+        for chave, total in dict(self.requisicoes).items():
+            destino.requisicoes[chave] = destino.requisicoes.get(chave, 0) + total
+        for chave, buckets in dict(self.buckets).items():
+            acumulado = destino.buckets.setdefault(chave, [0] * len(buckets))
+            for i, quantidade in enumerate(list(buckets)):
+                acumulado[i] += quantidade
+        for chave, soma in dict(self.somas).items():
+            destino.somas[chave] = destino.somas.get(chave, 0.0) + soma
+
+
+class MetricasHttp:
+    """
+    Contadores de requisições HTTP agregados por thread.
+
+    Cada thread escreve só nos próprios contadores, sem lock no caminho da
+    requisição. O lock só é usado quando uma thread registra os seus
+    contadores pela primeira vez e na leitura (scrape), que soma as threads.
+    Contadores de threads encerradas (o servidor de desenvolvimento abre uma
+    por requisição) são incorporados a um total fixo e descartados.
+    """
+
+    def __init__(self) -> None:
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__threads: List[_ContadoresThread] = []
+        self.__encerradas = _ContadoresThread()
+
+    def registrar(self, metodo: str, rota: str, status: int, duracao: float) -> None:
+        contadores = getattr(self.__local, "contadores", None)
+        if contadores is None:
+            contadores = self.__local.contadores = _ContadoresThread()
+            with self.__lock:
+                self.__recolher_encerradas()
+                self.__threads.append(contadores)
+        contadores.registrar(metodo, rota, status, duracao)
+
+    def snapshot(self) -> _ContadoresThread:
+        """Soma dos contadores de todas as threads, vivas e encerradas."""
+        total = _ContadoresThread()
+        with self.__lock:
+            self.__recolher_encerradas()
+            self.__encerradas.somar_em(total)
+            for contadores in self.__threads:
+                contadores.somar_em(total)
+        return total
+
+    def limpar(self) -> None:
+        with self.__lock:
+            self.__threads.clear()
+            self.__encerradas = _ContadoresThread()
+        self.__local = threading.local()
+
+    def __recolher_encerradas(self) -> None:
+        vivas = []
+        for contadores in self.__threads:
+            if contadores.thread.is_alive():
+                vivas.append(contadores)
+            else:
+                contadores.somar_em(self.__encerradas)
+        self.__threads = vivas
+
+
+metricas_http = MetricasHttp()
+
+
+def registrar_metricas(
+    app: Flask,
+    db_handler: DBConnectionHandler = db_connection_handler,
+    cache: CacheLRUTTL = cache_contas,
+) -> None:
+    """
+    Conta as requisições de `app` e expõe GET /metrics no formato texto do
+    Prometheus:
+
+        http_requests_total              - por método, rota e status
+        http_request_errors_total        - respostas 4xx/5xx (as de handle_errors)
+        http_request_duration_seconds    - histograma de latência por rota
+        db_queries_*, db_time_*, ...     - SQL por rota (ver server_timing.py)
+        db_pool_*                        - conexões do pool do engine
+        cache_contas_*                   - cache dos repositórios dos composers
+
+    GET /metrics/sql devolve em JSON as estatísticas de SQL por rota, com o
+    texto da consulta mais lenta, que fica fora do /metrics.
+
+    A latência vai do before_request ao after_request; em respostas
+    transmitidas (exportar), não inclui a transmissão.
+    """
+    app.before_request(_iniciar)
+    app.after_request(_finalizar)
+    app.add_url_rule(
+        "/metrics",
+        "metrics",
+        lambda: Response(
+            exportar_metricas(db_handler, cache), content_type=CONTENT_TYPE
+        ),
+        methods=["GET"],
+    )
+    app.add_url_rule(
+        "/metrics/sql",
+        "metrics_sql",
+        lambda: jsonify(estatisticas_sql.estatisticas()),
+        methods=["GET"],
+    )
+
+
+def _iniciar() -> None:
+    g.inicio_metricas = time.perf_counter()
+
+
+def _finalizar(response: Response) -> Response:
+    inicio = g.pop("inicio_metricas", None)
+    if inicio is not None:
+        regra = request.url_rule.rule if request.url_rule else "<sem rota>"
+        metricas_http.registrar(
+            request.method,
+            regra,
+            response.status_code,
+            time.perf_counter() - inicio,
+        )
+    return response
+
+
+def exportar_metricas(db_handler: DBConnectionHandler, cache: CacheLRUTTL) -> str:
+    linhas: List[str] = []
+    _exportar_http(linhas, metricas_http.snapshot())
+    _exportar_sql(linhas, estatisticas_sql.estatisticas())
+    _exportar_pool(linhas, db_handler)
+    _exportar_cache(linhas, cache)
+    return "\n".join(linhas) + "\n"
+
+
+def _exportar_http(linhas: List[str], total: _ContadoresThread) -> None:
+    _cabecalho(linhas, "http_requests_total", "counter", "Requisições HTTP atendidas")
+    for (metodo, rota, status), quantidade in sorted(total.requisicoes.items()):
+        rotulos = _rotulos(method=metodo, route=rota, status=status)
+        linhas.append(f"http_requests_total{{{rotulos}}} {quantidade}")
+
+    _cabecalho(
+        linhas, "http_request_errors_total", "counter", "Respostas HTTP 4xx e 5xx"
+    )
+    for (metodo, rota, status), quantidade in sorted(total.requisicoes.items()):
+        if status >= 400:
+            rotulos = _rotulos(method=metodo, route=rota, status=status)
+            linhas.append(f"http_request_errors_total{{{rotulos}}} {quantidade}")
+
+    nome = "http_request_duration_seconds"
+    _cabecalho(linhas, nome, "histogram", "Latência das requisições HTTP")
+    for (metodo, rota), buckets in sorted(total.buckets.items()):
+        rotulos = _rotulos(method=metodo, route=rota)
+        acumulado = 0
+        for limite, quantidade in zip(LIMITES_LATENCIA + ("+Inf",), buckets):
+            acumulado += quantidade
+            linhas.append(f'{nome}_bucket{{{rotulos},le="{limite}"}} {acumulado}')
+        linhas.append(f"{nome}_sum{{{rotulos}}} {total.somas[(metodo, rota)]!r}")
+        linhas.append(f"{nome}_count{{{rotulos}}} {acumulado}")
+
+
+def _exportar_sql(linhas: List[str], rotas: Dict[str, Dict]) -> None:
+    # As chaves de estatisticas_sql são "MÉTODO rota"
+    series = (
+        ("db_queries_total", "counter", "Comandos SQL executados", "consultas", 1),
+        ("db_time_seconds_total", "counter", "Tempo de banco", "tempo_db_ms", 1e-3),
+        (
+            "db_queries_max",
+            "gauge",
+            "Máximo de comandos SQL em uma requisição",
+            "consultas_max",
+            1,
+        ),
+        (
+            "db_slowest_query_seconds",
+            "gauge",
+            "Duração do comando SQL mais lento",
+            "mais_lenta_ms",
+            1e-3,
+        ),
+    )
+    for nome, tipo, ajuda, campo, escala in series:
+        _cabecalho(linhas, nome, tipo, ajuda)
+        for chave, totais in sorted(rotas.items()):
+            metodo, rota = chave.split(" ", 1)
+            rotulos = _rotulos(method=metodo, route=rota)
+            linhas.append(f"{nome}{{{rotulos}}} {totais[campo] * escala!r}")
+
+
+def _exportar_pool(linhas: List[str], db_handler: DBConnectionHandler) -> None:
+    pool = db_handler.get_engine().pool
+    # Só o QueuePool (banco em arquivo) tem essas contagens
+    if not hasattr(pool, "checkedout"):
+        return
+    gauges = (
+        ("db_pool_size", "Conexões mantidas pelo pool", pool.size()),
+        ("db_pool_checked_out", "Conexões em uso", pool.checkedout()),
+        ("db_pool_checked_in", "Conexões livres no pool", pool.checkedin()),
+        (
+            "db_pool_overflow",
+            "Conexões além do tamanho do pool",
+            max(pool.overflow(), 0),
+        ),
+    )
+    for nome, ajuda, valor in gauges:
+        _cabecalho(linhas, nome, "gauge", ajuda)
+        linhas.append(f"{nome} {valor}")
+
+
+def _exportar_cache(linhas: List[str], cache: CacheLRUTTL) -> None:
+    estatisticas = cache.estatisticas()
+    for contador in ("hits", "misses", "evictions", "expirations"):
+        nome = f"cache_contas_{contador}_total"
+        _cabecalho(
+            linhas, nome, "counter", f"{contador.capitalize()} do cache de contas"
+        )
+        linhas.append(f"{nome} {estatisticas[contador]}")
+
+    _cabecalho(linhas, "cache_contas_size", "gauge", "Entradas no cache de contas")
+    linhas.append(f"cache_contas_size {estatisticas['size']}")
+
+    # Sem leituras não há ratio: 0.0 pareceria um cache frio, não um cache
+    # que nenhuma rota consultou
+    leituras = estatisticas["hits"] + estatisticas["misses"]
+    if leituras:
+        _cabecalho(
+            linhas, "cache_contas_hit_ratio", "gauge", "Hits sobre leituras do cache"
+        )
+        linhas.append(f"cache_contas_hit_ratio {estatisticas['hits'] / leituras!r}")
+
+
+def _cabecalho(linhas: List[str], nome: str, tipo: str, ajuda: str) -> None:
+    linhas.append(f"# HELP {nome} {ajuda}")
+    linhas.append(f"# TYPE {nome} {tipo}")
+
+
+def _rotulos(**rotulos) -> str:
+    return ",".join(
+        f'{nome}="{_escapar(str(valor))}"' for nome, valor in rotulos.items()
+    )
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,107 @@
+import argparse
+import gc
+import importlib
+import os
+from typing import Any, Dict, Optional, Sequence
+
+from gunicorn.app.base import BaseApplication
+
+from src.models.sqlite.settings.connection import db_connection_handler
+
+PORTA_PADRAO = 3000
+THREADS_PADRAO = 4
+
+
+def antes_do_fork(server, worker) -> None:  # pylint: disable=unused-argument
+    """
+    Roda no mestre antes de cada fork: move os objetos já criados para a
+    geração permanente do GC, que o coletor dos workers não percorre. Sem
+    isso, a primeira coleta em cada worker escreveria nos cabeçalhos desses
+    objetos e copiaria as páginas compartilhadas (copy-on-write).
+    """
+    gc.freeze()
+
+
+def quando_pronto(server) -> None:  # pylint: disable=unused-argument
+    """
+    Roda no mestre depois do preload, logo antes de subir os workers: religa
+    o GC desligado em load(). O mestre continua coletando pelo resto da vida
+    (respawns, sinais); antes_do_fork congela o heap antes de cada fork.
+    """
+    gc.enable()
+
+
+def depois_do_fork(server, worker) -> None:  # pylint: disable=unused-argument
+    """
+    Roda em cada worker logo após o fork: religa o GC e abre um engine
+    próprio do worker, para nenhuma conexão do pool ser compartilhada entre
+    processos.
+    """
+    gc.enable()
+    db_connection_handler.connect_to_db()
+
+
+class ServidorProducao(BaseApplication):  # pylint: disable=abstract-method
+    """
+    O app Flask no gunicorn, com N workers pré-forkados.
+
+    O mestre importa src.main.server.server uma única vez (preload_app) e
+    os workers herdam o app já montado por fork. Antes do fork o engine
+    aberto pelo import é descartado e o GC fica desligado até o mestre estar
+    pronto (quando_pronto); antes de cada fork o heap é congelado
+    (antes_do_fork) e cada worker abre o seu engine em depois_do_fork.
+
+    `opcoes` são configurações do gunicorn (bind, workers, threads...) e
+    podem sobrescrever os hooks padrão.
+    """
+
+    def __init__(self, opcoes: Optional[Dict[str, Any]] = None) -> None:
+        self.__opcoes = {
+            "preload_app": True,
+            "worker_class": "gthread",
+            "when_ready": quando_pronto,
+            "pre_fork": antes_do_fork,
+            "post_fork": depois_do_fork,
+            **(opcoes or {}),
+        }
+        super().__init__()
+
+    def load_config(self) -> None:
+        for chave, valor in self.__opcoes.items():
+            self.cfg.set(chave, valor)
+
+    def load(self):
+        app = importlib.import_module("src.main.server.server").app
+        # O import conectou ao banco no mestre; fecha as conexões do pool
+        # para os workers não herdarem nenhuma
+        db_connection_handler.get_engine().dispose()
+        # Daqui até quando_pronto não há coleta: o que foi criado no import
+        # fica nas mesmas páginas até o gc.freeze
+        gc.disable()
+        return app
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Servidor de produção: gunicorn com workers pré-forkados."
+    )
+    parser.add_argument(
+        "--bind", default=f"0.0.0.0:{PORTA_PADRAO}", help="Endereço (host:porta)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        help="Processos worker (padrão: WEB_CONCURRENCY ou número de CPUs)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=THREADS_PADRAO,
+        help="Threads por worker",
+    )
+    args = parser.parse_args(argv)
+
+    ServidorProducao(
+        {"bind": args.bind, "workers": args.workers, "threads": args.threads}
+    ).run()
@@ -3,11 +3,17 @@ from flask_cors import CORS
 
 from src.main.routes.pessoa_fisica_routes import pessoa_fisica_route_bp
 from src.main.routes.pessoa_juridica_routes import pessoa_juridica_route_bp
+from src.main.server.json_provider import criar_json_provider
+from src.main.server.metricas import registrar_metricas
+from src.main.server.server_timing import registrar_server_timing
 from src.models.sqlite.settings.connection import db_connection_handler
 
 db_connection_handler.connect_to_db()
 
 app = Flask(__name__)
+app.json = criar_json_provider(app)
+registrar_server_timing(app)
+registrar_metricas(app)
 CORS(app)
 
 app.register_blueprint(pessoa_fisica_route_bp)
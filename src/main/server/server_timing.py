@@ -0,0 +1,63 @@
+import time
+
+from flask import Flask, Response, g, request
+
+from src.models.sqlite.settings.instrumentacao import (
+    MedicaoRequisicao,
+    encerrar_medicao,
+    estatisticas_sql,
+    iniciar_medicao,
+)
+
+
+def registrar_server_timing(app: Flask) -> None:
+    """
+    Mede o SQL de cada requisição de `app` e devolve o resultado no header
+    Server-Timing, que o DevTools do navegador mostra na aba Timing:
+
+        db       - tempo total de banco; desc com o número de consultas
+        db-lenta - a consulta mais lenta
+        total    - do before_request ao after_request (Flask, pydantic e banco)
+
+    Os números também são somados por rota em estatisticas_sql. Em respostas
+    transmitidas (exportar), conta só o SQL executado antes da transmissão.
+    """
+    app.before_request(_iniciar)
+    app.after_request(_finalizar)
+    app.teardown_request(_descartar)
+
+
+def _iniciar() -> None:
+    g.medicao_sql = iniciar_medicao()
+    g.inicio_requisicao = time.perf_counter()
+
+
+def _finalizar(response: Response) -> Response:
+    token = g.pop("medicao_sql", None)
+    if token is None:
+        return response
+
+    medicao = encerrar_medicao(token)
+    total = time.perf_counter() - g.pop("inicio_requisicao")
+    response.headers["Server-Timing"] = _server_timing(medicao, total)
+
+    regra = request.url_rule.rule if request.url_rule else "<sem rota>"
+    estatisticas_sql.registrar(f"{request.method} {regra}", medicao)
+    return response
+
+
+def _descartar(_exception) -> None:
+    """Se o after_request não rodou, só desfaz a medição."""
+    token = g.pop("medicao_sql", None)
+    if token is not None:
+        encerrar_medicao(token)
+
+
+def _server_timing(medicao: MedicaoRequisicao, total: float) -> str:
+    # Só a duração da consulta mais lenta: o texto do SQL fica nas
+    # estatísticas por rota, fora da resposta
+    return (
+        f'db;dur={medicao.tempo_db * 1000:.3f};desc="{medicao.consultas} consultas", '
+        f"db-lenta;dur={medicao.tempo_mais_lenta * 1000:.3f}, "
+        f"total;dur={total * 1000:.3f}"
+    )
@@ -0,0 +1,73 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.main.server import json_provider
+from src.main.server.json_provider import OrjsonProvider, criar_json_provider
+
+pytest.importorskip("orjson")
+
+CORPO = {
+    "data": {
+        "type": "Pessoa Física",
+        "count": 1,
+        "attributes": [
+            {"nome_completo": "José", "saldo": Decimal("1500.50"), "idade": 30}
+        ],
+        "next_cursor": None,
+    }
+}
+
+
+@pytest.fixture(name="app")
+def fixture_app():
+    app = Flask(__name__)
+    app.json = criar_json_provider(app)
+    return app
+
+
+def test_usa_orjson_quando_instalado(app):
+    assert isinstance(app.json, OrjsonProvider)
+
+
+def test_sem_orjson_usa_o_provider_padrao(monkeypatch):
+    monkeypatch.setattr(json_provider, "orjson", None)
+
+    provider = criar_json_provider(Flask(__name__))
+
+    assert not isinstance(provider, OrjsonProvider)
+    assert isinstance(provider, DefaultJSONProvider)
+
+
+def test_resposta_equivale_ao_provider_padrao(app):
+    padrao = DefaultJSONProvider(app)
+
+    with app.app_context():
+        resposta = app.json.response(CORPO)
+
+    assert resposta.mimetype == "application/json"
+    assert resposta.data.endswith(b"\n")
+    assert json.loads(resposta.data) == json.loads(padrao.dumps(CORPO))
+    # Chaves ordenadas e Decimal como texto, como no padrão do Flask
+    assert resposta.data.index(b'"data"') < resposta.data.index(b'"count"')
+    assert b'"saldo":"1500.50"' in resposta.data
+
+
+def test_datetime_em_iso_8601(app):
+    assert app.json.dumps({"em": datetime(2024, 1, 2, 3, 4, 5)}) == (
+        '{"em":"2024-01-02T03:04:05"}'
+    )
+
+
+def test_tipo_desconhecido_gera_type_error(app):
+    with pytest.raises(TypeError):
+        app.json.dumps({"objeto": object()})
+
+
+def test_loads_e_argumentos_do_json_padrao(app):
+    assert app.json.loads(b'{"valor": 1.5}') == {"valor": 1.5}
+    assert app.json.dumps({"b": 1, "a": 2}, indent=2) == '{\n  "a": 2,\n  "b": 1\n}'
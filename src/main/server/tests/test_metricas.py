@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from src.main.server.metricas import LIMITES_LATENCIA, MetricasHttp
+
+
+def test_soma_as_threads_inclusive_as_encerradas():
+    metricas = MetricasHttp()
+
+    def atender():
+        for _ in range(100):
+            metricas.registrar("GET", "/fisica", 200, 0.002)
+
+    threads = [threading.Thread(target=atender) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metricas.registrar("GET", "/fisica", 404, 0.0005)
+
+    total = metricas.snapshot()
+
+    assert total.requisicoes == {
+        ("GET", "/fisica", 200): 400,
+        ("GET", "/fisica", 404): 1,
+    }
+    assert sum(total.buckets[("GET", "/fisica")]) == 401
+    assert total.somas[("GET", "/fisica")] == pytest.approx(400 * 0.002 + 0.0005)
+    # as 4 threads encerradas já foram incorporadas ao total fixo
+    assert metricas.snapshot().requisicoes == total.requisicoes
+
+
+def test_buckets_do_histograma():
+    metricas = MetricasHttp()
+    for duracao in (0.0005, 0.001, 0.003, 10):
+        metricas.registrar("GET", "/fisica", 200, duracao)
+
+    buckets = metricas.snapshot().buckets[("GET", "/fisica")]
+
+    assert len(buckets) == len(LIMITES_LATENCIA) + 1
+    # le="0.001" recebe 0.0005 e 0.001; 0.003 cai em le="0.005"; 10 só no +Inf
+    assert buckets[0] == 2
+    assert buckets[LIMITES_LATENCIA.index(0.005)] == 1
+    assert buckets[-1] == 1
+
+
+def test_limpar():
+    metricas = MetricasHttp()
+    metricas.registrar("GET", "/fisica", 200, 0.001)
+    metricas.limpar()
+
+    assert not metricas.snapshot().requisicoes
@@ -0,0 +1,76 @@
+import gc
+from unittest.mock import Mock
+
+import pytest
+
+from src.main.server import producao
+from src.main.server.producao import (
+    ServidorProducao,
+    antes_do_fork,
+    depois_do_fork,
+    quando_pronto,
+)
+from src.models.sqlite.settings import connection
+
+
+@pytest.fixture(name="handler")
+def fixture_handler(monkeypatch):
+    """Handler falso no lugar do global, inclusive para o import do server.py."""
+    handler = Mock()
+    monkeypatch.setattr(producao, "db_connection_handler", handler)
+    monkeypatch.setattr(connection, "db_connection_handler", handler)
+    return handler
+
+
+def test_configuracao_padrao_faz_preload_e_instala_os_hooks():
+    cfg = ServidorProducao({"workers": 3, "bind": "127.0.0.1:0"}).cfg
+
+    assert cfg.preload_app is True
+    assert cfg.workers == 3
+    assert cfg.worker_class_str == "gthread"
+    assert cfg.when_ready is quando_pronto
+    assert cfg.pre_fork is antes_do_fork
+    assert cfg.post_fork is depois_do_fork
+
+
+def test_antes_do_fork_congela_o_heap():
+    try:
+        antes_do_fork(None, None)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_depois_do_fork_religa_gc_e_abre_engine_no_worker(handler):
+    gc.disable()
+    try:
+        depois_do_fork(None, None)
+        assert gc.isenabled()
+    finally:
+        gc.enable()
+    handler.connect_to_db.assert_called_once_with()
+
+
+def test_load_descarta_o_engine_aberto_no_import(handler):
+    try:
+        app = ServidorProducao().load()
+    finally:
+        gc.enable()
+
+    assert app.name == "src.main.server.server"
+    handler.get_engine.return_value.dispose.assert_called_once_with()
+
+
+def test_mestre_religa_o_gc_depois_do_startup(
+    handler,
+):  # pylint: disable=unused-argument
+    servidor = ServidorProducao()
+    try:
+        servidor.load()
+        assert not gc.isenabled()
+
+        servidor.cfg.when_ready(None)
+
+        assert gc.isenabled()
+    finally:
+        gc.enable()
@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheLRUTTL:
+    """
+    Cache em memória com despejo LRU e expiração por TTL, seguro entre threads.
+
+    - capacidade: número máximo de entradas; ao passar do limite a entrada
+      usada há mais tempo é despejada (eviction)
+    - ttl: segundos de validade de cada entrada, contados a partir da escrita
+
+    obter_ou_carregar() é o caminho de leitura: devolve a entrada válida ou
+    chama `carregar` e guarda o resultado. Uma invalidação da mesma chave
+    enquanto `carregar` roda impede que o valor (possivelmente antigo) seja
+    guardado; invalidar outras chaves não afeta a carga.
+    """
+
+    def __init__(
+        self,
+        capacidade: int,
+        ttl: float,
+        relogio: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if capacidade < 1:
+            raise ValueError("Capacidade do cache deve ser positiva")
+        if ttl <= 0:
+            raise ValueError("TTL do cache deve ser positivo")
+
+        self.__capacidade = capacidade
+        self.__ttl = ttl
+        self.__relogio = relogio
+        self.__entradas: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # Só chaves com carga em andamento: [cargas, geração]. invalidar()
+        # incrementa a geração; a chave sai quando a última carga termina.
+        self.__carregando: Dict[Hashable, List[int]] = {}
+        self.__lock = threading.Lock()
+        self.__contadores = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def obter(self, chave: Hashable) -> Optional[object]:
+        with self.__lock:
+            return self.__buscar(chave)
+
+    def obter_ou_carregar(self, chave: Hashable, carregar: Callable[[], T]) -> T:
+        with self.__lock:
+            valor = self.__buscar(chave)
+            if valor is not None:
+                return valor
+            carga = self.__carregando.setdefault(chave, [0, 0])
+            carga[0] += 1
+            geracao = carga[1]
+
+        valor = None
+        try:
+            valor = carregar()
+        finally:
+            with self.__lock:
+                if valor is not None and geracao == carga[1]:
+                    self.__guardar(chave, valor)
+                carga[0] -= 1
+                if not carga[0]:
+                    del self.__carregando[chave]
+        return valor
+
+    def guardar(self, chave: Hashable, valor: object) -> None:
+        with self.__lock:
+            self.__guardar(chave, valor)
+
+    def invalidar(self, *chaves: Hashable) -> None:
+        with self.__lock:
+            for chave in chaves:
+                self.__entradas.pop(chave, None)
+                carga = self.__carregando.get(chave)
+                if carga is not None:
+                    carga[1] += 1
+
+    def limpar(self) -> None:
+        with self.__lock:
+            for carga in self.__carregando.values():
+                carga[1] += 1
+            self.__entradas.clear()
+
+    def estatisticas(self) -> Dict[str, int]:
+        with self.__lock:
+            return {**self.__contadores, "size": len(self.__entradas)}
+
+    def __buscar(self, chave: Hashable) -> Optional[object]:
+        entrada = self.__entradas.get(chave)
+        if entrada is None:
+            self.__contadores["misses"] += 1
+            return None
+
+        valor, expira_em = entrada
+        if self.__relogio() >= expira_em:
+            del self.__entradas[chave]
+            self.__contadores["expirations"] += 1
+            self.__contadores["misses"] += 1
+            return None
+
+        self.__entradas.move_to_end(chave)
+        self.__contadores["hits"] += 1
+        return valor
+
+    def __guardar(self, chave: Hashable, valor: object) -> None:
+        self.__entradas[chave] = (valor, self.__relogio() + self.__ttl)
+        self.__entradas.move_to_end(chave)
+        while len(self.__entradas) > self.__capacidade:
+            self.__entradas.popitem(last=False)
+            self.__contadores["evictions"] += 1
+
+
+cache_contas = CacheLRUTTL(
+    capacidade=int(os.environ.get("CACHE_CAPACIDADE", "10000")),
+    ttl=float(os.environ.get("CACHE_TTL_SEGUNDOS", "5")),
+)
@@ -0,0 +1,142 @@
+import threading
+
+import pytest
+
+from src.models.cache.cache_lru_ttl import CacheLRUTTL
+
+
+class RelogioFalso:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_hit_e_miss():
+    cache = CacheLRUTTL(capacidade=10, ttl=5)
+    carregamentos = []
+
+    def carregar():
+        carregamentos.append(1)
+        return "valor"
+
+    assert cache.obter_ou_carregar("a", carregar) == "valor"
+    assert cache.obter_ou_carregar("a", carregar) == "valor"
+
+    assert len(carregamentos) == 1
+    assert cache.estatisticas() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 0,
+        "size": 1,
+    }
+
+
+def test_despeja_menos_usado_recentemente():
+    cache = CacheLRUTTL(capacidade=2, ttl=5)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+    cache.obter("a")
+    cache.guardar("c", 3)
+
+    assert cache.obter("b") is None
+    assert cache.obter("a") == 1
+    assert cache.obter("c") == 3
+    assert cache.estatisticas()["evictions"] == 1
+
+
+def test_expira_pelo_ttl():
+    relogio = RelogioFalso()
+    cache = CacheLRUTTL(capacidade=10, ttl=5, relogio=relogio)
+    cache.guardar("a", 1)
+
+    relogio.agora = 4.9
+    assert cache.obter("a") == 1
+    relogio.agora = 5.0
+    assert cache.obter("a") is None
+    assert cache.estatisticas()["expirations"] == 1
+    assert cache.estatisticas()["size"] == 0
+
+
+def test_invalidar_remove_entradas():
+    cache = CacheLRUTTL(capacidade=10, ttl=5)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+
+    cache.invalidar("a", "inexistente")
+
+    assert cache.obter("a") is None
+    assert cache.obter("b") == 2
+
+
+def test_none_nao_e_guardado():
+    cache = CacheLRUTTL(capacidade=10, ttl=5)
+
+    cache.obter_ou_carregar("a", lambda: None)
+
+    assert cache.estatisticas()["size"] == 0
+
+
+def test_invalidacao_durante_carga_descarta_valor_antigo():
+    cache = CacheLRUTTL(capacidade=10, ttl=5)
+    carregando = threading.Event()
+    liberar = threading.Event()
+
+    def carregar_lento():
+        carregando.set()
+        liberar.wait(timeout=5)
+        return "antigo"
+
+    leitor = threading.Thread(
+        target=cache.obter_ou_carregar, args=("a", carregar_lento)
+    )
+    leitor.start()
+    carregando.wait(timeout=5)
+    cache.invalidar("a")
+    liberar.set()
+    leitor.join()
+
+    assert cache.obter("a") is None
+
+
+def test_invalidar_outra_chave_durante_carga_nao_descarta_valor():
+    cache = CacheLRUTTL(capacidade=10, ttl=5)
+    carregando = threading.Event()
+    liberar = threading.Event()
+
+    def carregar_lento():
+        carregando.set()
+        liberar.wait(timeout=5)
+        return "novo"
+
+    leitor = threading.Thread(
+        target=cache.obter_ou_carregar, args=("a", carregar_lento)
+    )
+    leitor.start()
+    carregando.wait(timeout=5)
+    cache.invalidar("b")
+    liberar.set()
+    leitor.join()
+
+    assert cache.obter("a") == "novo"
+
+
+def test_carga_com_erro_nao_deixa_estado():
+    cache = CacheLRUTTL(capacidade=10, ttl=5)
+
+    def carregar_com_erro():
+        raise RuntimeError("banco fora")
+
+    with pytest.raises(RuntimeError):
+        cache.obter_ou_carregar("a", carregar_com_erro)
+
+    assert cache.obter_ou_carregar("a", lambda: 1) == 1
+    assert cache.obter("a") == 1
+
+
+@pytest.mark.parametrize("capacidade, ttl", [(0, 5), (10, 0)])
+def test_parametros_invalidos(capacidade, ttl):
+    with pytest.raises(ValueError):
+        CacheLRUTTL(capacidade=capacidade, ttl=ttl)
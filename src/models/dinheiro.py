@@ -0,0 +1,33 @@
+from decimal import Decimal, InvalidOperation
+from typing import Union
+
+CENTAVOS_POR_REAL = 100
+UM_CENTAVO = Decimal("0.01")
+
+ValorMonetario = Union[Decimal, int, str, float]
+
+
+def para_centavos(valor: ValorMonetario) -> int:
+    """
+    Converte um valor em reais para centavos inteiros.
+
+    Floats passam por str() antes de virar Decimal, para que 0.1 seja lido
+    como "0.1" e não como 0.1000000000000000055... Valores com frações de
+    centavo são rejeitados em vez de arredondados.
+    """
+    try:
+        reais = Decimal(str(valor)) if isinstance(valor, float) else Decimal(valor)
+    except (InvalidOperation, TypeError) as exc:
+        raise ValueError(f"Valor monetário inválido: {valor!r}") from exc
+
+    if not reais.is_finite():
+        raise ValueError(f"Valor monetário inválido: {valor!r}")
+    if reais != reais.quantize(UM_CENTAVO):
+        raise ValueError(f"Valor monetário com mais de duas casas decimais: {valor}")
+
+    return int(reais * CENTAVOS_POR_REAL)
+
+
+def para_reais(centavos: int) -> Decimal:
+    """Converte centavos inteiros para Decimal em reais, com duas casas."""
+    return Decimal(int(centavos)).scaleb(-2)
@@ -0,0 +1,374 @@
+"""
+Auditoria dos índices do banco SQLite.
+
+Compara os índices existentes (sqlite_master / PRAGMA index_list) com os
+declarados nas entidades (Base.metadata) e aponta:
+
+    duplicado         - mesmas colunas de outro índice, sem acrescentar nada
+    redundante        - prefixo de outro índice ou da chave primária (rowid)
+    nao_usado         - nenhuma consulta da carga usa o índice (EXPLAIN QUERY PLAN)
+    fora_do_modelo    - existe no banco mas não está declarado nas entidades
+    ausente_no_banco  - declarado nas entidades mas não existe no banco
+
+Índices que garantem UNIQUE ou PRIMARY KEY nunca são candidatos a remoção.
+A carga padrão são as consultas emitidas pelos repositórios, executadas
+numa cópia temporária do banco.
+
+    python -m src.models.sqlite.auditoria_indices --banco storage.db
+    python -m src.models.sqlite.auditoria_indices --migracao init/migrations/006_x.sql
+"""
+
+import argparse
+import re
+import sqlite3
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+from sqlalchemy import UniqueConstraint, event
+
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+from src.models.sqlite.settings.base import Base
+from src.models.sqlite.settings.connection import DBConnectionHandler
+
+TIPOS_REMOVIVEIS = ("duplicado", "redundante")
+
+_USO_DE_INDICE = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+
+# Chamadas dos repositórios cujo SQL forma a carga padrão da auditoria.
+# Operações de escrita entram porque também procuram linhas por índice.
+CARGA_FISICA: Dict[str, Callable[[PessoaFisicaRepository], object]] = {
+    "buscar_por_id": lambda r: r.buscar_por_id(1),
+    "buscar_por_email": lambda r: r.buscar_por_email("auditoria@indices.com"),
+    "buscar_por_celular": lambda r: r.buscar_por_celular("000-0000"),
+    "buscar_por_categoria": lambda r: r.buscar_por_categoria("Auditoria"),
+    "buscar_com_saldo_maior_que": lambda r: r.buscar_com_saldo_maior_que(
+        Decimal("100")
+    ),
+    "buscar_por_nome": lambda r: r.buscar_por_nome("auditoria", ("id",), 10),
+    "listar_projecao": lambda r: r.listar_projecao(("id", "saldo"), 10, apos_id=1),
+    "relatorio_por_categoria": lambda r: r.relatorio_por_categoria(),
+    "depositar_dinheiro": lambda r: r.depositar_dinheiro(1, Decimal("1")),
+    "sacar_dinheiro": lambda r: r.sacar_dinheiro(1, Decimal("1")),
+    "transferir": lambda r: r.transferir(1, 2, Decimal("1")),
+    "realizar_extrato": lambda r: r.realizar_extrato(1),
+}
+
+CARGA_JURIDICA: Dict[str, Callable[[PessoaJuridicaRepository], object]] = {
+    "buscar_por_id": lambda r: r.buscar_por_id(1),
+    "buscar_por_email_corporativo": lambda r: r.buscar_por_email_corporativo(
+        "auditoria@indices.com"
+    ),
+    "buscar_por_celular": lambda r: r.buscar_por_celular("000-0000"),
+    "buscar_por_categoria": lambda r: r.buscar_por_categoria("Auditoria"),
+    "buscar_por_saldo_maior_que": lambda r: r.buscar_por_saldo_maior_que(
+        Decimal("100")
+    ),
+    "buscar_com_faturamento_maior_que": lambda r: r.buscar_com_faturamento_maior_que(
+        Decimal("100")
+    ),
+    "buscar_por_idade_empresa": lambda r: r.buscar_por_idade_empresa(5, 10),
+    "buscar_por_nome": lambda r: r.buscar_por_nome("auditoria", ("id",), 10),
+    "listar_projecao": lambda r: r.listar_projecao(("id", "saldo"), 10, apos_id=1),
+    "relatorio_por_categoria": lambda r: r.relatorio_por_categoria(),
+    "depositar_dinheiro": lambda r: r.depositar_dinheiro(1, Decimal("1")),
+    "sacar_dinheiro": lambda r: r.sacar_dinheiro(1, Decimal("1")),
+    "transferir": lambda r: r.transferir(1, 2, Decimal("1")),
+    "realizar_extrato": lambda r: r.realizar_extrato(1),
+}
+
+
+class Indice(NamedTuple):
+    nome: str
+    tabela: str
+    chave: tuple  # ((coluna, desc, collation), ...)
+    unico: bool
+    origem: str  # "c" (CREATE INDEX), "u" (UNIQUE) ou "pk"
+    parcial: bool
+
+    @property
+    def colunas(self) -> tuple:
+        return tuple(coluna for coluna, _, _ in self.chave)
+
+
+class Achado(NamedTuple):
+    tipo: str
+    tabela: str
+    indice: str
+    motivo: str
+
+
+def ler_indices(conn: sqlite3.Connection, tabelas: Iterable[str]) -> List[Indice]:
+    indices = []
+    for tabela in tabelas:
+        for _, nome, unico, origem, parcial in conn.execute(
+            f"PRAGMA index_list({tabela})"
+        ):
+            chave = tuple(
+                (linha[2], bool(linha[3]), linha[4])
+                for linha in conn.execute(f"PRAGMA index_xinfo({nome})")
+                if linha[5]
+            )
+            indices.append(
+                Indice(nome, tabela, chave, bool(unico), origem, bool(parcial))
+            )
+    return indices
+
+
+def coluna_rowid(conn: sqlite3.Connection, tabela: str) -> Optional[str]:
+    """Nome da coluna INTEGER PRIMARY KEY (alias do rowid), se houver."""
+    chaves = [
+        (nome, tipo)
+        for _, nome, tipo, _, _, pk in conn.execute(f"PRAGMA table_info({tabela})")
+        if pk
+    ]
+    if len(chaves) == 1 and chaves[0][1].upper() == "INTEGER":
+        return chaves[0][0]
+    return None
+
+
+def encontrar_redundantes(
+    indices: Sequence[Indice], rowids: Dict[str, Optional[str]]
+) -> List[Achado]:
+    achados = []
+    for indice in indices:
+        if indice.origem != "c" or indice.parcial:
+            continue
+        motivo = _motivo_redundancia(indice, indices, rowids.get(indice.tabela))
+        if motivo is not None:
+            achados.append(Achado(motivo[0], indice.tabela, indice.nome, motivo[1]))
+    return achados
+
+
+def _motivo_redundancia(indice: Indice, indices: Sequence[Indice], rowid):
+    if not indice.unico and indice.colunas[0] == rowid:
+        return "redundante", f"começa pela chave primária {rowid} (rowid)"
+
+    for outro in indices:
+        if outro.nome == indice.nome or outro.tabela != indice.tabela:
+            continue
+        if outro.parcial:
+            continue
+        if outro.chave == indice.chave:
+            if outro.unico and not indice.unico:
+                return "duplicado", f"mesmas colunas do índice único {outro.nome}"
+            if outro.unico == indice.unico and (
+                outro.origem != "c" or outro.nome < indice.nome
+            ):
+                return "duplicado", f"mesmas colunas de {outro.nome}"
+        elif (
+            not indice.unico
+            and len(indice.chave) < len(outro.chave)
+            and outro.chave[: len(indice.chave)] == indice.chave
+        ):
+            return "redundante", f"prefixo de {outro.nome}{outro.colunas}"
+    return None
+
+
+def indices_usados(conn: sqlite3.Connection, consultas: Iterable[tuple]) -> Set[str]:
+    """Índices citados no EXPLAIN QUERY PLAN de cada (sql, parâmetros)."""
+    usados = set()
+    for statement, parametros in consultas:
+        for linha in conn.execute(f"EXPLAIN QUERY PLAN {statement}", parametros):
+            usados.update(_USO_DE_INDICE.findall(linha[3]))
+    return usados
+
+
+def encontrar_nao_usados(indices: Sequence[Indice], usados: Set[str]) -> List[Achado]:
+    return [
+        Achado(
+            "nao_usado",
+            indice.tabela,
+            indice.nome,
+            "nenhuma consulta da carga usa o índice",
+        )
+        for indice in indices
+        if indice.origem == "c" and not indice.unico and indice.nome not in usados
+    ]
+
+
+def comparar_com_modelo(
+    indices: Sequence[Indice], metadata=Base.metadata
+) -> List[Achado]:
+    achados = []
+    for tabela in metadata.sorted_tables:
+        declarados = {
+            tuple(coluna.name for coluna in indice.columns): indice.name
+            for indice in tabela.indexes
+        }
+        declarados.update(
+            {
+                tuple(coluna.name for coluna in restricao.columns): "UNIQUE"
+                for restricao in tabela.constraints
+                if isinstance(restricao, UniqueConstraint)
+            }
+        )
+        no_banco = {
+            indice.colunas: indice.nome
+            for indice in indices
+            if indice.tabela == tabela.name
+        }
+
+        for colunas, nome in no_banco.items():
+            if colunas not in declarados:
+                achados.append(
+                    Achado(
+                        "fora_do_modelo",
+                        tabela.name,
+                        nome,
+                        f"{colunas} não está declarado em {tabela.name}",
+                    )
+                )
+        for colunas, nome in declarados.items():
+            if colunas not in no_banco:
+                achados.append(
+                    Achado(
+                        "ausente_no_banco",
+                        tabela.name,
+                        nome,
+                        f"declarado nas entidades sobre {colunas}, sem índice no banco",
+                    )
+                )
+    return achados
+
+
+def capturar_carga_padrao(caminho_banco: Path) -> List[tuple]:
+    """
+    Executa CARGA_FISICA e CARGA_JURIDICA numa cópia temporária do banco e
+    devolve o SQL emitido, como (statement, parâmetros).
+    """
+    consultas = []
+    with tempfile.TemporaryDirectory() as diretorio:
+        copia = Path(diretorio) / "auditoria.db"
+        with sqlite3.connect(caminho_banco) as origem, sqlite3.connect(
+            copia
+        ) as destino:
+            origem.backup(destino)
+
+        handler = DBConnectionHandler(f"sqlite:///{copia}", pragma_profile="padrao")
+        handler.connect_to_db()
+        engine = handler.get_engine()
+
+        def registrar(conn, cursor, statement, parameters, context, executemany):
+            if not executemany:
+                consultas.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", registrar)
+        try:
+            for carga, repository in (
+                (CARGA_FISICA, PessoaFisicaRepository(handler)),
+                (CARGA_JURIDICA, PessoaJuridicaRepository(handler)),
+            ):
+                for chamada in carga.values():
+                    try:
+                        chamada(repository)
+                    except ValueError:
+                        # Conta inexistente ou saldo insuficiente: o SQL já foi emitido
+                        pass
+        finally:
+            event.remove(engine, "before_cursor_execute", registrar)
+            engine.dispose()
+    return consultas
+
+
+def auditar(
+    caminho_banco: Path, consultas_extras: Sequence[tuple] = ()
+) -> List[Achado]:
+    tabelas = [tabela.name for tabela in Base.metadata.sorted_tables]
+    consultas = capturar_carga_padrao(caminho_banco) + list(consultas_extras)
+
+    with sqlite3.connect(caminho_banco) as conn:
+        indices = ler_indices(conn, tabelas)
+        rowids = {tabela: coluna_rowid(conn, tabela) for tabela in tabelas}
+        usados = indices_usados(conn, consultas)
+
+    redundantes = encontrar_redundantes(indices, rowids)
+    ja_apontados = {achado.indice for achado in redundantes}
+    return (
+        redundantes
+        + [
+            achado
+            for achado in encontrar_nao_usados(indices, usados)
+            if achado.indice not in ja_apontados
+        ]
+        + comparar_com_modelo(indices)
+    )
+
+
+def gerar_migracao(
+    achados: Sequence[Achado],
+    nome_arquivo: str,
+    tipos: Sequence[str] = TIPOS_REMOVIVEIS,
+) -> str:
+    numero = re.match(r"\d+", nome_arquivo)
+    titulo = f"Migração {numero.group()}" if numero else "Migração"
+    linhas = [
+        f"-- {titulo}: remove índices apontados pela auditoria de índices.",
+        f"-- Uso: sqlite3 storage.db < init/migrations/{nome_arquivo}",
+        "--",
+        "-- Gerada por: python -m src.models.sqlite.auditoria_indices --migracao",
+    ]
+    for achado in achados:
+        if achado.tipo in tipos:
+            linhas += [
+                "",
+                f"-- {achado.tipo}: {achado.motivo}",
+                f"DROP INDEX IF EXISTS {achado.indice};",
+            ]
+    return "\n".join(linhas) + "\n"
+
+
+def ler_consultas(caminho: Path) -> List[tuple]:
+    """Arquivo com um SELECT/UPDATE/DELETE por linha, sem parâmetros."""
+    return [
+        (linha.strip().rstrip(";"), ())
+        for linha in caminho.read_text(encoding="utf-8").splitlines()
+        if linha.strip() and not linha.lstrip().startswith("--")
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Auditoria de índices do SQLite")
+    parser.add_argument("--banco", type=Path, default=Path("storage.db"))
+    parser.add_argument(
+        "--consultas",
+        type=Path,
+        help="arquivo com consultas extras (uma por linha) para a análise de uso",
+    )
+    parser.add_argument(
+        "--migracao",
+        type=Path,
+        help="grava um script com DROP INDEX dos duplicados e redundantes",
+    )
+    parser.add_argument(
+        "--incluir-nao-usados",
+        action="store_true",
+        help="inclui também os índices não usados na migração",
+    )
+    args = parser.parse_args(argv)
+
+    extras = ler_consultas(args.consultas) if args.consultas else []
+    achados = auditar(args.banco, extras)
+
+    if not achados:
+        print("Nenhum problema encontrado nos índices")
+    print(f"{'tipo':<18}{'tabela':<18}{'índice':<36}motivo")
+    for achado in achados:
+        print(f"{achado.tipo:<18}{achado.tabela:<18}{achado.indice:<36}{achado.motivo}")
+
+    if args.migracao:
+        tipos = TIPOS_REMOVIVEIS + (("nao_usado",) if args.incluir_nao_usados else ())
+        args.migracao.write_text(
+            gerar_migracao(achados, args.migracao.name, tipos), encoding="utf-8"
+        )
+        print(f"Migração gravada em {args.migracao}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,31 @@
 from datetime import datetime
-from sqlalchemy import Column, String, BIGINT, NUMERIC, INT, DateTime, CheckConstraint
+from sqlalchemy import Column, String, BIGINT, INT, DateTime, CheckConstraint, Index
 from src.models.sqlite.settings.base import Base
+from src.models.sqlite.entities.tipos import Centavos
 
 class PessoaJuridicaTable(Base):
     __tablename__ = "pessoa_juridica"
 
     id = Column(BIGINT, primary_key=True)
-    faturamento = Column(NUMERIC(10, 2), nullable=False)
+    faturamento = Column("faturamento_centavos", Centavos, nullable=False)
     idade = Column(INT, nullable=False)
     nome_fantasia = Column(String(200), nullable=False, index=True)
     celular = Column(String(15), nullable=False, unique=True)
     email_corporativo = Column(String(150), nullable=False, unique=True)
     categoria = Column(String(50), nullable=False)
-    saldo = Column(NUMERIC(15, 2), nullable=False, default=0.0)
+    saldo = Column("saldo_centavos", Centavos, nullable=False, default=0)
     criado_em = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Único caminho de escrita de atualizado_em: o schema não tem trigger para ele
     atualizado_em = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     __table_args__ = (
         CheckConstraint('idade >= 0', name='check_idade_minima'),
-        CheckConstraint('faturamento >= 0', name='check_faturamento_positivo'),
-        CheckConstraint('saldo >= 0', name='check_saldo_positivo'),
+        CheckConstraint('faturamento_centavos >= 0', name='check_faturamento_positivo'),
+        CheckConstraint('saldo_centavos >= 0', name='check_saldo_positivo'),
+        Index('idx_pessoa_juridica_categoria', 'categoria'),
+        Index('idx_pessoa_juridica_saldo', 'saldo_centavos'),
+        Index('idx_pessoa_juridica_faturamento', 'faturamento_centavos'),
+        Index('idx_pessoa_juridica_idade', 'idade'),
     )
 
     def __repr__(self):
@@ -0,0 +1,31 @@
+from sqlalchemy import BIGINT
+from sqlalchemy.types import TypeDecorator
+
+from src.models.dinheiro import para_centavos, para_reais
+
+
+class Centavos(TypeDecorator):  # pylint: disable=too-many-ancestors
+    """
+    Dinheiro guardado como inteiro de centavos (BIGINT).
+
+    No Python o atributo continua sendo Decimal em reais; a conversão
+    acontece só na fronteira com o banco. Dentro do SQL (saldo - :valor,
+    SUM, comparações) a aritmética é toda inteira, sem arredondamento.
+    """
+
+    impl = BIGINT
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return para_centavos(value)
+
+    def process_literal_param(self, value, dialect):
+        return self.process_bind_param(value, dialect)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # AVG devolve REAL; o resultado é arredondado para o centavo
+        return para_reais(round(value))
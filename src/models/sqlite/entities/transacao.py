@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    BIGINT,
+    CheckConstraint,
+    Column,
+    DateTime,
+    Index,
+    String,
+)
+
+from src.models.sqlite.entities.tipos import Centavos
+from src.models.sqlite.settings.base import Base
+
+
+class TransacaoTable(Base):
+    """
+    Livro-razão append-only: uma linha por débito ou crédito em conta.
+
+    O índice (conta_tipo, conta_id, criado_em, id) atende o extrato: filtro
+    por conta, faixa de datas e paginação por cursor sem varrer a tabela.
+    """
+
+    __tablename__ = "transacoes"
+
+    id = Column(BIGINT, primary_key=True)
+    conta_tipo = Column(String(10), nullable=False)
+    conta_id = Column(BIGINT, nullable=False)
+    tipo = Column(String(10), nullable=False)
+    operacao = Column(String(20), nullable=False)
+    valor = Column("valor_centavos", Centavos, nullable=False)
+    contraparte_tipo = Column(String(10), nullable=True)
+    contraparte_id = Column(BIGINT, nullable=True)
+    criado_em = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("valor_centavos > 0", name="check_valor_positivo"),
+        CheckConstraint("tipo IN ('debito', 'credito')", name="check_tipo_transacao"),
+        Index("idx_transacoes_conta_data", "conta_tipo", "conta_id", "criado_em", "id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"Transação: [id={self.id}, conta={self.conta_tipo}:{self.conta_id}, "
+            f"tipo={self.tipo}, valor={self.valor}]"
+        )
@@ -0,0 +1,125 @@
+# pylint: disable=duplicate-code
+from abc import ABC, abstractmethod
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Sequence, Union
+
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+
+
+class PessoaFisicaAsyncRepositoryInterface(ABC):
+    """Mesmos métodos de PessoaFisicaRepositoryInterface, como corrotinas."""
+
+    # CRUD BÁSICO
+    @abstractmethod
+    async def criar_pessoa(self, pessoa_data: dict) -> PessoaFisicaTable:
+        pass
+
+    @abstractmethod
+    async def criar_pessoas_em_lote(
+        self, pessoas: List[dict], tamanho_lote: int = 500
+    ) -> List[Union[int, IntegrityError]]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_id(self, pessoa_id: int) -> Optional[PessoaFisicaTable]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_email(self, email: str) -> Optional[PessoaFisicaTable]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_celular(self, celular: str) -> Optional[PessoaFisicaTable]:
+        pass
+
+    @abstractmethod
+    async def listar_todas(self) -> List[PessoaFisicaTable]:
+        pass
+
+    @abstractmethod
+    async def listar_pagina(
+        self, limite: int, apos_id: Optional[int] = None
+    ) -> List[PessoaFisicaTable]:
+        pass
+
+    @abstractmethod
+    async def listar_projecao(
+        self, colunas: Sequence[str], limite: int, apos_id: Optional[int] = None
+    ) -> List[Row]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_nome(
+        self, termo: str, colunas: Sequence[str], limite: int, deslocamento: int = 0
+    ) -> List[Row]:
+        pass
+
+    @abstractmethod
+    async def iterar_todas(
+        self, tamanho_lote: int = 1000
+    ) -> AsyncIterator[PessoaFisicaTable]:
+        pass
+
+    @abstractmethod
+    async def atualizar_pessoa(
+        self, pessoa_id: int, dados_atualizacao: dict
+    ) -> Optional[PessoaFisicaTable]:
+        pass
+
+    @abstractmethod
+    async def deletar_pessoa(self, pessoa_id: int) -> bool:
+        pass
+
+    # OPERAÇÕES BANCÁRIAS
+    @abstractmethod
+    async def sacar_dinheiro(self, pessoa_id: int, valor: Decimal) -> bool:
+        pass
+
+    @abstractmethod
+    async def depositar_dinheiro(self, pessoa_id: int, valor: Decimal) -> bool:
+        pass
+
+    @abstractmethod
+    async def transferir(
+        self,
+        pessoa_id: int,
+        destino_id: int,
+        valor: Decimal,
+        tipo_destino: str = "fisica",
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def obter_saldo(self, pessoa_id: int) -> Decimal:
+        pass
+
+    @abstractmethod
+    async def realizar_extrato(
+        self,
+        pessoa_id: int,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limite: int = 50,
+        cursor: Optional[int] = None,
+    ) -> dict:
+        pass
+
+    # CONSULTAS ESPECÍFICAS
+    @abstractmethod
+    async def buscar_por_categoria(self, categoria: str) -> List[PessoaFisicaTable]:
+        pass
+
+    @abstractmethod
+    async def buscar_com_saldo_maior_que(
+        self, valor: Decimal
+    ) -> List[PessoaFisicaTable]:
+        pass
+
+    # RELATÓRIOS
+    @abstractmethod
+    async def relatorio_por_categoria(self) -> List[Row]:
+        pass
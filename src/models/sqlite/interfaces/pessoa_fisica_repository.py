@@ -1,7 +1,11 @@
 # pylint: disable=duplicate-code
 from abc import ABC, abstractmethod
+from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Union
+
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 
 from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
 
@@ -13,6 +17,12 @@ class PessoaFisicaRepositoryInterface(ABC):
     def criar_pessoa(self, pessoa_data: dict) -> PessoaFisicaTable:
         pass
 
+    @abstractmethod
+    def criar_pessoas_em_lote(
+        self, pessoas: List[dict], tamanho_lote: int = 500
+    ) -> List[Union[int, IntegrityError]]:
+        pass
+
     @abstractmethod
     def buscar_por_id(self, pessoa_id: int) -> Optional[PessoaFisicaTable]:
         pass
@@ -29,6 +39,28 @@ class PessoaFisicaRepositoryInterface(ABC):
     def listar_todas(self) -> List[PessoaFisicaTable]:
         pass
 
+    @abstractmethod
+    def listar_pagina(
+        self, limite: int, apos_id: Optional[int] = None
+    ) -> List[PessoaFisicaTable]:
+        pass
+
+    @abstractmethod
+    def listar_projecao(
+        self, colunas: Sequence[str], limite: int, apos_id: Optional[int] = None
+    ) -> List[Row]:
+        pass
+
+    @abstractmethod
+    def buscar_por_nome(
+        self, termo: str, colunas: Sequence[str], limite: int, deslocamento: int = 0
+    ) -> List[Row]:
+        pass
+
+    @abstractmethod
+    def iterar_todas(self, tamanho_lote: int = 1000) -> Iterator[PessoaFisicaTable]:
+        pass
+
     @abstractmethod
     def atualizar_pessoa(
         self, pessoa_id: int, dados_atualizacao: dict
@@ -48,12 +80,29 @@ class PessoaFisicaRepositoryInterface(ABC):
     def depositar_dinheiro(self, pessoa_id: int, valor: Decimal) -> bool:
         pass
 
+    @abstractmethod
+    def transferir(
+        self,
+        pessoa_id: int,
+        destino_id: int,
+        valor: Decimal,
+        tipo_destino: str = "fisica",
+    ) -> bool:
+        pass
+
     @abstractmethod
     def obter_saldo(self, pessoa_id: int) -> Decimal:
         pass
 
     @abstractmethod
-    def realizar_extrato(self, pessoa_id: int) -> dict:
+    def realizar_extrato(
+        self,
+        pessoa_id: int,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limite: int = 50,
+        cursor: Optional[int] = None,
+    ) -> dict:
         pass
 
     # CONSULTAS ESPECÍFICAS
@@ -64,3 +113,8 @@ class PessoaFisicaRepositoryInterface(ABC):
     @abstractmethod
     def buscar_com_saldo_maior_que(self, valor: Decimal) -> List[PessoaFisicaTable]:
         pass
+
+    # RELATÓRIOS
+    @abstractmethod
+    def relatorio_por_categoria(self) -> List[Row]:
+        pass
@@ -0,0 +1,139 @@
+# pylint: disable=duplicate-code
+from abc import ABC, abstractmethod
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Sequence, Union
+
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+
+from src.models.sqlite.entities.pessoa_juridica import PessoaJuridicaTable
+
+
+class PessoaJuridicaAsyncRepositoryInterface(ABC):
+    """Mesmos métodos de PessoaJuridicaRepositoryInterface, como corrotinas."""
+
+    # CRUD BÁSICO
+    @abstractmethod
+    async def criar_empresa(self, empresa_data: dict) -> PessoaJuridicaTable:
+        pass
+
+    @abstractmethod
+    async def criar_empresas_em_lote(
+        self, empresas: List[dict], tamanho_lote: int = 500
+    ) -> List[Union[int, IntegrityError]]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_id(self, empresa_id: int) -> Optional[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_email_corporativo(
+        self, email: str
+    ) -> Optional[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_celular(self, celular: str) -> Optional[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def listar_todas(self) -> List[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def listar_pagina(
+        self, limite: int, apos_id: Optional[int] = None
+    ) -> List[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def listar_projecao(
+        self, colunas: Sequence[str], limite: int, apos_id: Optional[int] = None
+    ) -> List[Row]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_nome(
+        self, termo: str, colunas: Sequence[str], limite: int, deslocamento: int = 0
+    ) -> List[Row]:
+        pass
+
+    @abstractmethod
+    async def iterar_todas(
+        self, tamanho_lote: int = 1000
+    ) -> AsyncIterator[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def atualizar_empresa(
+        self, empresa_id: int, dados_atualizacao: dict
+    ) -> Optional[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def deletar_empresa(self, empresa_id: int) -> bool:
+        pass
+
+    # OPERAÇÕES BANCÁRIAS
+    @abstractmethod
+    async def sacar_dinheiro(self, empresa_id: int, valor: Decimal) -> bool:
+        pass
+
+    @abstractmethod
+    async def depositar_dinheiro(self, empresa_id: int, valor: Decimal) -> bool:
+        pass
+
+    @abstractmethod
+    async def transferir(
+        self,
+        empresa_id: int,
+        destino_id: int,
+        valor: Decimal,
+        tipo_destino: str = "juridica",
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def obter_saldo(self, empresa_id: int) -> Decimal:
+        pass
+
+    @abstractmethod
+    async def realizar_extrato(
+        self,
+        empresa_id: int,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limite: int = 50,
+        cursor: Optional[int] = None,
+    ) -> dict:
+        pass
+
+    # CONSULTAS ESPECÍFICAS
+    @abstractmethod
+    async def buscar_por_categoria(self, categoria: str) -> List[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_saldo_maior_que(
+        self, valor: Decimal
+    ) -> List[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def buscar_com_faturamento_maior_que(
+        self, valor: Decimal
+    ) -> List[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    async def buscar_por_idade_empresa(
+        self, idade_min: int, idade_max: int
+    ) -> List[PessoaJuridicaTable]:
+        pass
+
+    # RELATÓRIOS
+    @abstractmethod
+    async def relatorio_por_categoria(self) -> List[Row]:
+        pass
@@ -1,7 +1,11 @@
 # pylint: disable=duplicate-code
 from abc import ABC, abstractmethod
+from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Union
+
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 
 from src.models.sqlite.entities.pessoa_juridica import PessoaJuridicaTable
 
@@ -13,6 +17,12 @@ class PessoaJuridicaRepositoryInterface(ABC):
     def criar_empresa(self, empresa_data: dict) -> PessoaJuridicaTable:
         pass
 
+    @abstractmethod
+    def criar_empresas_em_lote(
+        self, empresas: List[dict], tamanho_lote: int = 500
+    ) -> List[Union[int, IntegrityError]]:
+        pass
+
     @abstractmethod
     def buscar_por_id(self, empresa_id: int) -> Optional[PessoaJuridicaTable]:
         pass
@@ -29,6 +39,28 @@ class PessoaJuridicaRepositoryInterface(ABC):
     def listar_todas(self) -> List[PessoaJuridicaTable]:
         pass
 
+    @abstractmethod
+    def listar_pagina(
+        self, limite: int, apos_id: Optional[int] = None
+    ) -> List[PessoaJuridicaTable]:
+        pass
+
+    @abstractmethod
+    def listar_projecao(
+        self, colunas: Sequence[str], limite: int, apos_id: Optional[int] = None
+    ) -> List[Row]:
+        pass
+
+    @abstractmethod
+    def buscar_por_nome(
+        self, termo: str, colunas: Sequence[str], limite: int, deslocamento: int = 0
+    ) -> List[Row]:
+        pass
+
+    @abstractmethod
+    def iterar_todas(self, tamanho_lote: int = 1000) -> Iterator[PessoaJuridicaTable]:
+        pass
+
     @abstractmethod
     def atualizar_empresa(
         self, empresa_id: int, dados_atualizacao: dict
@@ -48,12 +80,29 @@ class PessoaJuridicaRepositoryInterface(ABC):
     def depositar_dinheiro(self, empresa_id: int, valor: Decimal) -> bool:
         pass
 
+    @abstractmethod
+    def transferir(
+        self,
+        empresa_id: int,
+        destino_id: int,
+        valor: Decimal,
+        tipo_destino: str = "juridica",
+    ) -> bool:
+        pass
+
     @abstractmethod
     def obter_saldo(self, empresa_id: int) -> Decimal:
         pass
 
     @abstractmethod
-    def realizar_extrato(self, empresa_id: int) -> dict:
+    def realizar_extrato(
+        self,
+        empresa_id: int,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limite: int = 50,
+        cursor: Optional[int] = None,
+    ) -> dict:
         pass
 
     # CONSULTAS ESPECÍFICAS
@@ -76,3 +125,8 @@ class PessoaJuridicaRepositoryInterface(ABC):
         self, idade_min: int, idade_max: int
     ) -> List[PessoaJuridicaTable]:
         pass
+
+    # RELATÓRIOS
+    @abstractmethod
+    def relatorio_por_categoria(self) -> List[Row]:
+        pass
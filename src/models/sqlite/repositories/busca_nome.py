@@ -0,0 +1,56 @@
+import re
+from typing import Sequence
+
+from sqlalchemy import Select, column, literal_column, select, table
+
+from src.models.sqlite.repositories.projecao import selecionar_colunas
+
+# Tabela FTS5 (init/schema.sql) que indexa o nome de cada tabela de contas
+TABELAS_BUSCA = {
+    "pessoa_fisica": "pessoa_fisica_busca",
+    "pessoa_juridica": "pessoa_juridica_busca",
+}
+
+_PALAVRA = re.compile(r"\w+")
+
+
+def montar_consulta_fts(termo: str) -> str:
+    """
+    Converte o texto digitado em uma consulta FTS5 de prefixos.
+
+    Cada palavra vira "palavra"* e todas precisam aparecer no nome, então
+    "harv spec" encontra "Harvey Specter". As aspas impedem que o texto seja
+    interpretado como sintaxe do FTS5 (AND, OR, NEAR, filtros de coluna).
+    """
+    palavras = _PALAVRA.findall(termo or "")
+    if not palavras:
+        raise ValueError("Informe ao menos uma palavra para a busca")
+    return " ".join(f'"{palavra}"*' for palavra in palavras)
+
+
+def selecionar_por_nome(
+    tabela, colunas: Sequence[str], termo: str, limite: int, deslocamento: int = 0
+) -> Select:
+    """
+    Projeção de `colunas` das linhas cujo nome casa com `termo`, da mais
+    relevante (bm25) para a menos relevante, com desempate por id.
+
+    A ordenação e o LIMIT rodam numa subconsulta só sobre o índice FTS5; a
+    tabela de contas é lida depois, pela chave primária, apenas para as
+    linhas da página. Ordenar depois do JOIN obrigaria a buscar a linha de
+    cada resultado, mesmo os que ficam fora da página.
+    """
+    busca = table(TABELAS_BUSCA[tabela.__tablename__], column("rowid"), column("rank"))
+    pagina = (
+        select(busca.c.rowid, busca.c.rank)
+        .where(literal_column(busca.name).op("MATCH")(montar_consulta_fts(termo)))
+        .order_by(busca.c.rank, busca.c.rowid)
+        .limit(limite)
+        .offset(deslocamento)
+        .subquery("pagina")
+    )
+    return (
+        selecionar_colunas(tabela, colunas)
+        .join_from(pagina, tabela, tabela.id == pagina.c.rowid)
+        .order_by(pagina.c.rank, tabela.id)
+    )
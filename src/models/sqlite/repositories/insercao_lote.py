@@ -0,0 +1,51 @@
+from typing import List, Sequence, Union
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+TAMANHO_LOTE_PADRAO = 500
+
+ResultadoInsercao = Union[int, IntegrityError]
+
+
+def inserir_em_lote(
+    session,
+    tabela,
+    linhas: Sequence[dict],
+    tamanho_lote: int = TAMANHO_LOTE_PADRAO,
+) -> List[ResultadoInsercao]:
+    """
+    Insere `linhas` em blocos de `tamanho_lote`, cada bloco em um único
+    INSERT ... RETURNING id (insertmanyvalues), tudo na transação da `session`.
+
+    Cada bloco roda dentro de um SAVEPOINT. Se o bloco violar alguma
+    constraint (email/celular duplicado, inclusive dentro do próprio lote),
+    o SAVEPOINT é desfeito e só aquele bloco é refeito linha a linha, cada
+    uma em seu próprio SAVEPOINT, para isolar as linhas com problema.
+
+    Retorna, na ordem de `linhas`, o id criado ou a IntegrityError da linha.
+    O commit fica a cargo de quem chama.
+    """
+    comando = insert(tabela).returning(tabela.id, sort_by_parameter_order=True)
+    resultados: List[ResultadoInsercao] = []
+
+    for inicio in range(0, len(linhas), tamanho_lote):
+        bloco = linhas[inicio : inicio + tamanho_lote]
+        try:
+            with session.begin_nested():
+                resultados.extend(session.scalars(comando, bloco).all())
+        except IntegrityError:
+            resultados.extend(_inserir_linha_a_linha(session, comando, bloco))
+
+    return resultados
+
+
+def _inserir_linha_a_linha(session, comando, bloco) -> List[ResultadoInsercao]:
+    resultados: List[ResultadoInsercao] = []
+    for linha in bloco:
+        try:
+            with session.begin_nested():
+                resultados.append(session.scalars(comando, [linha]).one())
+        except IntegrityError as error:
+            resultados.append(error)
+    return resultados
@@ -0,0 +1,251 @@
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from sqlalchemy import insert, select, tuple_, update
+
+from src.models.dinheiro import para_centavos
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+from src.models.sqlite.entities.pessoa_juridica import PessoaJuridicaTable
+from src.models.sqlite.entities.transacao import TransacaoTable
+
+TABELAS_CONTA = {
+    "fisica": PessoaFisicaTable,
+    "juridica": PessoaJuridicaTable,
+}
+
+TIPOS_CONTA = {tabela.__tablename__: tipo for tipo, tabela in TABELAS_CONTA.items()}
+
+LIMITE_MAXIMO_EXTRATO = 500
+
+
+class ResultadoOperacao(Enum):
+    OK = "ok"
+    NAO_ENCONTRADO = "nao_encontrado"
+    SALDO_INSUFICIENTE = "saldo_insuficiente"
+    DESTINO_NAO_ENCONTRADO = "destino_nao_encontrado"
+
+
+def debitar_saldo(
+    session,
+    tabela,
+    conta_id: int,
+    valor: Decimal,
+    operacao: str = "saque",
+    contraparte: Optional[Tuple[object, int]] = None,
+) -> ResultadoOperacao:
+    """
+    Debita `valor` em um único UPDATE condicional:
+
+        UPDATE tabela SET saldo = saldo - :valor
+        WHERE id = :conta_id AND saldo >= :valor
+
+    A checagem de saldo acontece dentro do próprio UPDATE, então dois saques
+    concorrentes não conseguem passar pela verificação ao mesmo tempo.
+    Em caso de sucesso o débito é registrado em `transacoes` na mesma
+    transação. O commit fica a cargo de quem chama.
+
+    Saldo e valor são centavos inteiros no banco (ver entities/tipos.py),
+    então a subtração e a comparação não acumulam erro de ponto flutuante.
+    """
+    _validar_valor(valor)
+    resultado = session.execute(
+        update(tabela)
+        .where(tabela.id == conta_id, tabela.saldo >= valor)
+        .values(saldo=tabela.saldo - valor)
+        .execution_options(synchronize_session=False)
+    )
+    if resultado.rowcount != 1:
+        return _resultado_falha(session, tabela, conta_id)
+
+    _registrar_transacao(
+        session, tabela, conta_id, "debito", operacao, valor, contraparte
+    )
+    return ResultadoOperacao.OK
+
+
+def creditar_saldo(
+    session,
+    tabela,
+    conta_id: int,
+    valor: Decimal,
+    operacao: str = "deposito",
+    contraparte: Optional[Tuple[object, int]] = None,
+) -> ResultadoOperacao:
+    _validar_valor(valor)
+    resultado = session.execute(
+        update(tabela)
+        .where(tabela.id == conta_id)
+        .values(saldo=tabela.saldo + valor)
+        .execution_options(synchronize_session=False)
+    )
+    if resultado.rowcount != 1:
+        return ResultadoOperacao.NAO_ENCONTRADO
+
+    _registrar_transacao(
+        session, tabela, conta_id, "credito", operacao, valor, contraparte
+    )
+    return ResultadoOperacao.OK
+
+
+def transferir_saldo(
+    session,
+    origem_tabela,
+    origem_id: int,
+    destino_tabela,
+    destino_id: int,
+    valor: Decimal,
+) -> ResultadoOperacao:
+    """
+    Debita a origem e credita o destino na mesma transação da `session`.
+
+    Os dois UPDATEs são emitidos sempre na ordem (nome da tabela, id), não na
+    ordem origem -> destino, para que transferências cruzadas A->B e B->A
+    bloqueiem as linhas na mesma sequência. Se qualquer lado falhar, quem
+    chama deve fazer rollback; nada é commitado aqui.
+    """
+    operacoes = sorted(
+        [
+            (origem_tabela.__tablename__, origem_id, True),
+            (destino_tabela.__tablename__, destino_id, False),
+        ]
+    )
+
+    for _, conta_id, debito in operacoes:
+        if debito:
+            resultado = debitar_saldo(
+                session,
+                origem_tabela,
+                conta_id,
+                valor,
+                operacao="transferencia",
+                contraparte=(destino_tabela, destino_id),
+            )
+        else:
+            resultado = creditar_saldo(
+                session,
+                destino_tabela,
+                conta_id,
+                valor,
+                operacao="transferencia",
+                contraparte=(origem_tabela, origem_id),
+            )
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                resultado = ResultadoOperacao.DESTINO_NAO_ENCONTRADO
+
+        if resultado is not ResultadoOperacao.OK:
+            return resultado
+
+    return ResultadoOperacao.OK
+
+
+def listar_transacoes(
+    session,
+    tabela,
+    conta_id: int,
+    data_inicio: Optional[datetime] = None,
+    data_fim: Optional[datetime] = None,
+    limite: int = 50,
+    cursor: Optional[int] = None,
+) -> Tuple[List[dict], Optional[int]]:
+    """
+    Página do extrato, da transação mais recente para a mais antiga.
+
+    A paginação é por cursor (id da última transação da página anterior) e
+    compara (criado_em, id) contra a linha do cursor, então cada página é uma
+    busca no índice idx_transacoes_conta_data, independente do tamanho do
+    histórico. Retorna as transações e o cursor da próxima página (ou None).
+    """
+    limite = max(1, min(limite, LIMITE_MAXIMO_EXTRATO))
+
+    consulta = select(
+        TransacaoTable.id,
+        TransacaoTable.tipo,
+        TransacaoTable.operacao,
+        TransacaoTable.valor,
+        TransacaoTable.contraparte_tipo,
+        TransacaoTable.contraparte_id,
+        TransacaoTable.criado_em,
+    ).where(
+        TransacaoTable.conta_tipo == TIPOS_CONTA[tabela.__tablename__],
+        TransacaoTable.conta_id == conta_id,
+    )
+
+    if data_inicio is not None:
+        consulta = consulta.where(TransacaoTable.criado_em >= data_inicio)
+    if data_fim is not None:
+        consulta = consulta.where(TransacaoTable.criado_em <= data_fim)
+    if cursor is not None:
+        criado_em_cursor = (
+            select(TransacaoTable.criado_em)
+            .where(TransacaoTable.id == cursor)
+            .scalar_subquery()
+        )
+        consulta = consulta.where(
+            tuple_(TransacaoTable.criado_em, TransacaoTable.id)
+            < tuple_(criado_em_cursor, cursor)
+        )
+
+    linhas = session.execute(
+        consulta.order_by(
+            TransacaoTable.criado_em.desc(), TransacaoTable.id.desc()
+        ).limit(limite + 1)
+    ).all()
+
+    proximo_cursor = linhas[limite - 1].id if len(linhas) > limite else None
+    transacoes = [
+        {
+            "id": linha.id,
+            "tipo": linha.tipo,
+            "operacao": linha.operacao,
+            "valor": linha.valor,
+            "contraparte_tipo": linha.contraparte_tipo,
+            "contraparte_id": linha.contraparte_id,
+            "criado_em": linha.criado_em,
+        }
+        for linha in linhas[:limite]
+    ]
+    return transacoes, proximo_cursor
+
+
+def _registrar_transacao(
+    session,
+    tabela,
+    conta_id: int,
+    tipo: str,
+    operacao: str,
+    valor: Decimal,
+    contraparte: Optional[Tuple[object, int]],
+) -> None:
+    contraparte_tabela, contraparte_id = contraparte or (None, None)
+    session.execute(
+        insert(TransacaoTable).values(
+            conta_tipo=TIPOS_CONTA[tabela.__tablename__],
+            conta_id=conta_id,
+            tipo=tipo,
+            operacao=operacao,
+            valor=valor,
+            contraparte_tipo=(
+                TIPOS_CONTA[contraparte_tabela.__tablename__]
+                if contraparte_tabela is not None
+                else None
+            ),
+            contraparte_id=contraparte_id,
+        )
+    )
+
+
+def _validar_valor(valor: Decimal) -> None:
+    # Converte antes do UPDATE para que frações de centavo virem ValueError
+    # aqui, e não um StatementError do SQLAlchemy no meio da transação.
+    para_centavos(valor)
+
+
+def _resultado_falha(session, tabela, conta_id: int) -> ResultadoOperacao:
+    # Só roda quando o UPDATE não afetou nenhuma linha, para diferenciar
+    # "conta inexistente" de "saldo insuficiente".
+    existe = session.query(tabela.id).filter(tabela.id == conta_id).one_or_none()
+    if existe is None:
+        return ResultadoOperacao.NAO_ENCONTRADO
+    return ResultadoOperacao.SALDO_INSUFICIENTE
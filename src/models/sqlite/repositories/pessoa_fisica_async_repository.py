@@ -0,0 +1,305 @@
+# pylint: disable=duplicate-code
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Row
+
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+from src.models.sqlite.interfaces.pessoa_fisica_async_repository import (
+    PessoaFisicaAsyncRepositoryInterface,
+)
+from src.models.sqlite.repositories.busca_nome import selecionar_por_nome
+from src.models.sqlite.repositories.insercao_lote import (
+    TAMANHO_LOTE_PADRAO,
+    ResultadoInsercao,
+    inserir_em_lote,
+)
+from src.models.sqlite.repositories.operacoes_saldo import (
+    TABELAS_CONTA,
+    ResultadoOperacao,
+    creditar_saldo,
+    debitar_saldo,
+    listar_transacoes,
+    transferir_saldo,
+)
+from src.models.sqlite.repositories.projecao import selecionar_colunas
+from src.models.sqlite.repositories.relatorios import selecionar_relatorio_fisica
+
+
+class PessoaFisicaAsyncRepository(PessoaFisicaAsyncRepositoryInterface):
+    """
+    Versão asyncio do PessoaFisicaRepository, sobre o AsyncDBConnectionHandler.
+
+    Mesmas consultas, validações e mensagens de erro do repositório síncrono.
+    As operações de saldo e a inserção em lote reaproveitam as funções de
+    operacoes_saldo.py e insercao_lote.py via `session.run_sync`, para que
+    as regras de débito/crédito existam em um lugar só.
+    """
+
+    def __init__(self, db_connection) -> None:
+        self.__db_connection = db_connection
+
+    # CRUD BÁSICO
+
+    async def criar_pessoa(self, pessoa_data: dict) -> PessoaFisicaTable:
+        async with self.__db_connection.sessao() as session:
+            nova_pessoa = PessoaFisicaTable(**pessoa_data)
+            session.add(nova_pessoa)
+            await session.commit()
+            await session.refresh(nova_pessoa)
+            return nova_pessoa
+
+    async def criar_pessoas_em_lote(
+        self, pessoas: List[dict], tamanho_lote: int = TAMANHO_LOTE_PADRAO
+    ) -> List[ResultadoInsercao]:
+        async with self.__db_connection.sessao() as session:
+            resultados = await session.run_sync(
+                inserir_em_lote, PessoaFisicaTable, pessoas, tamanho_lote
+            )
+            await session.commit()
+            return resultados
+
+    async def buscar_por_id(self, pessoa_id: int) -> Optional[PessoaFisicaTable]:
+        return await self.__buscar_um(PessoaFisicaTable.id == pessoa_id)
+
+    async def buscar_por_email(self, email: str) -> Optional[PessoaFisicaTable]:
+        return await self.__buscar_um(PessoaFisicaTable.email == email)
+
+    async def buscar_por_celular(self, celular: str) -> Optional[PessoaFisicaTable]:
+        return await self.__buscar_um(PessoaFisicaTable.celular == celular)
+
+    async def listar_todas(self) -> List[PessoaFisicaTable]:
+        return await self.__listar(select(PessoaFisicaTable))
+
+    async def listar_pagina(
+        self, limite: int, apos_id: Optional[int] = None
+    ) -> List[PessoaFisicaTable]:
+        consulta = select(PessoaFisicaTable)
+        if apos_id is not None:
+            consulta = consulta.where(PessoaFisicaTable.id > apos_id)
+        return await self.__listar(
+            consulta.order_by(PessoaFisicaTable.id).limit(limite)
+        )
+
+    async def listar_projecao(
+        self, colunas: Sequence[str], limite: int, apos_id: Optional[int] = None
+    ) -> List[Row]:
+        consulta = selecionar_colunas(PessoaFisicaTable, colunas)
+        if apos_id is not None:
+            consulta = consulta.where(PessoaFisicaTable.id > apos_id)
+        consulta = consulta.order_by(PessoaFisicaTable.id).limit(limite)
+
+        async with self.__db_connection.sessao() as session:
+            return (await session.execute(consulta)).all()
+
+    async def buscar_por_nome(
+        self, termo: str, colunas: Sequence[str], limite: int, deslocamento: int = 0
+    ) -> List[Row]:
+        consulta = selecionar_por_nome(
+            PessoaFisicaTable, colunas, termo, limite, deslocamento
+        )
+        async with self.__db_connection.sessao() as session:
+            return (await session.execute(consulta)).all()
+
+    async def iterar_todas(
+        self, tamanho_lote: int = 1000
+    ) -> AsyncIterator[PessoaFisicaTable]:
+        """Como no síncrono: `tamanho_lote` linhas por vez do cursor (yield_per)."""
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.stream_scalars(
+                select(PessoaFisicaTable)
+                .order_by(PessoaFisicaTable.id)
+                .execution_options(yield_per=tamanho_lote)
+            )
+            async for pessoa in resultado:
+                yield pessoa
+
+    async def atualizar_pessoa(
+        self, pessoa_id: int, dados_atualizacao: dict
+    ) -> Optional[PessoaFisicaTable]:
+        async with self.__db_connection.sessao() as session:
+            pessoa = await session.scalar(
+                select(PessoaFisicaTable).where(PessoaFisicaTable.id == pessoa_id)
+            )
+            if pessoa is None:
+                return None
+
+            campos_permitidos = {
+                "nome_completo",
+                "email",
+                "celular",
+                "categoria",
+                "renda_mensal",
+                "idade",
+            }
+
+            for campo, valor in dados_atualizacao.items():
+                if campo in campos_permitidos and hasattr(pessoa, campo):
+                    setattr(pessoa, campo, valor)
+
+            await session.commit()
+            await session.refresh(pessoa)
+            return pessoa
+
+    async def deletar_pessoa(self, pessoa_id: int) -> bool:
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.execute(
+                delete(PessoaFisicaTable).where(PessoaFisicaTable.id == pessoa_id)
+            )
+            await session.commit()
+            return resultado.rowcount > 0
+
+    # Operações Bancárias
+
+    async def sacar_dinheiro(self, pessoa_id: int, valor: Decimal) -> bool:
+        if valor <= 0:
+            raise ValueError("Valor de saque deve ser positivo")
+
+        limite_saque_fisica = Decimal("50000.00")
+        if valor > limite_saque_fisica:
+            raise ValueError(
+                f"Limite de saque excedido. Máximo permitido: ${limite_saque_fisica}"
+            )
+
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.run_sync(
+                debitar_saldo, PessoaFisicaTable, pessoa_id, valor
+            )
+
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                raise ValueError(f"Pessoa com ID {pessoa_id} não encontrada")
+            if resultado is ResultadoOperacao.SALDO_INSUFICIENTE:
+                raise ValueError(f"Saldo Insuficiente. Saque: {valor}")
+
+            await session.commit()
+            return True
+
+    async def depositar_dinheiro(self, pessoa_id: int, valor: Decimal) -> bool:
+        if valor <= 0:
+            raise ValueError("Valor de depósito deve ser positivo.")
+
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.run_sync(
+                creditar_saldo, PessoaFisicaTable, pessoa_id, valor
+            )
+
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                raise ValueError(f"Pessoa com ID {pessoa_id} não foi encontrada")
+
+            await session.commit()
+            return True
+
+    async def transferir(
+        self,
+        pessoa_id: int,
+        destino_id: int,
+        valor: Decimal,
+        tipo_destino: str = "fisica",
+    ) -> bool:
+        if valor <= 0:
+            raise ValueError("Valor de transferência deve ser positivo")
+        if tipo_destino not in TABELAS_CONTA:
+            raise ValueError(f"Tipo de conta de destino inválido: '{tipo_destino}'")
+        if tipo_destino == "fisica" and destino_id == pessoa_id:
+            raise ValueError("Conta de origem e destino devem ser diferentes")
+
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.run_sync(
+                transferir_saldo,
+                PessoaFisicaTable,
+                pessoa_id,
+                TABELAS_CONTA[tipo_destino],
+                destino_id,
+                valor,
+            )
+
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                raise ValueError(f"Pessoa com ID {pessoa_id} não encontrada")
+            if resultado is ResultadoOperacao.DESTINO_NAO_ENCONTRADO:
+                raise ValueError(f"Conta de destino com ID {destino_id} não encontrada")
+            if resultado is ResultadoOperacao.SALDO_INSUFICIENTE:
+                raise ValueError(f"Saldo Insuficiente. Transferência: {valor}")
+
+            await session.commit()
+            return True
+
+    async def obter_saldo(self, pessoa_id: int) -> Decimal:
+        async with self.__db_connection.sessao() as session:
+            saldo = (
+                await session.execute(
+                    select(PessoaFisicaTable.saldo).where(
+                        PessoaFisicaTable.id == pessoa_id
+                    )
+                )
+            ).one_or_none()
+            if saldo is None:
+                raise ValueError(f"Pessoa com ID {pessoa_id} não encontrada")
+            return saldo.saldo
+
+    async def realizar_extrato(
+        self,
+        pessoa_id: int,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limite: int = 50,
+        cursor: Optional[int] = None,
+    ) -> dict:
+        async with self.__db_connection.sessao() as session:
+            pessoa = await session.scalar(
+                select(PessoaFisicaTable).where(PessoaFisicaTable.id == pessoa_id)
+            )
+            if pessoa is None:
+                raise ValueError(f"Pessoa com ID {pessoa_id} não encontrada")
+
+            transacoes, proximo_cursor = await session.run_sync(
+                listar_transacoes,
+                PessoaFisicaTable,
+                pessoa_id,
+                data_inicio=data_inicio,
+                data_fim=data_fim,
+                limite=limite,
+                cursor=cursor,
+            )
+
+            return {
+                "id": pessoa.id,
+                "nome_completo": pessoa.nome_completo,
+                "email": pessoa.email,
+                "saldo": pessoa.saldo,
+                "categoria": pessoa.categoria,
+                "criado_em": pessoa.criado_em,
+                "atualizado_em": pessoa.atualizado_em,
+                "transacoes": transacoes,
+                "proximo_cursor": proximo_cursor,
+            }
+
+    # Queries(Consultas) Específicas
+
+    async def buscar_por_categoria(self, categoria: str) -> List[PessoaFisicaTable]:
+        return await self.__listar(
+            select(PessoaFisicaTable).where(PessoaFisicaTable.categoria == categoria)
+        )
+
+    async def buscar_com_saldo_maior_que(
+        self, valor: Decimal
+    ) -> List[PessoaFisicaTable]:
+        return await self.__listar(
+            select(PessoaFisicaTable).where(PessoaFisicaTable.saldo > valor)
+        )
+
+    # Relatórios
+
+    async def relatorio_por_categoria(self) -> List[Row]:
+        consulta = selecionar_relatorio_fisica()
+        async with self.__db_connection.sessao() as session:
+            return (await session.execute(consulta)).all()
+
+    async def __buscar_um(self, condicao) -> Optional[PessoaFisicaTable]:
+        async with self.__db_connection.sessao() as session:
+            return await session.scalar(select(PessoaFisicaTable).where(condicao))
+
+    async def __listar(self, consulta) -> List[PessoaFisicaTable]:
+        async with self.__db_connection.sessao() as session:
+            return list((await session.scalars(consulta)).all())
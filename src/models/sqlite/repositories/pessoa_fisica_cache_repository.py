@@ -0,0 +1,158 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterator, List, Optional, Sequence
+
+from sqlalchemy.engine import Row
+
+from src.models.cache.cache_lru_ttl import CacheLRUTTL, cache_contas
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+from src.models.sqlite.interfaces.pessoa_fisica_repository import (
+    PessoaFisicaRepositoryInterface,
+)
+from src.models.sqlite.repositories.insercao_lote import ResultadoInsercao
+
+
+class PessoaFisicaCacheRepository(PessoaFisicaRepositoryInterface):
+    """
+    Decorator de PessoaFisicaRepository com cache de leitura por id.
+
+    buscar_por_id e obter_saldo são servidos do cache (read-through). Toda
+    operação que altera uma conta invalida as entradas dela, inclusive a
+    conta de destino de uma transferência, que pode ser de outro tipo. Por
+    isso o cache padrão (cache_contas) é compartilhado entre os repositórios
+    de pessoa física e jurídica. O TTL limita o tempo em que outro processo
+    pode enxergar um valor antigo.
+
+    Os objetos devolvidos por buscar_por_id vêm do cache e são
+    compartilhados: devem ser tratados como somente leitura.
+    """
+
+    TIPO_CONTA = "fisica"
+
+    def __init__(
+        self,
+        repository: PessoaFisicaRepositoryInterface,
+        cache: CacheLRUTTL = cache_contas,
+    ) -> None:
+        self.__repository = repository
+        self.__cache = cache
+
+    # Leituras com cache
+
+    def buscar_por_id(self, pessoa_id: int) -> Optional[PessoaFisicaTable]:
+        return self.__cache.obter_ou_carregar(
+            (self.TIPO_CONTA, "registro", pessoa_id),
+            lambda: self.__repository.buscar_por_id(pessoa_id),
+        )
+
+    def obter_saldo(self, pessoa_id: int) -> Decimal:
+        return self.__cache.obter_ou_carregar(
+            (self.TIPO_CONTA, "saldo", pessoa_id),
+            lambda: self.__repository.obter_saldo(pessoa_id),
+        )
+
+    # Escritas que invalidam o cache
+
+    def atualizar_pessoa(
+        self, pessoa_id: int, dados_atualizacao: dict
+    ) -> Optional[PessoaFisicaTable]:
+        try:
+            return self.__repository.atualizar_pessoa(pessoa_id, dados_atualizacao)
+        finally:
+            self.__invalidar(self.TIPO_CONTA, pessoa_id)
+
+    def deletar_pessoa(self, pessoa_id: int) -> bool:
+        try:
+            return self.__repository.deletar_pessoa(pessoa_id)
+        finally:
+            self.__invalidar(self.TIPO_CONTA, pessoa_id)
+
+    def sacar_dinheiro(self, pessoa_id: int, valor: Decimal) -> bool:
+        try:
+            return self.__repository.sacar_dinheiro(pessoa_id, valor)
+        finally:
+            self.__invalidar(self.TIPO_CONTA, pessoa_id)
+
+    def depositar_dinheiro(self, pessoa_id: int, valor: Decimal) -> bool:
+        try:
+            return self.__repository.depositar_dinheiro(pessoa_id, valor)
+        finally:
+            self.__invalidar(self.TIPO_CONTA, pessoa_id)
+
+    def transferir(
+        self,
+        pessoa_id: int,
+        destino_id: int,
+        valor: Decimal,
+        tipo_destino: str = "fisica",
+    ) -> bool:
+        try:
+            return self.__repository.transferir(
+                pessoa_id, destino_id, valor, tipo_destino
+            )
+        finally:
+            self.__invalidar(self.TIPO_CONTA, pessoa_id)
+            self.__invalidar(tipo_destino, destino_id)
+
+    # Demais operações: repassadas sem cache
+
+    def criar_pessoa(self, pessoa_data: dict) -> PessoaFisicaTable:
+        return self.__repository.criar_pessoa(pessoa_data)
+
+    def criar_pessoas_em_lote(
+        self, pessoas: List[dict], tamanho_lote: int = 500
+    ) -> List[ResultadoInsercao]:
+        return self.__repository.criar_pessoas_em_lote(pessoas, tamanho_lote)
+
+    def buscar_por_email(self, email: str) -> Optional[PessoaFisicaTable]:
+        return self.__repository.buscar_por_email(email)
+
+    def buscar_por_celular(self, celular: str) -> Optional[PessoaFisicaTable]:
+        return self.__repository.buscar_por_celular(celular)
+
+    def listar_todas(self) -> List[PessoaFisicaTable]:
+        return self.__repository.listar_todas()
+
+    def listar_pagina(
+        self, limite: int, apos_id: Optional[int] = None
+    ) -> List[PessoaFisicaTable]:
+        return self.__repository.listar_pagina(limite, apos_id)
+
+    def listar_projecao(
+        self, colunas: Sequence[str], limite: int, apos_id: Optional[int] = None
+    ) -> List[Row]:
+        return self.__repository.listar_projecao(colunas, limite, apos_id)
+
+    def buscar_por_nome(
+        self, termo: str, colunas: Sequence[str], limite: int, deslocamento: int = 0
+    ) -> List[Row]:
+        return self.__repository.buscar_por_nome(termo, colunas, limite, deslocamento)
+
+    def iterar_todas(self, tamanho_lote: int = 1000) -> Iterator[PessoaFisicaTable]:
+        return self.__repository.iterar_todas(tamanho_lote)
+
+    def realizar_extrato(
+        self,
+        pessoa_id: int,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limite: int = 50,
+        cursor: Optional[int] = None,
+    ) -> dict:
+        return self.__repository.realizar_extrato(
+            pessoa_id, data_inicio, data_fim, limite, cursor
+        )
+
+    def buscar_por_categoria(self, categoria: str) -> List[PessoaFisicaTable]:
+        return self.__repository.buscar_por_categoria(categoria)
+
+    def buscar_com_saldo_maior_que(self, valor: Decimal) -> List[PessoaFisicaTable]:
+        return self.__repository.buscar_com_saldo_maior_que(valor)
+
+    def relatorio_por_categoria(self) -> List[Row]:
+        return self.__repository.relatorio_por_categoria()
+
+    def __invalidar(self, tipo_conta: str, conta_id: int) -> None:
+        self.__cache.invalidar(
+            (tipo_conta, "registro", conta_id), (tipo_conta, "saldo", conta_id)
+        )
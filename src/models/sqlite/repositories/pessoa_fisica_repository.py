@@ -1,12 +1,31 @@
+from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 
+from sqlalchemy import select
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import NoResultFound
 
 from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
 from src.models.sqlite.interfaces.pessoa_fisica_repository import (
     PessoaFisicaRepositoryInterface,
 )
+from src.models.sqlite.repositories.busca_nome import selecionar_por_nome
+from src.models.sqlite.repositories.insercao_lote import (
+    TAMANHO_LOTE_PADRAO,
+    ResultadoInsercao,
+    inserir_em_lote,
+)
+from src.models.sqlite.repositories.operacoes_saldo import (
+    TABELAS_CONTA,
+    ResultadoOperacao,
+    creditar_saldo,
+    debitar_saldo,
+    listar_transacoes,
+    transferir_saldo,
+)
+from src.models.sqlite.repositories.projecao import selecionar_colunas
+from src.models.sqlite.repositories.relatorios import selecionar_relatorio_fisica
 
 
 class PessoaFisicaRepository(PessoaFisicaRepositoryInterface):
@@ -32,6 +51,22 @@ class PessoaFisicaRepository(PessoaFisicaRepositoryInterface):
             database.session.refresh(nova_pessoa)
             return nova_pessoa
 
+    def criar_pessoas_em_lote(
+        self, pessoas: List[dict], tamanho_lote: int = TAMANHO_LOTE_PADRAO
+    ) -> List[ResultadoInsercao]:
+        """
+        Insere vários registros em uma única transação (um commit só).
+
+        Retorna, na ordem de `pessoas`, o id criado ou a IntegrityError da
+        linha rejeitada (ver inserir_em_lote).
+        """
+        with self.__db_connection as database:
+            resultados = inserir_em_lote(
+                database.session, PessoaFisicaTable, pessoas, tamanho_lote
+            )
+            database.session.commit()
+            return resultados
+
     def buscar_por_id(self, pessoa_id: int) -> Optional[PessoaFisicaTable]:
         with self.__db_connection as database:
             try:
@@ -72,6 +107,69 @@ class PessoaFisicaRepository(PessoaFisicaRepositoryInterface):
         with self.__db_connection as database:
             return database.session.query(PessoaFisicaTable).all()
 
+    def listar_pagina(
+        self, limite: int, apos_id: Optional[int] = None
+    ) -> List[PessoaFisicaTable]:
+        """
+        Página ordenada por id, começando depois de `apos_id`.
+
+        Paginação por chave (WHERE id > :apos_id ORDER BY id LIMIT :limite):
+        cada página é uma busca na chave primária, sem OFFSET, então o custo
+        não cresce com o tamanho da tabela.
+        """
+        with self.__db_connection as database:
+            consulta = database.session.query(PessoaFisicaTable)
+            if apos_id is not None:
+                consulta = consulta.filter(PessoaFisicaTable.id > apos_id)
+            return consulta.order_by(PessoaFisicaTable.id).limit(limite).all()
+
+    def listar_projecao(
+        self, colunas: Sequence[str], limite: int, apos_id: Optional[int] = None
+    ) -> List[Row]:
+        """
+        Mesma paginação de listar_pagina, mas lendo só `colunas` via Core.
+
+        Retorna Rows em vez de PessoaFisicaTable: sem hidratar objetos ORM nem
+        registrar cada linha no identity map.
+        """
+        consulta = selecionar_colunas(PessoaFisicaTable, colunas)
+        if apos_id is not None:
+            consulta = consulta.where(PessoaFisicaTable.id > apos_id)
+        consulta = consulta.order_by(PessoaFisicaTable.id).limit(limite)
+
+        with self.__db_connection as database:
+            return database.session.execute(consulta).all()
+
+    def buscar_por_nome(
+        self, termo: str, colunas: Sequence[str], limite: int, deslocamento: int = 0
+    ) -> List[Row]:
+        """
+        Busca textual em nome_completo pelo índice FTS5 (ver busca_nome.py),
+        ordenada por relevância. Cada palavra de `termo` casa por prefixo.
+        """
+        consulta = selecionar_por_nome(
+            PessoaFisicaTable, colunas, termo, limite, deslocamento
+        )
+        with self.__db_connection as database:
+            return database.session.execute(consulta).all()
+
+    def iterar_todas(self, tamanho_lote: int = 1000) -> Iterator[PessoaFisicaTable]:
+        """
+        Percorre a tabela inteira em ordem de id, buscando `tamanho_lote`
+        linhas por vez do cursor (yield_per).
+
+        A sessão fica aberta até o gerador ser consumido ou fechado. O identity
+        map só guarda referências fracas, então objetos já consumidos são
+        liberados e a memória fica proporcional ao lote, não ao total.
+        """
+        with self.__db_connection as database:
+            resultado = database.session.execute(
+                select(PessoaFisicaTable)
+                .order_by(PessoaFisicaTable.id)
+                .execution_options(yield_per=tamanho_lote)
+            )
+            yield from resultado.scalars()
+
     def atualizar_pessoa(
         self, pessoa_id: int, dados_atualizacao: dict
     ) -> Optional[PessoaFisicaTable]:
@@ -116,51 +214,74 @@ class PessoaFisicaRepository(PessoaFisicaRepositoryInterface):
     # Operações Bancárias
 
     def sacar_dinheiro(self, pessoa_id: int, valor: Decimal) -> bool:
-        with self.__db_connection as database:
-            try:
-                pessoa = (
-                    database.session.query(PessoaFisicaTable)
-                    .filter(PessoaFisicaTable.id == pessoa_id)
-                    .one()
-                )
-            except NoResultFound as exc:
-                raise ValueError(f"Pessoa com ID {pessoa_id} não encontrada") from exc
+        if valor <= 0:
+            raise ValueError("Valor de saque deve ser positivo")
 
-            if valor <= 0:
-                raise ValueError("Valor de saque deve ser positivo")
+        limite_saque_fisica = Decimal("50000.00")
+        if valor > limite_saque_fisica:
+            raise ValueError(
+                f"Limite de saque excedido. Máximo permitido: ${limite_saque_fisica}"
+            )
 
-            limite_saque_fisica = Decimal("50000.00")
-            if valor > limite_saque_fisica:
-                raise ValueError(
-                    f"Limite de saque excedido. Máximo permitido: ${limite_saque_fisica}"
-                )
+        with self.__db_connection as database:
+            resultado = debitar_saldo(
+                database.session, PessoaFisicaTable, pessoa_id, valor
+            )
 
-            if pessoa.saldo < valor:
-                raise ValueError(
-                    f"Saldo Insuficiente. Saldo: {pessoa.saldo}, Saque: {valor}"
-                )
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                raise ValueError(f"Pessoa com ID {pessoa_id} não encontrada")
+            if resultado is ResultadoOperacao.SALDO_INSUFICIENTE:
+                raise ValueError(f"Saldo Insuficiente. Saque: {valor}")
 
-            pessoa.saldo -= valor
             database.session.commit()
             return True
 
     def depositar_dinheiro(self, pessoa_id: int, valor: Decimal) -> bool:
+        if valor <= 0:
+            raise ValueError("Valor de depósito deve ser positivo.")
+
         with self.__db_connection as database:
-            try:
-                pessoa = (
-                    database.session.query(PessoaFisicaTable)
-                    .filter(PessoaFisicaTable.id == pessoa_id)
-                    .one()
-                )
-            except NoResultFound as exc:
-                raise ValueError(
-                    f"Pessoa com ID {pessoa_id} não foi encontrada"
-                ) from exc
+            resultado = creditar_saldo(
+                database.session, PessoaFisicaTable, pessoa_id, valor
+            )
+
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                raise ValueError(f"Pessoa com ID {pessoa_id} não foi encontrada")
+
+            database.session.commit()
+            return True
 
-            if valor <= 0:
-                raise ValueError("Valor de depósito deve ser positivo.")
+    def transferir(
+        self,
+        pessoa_id: int,
+        destino_id: int,
+        valor: Decimal,
+        tipo_destino: str = "fisica",
+    ) -> bool:
+        if valor <= 0:
+            raise ValueError("Valor de transferência deve ser positivo")
+        if tipo_destino not in TABELAS_CONTA:
+            raise ValueError(f"Tipo de conta de destino inválido: '{tipo_destino}'")
+        if tipo_destino == "fisica" and destino_id == pessoa_id:
+            raise ValueError("Conta de origem e destino devem ser diferentes")
+
+        with self.__db_connection as database:
+            resultado = transferir_saldo(
+                database.session,
+                PessoaFisicaTable,
+                pessoa_id,
+                TABELAS_CONTA[tipo_destino],
+                destino_id,
+                valor,
+            )
+
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                raise ValueError(f"Pessoa com ID {pessoa_id} não encontrada")
+            if resultado is ResultadoOperacao.DESTINO_NAO_ENCONTRADO:
+                raise ValueError(f"Conta de destino com ID {destino_id} não encontrada")
+            if resultado is ResultadoOperacao.SALDO_INSUFICIENTE:
+                raise ValueError(f"Saldo Insuficiente. Transferência: {valor}")
 
-            pessoa.saldo += valor
             database.session.commit()
             return True
 
@@ -176,7 +297,14 @@ class PessoaFisicaRepository(PessoaFisicaRepositoryInterface):
             except NoResultFound as exc:
                 raise ValueError(f"Pessoa com ID {pessoa_id} não encontrada") from exc
 
-    def realizar_extrato(self, pessoa_id: int) -> dict:
+    def realizar_extrato(
+        self,
+        pessoa_id: int,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limite: int = 50,
+        cursor: Optional[int] = None,
+    ) -> dict:
         with self.__db_connection as database:
             try:
                 pessoa = (
@@ -184,19 +312,31 @@ class PessoaFisicaRepository(PessoaFisicaRepositoryInterface):
                     .filter(PessoaFisicaTable.id == pessoa_id)
                     .one()
                 )
-
-                return {
-                    "id": pessoa.id,
-                    "nome_completo": pessoa.nome_completo,
-                    "email": pessoa.email,
-                    "saldo": float(pessoa.saldo),
-                    "categoria": pessoa.categoria,
-                    "criado_em": pessoa.criado_em,
-                    "atualizado_em": pessoa.atualizado_em,
-                }
             except NoResultFound as exc:
                 raise ValueError(f"Pessoa com ID {pessoa_id} não encontrada") from exc
 
+            transacoes, proximo_cursor = listar_transacoes(
+                database.session,
+                PessoaFisicaTable,
+                pessoa_id,
+                data_inicio=data_inicio,
+                data_fim=data_fim,
+                limite=limite,
+                cursor=cursor,
+            )
+
+            return {
+                "id": pessoa.id,
+                "nome_completo": pessoa.nome_completo,
+                "email": pessoa.email,
+                "saldo": pessoa.saldo,
+                "categoria": pessoa.categoria,
+                "criado_em": pessoa.criado_em,
+                "atualizado_em": pessoa.atualizado_em,
+                "transacoes": transacoes,
+                "proximo_cursor": proximo_cursor,
+            }
+
     # Queries(Consultas) Específicas
 
     def buscar_por_categoria(self, categoria: str) -> List[PessoaFisicaTable]:
@@ -216,3 +356,15 @@ class PessoaFisicaRepository(PessoaFisicaRepositoryInterface):
                 .all()
             )
             return pessoas
+
+    # Relatórios
+
+    def relatorio_por_categoria(self) -> List[Row]:
+        """
+        Uma linha por categoria com quantidade de contas, saldo total e renda
+        mensal média, calculados no banco (GROUP BY). O resultado cresce com
+        o número de categorias, não de pessoas.
+        """
+        consulta = selecionar_relatorio_fisica()
+        with self.__db_connection as database:
+            return database.session.execute(consulta).all()
@@ -0,0 +1,327 @@
+# pylint: disable=duplicate-code
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Row
+
+from src.models.sqlite.entities.pessoa_juridica import PessoaJuridicaTable
+from src.models.sqlite.interfaces.pessoa_juridica_async_repository import (
+    PessoaJuridicaAsyncRepositoryInterface,
+)
+from src.models.sqlite.repositories.busca_nome import selecionar_por_nome
+from src.models.sqlite.repositories.insercao_lote import (
+    TAMANHO_LOTE_PADRAO,
+    ResultadoInsercao,
+    inserir_em_lote,
+)
+from src.models.sqlite.repositories.operacoes_saldo import (
+    TABELAS_CONTA,
+    ResultadoOperacao,
+    creditar_saldo,
+    debitar_saldo,
+    listar_transacoes,
+    transferir_saldo,
+)
+from src.models.sqlite.repositories.projecao import selecionar_colunas
+from src.models.sqlite.repositories.relatorios import selecionar_relatorio_juridica
+
+
+class PessoaJuridicaAsyncRepository(PessoaJuridicaAsyncRepositoryInterface):
+    """
+    Versão asyncio do PessoaJuridicaRepository, sobre o AsyncDBConnectionHandler.
+
+    Mesmas consultas, validações e mensagens de erro do repositório síncrono.
+    As operações de saldo e a inserção em lote reaproveitam as funções de
+    operacoes_saldo.py e insercao_lote.py via `session.run_sync`, para que
+    as regras de débito/crédito existam em um lugar só.
+    """
+
+    def __init__(self, db_connection) -> None:
+        self.__db_connection = db_connection
+
+    # CRUD BÁSICO
+
+    async def criar_empresa(self, empresa_data: dict) -> PessoaJuridicaTable:
+        async with self.__db_connection.sessao() as session:
+            nova_empresa = PessoaJuridicaTable(**empresa_data)
+            session.add(nova_empresa)
+            await session.commit()
+            await session.refresh(nova_empresa)
+            return nova_empresa
+
+    async def criar_empresas_em_lote(
+        self, empresas: List[dict], tamanho_lote: int = TAMANHO_LOTE_PADRAO
+    ) -> List[ResultadoInsercao]:
+        async with self.__db_connection.sessao() as session:
+            resultados = await session.run_sync(
+                inserir_em_lote, PessoaJuridicaTable, empresas, tamanho_lote
+            )
+            await session.commit()
+            return resultados
+
+    async def buscar_por_id(self, empresa_id: int) -> Optional[PessoaJuridicaTable]:
+        return await self.__buscar_um(PessoaJuridicaTable.id == empresa_id)
+
+    async def buscar_por_email_corporativo(
+        self, email: str
+    ) -> Optional[PessoaJuridicaTable]:
+        return await self.__buscar_um(PessoaJuridicaTable.email_corporativo == email)
+
+    async def buscar_por_celular(self, celular: str) -> Optional[PessoaJuridicaTable]:
+        return await self.__buscar_um(PessoaJuridicaTable.celular == celular)
+
+    async def listar_todas(self) -> List[PessoaJuridicaTable]:
+        return await self.__listar(select(PessoaJuridicaTable))
+
+    async def listar_pagina(
+        self, limite: int, apos_id: Optional[int] = None
+    ) -> List[PessoaJuridicaTable]:
+        consulta = select(PessoaJuridicaTable)
+        if apos_id is not None:
+            consulta = consulta.where(PessoaJuridicaTable.id > apos_id)
+        return await self.__listar(
+            consulta.order_by(PessoaJuridicaTable.id).limit(limite)
+        )
+
+    async def listar_projecao(
+        self, colunas: Sequence[str], limite: int, apos_id: Optional[int] = None
+    ) -> List[Row]:
+        consulta = selecionar_colunas(PessoaJuridicaTable, colunas)
+        if apos_id is not None:
+            consulta = consulta.where(PessoaJuridicaTable.id > apos_id)
+        consulta = consulta.order_by(PessoaJuridicaTable.id).limit(limite)
+
+        async with self.__db_connection.sessao() as session:
+            return (await session.execute(consulta)).all()
+
+    async def buscar_por_nome(
+        self, termo: str, colunas: Sequence[str], limite: int, deslocamento: int = 0
+    ) -> List[Row]:
+        consulta = selecionar_por_nome(
+            PessoaJuridicaTable, colunas, termo, limite, deslocamento
+        )
+        async with self.__db_connection.sessao() as session:
+            return (await session.execute(consulta)).all()
+
+    async def iterar_todas(
+        self, tamanho_lote: int = 1000
+    ) -> AsyncIterator[PessoaJuridicaTable]:
+        """Como no síncrono: `tamanho_lote` linhas por vez do cursor (yield_per)."""
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.stream_scalars(
+                select(PessoaJuridicaTable)
+                .order_by(PessoaJuridicaTable.id)
+                .execution_options(yield_per=tamanho_lote)
+            )
+            async for empresa in resultado:
+                yield empresa
+
+    async def atualizar_empresa(
+        self, empresa_id: int, dados_atualizacao: dict
+    ) -> Optional[PessoaJuridicaTable]:
+        async with self.__db_connection.sessao() as session:
+            empresa = await session.scalar(
+                select(PessoaJuridicaTable).where(PessoaJuridicaTable.id == empresa_id)
+            )
+            if empresa is None:
+                return None
+
+            campos_permitidos = {
+                "nome_fantasia",
+                "email_corporativo",
+                "celular",
+                "categoria",
+                "faturamento",
+                "idade",
+            }
+
+            for campo, valor in dados_atualizacao.items():
+                if campo in campos_permitidos and hasattr(empresa, campo):
+                    setattr(empresa, campo, valor)
+
+            await session.commit()
+            await session.refresh(empresa)
+            return empresa
+
+    async def deletar_empresa(self, empresa_id: int) -> bool:
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.execute(
+                delete(PessoaJuridicaTable).where(PessoaJuridicaTable.id == empresa_id)
+            )
+            await session.commit()
+            return resultado.rowcount > 0
+
+    # Operações Bancárias
+
+    async def sacar_dinheiro(self, empresa_id: int, valor: Decimal) -> bool:
+        if valor <= 0:
+            raise ValueError("Valor de saque deve ser positivo")
+
+        limite_saque_juridica = Decimal("5000000.00")
+        if valor > limite_saque_juridica:
+            raise ValueError(
+                f"Limite de saque excedido. Máximo permitido: ${limite_saque_juridica}"
+            )
+
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.run_sync(
+                debitar_saldo, PessoaJuridicaTable, empresa_id, valor
+            )
+
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                raise ValueError(f"Empresa com ID {empresa_id} não encontrada")
+            if resultado is ResultadoOperacao.SALDO_INSUFICIENTE:
+                raise ValueError(f"Saldo Insuficiente. Saque: {valor}")
+
+            await session.commit()
+            return True
+
+    async def depositar_dinheiro(self, empresa_id: int, valor: Decimal) -> bool:
+        if valor <= 0:
+            raise ValueError("Valor de depósito deve ser positivo")
+
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.run_sync(
+                creditar_saldo, PessoaJuridicaTable, empresa_id, valor
+            )
+
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                raise ValueError(f"Empresa com ID {empresa_id} não encontrada")
+
+            await session.commit()
+            return True
+
+    async def transferir(
+        self,
+        empresa_id: int,
+        destino_id: int,
+        valor: Decimal,
+        tipo_destino: str = "juridica",
+    ) -> bool:
+        if valor <= 0:
+            raise ValueError("Valor de transferência deve ser positivo")
+        if tipo_destino not in TABELAS_CONTA:
+            raise ValueError(f"Tipo de conta de destino inválido: '{tipo_destino}'")
+        if tipo_destino == "juridica" and destino_id == empresa_id:
+            raise ValueError("Conta de origem e destino devem ser diferentes")
+
+        async with self.__db_connection.sessao() as session:
+            resultado = await session.run_sync(
+                transferir_saldo,
+                PessoaJuridicaTable,
+                empresa_id,
+                TABELAS_CONTA[tipo_destino],
+                destino_id,
+                valor,
+            )
+
+            if resultado is ResultadoOperacao.NAO_ENCONTRADO:
+                raise ValueError(f"Empresa com ID {empresa_id} não encontrada")
+            if resultado is ResultadoOperacao.DESTINO_NAO_ENCONTRADO:
+                raise ValueError(f"Conta de destino com ID {destino_id} não encontrada")
+            if resultado is ResultadoOperacao.SALDO_INSUFICIENTE:
+                raise ValueError(f"Saldo Insuficiente. Transferência: {valor}")
+
+            await session.commit()
+            return True
+
+    async def obter_saldo(self, empresa_id: int) -> Decimal:
+        async with self.__db_connection.sessao() as session:
+            saldo = (
+                await session.execute(
+                    select(PessoaJuridicaTable.saldo).where(
+                        PessoaJuridicaTable.id == empresa_id
+                    )
+                )
+            ).one_or_none()
+            if saldo is None:
+                raise ValueError(f"Empresa com ID {empresa_id} não encontrada")
+            return saldo.saldo
+
+    async def realizar_extrato(
+        self,
+        empresa_id: int,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limite: int = 50,
+        cursor: Optional[int] = None,
+    ) -> dict:
+        async with self.__db_connection.sessao() as session:
+            empresa = await session.scalar(
+                select(PessoaJuridicaTable).where(PessoaJuridicaTable.id == empresa_id)
+            )
+            if empresa is None:
+                raise ValueError(f"Empresa com ID {empresa_id} não encontrada")
+
+            transacoes, proximo_cursor = await session.run_sync(
+                listar_transacoes,
+                PessoaJuridicaTable,
+                empresa_id,
+                data_inicio=data_inicio,
+                data_fim=data_fim,
+                limite=limite,
+                cursor=cursor,
+            )
+
+            return {
+                "id": empresa.id,
+                "nome_fantasia": empresa.nome_fantasia,
+                "email_corporativo": empresa.email_corporativo,
+                "saldo": empresa.saldo,
+                "categoria": empresa.categoria,
+                "idade": empresa.idade,
+                "criado_em": empresa.criado_em,
+                "atualizado_em": empresa.atualizado_em,
+                "transacoes": transacoes,
+                "proximo_cursor": proximo_cursor,
+            }
+
+    # Queries(Consultas) Específicas
+
+    async def buscar_por_categoria(self, categoria: str) -> List[PessoaJuridicaTable]:
+        return await self.__listar(
+            select(PessoaJuridicaTable).where(
+                PessoaJuridicaTable.categoria == categoria
+            )
+        )
+
+    async def buscar_por_saldo_maior_que(
+        self, valor: Decimal
+    ) -> List[PessoaJuridicaTable]:
+        return await self.__listar(
+            select(PessoaJuridicaTable).where(PessoaJuridicaTable.saldo > valor)
+        )
+
+    async def buscar_com_faturamento_maior_que(
+        self, valor: Decimal
+    ) -> List[PessoaJuridicaTable]:
+        return await self.__listar(
+            select(PessoaJuridicaTable).where(PessoaJuridicaTable.faturamento > valor)
+        )
+
+    async def buscar_por_idade_empresa(
+        self, idade_min: int, idade_max: int
+    ) -> List[PessoaJuridicaTable]:
+        return await self.__listar(
+            select(PessoaJuridicaTable).where(
+                PessoaJuridicaTable.idade >= idade_min,
+                PessoaJuridicaTable.idade <= idade_max,
+            )
+        )
+
+    # Relatórios
+
+    async def relatorio_por_categoria(self) -> List[Row]:
+        consulta = selecionar_relatorio_juridica()
+        async with self.__db_connection.sessao() as session:
+            return (await session.execute(consulta)).all()
+
+    async def __buscar_um(self, condicao) -> Optional[PessoaJuridicaTable]:
+        async with self.__db_connection.sessao() as session:
+            return await session.scalar(select(PessoaJuridicaTable).where(condicao))
+
+    async def __listar(self, consulta) -> List[PessoaJuridicaTable]:
+        async with self.__db_connection.sessao() as session:
+            return list((await session.scalars(consulta)).all())
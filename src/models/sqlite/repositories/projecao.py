@@ -0,0 +1,26 @@
+from typing import Sequence
+
+from sqlalchemy import Select, inspect, select
+
+
+def selecionar_colunas(tabela, colunas: Sequence[str]) -> Select:
+    """
+    SELECT só das `colunas` pedidas de `tabela`, via Core.
+
+    O resultado são Rows (tuplas nomeadas, acesso por atributo), sem criar
+    instâncias ORM nem passar pelo identity map da sessão. As colunas são
+    pedidas pelo nome do atributo do mapeamento (ex.: saldo, e não
+    saldo_centavos) e voltam rotuladas com esse mesmo nome.
+    """
+    if not colunas:
+        raise ValueError("Informe ao menos uma coluna para a projeção")
+
+    mapeadas = inspect(tabela).columns
+    desconhecidas = [nome for nome in colunas if nome not in mapeadas]
+    if desconhecidas:
+        raise ValueError(
+            f"Colunas desconhecidas em {tabela.__tablename__}: "
+            f"{', '.join(desconhecidas)}"
+        )
+
+    return select(*(mapeadas[nome].label(nome) for nome in colunas))
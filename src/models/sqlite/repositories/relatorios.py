@@ -0,0 +1,45 @@
+from sqlalchemy import Select, func, select
+
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+from src.models.sqlite.entities.pessoa_juridica import PessoaJuridicaTable
+from src.models.sqlite.entities.tipos import Centavos
+
+
+def selecionar_relatorio_fisica() -> Select:
+    """
+    Uma linha por categoria com quantidade de contas, saldo total e renda
+    mensal média, calculados no banco (GROUP BY).
+    """
+    return (
+        select(
+            PessoaFisicaTable.categoria,
+            func.count(PessoaFisicaTable.id).label("quantidade"),
+            func.sum(PessoaFisicaTable.saldo).label("saldo_total"),
+            func.avg(PessoaFisicaTable.renda_mensal, type_=Centavos()).label(
+                "renda_mensal_media"
+            ),
+        )
+        .group_by(PessoaFisicaTable.categoria)
+        .order_by(PessoaFisicaTable.categoria)
+    )
+
+
+def selecionar_relatorio_juridica() -> Select:
+    """
+    Uma linha por categoria com quantidade de contas, saldo total e
+    faturamento médio, mínimo e máximo, calculados no banco (GROUP BY).
+    """
+    return (
+        select(
+            PessoaJuridicaTable.categoria,
+            func.count(PessoaJuridicaTable.id).label("quantidade"),
+            func.sum(PessoaJuridicaTable.saldo).label("saldo_total"),
+            func.avg(PessoaJuridicaTable.faturamento, type_=Centavos()).label(
+                "faturamento_medio"
+            ),
+            func.min(PessoaJuridicaTable.faturamento).label("faturamento_minimo"),
+            func.max(PessoaJuridicaTable.faturamento).label("faturamento_maximo"),
+        )
+        .group_by(PessoaJuridicaTable.categoria)
+        .order_by(PessoaJuridicaTable.categoria)
+    )
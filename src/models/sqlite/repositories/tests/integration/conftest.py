@@ -0,0 +1,47 @@
+import importlib
+import pkgutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from src.main import composer
+from src.main.routes.pessoa_fisica_routes import pessoa_fisica_route_bp
+from src.main.routes.pessoa_juridica_routes import pessoa_juridica_route_bp
+from src.main.server.json_provider import criar_json_provider
+from src.models.sqlite.settings.connection import DBConnectionHandler
+
+SCHEMA_PATH = Path(__file__).resolve().parents[6] / "init" / "schema.sql"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Banco SQLite temporário criado a partir de init/schema.sql (com seeds)."""
+    caminho = tmp_path / "storage.db"
+    with sqlite3.connect(caminho) as conn:
+        conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return caminho
+
+
+@pytest.fixture
+def db_handler(db_path):
+    handler = DBConnectionHandler(f"sqlite:///{db_path}")
+    handler.connect_to_db()
+    yield handler
+    handler.get_engine().dispose()
+
+
+@pytest.fixture
+def client(db_handler, monkeypatch):
+    """Cliente Flask com os composers apontando para o banco temporário."""
+    for modulo in pkgutil.iter_modules(composer.__path__):
+        modulo_composer = importlib.import_module(f"{composer.__name__}.{modulo.name}")
+        if hasattr(modulo_composer, "db_connection_handler"):
+            monkeypatch.setattr(modulo_composer, "db_connection_handler", db_handler)
+
+    app = Flask(__name__)
+    app.json = criar_json_provider(app)
+    app.register_blueprint(pessoa_fisica_route_bp)
+    app.register_blueprint(pessoa_juridica_route_bp)
+    return app.test_client()
@@ -0,0 +1,188 @@
+import asyncio
+
+import pytest
+from flask_cors import CORS
+
+from src.main.server.asgi import AsgiApp
+from src.models.sqlite.settings.async_connection import AsyncDBConnectionHandler
+
+
+@pytest.fixture(name="asgi")
+def fixture_asgi(client, db_path):
+    """
+    Chama o AsgiApp com um banco temporário e devolve (status, cabeçalhos,
+    corpo). Depende de `client` para os composers já apontarem para o banco.
+    """
+
+    def requisitar(metodo, caminho, corpo=b"", query=b"", headers=()):
+        async def _rodar():
+            app = AsgiApp(AsyncDBConnectionHandler(f"sqlite:///{db_path}"))
+            await app.iniciar()
+            recebidas = []
+
+            async def receive():
+                return {"type": "http.request", "body": corpo, "more_body": False}
+
+            async def send(mensagem):
+                recebidas.append(mensagem)
+
+            scope = {
+                "type": "http",
+                "method": metodo,
+                "path": caminho,
+                "query_string": query,
+                "headers": list(headers),
+            }
+            try:
+                await app(scope, receive, send)
+            finally:
+                await app.encerrar()
+            return recebidas
+
+        mensagens = asyncio.run(_rodar())
+        inicio, partes = mensagens[0], mensagens[1:]
+        return (
+            inicio["status"],
+            dict(inicio["headers"]),
+            b"".join(parte["body"] for parte in partes),
+        )
+
+    return requisitar
+
+
+@pytest.mark.parametrize(
+    "caminho, query",
+    [
+        ("/fisica", b"limit=2"),
+        ("/fisica", b"limit=2&after_id=2"),
+        ("/fisica/busca", b"q=ana"),
+        ("/fisica/busca", b"q=Jos\xc3\xa9"),
+        ("/juridica/busca", b"q=Jos%C3%A9"),
+        ("/fisica/relatorio", b""),
+        ("/juridica", b""),
+        ("/fisica", b"limit=0"),
+    ],
+)
+def test_get_responde_o_mesmo_json_que_o_flask(client, asgi, caminho, query):
+    esperado = client.get(f"{caminho}?{query.decode()}")
+
+    status, headers, corpo = asgi("GET", caminho, query=query)
+
+    assert status == esperado.status_code
+    assert headers[b"content-type"] == b"application/json"
+    assert corpo == esperado.get_data()
+
+
+def test_busca_com_acento_sem_percent_encoding(client, asgi):
+    client.post(
+        "/fisica",
+        json={
+            "nome_completo": "José Alencar",
+            "email": "jose@asgi.com",
+            "celular": "11933334444",
+            "idade": 40,
+            "renda_mensal": 5000,
+            "categoria": "Associado",
+            "saldo": 10,
+        },
+    )
+    esperado = client.get("/fisica/busca?q=José")
+
+    status, _, corpo = asgi("GET", "/fisica/busca", query="q=José".encode())
+
+    assert status == esperado.status_code == 200
+    assert "José Alencar" in esperado.get_data(as_text=True)
+    assert corpo == esperado.get_data()
+
+
+def test_exportar_transmite_ndjson(client, asgi):
+    status, headers, corpo = asgi("GET", "/fisica/exportar")
+
+    assert status == 200
+    assert headers[b"content-type"] == b"application/x-ndjson"
+    assert corpo == client.get("/fisica/exportar").get_data()
+
+
+def test_post_cria_pela_view_sincrona(asgi):
+    corpo = (
+        b'{"nome_completo": "Rachel Zane", "email": "rachel@asgi.com", '
+        b'"celular": "11911112222", "idade": 28, "renda_mensal": 9000, '
+        b'"categoria": "Paralegal", "saldo": 100}'
+    )
+
+    status, _, resposta = asgi("POST", "/fisica", corpo=corpo)
+
+    assert status == 201, resposta
+    assert b"rachel@asgi.com" in resposta
+
+
+def test_rota_inexistente_e_metodo_nao_permitido(asgi):
+    assert asgi("GET", "/nada")[0] == 404
+    assert asgi("DELETE", "/fisica")[0] == 405
+
+
+def _cabecalhos_cors(headers) -> dict:
+    """access-control-*, Vary e Allow, com Allow como conjunto (a ordem varia)."""
+    cabecalhos = {
+        nome.lower(): valor
+        for nome, valor in headers
+        if nome.lower().startswith("access-control-") or nome.lower() == "vary"
+    }
+    allow = dict((nome.lower(), valor) for nome, valor in headers).get("allow")
+    if allow:
+        cabecalhos["allow"] = set(allow.split(", "))
+    return cabecalhos
+
+
+@pytest.mark.parametrize(
+    "metodo, caminho, headers",
+    [
+        ("GET", "/fisica", {}),
+        ("GET", "/fisica", {"Origin": "http://a.com"}),
+        ("OPTIONS", "/fisica", {}),
+        ("OPTIONS", "/fisica", {"Origin": "http://a.com"}),
+        (
+            "OPTIONS",
+            "/fisica",
+            {
+                "Origin": "http://a.com",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "X-Foo, Content-Type",
+            },
+        ),
+        ("GET", "/nada", {"Origin": "http://a.com"}),
+    ],
+)
+def test_cors_como_o_app_flask(client, asgi, metodo, caminho, headers):
+    CORS(client.application)
+    esperado = client.open(caminho, method=metodo, headers=headers)
+
+    status, recebidos, _ = asgi(
+        metodo,
+        caminho,
+        headers=[
+            (nome.lower().encode(), valor.encode()) for nome, valor in headers.items()
+        ],
+    )
+
+    assert status == esperado.status_code
+    assert _cabecalhos_cors(
+        (nome.decode(), valor.decode()) for nome, valor in recebidos.items()
+    ) == _cabecalhos_cors(esperado.headers.items())
+
+
+@pytest.mark.parametrize(
+    "caminho", ["/fisica?limit=2", "/juridica/relatorio", "/fisica/exportar"]
+)
+def test_head_como_o_app_flask(client, asgi, caminho):
+    esperado = client.head(caminho)
+    rota, _, query = caminho.partition("?")
+
+    status, headers, corpo = asgi("HEAD", rota, query=query.encode())
+
+    assert status == esperado.status_code == 200
+    assert corpo == b""
+    assert headers[b"content-type"].decode() == esperado.headers["Content-Type"]
+    assert headers.get(b"content-length", b"").decode() == esperado.headers.get(
+        "Content-Length", ""
+    )
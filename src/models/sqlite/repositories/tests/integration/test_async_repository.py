@@ -0,0 +1,88 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from src.models.sqlite.repositories.pessoa_fisica_async_repository import (
+    PessoaFisicaAsyncRepository,
+)
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.settings.async_connection import (
+    AsyncDBConnectionHandler,
+    para_url_assincrona,
+)
+
+
+def _executar(db_path, operacao):
+    """Roda `operacao(repository)` em um event loop com handler próprio."""
+
+    async def _rodar():
+        handler = AsyncDBConnectionHandler(f"sqlite:///{db_path}")
+        await handler.connect_to_db()
+        try:
+            return await operacao(PessoaFisicaAsyncRepository(handler))
+        finally:
+            await handler.dispose()
+
+    return asyncio.run(_rodar())
+
+
+def test_para_url_assincrona_troca_so_o_driver_sqlite():
+    assert para_url_assincrona("sqlite:///storage.db") == (
+        "sqlite+aiosqlite:///storage.db"
+    )
+    assert para_url_assincrona("postgresql://db/banco") == "postgresql://db/banco"
+
+
+def test_sessao_sem_conectar_falha():
+    with pytest.raises(RuntimeError, match="connect_to_db"):
+        AsyncDBConnectionHandler("sqlite:///:memory:").sessao()
+
+
+def test_consultas_concorrentes_retornam_o_mesmo_que_o_sincrono(db_handler, db_path):
+    sincrono = PessoaFisicaRepository(db_handler)
+    ids = [pessoa.id for pessoa in sincrono.listar_todas()]
+
+    async def _consultar(repository):
+        return await asyncio.gather(
+            *(repository.obter_saldo(pessoa_id) for pessoa_id in ids),
+            *(repository.buscar_por_id(pessoa_id) for pessoa_id in ids),
+        )
+
+    resultados = _executar(db_path, _consultar)
+    saldos, pessoas = resultados[: len(ids)], resultados[len(ids) :]
+
+    assert saldos == [sincrono.obter_saldo(pessoa_id) for pessoa_id in ids]
+    assert [pessoa.email for pessoa in pessoas] == [
+        sincrono.buscar_por_id(pessoa_id).email for pessoa_id in ids
+    ]
+
+
+def test_operacoes_de_saldo_seguem_as_regras_do_sincrono(db_handler, db_path):
+    saldo_inicial = PessoaFisicaRepository(db_handler).obter_saldo(5)
+
+    async def _operar(repository):
+        await repository.sacar_dinheiro(5, Decimal("1000.50"))
+        await repository.depositar_dinheiro(5, Decimal("250.25"))
+        with pytest.raises(ValueError, match="Limite de saque excedido"):
+            await repository.sacar_dinheiro(5, Decimal("50000.01"))
+        with pytest.raises(ValueError, match="Pessoa com ID 9999 não encontrada"):
+            await repository.obter_saldo(9999)
+        return await repository.obter_saldo(5)
+
+    assert _executar(db_path, _operar) == (
+        saldo_inicial - Decimal("1000.50") + Decimal("250.25")
+    )
+
+
+def test_iterar_todas_percorre_em_ordem_de_id(db_handler, db_path):
+    esperado = [
+        pessoa.id for pessoa in PessoaFisicaRepository(db_handler).listar_todas()
+    ]
+
+    async def _iterar(repository):
+        return [pessoa.id async for pessoa in repository.iterar_todas(tamanho_lote=2)]
+
+    assert _executar(db_path, _iterar) == sorted(esperado)
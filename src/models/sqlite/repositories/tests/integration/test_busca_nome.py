@@ -0,0 +1,140 @@
+import sqlite3
+
+import pytest
+
+from src.controllers.fisica_listar_controller import COLUNAS_LISTAGEM
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+from src.models.sqlite.repositories.busca_nome import (
+    montar_consulta_fts,
+    selecionar_por_nome,
+)
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+
+
+def _nomes(linhas):
+    return [linha.nome_completo for linha in linhas]
+
+
+def test_busca_por_prefixo_de_cada_palavra(db_handler):
+    repository = PessoaFisicaRepository(db_handler)
+
+    linhas = repository.buscar_por_nome("harv spec", COLUNAS_LISTAGEM, 10)
+
+    assert _nomes(linhas) == ["Harvey Specter"]
+    assert linhas[0].saldo is not None
+
+
+def test_busca_ignora_acentos_e_caixa(db_handler):
+    repository = PessoaJuridicaRepository(db_handler)
+
+    linhas = repository.buscar_por_nome("PÉARSON", ("id", "nome_fantasia"), 10)
+
+    assert {linha.nome_fantasia for linha in linhas} == {
+        "Pearson Hardman",
+        "Pearson Specter",
+        "Pearson Specter Litt",
+    }
+
+
+def test_busca_ordena_por_relevancia(db_handler):
+    repository = PessoaJuridicaRepository(db_handler)
+
+    linhas = repository.buscar_por_nome("specter", ("id", "nome_fantasia"), 10)
+
+    # Nome mais curto concentra o termo: maior relevância no bm25
+    assert linhas[0].nome_fantasia == "Pearson Specter"
+
+
+def test_busca_paginada_por_deslocamento(db_handler):
+    repository = PessoaJuridicaRepository(db_handler)
+    todas = repository.buscar_por_nome("pearson", ("id",), 10)
+
+    pagina = repository.buscar_por_nome("pearson", ("id",), 2, deslocamento=2)
+
+    assert [linha.id for linha in pagina] == [linha.id for linha in todas[2:4]]
+
+
+def test_busca_sem_palavras(db_handler):
+    with pytest.raises(ValueError, match="ao menos uma palavra"):
+        PessoaFisicaRepository(db_handler).buscar_por_nome('"*', ("id",), 10)
+
+
+def test_texto_nao_e_interpretado_como_sintaxe_fts(db_handler):
+    assert montar_consulta_fts("mike OR nome_completo:ross") == (
+        '"mike"* "OR"* "nome_completo"* "ross"*'
+    )
+    assert (
+        PessoaFisicaRepository(db_handler).buscar_por_nome("mike OR ross", ("id",), 10)
+        == []
+    )
+
+
+def test_triggers_mantem_indice_sincronizado(db_handler, db_path):
+    repository = PessoaFisicaRepository(db_handler)
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE pessoa_fisica SET nome_completo = 'Harold Gunderson' WHERE id = 1"
+        )
+        conn.execute("UPDATE pessoa_fisica SET saldo_centavos = 1 WHERE id = 2")
+        conn.execute("DELETE FROM pessoa_fisica WHERE id = 3")
+
+    assert repository.buscar_por_nome("harvey", ("id",), 10) == []
+    assert [linha.id for linha in repository.buscar_por_nome("gund", ("id",), 10)] == [
+        1
+    ]
+    assert [linha.id for linha in repository.buscar_por_nome("mike", ("id",), 10)] == [
+        2
+    ]
+    assert repository.buscar_por_nome("jessica", ("id",), 10) == []
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO pessoa_fisica_busca(pessoa_fisica_busca, rank) "
+            "VALUES ('integrity-check', 1)"
+        )
+
+
+def test_busca_usa_indice_fts_e_chave_primaria(db_handler, db_path):
+    consulta = selecionar_por_nome(PessoaFisicaTable, COLUNAS_LISTAGEM, "harv", 10)
+    compilada = consulta.compile(db_handler.get_engine())
+    parametros = [compilada.params[nome] for nome in compilada.positiontup]
+
+    with sqlite3.connect(db_path) as conn:
+        plano = [
+            linha[3]
+            for linha in conn.execute(f"EXPLAIN QUERY PLAN {compilada}", parametros)
+        ]
+
+    assert any("pessoa_fisica_busca VIRTUAL TABLE" in passo for passo in plano), plano
+    assert any(
+        passo.startswith("SEARCH pessoa_fisica USING INTEGER PRIMARY KEY")
+        for passo in plano
+    ), plano
+
+
+def test_rota_busca(client):
+    response = client.get("/juridica/busca?q=pearson&limit=2")
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert data["count"] == 2
+    assert data["next_cursor"] == 2
+    assert all("Pearson" in item["nome_fantasia"] for item in data["attributes"])
+
+    proxima = client.get(
+        f"/juridica/busca?q=pearson&limit=2&cursor={data['next_cursor']}"
+    )
+    assert proxima.get_json()["data"]["count"] == 1
+    assert proxima.get_json()["data"]["next_cursor"] is None
+
+
+def test_rota_busca_sem_termo(client):
+    response = client.get("/fisica/busca")
+
+    assert response.status_code == 400
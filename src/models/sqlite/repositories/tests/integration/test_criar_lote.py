@@ -0,0 +1,100 @@
+import sqlite3
+
+from sqlalchemy import event
+
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+
+def _pessoa(i, **campos):
+    return {
+        "nome_completo": f"Cliente {i}",
+        "email": f"cliente{i}@lote.com",
+        "celular": f"1198{i:07d}",
+        "idade": 30,
+        "renda_mensal": "1000.00",
+        "categoria": "Lote",
+        "saldo": "10.00",
+        **campos,
+    }
+
+
+def _contar(db_path, tabela):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {tabela}").fetchone()[0]
+
+
+def test_lote_fisica_isola_duplicados(client, db_path):
+    corpo = [_pessoa(i) for i in range(1200)]
+    corpo[3] = _pessoa(3, email="hervey.specter@personhardman.com")
+    corpo[700] = _pessoa(700, celular=corpo[10]["celular"])
+    corpo[900] = _pessoa(900, idade=12)
+
+    response = client.post("/fisica/batch", json=corpo)
+
+    assert response.status_code == 207
+    data = response.get_json()["data"]
+    assert data["total"] == 1200
+    assert data["count"] == 1197
+    resultados = data["results"]
+    assert [r["index"] for r in resultados] == list(range(1200))
+    assert resultados[3]["errors"][0]["detail"] == "Email já cadastrado no sistema"
+    assert resultados[700]["errors"][0]["detail"] == "Celular já cadastrado no sistema"
+    assert resultados[900]["status"] == 400
+    assert resultados[0] == {"index": 0, "status": 201, "id": 7}
+    assert _contar(db_path, "pessoa_fisica") == 6 + 1197
+
+
+def test_lote_juridica_todos_criados(client, db_path):
+    corpo = [
+        {
+            "nome_fantasia": f"Empresa {i}",
+            "email_corporativo": f"empresa{i}@lote.com",
+            "celular": f"1197{i:07d}",
+            "idade": 5,
+            "faturamento": "100000.00",
+            "categoria": "Lote",
+            "saldo": "0",
+        }
+        for i in range(3)
+    ]
+
+    response = client.post("/juridica/batch", json=corpo)
+
+    assert response.status_code == 201
+    assert [r["id"] for r in response.get_json()["data"]["results"]] == [7, 8, 9]
+    assert _contar(db_path, "pessoa_juridica") == 9
+
+
+def test_repository_lote_em_uma_transacao(db_handler, db_path):
+    commits = []
+    engine = db_handler.get_engine()
+
+    def registrar_commit(conn):
+        commits.append(conn)
+
+    event.listen(engine, "commit", registrar_commit)
+    try:
+        resultados = PessoaFisicaRepository(db_handler).criar_pessoas_em_lote(
+            [_pessoa(i) for i in range(50)], tamanho_lote=10
+        )
+    finally:
+        event.remove(engine, "commit", registrar_commit)
+
+    assert resultados == list(range(7, 57))
+    assert len(commits) == 1
+
+
+def test_criar_fisica_com_json_malformado(client, db_path):
+    antes = _contar(db_path, "pessoa_fisica")
+
+    response = client.post(
+        "/fisica", data=b'{"nome_completo": ', content_type="application/json"
+    )
+    lote = client.post("/fisica/batch", data=b"[{", content_type="application/json")
+
+    assert response.status_code == 400
+    assert lote.status_code == 400
+    assert "JSON inválido" in lote.get_json()["errors"][0]["detail"]
+    assert _contar(db_path, "pessoa_fisica") == antes
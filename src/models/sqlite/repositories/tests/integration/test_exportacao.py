@@ -0,0 +1,77 @@
+import json
+import sqlite3
+
+from flask import Flask
+
+from src.main.routes import ndjson
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+
+
+def _popular(db_path, quantidade):
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO pessoa_fisica "
+            "(renda_mensal_centavos, idade, nome_completo, celular, email, "
+            "categoria, saldo_centavos) "
+            "VALUES (100000, 30, ?, ?, ?, 'Teste', 1000)",
+            (
+                (f"Cliente {i}", f"exp-{i}", f"exp{i}@teste.com")
+                for i in range(quantidade)
+            ),
+        )
+
+
+def test_iterar_todas_percorre_em_lotes(db_handler, db_path):
+    _popular(db_path, 25)
+
+    ids = [pessoa.id for pessoa in PessoaFisicaRepository(db_handler).iterar_todas(4)]
+
+    assert ids == list(range(1, 32))
+
+
+def test_exportar_transmite_ndjson(client, db_path, monkeypatch):
+    _popular(db_path, 1200)
+    monkeypatch.setattr(ndjson, "LINHAS_POR_BLOCO", 100)
+
+    response = client.get("/fisica/exportar")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.is_streamed
+    linhas = response.get_data(as_text=True).splitlines()
+    assert len(linhas) == 1206
+    primeiro = json.loads(linhas[0])
+    assert primeiro["id"] == 1
+    assert primeiro["nome_completo"] == "Harvey Specter"
+
+
+def test_exportar_juridica(client):
+    response = client.get("/juridica/exportar")
+
+    linhas = [
+        json.loads(linha)
+        for linha in response.get_data(as_text=True).split("\n")
+        if linha
+    ]
+    assert [linha["id"] for linha in linhas] == [1, 2, 3, 4, 5, 6]
+
+
+def test_erro_no_meio_da_exportacao_vira_ultima_linha():
+    def registros():
+        yield {"id": 1}
+        raise RuntimeError("conexão perdida")
+
+    app = Flask(__name__)
+    with app.test_request_context():
+        response = ndjson.resposta_ndjson(registros())
+        corpo = "".join(
+            chunk.decode() if isinstance(chunk, bytes) else chunk
+            for chunk in response.response
+        )
+
+    assert [json.loads(linha) for linha in corpo.splitlines()] == [
+        {"id": 1},
+        {"errors": [{"title": "Server Error", "detail": "conexão perdida"}]},
+    ]
@@ -0,0 +1,135 @@
+import sqlite3
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+
+
+def test_extrato_registra_debitos_e_creditos(db_handler):
+    repository = PessoaFisicaRepository(db_handler)
+
+    repository.depositar_dinheiro(2, Decimal("100.00"))
+    repository.sacar_dinheiro(2, Decimal("40.00"))
+    repository.transferir(2, 4, Decimal("10.00"), tipo_destino="juridica")
+
+    extrato = repository.realizar_extrato(2)
+
+    assert [(t["tipo"], t["operacao"], t["valor"]) for t in extrato["transacoes"]] == [
+        ("debito", "transferencia", 10.0),
+        ("debito", "saque", 40.0),
+        ("credito", "deposito", 100.0),
+    ]
+    assert extrato["transacoes"][0]["contraparte_tipo"] == "juridica"
+    assert extrato["transacoes"][0]["contraparte_id"] == 4
+    assert extrato["proximo_cursor"] is None
+
+    extrato_destino = PessoaJuridicaRepository(db_handler).realizar_extrato(4)
+    assert extrato_destino["transacoes"][0]["tipo"] == "credito"
+    assert extrato_destino["transacoes"][0]["contraparte_tipo"] == "fisica"
+
+
+def test_operacao_com_falha_nao_gera_lancamento(db_handler, db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE pessoa_fisica SET saldo_centavos = 10000 WHERE id = 5")
+    repository = PessoaFisicaRepository(db_handler)
+
+    with pytest.raises(ValueError, match="Saldo Insuficiente"):
+        repository.sacar_dinheiro(5, Decimal("200.00"))
+    with pytest.raises(ValueError, match="Conta de destino"):
+        repository.transferir(5, 999, Decimal("10.00"))
+
+    assert repository.realizar_extrato(5)["transacoes"] == []
+
+
+def test_extrato_paginado_por_cursor(db_handler):
+    repository = PessoaFisicaRepository(db_handler)
+    for i in range(1, 26):
+        repository.depositar_dinheiro(3, Decimal(i))
+
+    valores = []
+    cursor = None
+    paginas = 0
+    while True:
+        extrato = repository.realizar_extrato(3, limite=10, cursor=cursor)
+        valores += [t["valor"] for t in extrato["transacoes"]]
+        paginas += 1
+        cursor = extrato["proximo_cursor"]
+        if cursor is None:
+            break
+
+    assert paginas == 3
+    assert valores == [float(i) for i in range(25, 0, -1)]
+
+
+def test_extrato_filtra_periodo(db_handler):
+    repository = PessoaFisicaRepository(db_handler)
+    repository.depositar_dinheiro(1, Decimal("10.00"))
+
+    agora = datetime.utcnow()
+    no_periodo = repository.realizar_extrato(
+        1,
+        data_inicio=agora - timedelta(minutes=5),
+        data_fim=agora + timedelta(minutes=5),
+    )
+    fora_do_periodo = repository.realizar_extrato(
+        1, data_inicio=agora + timedelta(days=1)
+    )
+
+    assert len(no_periodo["transacoes"]) == 1
+    assert fora_do_periodo["transacoes"] == []
+
+
+def test_livro_razao_append_only(db_handler, db_path):
+    PessoaFisicaRepository(db_handler).depositar_dinheiro(1, Decimal("10.00"))
+
+    with sqlite3.connect(db_path) as conn:
+        with pytest.raises(sqlite3.IntegrityError, match="append-only"):
+            conn.execute("UPDATE transacoes SET valor_centavos = 1")
+        with pytest.raises(sqlite3.IntegrityError, match="append-only"):
+            conn.execute("DELETE FROM transacoes")
+
+
+def test_pagina_do_extrato_usa_indice(db_handler, db_path):
+    repository = PessoaFisicaRepository(db_handler)
+    for _ in range(3):
+        repository.depositar_dinheiro(1, Decimal("1.00"))
+
+    consultas = []
+
+    def capturar(conn, cursor, statement, parameters, context, executemany):
+        if "FROM transacoes" in statement:
+            consultas.append((statement, parameters))
+
+    engine = db_handler.get_engine()
+    event.listen(engine, "before_cursor_execute", capturar)
+    try:
+        primeira = repository.realizar_extrato(1, limite=1)
+        repository.realizar_extrato(
+            1,
+            data_inicio=datetime(2000, 1, 1),
+            limite=1,
+            cursor=primeira["proximo_cursor"],
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capturar)
+
+    assert len(consultas) == 2
+    with sqlite3.connect(db_path) as conn:
+        for statement, parameters in consultas:
+            plano = [
+                linha[3]
+                for linha in conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            ]
+            assert any(
+                "SEARCH transacoes USING INDEX idx_transacoes_conta_data" in passo
+                for passo in plano
+            ), plano
+            assert not any("TEMP B-TREE" in passo for passo in plano), plano
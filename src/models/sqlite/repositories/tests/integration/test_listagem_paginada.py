@@ -0,0 +1,79 @@
+import sqlite3
+from decimal import Decimal
+
+import pytest
+
+from src.controllers.juridica_listar_controller import PessoaJuridicaListarController
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+
+
+def test_listar_pagina_percorre_tabela_sem_repetir(db_handler):
+    repository = PessoaFisicaRepository(db_handler)
+
+    ids = []
+    apos_id = None
+    while True:
+        pagina = repository.listar_pagina(4, apos_id)
+        if not pagina:
+            break
+        ids += [pessoa.id for pessoa in pagina]
+        apos_id = pagina[-1].id
+
+    assert ids == [1, 2, 3, 4, 5, 6]
+
+
+def test_listar_pagina_juridica_apos_id(db_handler):
+    pagina = PessoaJuridicaRepository(db_handler).listar_pagina(2, apos_id=3)
+
+    assert [empresa.id for empresa in pagina] == [4, 5]
+
+
+def test_listar_pagina_busca_pela_chave_primaria(db_path):
+    with sqlite3.connect(db_path) as conn:
+        plano = [
+            linha[3]
+            for linha in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM pessoa_fisica "
+                "WHERE id > ? ORDER BY id LIMIT ?",
+                (3, 10),
+            )
+        ]
+
+    assert any("USING INTEGER PRIMARY KEY" in passo for passo in plano), plano
+    assert not any("TEMP B-TREE" in passo for passo in plano), plano
+
+
+def test_listar_projecao_retorna_somente_colunas_pedidas(db_handler):
+    linhas = PessoaFisicaRepository(db_handler).listar_projecao(
+        ("id", "nome_completo"), 2, apos_id=1
+    )
+
+    assert [tuple(linha) for linha in linhas] == [
+        (2, "Mike Ross"),
+        (3, "Jessica Person"),
+    ]
+    assert linhas[0].nome_completo == "Mike Ross"
+    assert linhas[0]._fields == ("id", "nome_completo")
+
+
+def test_listar_projecao_coluna_desconhecida(db_handler):
+    repository = PessoaJuridicaRepository(db_handler)
+
+    with pytest.raises(ValueError, match="Colunas desconhecidas em pessoa_juridica"):
+        repository.listar_projecao(("id", "senha"), 10)
+
+
+def test_listar_controller_sobre_projecao(db_handler):
+    controller = PessoaJuridicaListarController(PessoaJuridicaRepository(db_handler))
+
+    resposta = controller.listar(limite=4)
+
+    assert resposta["data"]["count"] == 4
+    assert resposta["data"]["next_cursor"] == 4
+    assert resposta["data"]["attributes"][0]["nome_fantasia"] == "Pearson Hardman"
+    assert resposta["data"]["attributes"][0]["saldo"] == Decimal("120000000.00")
@@ -0,0 +1,124 @@
+import re
+
+import pytest
+
+from src.main.server.metricas import metricas_http, registrar_metricas
+from src.main.server.server_timing import registrar_server_timing
+from src.models.cache.cache_lru_ttl import CacheLRUTTL
+from src.models.sqlite.settings.instrumentacao import estatisticas_sql
+
+
+@pytest.fixture(name="cache")
+def fixture_cache():
+    return CacheLRUTTL(capacidade=10, ttl=60)
+
+
+@pytest.fixture(name="cliente")
+def fixture_cliente(client, db_handler, cache):
+    registrar_metricas(client.application, db_handler, cache)
+    metricas_http.limpar()
+    yield client
+    metricas_http.limpar()
+
+
+def amostras(cliente) -> dict:
+    response = cliente.get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    return dict(
+        linha.rsplit(" ", 1)
+        for linha in response.get_data(as_text=True).splitlines()
+        if not linha.startswith("#")
+    )
+
+
+def test_contagens_e_erros_por_rota(cliente):
+    for _ in range(3):
+        cliente.get("/fisica?limit=2")
+    cliente.get("/fisica?limit=0")
+    cliente.get("/nada")
+
+    metricas = amostras(cliente)
+
+    assert (
+        metricas['http_requests_total{method="GET",route="/fisica",status="200"}']
+        == "3"
+    )
+    assert (
+        metricas['http_request_errors_total{method="GET",route="/fisica",status="400"}']
+        == "1"
+    )
+    assert (
+        metricas[
+            'http_request_errors_total{method="GET",route="<sem rota>",status="404"}'
+        ]
+        == "1"
+    )
+    assert not any(
+        chave.startswith("http_request_errors_total") and 'status="200"' in chave
+        for chave in metricas
+    )
+
+
+def test_histograma_de_latencia(cliente):
+    for _ in range(2):
+        cliente.get("/fisica/relatorio")
+
+    metricas = amostras(cliente)
+    rotulos = 'method="GET",route="/fisica/relatorio"'
+    buckets = [
+        int(valor)
+        for chave, valor in metricas.items()
+        if chave.startswith(f"http_request_duration_seconds_bucket{{{rotulos},")
+    ]
+
+    assert buckets == sorted(buckets)
+    assert buckets[-1] == 2
+    assert metricas[f"http_request_duration_seconds_count{{{rotulos}}}"] == "2"
+    assert float(metricas[f"http_request_duration_seconds_sum{{{rotulos}}}"]) > 0
+
+
+def test_sql_por_rota(cliente):
+    registrar_server_timing(cliente.application)
+    estatisticas_sql.limpar()
+    for _ in range(2):
+        cliente.get("/fisica?limit=2")
+
+    metricas = amostras(cliente)
+    rotulos = 'method="GET",route="/fisica"'
+
+    assert metricas[f"db_queries_total{{{rotulos}}}"] == "2"
+    assert metricas[f"db_queries_max{{{rotulos}}}"] == "1"
+    assert float(metricas[f"db_time_seconds_total{{{rotulos}}}"]) > 0
+    assert 0 < float(metricas[f"db_slowest_query_seconds{{{rotulos}}}"])
+
+    rotas = cliente.get("/metrics/sql").get_json()
+    assert "FROM pessoa_fisica" in rotas["GET /fisica"]["mais_lenta_sql"]
+    estatisticas_sql.limpar()
+
+
+def test_sem_leituras_no_cache_nao_exporta_hit_ratio(cliente):
+    metricas = amostras(cliente)
+
+    assert metricas["cache_contas_misses_total"] == "0"
+    assert "cache_contas_hit_ratio" not in metricas
+
+
+def test_pool_e_cache(cliente, cache):
+    cache.guardar(1, "conta")
+    cache.obter(1)
+    cache.obter(2)
+
+    metricas = amostras(cliente)
+
+    assert metricas["db_pool_size"] == "5"
+    assert metricas["db_pool_checked_out"] == "0"
+    assert metricas["cache_contas_hits_total"] == "1"
+    assert metricas["cache_contas_misses_total"] == "1"
+    assert metricas["cache_contas_size"] == "1"
+    assert float(metricas["cache_contas_hit_ratio"]) == 0.5
+    assert re.search(
+        r"^# TYPE http_request_duration_seconds histogram$",
+        cliente.get("/metrics").get_data(as_text=True),
+        re.MULTILINE,
+    )
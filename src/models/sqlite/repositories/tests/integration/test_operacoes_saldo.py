@@ -0,0 +1,198 @@
+import sqlite3
+import threading
+from decimal import Decimal
+
+import pytest
+
+from src.models.cache.cache_lru_ttl import CacheLRUTTL
+from src.models.dinheiro import para_reais
+from src.models.sqlite.repositories.pessoa_fisica_cache_repository import (
+    PessoaFisicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_cache_repository import (
+    PessoaJuridicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+
+
+def _saldo(db_path, tabela, conta_id):
+    """Saldo como está gravado no banco: centavos inteiros."""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            f"SELECT saldo_centavos FROM {tabela} WHERE id = ?", (conta_id,)
+        ).fetchone()[0]
+
+
+def test_sacar_e_depositar_atualizam_saldo(db_handler, db_path):
+    repository = PessoaFisicaRepository(db_handler)
+    saldo_inicial = _saldo(db_path, "pessoa_fisica", 5)
+
+    assert repository.sacar_dinheiro(5, Decimal("1000.50")) is True
+    assert repository.depositar_dinheiro(5, Decimal("250.25")) is True
+
+    assert _saldo(db_path, "pessoa_fisica", 5) == saldo_inicial - 100050 + 25025
+
+
+def test_sacar_saldo_insuficiente_nao_altera_saldo(db_handler, db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE pessoa_juridica SET saldo_centavos = 100000 WHERE id = 6")
+
+    repository = PessoaJuridicaRepository(db_handler)
+
+    with pytest.raises(ValueError, match="Saldo Insuficiente"):
+        repository.sacar_dinheiro(6, Decimal("2000.00"))
+
+    assert _saldo(db_path, "pessoa_juridica", 6) == 100000
+
+
+def test_sacar_conta_inexistente(db_handler):
+    repository = PessoaFisicaRepository(db_handler)
+
+    with pytest.raises(ValueError, match="Pessoa com ID 999 não encontrada"):
+        repository.sacar_dinheiro(999, Decimal("10.00"))
+
+
+def test_saques_concorrentes_nao_deixam_saldo_negativo(db_handler, db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE pessoa_fisica SET saldo_centavos = 10000 WHERE id = 1")
+
+    repository = PessoaFisicaRepository(db_handler)
+    quantidade = 8
+    barreira = threading.Barrier(quantidade)
+    resultados = []
+
+    def sacar():
+        barreira.wait()
+        try:
+            resultados.append(repository.sacar_dinheiro(1, Decimal("100.00")))
+        except ValueError:
+            resultados.append(False)
+
+    threads = [threading.Thread(target=sacar) for _ in range(quantidade)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert resultados.count(True) == 1
+    assert _saldo(db_path, "pessoa_fisica", 1) == 0
+
+
+def test_transferir_entre_fisica_e_juridica(db_handler, db_path):
+    repository = PessoaFisicaRepository(db_handler)
+    origem_inicial = _saldo(db_path, "pessoa_fisica", 2)
+    destino_inicial = _saldo(db_path, "pessoa_juridica", 3)
+
+    repository.transferir(2, 3, Decimal("1234.56"), tipo_destino="juridica")
+
+    assert _saldo(db_path, "pessoa_fisica", 2) == origem_inicial - 123456
+    assert _saldo(db_path, "pessoa_juridica", 3) == destino_inicial + 123456
+
+
+def test_transferir_falha_nao_altera_nenhum_saldo(db_handler, db_path):
+    repository = PessoaJuridicaRepository(db_handler)
+    origem_inicial = _saldo(db_path, "pessoa_juridica", 1)
+    destino_inicial = _saldo(db_path, "pessoa_fisica", 1)
+
+    # Destino (pessoa_fisica) é creditado primeiro pela ordem de lock,
+    # e o débito da origem falha depois: o crédito precisa ser desfeito.
+    with pytest.raises(ValueError, match="Saldo Insuficiente"):
+        repository.transferir(
+            1, 1, para_reais(origem_inicial) + 1, tipo_destino="fisica"
+        )
+
+    assert _saldo(db_path, "pessoa_juridica", 1) == origem_inicial
+    assert _saldo(db_path, "pessoa_fisica", 1) == destino_inicial
+
+
+def test_transferencias_concorrentes_conservam_total(db_handler, db_path):
+    repository = PessoaFisicaRepository(db_handler)
+    total_inicial = sum(_saldo(db_path, "pessoa_fisica", i) for i in (1, 2))
+    barreira = threading.Barrier(8)
+
+    def transferir(origem, destino):
+        barreira.wait()
+        for _ in range(10):
+            repository.transferir(origem, destino, Decimal("10.00"))
+
+    threads = [
+        threading.Thread(target=transferir, args=((1, 2) if i % 2 else (2, 1)))
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total_final = sum(_saldo(db_path, "pessoa_fisica", i) for i in (1, 2))
+    assert total_final == total_inicial
+
+
+def test_saldo_em_cache_reflete_operacoes(db_handler):
+    cache = CacheLRUTTL(capacidade=100, ttl=60)
+    fisica = PessoaFisicaCacheRepository(PessoaFisicaRepository(db_handler), cache)
+    juridica = PessoaJuridicaCacheRepository(
+        PessoaJuridicaRepository(db_handler), cache
+    )
+    saldo_fisica = fisica.obter_saldo(2)
+    saldo_juridica = juridica.obter_saldo(2)
+    assert fisica.obter_saldo(2) == saldo_fisica
+    assert cache.estatisticas()["hits"] == 1
+
+    fisica.depositar_dinheiro(2, Decimal("100.00"))
+    assert fisica.obter_saldo(2) == saldo_fisica + Decimal("100.00")
+
+    fisica.transferir(2, 2, Decimal("50.00"), tipo_destino="juridica")
+    assert fisica.obter_saldo(2) == saldo_fisica + Decimal("50.00")
+    assert juridica.obter_saldo(2) == saldo_juridica + Decimal("50.00")
+    assert fisica.buscar_por_id(2).saldo == saldo_fisica + Decimal("50.00")
+
+
+def test_operacoes_com_centavos_nao_acumulam_erro(db_handler, db_path):
+    repository = PessoaFisicaRepository(db_handler)
+    saldo_inicial = repository.obter_saldo(3)
+
+    for _ in range(100):
+        repository.depositar_dinheiro(3, Decimal("0.10"))
+        repository.sacar_dinheiro(3, Decimal("0.03"))
+
+    assert repository.obter_saldo(3) == saldo_inicial + Decimal("7.00")
+    assert _saldo(db_path, "pessoa_fisica", 3) == int(saldo_inicial * 100) + 700
+
+
+def test_valor_com_fracao_de_centavo_e_rejeitado(db_handler, db_path):
+    repository = PessoaFisicaRepository(db_handler)
+    saldo_inicial = _saldo(db_path, "pessoa_fisica", 3)
+
+    with pytest.raises(ValueError, match="duas casas decimais"):
+        repository.depositar_dinheiro(3, Decimal("0.005"))
+
+    assert _saldo(db_path, "pessoa_fisica", 3) == saldo_inicial
+
+
+def test_atualizado_em_gravado_no_proprio_update(db_handler, db_path):
+    with sqlite3.connect(db_path) as conn:
+        triggers = conn.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'trigger' AND name LIKE 'atualizar_%_timestamp'"
+        ).fetchall()
+        conn.execute(
+            "UPDATE pessoa_fisica SET atualizado_em = '2000-01-01' WHERE id = 4"
+        )
+        mudancas_antes = conn.total_changes
+
+    assert triggers == []
+
+    PessoaFisicaRepository(db_handler).depositar_dinheiro(4, Decimal("1.00"))
+
+    with sqlite3.connect(db_path) as conn:
+        atualizado_em = conn.execute(
+            "SELECT atualizado_em FROM pessoa_fisica WHERE id = 4"
+        ).fetchone()[0]
+    assert atualizado_em > "2000-01-01"
+    assert mudancas_antes == 1
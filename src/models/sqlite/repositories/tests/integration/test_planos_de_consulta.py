@@ -0,0 +1,124 @@
+"""
+Roda EXPLAIN QUERY PLAN em cada SQL emitido pelas consultas filtradas dos
+repositórios e falha se alguma delas cair em SCAN (varredura da tabela).
+
+iterar_todas e listar_todas não entram: leem a tabela inteira por definição.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from src.models.sqlite.entities.pessoa_fisica import PessoaFisicaTable
+from src.models.sqlite.entities.pessoa_juridica import PessoaJuridicaTable
+from src.models.sqlite.entities.transacao import TransacaoTable
+from src.models.sqlite.repositories.pessoa_fisica_repository import (
+    PessoaFisicaRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_repository import (
+    PessoaJuridicaRepository,
+)
+
+CONSULTAS_FISICA = {
+    "buscar_por_id": lambda r: r.buscar_por_id(1),
+    "buscar_por_email": lambda r: r.buscar_por_email("mike.ross@personhardman.com"),
+    "buscar_por_celular": lambda r: r.buscar_por_celular("555-1002"),
+    "buscar_por_categoria": lambda r: r.buscar_por_categoria("Associado"),
+    "buscar_com_saldo_maior_que": lambda r: r.buscar_com_saldo_maior_que(
+        Decimal("1000000")
+    ),
+    "listar_pagina": lambda r: r.listar_pagina(10, apos_id=2),
+    "listar_projecao": lambda r: r.listar_projecao(("id", "saldo"), 10, apos_id=2),
+    "sacar_dinheiro": lambda r: r.sacar_dinheiro(1, Decimal("10")),
+    "depositar_dinheiro": lambda r: r.depositar_dinheiro(1, Decimal("10")),
+    "transferir": lambda r: r.transferir(1, 2, Decimal("10")),
+    "realizar_extrato": lambda r: r.realizar_extrato(1),
+}
+
+CONSULTAS_JURIDICA = {
+    "buscar_por_id": lambda r: r.buscar_por_id(1),
+    "buscar_por_email_corporativo": lambda r: r.buscar_por_email_corporativo(
+        "contato@psl.com"
+    ),
+    "buscar_por_celular": lambda r: r.buscar_por_celular("555-2003"),
+    "buscar_por_categoria": lambda r: r.buscar_por_categoria("Escritório de Advocacia"),
+    "buscar_por_saldo_maior_que": lambda r: r.buscar_por_saldo_maior_que(
+        Decimal("100000000")
+    ),
+    "buscar_com_faturamento_maior_que": lambda r: r.buscar_com_faturamento_maior_que(
+        Decimal("30000000")
+    ),
+    "buscar_por_idade_empresa": lambda r: r.buscar_por_idade_empresa(10, 20),
+    "listar_pagina": lambda r: r.listar_pagina(10, apos_id=2),
+    "sacar_dinheiro": lambda r: r.sacar_dinheiro(1, Decimal("10")),
+    "depositar_dinheiro": lambda r: r.depositar_dinheiro(1, Decimal("10")),
+    "transferir": lambda r: r.transferir(1, 2, Decimal("10")),
+    "realizar_extrato": lambda r: r.realizar_extrato(1),
+}
+
+
+@contextmanager
+def capturar_sql(engine):
+    consultas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            consultas.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        yield consultas
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+
+def assert_sem_scan(db_path, consultas):
+    assert consultas, "nenhum SQL foi capturado"
+    with sqlite3.connect(db_path) as conn:
+        for statement, parameters in consultas:
+            plano = [
+                linha[3]
+                for linha in conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            ]
+            assert not any(passo.startswith("SCAN") for passo in plano), (
+                statement,
+                plano,
+            )
+
+
+@pytest.mark.parametrize("consulta", CONSULTAS_FISICA.values(), ids=CONSULTAS_FISICA)
+def test_consultas_fisica_usam_indice(db_handler, db_path, consulta):
+    with capturar_sql(db_handler.get_engine()) as consultas:
+        consulta(PessoaFisicaRepository(db_handler))
+
+    assert_sem_scan(db_path, consultas)
+
+
+@pytest.mark.parametrize(
+    "consulta", CONSULTAS_JURIDICA.values(), ids=CONSULTAS_JURIDICA
+)
+def test_consultas_juridica_usam_indice(db_handler, db_path, consulta):
+    with capturar_sql(db_handler.get_engine()) as consultas:
+        consulta(PessoaJuridicaRepository(db_handler))
+
+    assert_sem_scan(db_path, consultas)
+
+
+@pytest.mark.parametrize(
+    "tabela", [PessoaFisicaTable, PessoaJuridicaTable, TransacaoTable]
+)
+def test_indices_das_entidades_existem_no_schema(db_path, tabela):
+    with sqlite3.connect(db_path) as conn:
+        no_schema = {
+            linha[1]: [
+                coluna[2] for coluna in conn.execute(f"PRAGMA index_info({linha[1]})")
+            ]
+            for linha in conn.execute(f"PRAGMA index_list({tabela.__tablename__})")
+        }
+
+    for indice in tabela.__table__.indexes:
+        if indice.name.startswith("idx_"):
+            assert no_schema.get(indice.name) == [c.name for c in indice.columns]
@@ -0,0 +1,57 @@
+import sqlite3
+
+from sqlalchemy import event
+
+
+def test_relatorio_fisica_por_categoria(client, db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE pessoa_fisica SET categoria = 'Sócios' WHERE id IN (1, 4)")
+
+    response = client.get("/fisica/relatorio")
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert data["count"] == 5
+    socios = next(item for item in data["attributes"] if item["categoria"] == "Sócios")
+    assert socios == {
+        "categoria": "Sócios",
+        "quantidade": 2,
+        "saldo_total": "3300000.00",
+        "renda_mensal_media": "70000.00",
+    }
+
+
+def test_relatorio_juridica_por_categoria(client):
+    response = client.get("/juridica/relatorio")
+
+    data = response.get_json()["data"]
+    advocacia = next(
+        item
+        for item in data["attributes"]
+        if item["categoria"] == "Escritório de Advocacia"
+    )
+    assert advocacia == {
+        "categoria": "Escritório de Advocacia",
+        "quantidade": 4,
+        "saldo_total": "360000000.00",
+        "faturamento_medio": "37500000.00",
+        "faturamento_minimo": "25000000.00",
+        "faturamento_maximo": "50000000.00",
+    }
+
+
+def test_relatorio_agrega_no_banco(client, db_handler):
+    consultas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        consultas.append(statement)
+
+    engine = db_handler.get_engine()
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        client.get("/juridica/relatorio")
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+    assert len(consultas) == 1
+    assert "GROUP BY pessoa_juridica.categoria" in consultas[0]
@@ -0,0 +1,49 @@
+import re
+
+import pytest
+
+from src.main.server.server_timing import registrar_server_timing
+from src.models.sqlite.settings.instrumentacao import estatisticas_sql
+
+SERVER_TIMING = re.compile(
+    r'db;dur=(?P<db>[\d.]+);desc="(?P<consultas>\d+) consultas", '
+    r"db-lenta;dur=(?P<lenta>[\d.]+), total;dur=(?P<total>[\d.]+)"
+)
+
+
+@pytest.fixture(name="cliente")
+def fixture_cliente(client):
+    registrar_server_timing(client.application)
+    estatisticas_sql.limpar()
+    yield client
+    estatisticas_sql.limpar()
+
+
+def test_header_server_timing_com_sql_da_requisicao(cliente):
+    response = cliente.get("/fisica?limit=2")
+
+    medida = SERVER_TIMING.fullmatch(response.headers["Server-Timing"])
+    assert medida is not None
+    assert int(medida["consultas"]) == 1
+    assert 0 < float(medida["lenta"]) <= float(medida["db"]) <= float(medida["total"])
+
+
+def test_estatisticas_somadas_por_rota(cliente):
+    for _ in range(3):
+        cliente.get("/fisica?limit=2")
+    cliente.get("/fisica/relatorio")
+    cliente.get("/fisica?limit=0")  # 400 antes de ir ao banco
+
+    rotas = estatisticas_sql.estatisticas()
+
+    assert rotas["GET /fisica"]["requisicoes"] == 4
+    assert rotas["GET /fisica"]["consultas_max"] == 1
+    assert "GROUP BY" in rotas["GET /fisica/relatorio"]["mais_lenta_sql"]
+
+
+def test_rota_inexistente_tambem_e_medida(cliente):
+    response = cliente.get("/nada")
+
+    assert response.status_code == 404
+    assert 'desc="0 consultas"' in response.headers["Server-Timing"]
+    assert estatisticas_sql.estatisticas()["GET <sem rota>"]["requisicoes"] == 1
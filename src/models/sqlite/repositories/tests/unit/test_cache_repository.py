@@ -0,0 +1,85 @@
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from src.models.cache.cache_lru_ttl import CacheLRUTTL
+from src.models.sqlite.repositories.pessoa_fisica_cache_repository import (
+    PessoaFisicaCacheRepository,
+)
+from src.models.sqlite.repositories.pessoa_juridica_cache_repository import (
+    PessoaJuridicaCacheRepository,
+)
+
+
+@pytest.fixture
+def cache():
+    return CacheLRUTTL(capacidade=100, ttl=60)
+
+
+def test_buscar_por_id_servido_do_cache(cache):
+    inner = Mock()
+    inner.buscar_por_id.return_value = Mock(id=1)
+    repository = PessoaFisicaCacheRepository(inner, cache)
+
+    primeira = repository.buscar_por_id(1)
+    segunda = repository.buscar_por_id(1)
+
+    assert primeira is segunda
+    inner.buscar_por_id.assert_called_once_with(1)
+
+
+@pytest.mark.parametrize(
+    "operacao",
+    [
+        lambda r: r.sacar_dinheiro(1, Decimal("10")),
+        lambda r: r.depositar_dinheiro(1, Decimal("10")),
+        lambda r: r.atualizar_pessoa(1, {"categoria": "B"}),
+        lambda r: r.deletar_pessoa(1),
+    ],
+)
+def test_escrita_invalida_conta(cache, operacao):
+    inner = Mock()
+    inner.obter_saldo.side_effect = [Decimal("100"), Decimal("90")]
+    repository = PessoaFisicaCacheRepository(inner, cache)
+
+    assert repository.obter_saldo(1) == Decimal("100")
+    operacao(repository)
+
+    assert repository.obter_saldo(1) == Decimal("90")
+
+
+def test_escrita_com_erro_tambem_invalida(cache):
+    inner = Mock()
+    inner.obter_saldo.side_effect = [Decimal("100"), Decimal("100")]
+    inner.sacar_dinheiro.side_effect = ValueError("Saldo Insuficiente")
+    repository = PessoaJuridicaCacheRepository(inner, cache)
+
+    repository.obter_saldo(1)
+    with pytest.raises(ValueError):
+        repository.sacar_dinheiro(1, Decimal("1000"))
+    repository.obter_saldo(1)
+
+    assert inner.obter_saldo.call_count == 2
+
+
+def test_transferencia_invalida_destino_de_outro_tipo(cache):
+    inner_fisica, inner_juridica = Mock(), Mock()
+    inner_juridica.obter_saldo.side_effect = [Decimal("5"), Decimal("15")]
+    fisica = PessoaFisicaCacheRepository(inner_fisica, cache)
+    juridica = PessoaJuridicaCacheRepository(inner_juridica, cache)
+
+    assert juridica.obter_saldo(3) == Decimal("5")
+    fisica.transferir(1, 3, Decimal("10"), tipo_destino="juridica")
+
+    inner_fisica.transferir.assert_called_once_with(1, 3, Decimal("10"), "juridica")
+    assert juridica.obter_saldo(3) == Decimal("15")
+
+
+def test_tipos_de_conta_nao_colidem(cache):
+    inner_fisica, inner_juridica = Mock(), Mock()
+    inner_fisica.obter_saldo.return_value = Decimal("1")
+    inner_juridica.obter_saldo.return_value = Decimal("2")
+
+    assert PessoaFisicaCacheRepository(inner_fisica, cache).obter_saldo(1) == 1
+    assert PessoaJuridicaCacheRepository(inner_juridica, cache).obter_saldo(1) == 2
@@ -309,21 +309,17 @@ class TestPessoaFisicaRepository:
 
         repository = PessoaFisicaRepository(mock_db_connection)
 
-        mock_pessoa = Mock()
-        mock_pessoa.id = 1
-        mock_pessoa.saldo = Decimal("1000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_pessoa
-        )
+        mock_session.execute.return_value.rowcount = 1
 
         resultado = repository.sacar_dinheiro(1, Decimal("500.00"))
 
         assert resultado is True
-        assert mock_pessoa.saldo == Decimal("500.00")
+        # UPDATE do saldo + INSERT no livro-razão
+        assert mock_session.execute.call_count == 2
+        mock_session.query.assert_not_called()
         mock_session.commit.assert_called_once()
 
-    def test_sacar_deposito_saldo_insuficiente(self):
+    def test_sacar_dinheiro_update_condicional(self):
         mock_db_connection = Mock()
         mock_session = Mock()
         mock_db_connection.__enter__ = Mock(return_value=mock_db_connection)
@@ -332,17 +328,34 @@ class TestPessoaFisicaRepository:
 
         repository = PessoaFisicaRepository(mock_db_connection)
 
-        mock_pessoa = Mock()
-        mock_pessoa.id = 1
-        mock_pessoa.saldo = Decimal("500.00")
+        mock_session.execute.return_value.rowcount = 1
 
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_pessoa
+        repository.sacar_dinheiro(1, Decimal("500.00"))
+
+        sql = str(mock_session.execute.call_args_list[0][0][0])
+        assert sql.startswith("UPDATE pessoa_fisica SET saldo_centavos=")
+        assert "pessoa_fisica.saldo_centavos - " in sql
+        assert "pessoa_fisica.saldo_centavos >= " in sql
+
+    def test_sacar_deposito_saldo_insuficiente(self):
+        mock_db_connection = Mock()
+        mock_session = Mock()
+        mock_db_connection.__enter__ = Mock(return_value=mock_db_connection)
+        mock_db_connection.__exit__ = Mock(return_value=False)
+        mock_db_connection.session = mock_session
+
+        repository = PessoaFisicaRepository(mock_db_connection)
+
+        mock_session.execute.return_value.rowcount = 0
+        mock_session.query.return_value.filter.return_value.one_or_none.return_value = (
+            1,
         )
 
         with pytest.raises(ValueError, match="Saldo Insuficiente"):
             repository.sacar_dinheiro(1, Decimal("1000.00"))
 
+        mock_session.commit.assert_not_called()
+
     def test_sacar_valor_negativo(self):
         mock_db_connection = Mock()
         mock_session = Mock()
@@ -352,17 +365,11 @@ class TestPessoaFisicaRepository:
 
         repository = PessoaFisicaRepository(mock_db_connection)
 
-        mock_pessoa = Mock()
-        mock_pessoa.id = 1
-        mock_pessoa.saldo = Decimal("1000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_pessoa
-        )
-
         with pytest.raises(ValueError, match="Valor de saque deve ser positivo"):
             repository.sacar_dinheiro(1, Decimal("-100.00"))
 
+        mock_session.execute.assert_not_called()
+
     def test_sacar_valor_zero(self):
         mock_db_connection = Mock()
         mock_session = Mock()
@@ -372,17 +379,25 @@ class TestPessoaFisicaRepository:
 
         repository = PessoaFisicaRepository(mock_db_connection)
 
-        mock_pessoa = Mock()
-        mock_pessoa.id = 1
-        mock_pessoa.saldo = Decimal("1000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_pessoa
-        )
-
         with pytest.raises(ValueError, match="Valor de saque deve ser positivo"):
             repository.sacar_dinheiro(1, Decimal("0.00"))
 
+        mock_session.execute.assert_not_called()
+
+    def test_sacar_acima_do_limite(self):
+        mock_db_connection = Mock()
+        mock_session = Mock()
+        mock_db_connection.__enter__ = Mock(return_value=mock_db_connection)
+        mock_db_connection.__exit__ = Mock(return_value=False)
+        mock_db_connection.session = mock_session
+
+        repository = PessoaFisicaRepository(mock_db_connection)
+
+        with pytest.raises(ValueError, match="Limite de saque excedido"):
+            repository.sacar_dinheiro(1, Decimal("50000.01"))
+
+        mock_session.execute.assert_not_called()
+
     def test_sacar_pessoa_nao_encontrada(self):
         mock_db_connection = Mock()
         mock_session = Mock()
@@ -392,8 +407,9 @@ class TestPessoaFisicaRepository:
 
         repository = PessoaFisicaRepository(mock_db_connection)
 
-        mock_session.query.return_value.filter.return_value.one.side_effect = (
-            NoResultFound()
+        mock_session.execute.return_value.rowcount = 0
+        mock_session.query.return_value.filter.return_value.one_or_none.return_value = (
+            None
         )
 
         with pytest.raises(ValueError, match="Pessoa com ID 999 não encontrada"):
@@ -408,18 +424,13 @@ class TestPessoaFisicaRepository:
 
         repository = PessoaFisicaRepository(mock_db_connection)
 
-        mock_pessoa = Mock()
-        mock_pessoa.id = 1
-        mock_pessoa.saldo = Decimal("1000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_pessoa
-        )
+        mock_session.execute.return_value.rowcount = 1
 
         resultado = repository.depositar_dinheiro(1, Decimal("500.00"))
 
         assert resultado is True
-        assert mock_pessoa.saldo == Decimal("1500.00")
+        sql = str(mock_session.execute.call_args_list[0][0][0])
+        assert "pessoa_fisica.saldo_centavos + " in sql
         mock_session.commit.assert_called_once()
 
     def test_depositar_valor_negativo(self):
@@ -431,17 +442,11 @@ class TestPessoaFisicaRepository:
 
         repository = PessoaFisicaRepository(mock_db_connection)
 
-        mock_pessoa = Mock()
-        mock_pessoa.id = 1
-        mock_pessoa.saldo = Decimal("1000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_pessoa
-        )
-
         with pytest.raises(ValueError, match="Valor de depósito deve ser positivo."):
             repository.depositar_dinheiro(1, Decimal("-500.00"))
 
+        mock_session.execute.assert_not_called()
+
     def test_depositar_valor_zero(self):
         mock_db_connection = Mock()
         mock_session = Mock()
@@ -451,17 +456,11 @@ class TestPessoaFisicaRepository:
 
         repository = PessoaFisicaRepository(mock_db_connection)
 
-        mock_pessoa = Mock()
-        mock_pessoa.id = 1
-        mock_pessoa.saldo = Decimal("1000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_pessoa
-        )
-
         with pytest.raises(ValueError, match="Valor de depósito deve ser positivo."):
             repository.depositar_dinheiro(1, Decimal("0.00"))
 
+        mock_session.execute.assert_not_called()
+
     def test_depositar_pessoa_nao_encontrada(self):
         mock_db_connection = Mock()
         mock_session = Mock()
@@ -471,13 +470,68 @@ class TestPessoaFisicaRepository:
 
         repository = PessoaFisicaRepository(mock_db_connection)
 
-        mock_session.query.return_value.filter.return_value.one.side_effect = (
-            NoResultFound()
-        )
+        mock_session.execute.return_value.rowcount = 0
 
         with pytest.raises(ValueError, match="Pessoa com ID 999 não foi encontrada"):
             repository.depositar_dinheiro(999, Decimal("1000.00"))
 
+        mock_session.commit.assert_not_called()
+
+    def test_transferir_sucesso(self):
+        mock_db_connection = Mock()
+        mock_session = Mock()
+        mock_db_connection.__enter__ = Mock(return_value=mock_db_connection)
+        mock_db_connection.__exit__ = Mock(return_value=False)
+        mock_db_connection.session = mock_session
+
+        repository = PessoaFisicaRepository(mock_db_connection)
+
+        mock_session.execute.return_value.rowcount = 1
+
+        resultado = repository.transferir(1, 2, Decimal("500.00"))
+
+        assert resultado is True
+        assert mock_session.execute.call_count == 4
+        mock_session.commit.assert_called_once()
+
+    def test_transferir_destino_nao_encontrado(self):
+        mock_db_connection = Mock()
+        mock_session = Mock()
+        mock_db_connection.__enter__ = Mock(return_value=mock_db_connection)
+        mock_db_connection.__exit__ = Mock(return_value=False)
+        mock_db_connection.session = mock_session
+
+        repository = PessoaFisicaRepository(mock_db_connection)
+
+        mock_session.execute.side_effect = [Mock(rowcount=1), Mock(), Mock(rowcount=0)]
+
+        with pytest.raises(
+            ValueError, match="Conta de destino com ID 2 não encontrada"
+        ):
+            repository.transferir(1, 2, Decimal("500.00"))
+
+        mock_session.commit.assert_not_called()
+
+    def test_transferir_origem_nao_encontrada(self):
+        mock_db_connection = Mock()
+        mock_session = Mock()
+        mock_db_connection.__enter__ = Mock(return_value=mock_db_connection)
+        mock_db_connection.__exit__ = Mock(return_value=False)
+        mock_db_connection.session = mock_session
+
+        repository = PessoaFisicaRepository(mock_db_connection)
+
+        # destino (id 2) vem antes na ordem de lock, então é creditado primeiro
+        mock_session.execute.side_effect = [Mock(rowcount=1), Mock(), Mock(rowcount=0)]
+        mock_session.query.return_value.filter.return_value.one_or_none.return_value = (
+            None
+        )
+
+        with pytest.raises(ValueError, match="Pessoa com ID 999 não encontrada"):
+            repository.transferir(999, 2, Decimal("500.00"))
+
+        mock_session.commit.assert_not_called()
+
     def test_obter_saldo_sucesso(self):
         mock_db_connection = Mock()
         mock_session = Mock()
@@ -536,6 +590,8 @@ class TestPessoaFisicaRepository:
             mock_pessoa
         )
 
+        mock_session.execute.return_value.all.return_value = []
+
         resultado = repository.realizar_extrato(1)
 
         assert resultado["id"] == 1
@@ -545,6 +601,8 @@ class TestPessoaFisicaRepository:
         assert resultado["categoria"] == "Socio Senior"
         assert "criado_em" in resultado
         assert "atualizado_em" in resultado
+        assert resultado["transacoes"] == []
+        assert resultado["proximo_cursor"] is None
 
     def test_realizar_extrato_pessoa_nao_encontrada(self):
         mock_db_connection = Mock()
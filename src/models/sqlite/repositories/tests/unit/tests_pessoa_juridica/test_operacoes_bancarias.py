@@ -10,196 +10,192 @@ class TestSacarDinheiro:
 
     def test_sacar_dinheiro_sucesso(self, db_session_mock, repository):
         _, mock_session = db_session_mock
-
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("200000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
-        )
+        mock_session.execute.return_value.rowcount = 1
 
         resultado = repository.sacar_dinheiro(1, Decimal("10000.00"))
 
         assert resultado is True
-        assert mock_empresa.saldo == Decimal("190000.00")
+        # UPDATE do saldo + INSERT no livro-razão
+        assert mock_session.execute.call_count == 2
+        mock_session.query.assert_not_called()
         mock_session.commit.assert_called_once()
 
-    def test_sacar_dinheiro_saldo_insuficiente(self, db_session_mock, repository):
+    def test_sacar_dinheiro_update_condicional(self, db_session_mock, repository):
         _, mock_session = db_session_mock
+        mock_session.execute.return_value.rowcount = 1
 
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("1000.00")
+        repository.sacar_dinheiro(1, Decimal("500.50"))
 
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
+        sql = str(mock_session.execute.call_args_list[0][0][0])
+        assert sql.startswith("UPDATE pessoa_juridica SET saldo_centavos=")
+        assert "pessoa_juridica.saldo_centavos - " in sql
+        assert "pessoa_juridica.id = " in sql
+        assert "pessoa_juridica.saldo_centavos >= " in sql
+
+    def test_sacar_dinheiro_saldo_insuficiente(self, db_session_mock, repository):
+        _, mock_session = db_session_mock
+        mock_session.execute.return_value.rowcount = 0
+        mock_session.query.return_value.filter.return_value.one_or_none.return_value = (
+            1,
         )
 
         with pytest.raises(ValueError, match="Saldo Insuficiente"):
             repository.sacar_dinheiro(1, Decimal("3000.00"))
 
+        mock_session.commit.assert_not_called()
+
     def test_sacar_dinheiro_valor_negativo(self, db_session_mock, repository):
         _, mock_session = db_session_mock
 
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("50000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
-        )
-
         with pytest.raises(ValueError, match="Valor de saque deve ser positivo"):
             repository.sacar_dinheiro(1, Decimal("-1000.00"))
 
+        mock_session.execute.assert_not_called()
+
     def test_sacar_valor_zero(self, db_session_mock, repository):
         _, mock_session = db_session_mock
 
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("50000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
-        )
-
         with pytest.raises(ValueError, match="Valor de saque deve ser positivo"):
             repository.sacar_dinheiro(1, Decimal("0.00"))
 
-    def test_sacar_valor_exato(self, db_session_mock, repository):
-        _, mock_session = db_session_mock
-
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("50000.00")
+        mock_session.execute.assert_not_called()
 
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
-        )
-
-        resultado = repository.sacar_dinheiro(1, Decimal("50000.00"))
-
-        assert resultado is True
-        assert mock_empresa.saldo == Decimal("0.00")
-        mock_session.commit.assert_called_once()
-
-    def test_sacar_com_centavos(self, db_session_mock, repository):
+    def test_sacar_acima_do_limite(self, db_session_mock, repository):
         _, mock_session = db_session_mock
 
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("1500.55")
+        with pytest.raises(ValueError, match="Limite de saque excedido"):
+            repository.sacar_dinheiro(1, Decimal("5000000.01"))
 
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
-        )
-
-        resultado = repository.sacar_dinheiro(1, Decimal("500.50"))
-
-        assert resultado is True
-        assert mock_empresa.saldo == Decimal("1000.05")
-        mock_session.commit.assert_called_once()
+        mock_session.execute.assert_not_called()
 
     def test_sacar_empresa_nao_encontrada(self, db_session_mock, repository):
         _, mock_session = db_session_mock
-        mock_session.query.return_value.filter.return_value.one.side_effect = (
-            NoResultFound()
+        mock_session.execute.return_value.rowcount = 0
+        mock_session.query.return_value.filter.return_value.one_or_none.return_value = (
+            None
         )
 
         with pytest.raises(ValueError, match="Empresa com ID 999 não encontrada"):
             repository.sacar_dinheiro(999, Decimal("100000.00"))
 
+        mock_session.commit.assert_not_called()
+
 
 class TestDepositarDinheiro:
 
     def test_depositar_dinheiro_sucesso(self, db_session_mock, repository):
         _, mock_session = db_session_mock
-
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("10000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
-        )
+        mock_session.execute.return_value.rowcount = 1
 
         resultado = repository.depositar_dinheiro(1, Decimal("5000.00"))
 
         assert resultado is True
-        assert mock_empresa.saldo == Decimal("15000.00")
+        # UPDATE do saldo + INSERT no livro-razão
+        assert mock_session.execute.call_count == 2
         mock_session.commit.assert_called_once()
 
-    def test_depositar_valor_negativo(self, db_session_mock, repository):
+    def test_depositar_dinheiro_update_atomico(self, db_session_mock, repository):
         _, mock_session = db_session_mock
+        mock_session.execute.return_value.rowcount = 1
 
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("10000.00")
+        repository.depositar_dinheiro(1, Decimal("500.25"))
 
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
-        )
+        sql = str(mock_session.execute.call_args_list[0][0][0])
+        assert sql.startswith("UPDATE pessoa_juridica SET saldo_centavos=")
+        assert "pessoa_juridica.saldo_centavos + " in sql
+
+    def test_depositar_valor_negativo(self, db_session_mock, repository):
+        _, mock_session = db_session_mock
 
         with pytest.raises(ValueError, match="Valor de depósito deve ser positivo"):
             repository.depositar_dinheiro(1, Decimal("-1000.00"))
 
+        mock_session.execute.assert_not_called()
+
     def test_depositar_valor_zero(self, db_session_mock, repository):
         _, mock_session = db_session_mock
 
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("10000.00")
-
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
-        )
-
         with pytest.raises(ValueError, match="Valor de depósito deve ser positivo"):
             repository.depositar_dinheiro(1, Decimal("0.00"))
 
-    def test_depositar_com_centavos(self, db_session_mock, repository):
+        mock_session.execute.assert_not_called()
+
+    def test_depositar_empresa_nao_encontrada(self, db_session_mock, repository):
         _, mock_session = db_session_mock
+        mock_session.execute.return_value.rowcount = 0
 
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("10500.50")
+        with pytest.raises(ValueError, match="Empresa com ID 999 não encontrada"):
+            repository.depositar_dinheiro(999, Decimal("10000.00"))
+
+        mock_session.commit.assert_not_called()
 
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
-        )
 
-        resultado = repository.depositar_dinheiro(1, Decimal("500.25"))
+class TestTransferir:
+
+    def test_transferir_sucesso(self, db_session_mock, repository):
+        _, mock_session = db_session_mock
+        mock_session.execute.return_value.rowcount = 1
+
+        resultado = repository.transferir(1, 2, Decimal("1000.00"))
 
         assert resultado is True
-        assert mock_empresa.saldo == Decimal("11000.75")
+        # dois UPDATEs de saldo + dois lançamentos no livro-razão
+        assert mock_session.execute.call_count == 4
         mock_session.commit.assert_called_once()
 
-    def test_depositar_valor_grande(self, db_session_mock, repository):
+    def test_transferir_ordem_deterministica(self, db_session_mock, repository):
         _, mock_session = db_session_mock
+        mock_session.execute.return_value.rowcount = 1
 
-        mock_empresa = Mock()
-        mock_empresa.id = 1
-        mock_empresa.saldo = Decimal("4000.00")
+        repository.transferir(1, 3, Decimal("10.00"), tipo_destino="fisica")
 
-        mock_session.query.return_value.filter.return_value.one.return_value = (
-            mock_empresa
+        credito, lancamento_credito, debito, lancamento_debito = [
+            str(chamada[0][0]) for chamada in mock_session.execute.call_args_list
+        ]
+        assert credito.startswith("UPDATE pessoa_fisica")
+        assert "pessoa_fisica.saldo_centavos + " in credito
+        assert lancamento_credito.startswith("INSERT INTO transacoes")
+        assert debito.startswith("UPDATE pessoa_juridica")
+        assert "pessoa_juridica.saldo_centavos >= " in debito
+        assert lancamento_debito.startswith("INSERT INTO transacoes")
+
+    def test_transferir_saldo_insuficiente(self, db_session_mock, repository):
+        _, mock_session = db_session_mock
+        mock_session.execute.return_value.rowcount = 0
+        mock_session.query.return_value.filter.return_value.one_or_none.return_value = (
+            1,
         )
 
-        resultado = repository.depositar_dinheiro(1, Decimal("1500000000.00"))
+        with pytest.raises(ValueError, match="Saldo Insuficiente"):
+            repository.transferir(1, 2, Decimal("1000.00"))
 
-        assert resultado is True
-        assert mock_empresa.saldo == Decimal("1500004000.00")
-        mock_session.commit.assert_called_once()
+        mock_session.commit.assert_not_called()
 
-    def test_depositar_empresa_nao_encontrada(self, db_session_mock, repository):
+    def test_transferir_mesma_conta(self, db_session_mock, repository):
         _, mock_session = db_session_mock
-        mock_session.query.return_value.filter.return_value.one.side_effect = (
-            NoResultFound()
-        )
 
-        with pytest.raises(ValueError, match="Empresa com ID 999 não encontrada"):
-            repository.depositar_dinheiro(999, Decimal("10000.00"))
+        with pytest.raises(ValueError, match="devem ser diferentes"):
+            repository.transferir(1, 1, Decimal("1000.00"))
+
+        mock_session.execute.assert_not_called()
+
+    def test_transferir_tipo_destino_invalido(self, db_session_mock, repository):
+        _, mock_session = db_session_mock
+
+        with pytest.raises(ValueError, match="Tipo de conta de destino inválido"):
+            repository.transferir(1, 2, Decimal("1000.00"), tipo_destino="poupanca")
+
+        mock_session.execute.assert_not_called()
+
+    def test_transferir_valor_zero(self, db_session_mock, repository):
+        _, mock_session = db_session_mock
+
+        with pytest.raises(
+            ValueError, match="Valor de transferência deve ser positivo"
+        ):
+            repository.transferir(1, 2, Decimal("0.00"))
+
+        mock_session.execute.assert_not_called()
 
 
 class TestObterSaldo:
@@ -248,6 +244,8 @@ class TestRealizarExtrato:
             mock_empresa
         )
 
+        mock_session.execute.return_value.all.return_value = []
+
         resultado = repository.realizar_extrato(1)
 
         assert resultado["id"] == 1
@@ -285,6 +283,8 @@ class TestRealizarExtrato:
             mock_empresa
         )
 
+        mock_session.execute.return_value.all.return_value = []
+
         resultado = repository.realizar_extrato(2)
 
         assert isinstance(resultado, dict)
@@ -297,6 +297,8 @@ class TestRealizarExtrato:
             "idade",
             "criado_em",
             "atualizado_em",
+            "transacoes",
+            "proximo_cursor",
         }
         assert resultado["id"] == 2
         assert resultado["nome_fantasia"] == "Pearson Specter"
@@ -304,3 +306,5 @@ class TestRealizarExtrato:
         assert resultado["saldo"] == float(200000.00)
         assert resultado["categoria"] == "Escritório de Advocacia"
         assert resultado["idade"] == 18
+        assert resultado["transacoes"] == []
+        assert resultado["proximo_cursor"] is None
@@ -0,0 +1,79 @@
+import os
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from .pragmas import DEFAULT_PRAGMA_PROFILE, aplicar_perfil_pragmas
+
+
+def para_url_assincrona(connection_string: str) -> str:
+    """sqlite:///arquivo.db -> sqlite+aiosqlite:///arquivo.db (outros drivers ficam)."""
+    if connection_string.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + connection_string[len("sqlite://") :]
+    return connection_string
+
+
+class AsyncDBConnectionHandler:
+    """
+    Versão asyncio do DBConnectionHandler: engine do SQLAlchemy sobre o
+    aiosqlite, para atender muitas consultas concorrentes de um único event
+    loop sem ocupar uma thread do servidor por consulta em andamento.
+
+    Usa a mesma DATABASE_URL (convertida para o driver aiosqlite) e o mesmo
+    perfil de PRAGMA do handler síncrono. Cada operação abre a sua própria
+    AsyncSession com `async with handler.sessao() as session`; sessões não
+    são compartilhadas entre tarefas.
+    """
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        pragma_profile: Optional[str] = None,
+    ) -> None:
+        self.__connection_string = para_url_assincrona(
+            connection_string or os.environ.get("DATABASE_URL", "sqlite:///storage.db")
+        )
+        self.__pragma_profile = pragma_profile or os.environ.get(
+            "SQLITE_PRAGMA_PROFILE", DEFAULT_PRAGMA_PROFILE
+        )
+        self.__engine = None
+        self.__session_factory = None
+
+    async def connect_to_db(self) -> None:
+        try:
+            self.__engine = create_async_engine(
+                self.__connection_string,
+                echo=False,
+                pool_pre_ping=True,
+            )
+            if self.__engine.dialect.name == "sqlite":
+                aplicar_perfil_pragmas(self.__engine.sync_engine, self.__pragma_profile)
+            # Sem expirar no commit: em asyncio não há lazy load implícito
+            # para recarregar atributos depois do commit
+            self.__session_factory = async_sessionmaker(
+                self.__engine, expire_on_commit=False
+            )
+            async with self.__engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            print(" Conexão assíncrona com banco estabelecida")
+        except Exception as e:
+            raise RuntimeError(f"Erro ao conectar ao banco: {e}") from e
+
+    def get_engine(self):
+        return self.__engine
+
+    def sessao(self) -> AsyncSession:
+        if self.__session_factory is None:
+            raise RuntimeError(
+                "Engine não inicializado. "
+                "Chame `await connect_to_db()` antes de abrir sessões."
+            )
+        return self.__session_factory()
+
+    async def dispose(self) -> None:
+        if self.__engine is not None:
+            await self.__engine.dispose()
+
+
+async_db_connection_handler = AsyncDBConnectionHandler()
@@ -1,12 +1,43 @@
+import os
+import threading
+from typing import Optional
+
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from .instrumentacao import instalar_instrumentacao
+from .pragmas import DEFAULT_PRAGMA_PROFILE, aplicar_perfil_pragmas
 
 
 class DBConnectionHandler:
-    def __init__(self) -> None:
-        self.__connection_string = "sqlite:///storage.db"
+    """
+    Gerencia o engine e as sessões do banco.
+
+    O engine e o sessionmaker são criados uma única vez em connect_to_db().
+    As sessões ficam em um scoped_session, ou seja, cada thread (requisição
+    do Flask) enxerga a sua própria sessão, mesmo compartilhando a mesma
+    instância de DBConnectionHandler.
+
+    A string de conexão e o perfil de PRAGMA (ver settings/pragmas.py) podem
+    vir por parâmetro ou pelas variáveis DATABASE_URL e SQLITE_PRAGMA_PROFILE.
+    O engine sai com a instrumentação de SQL por requisição instalada (ver
+    settings/instrumentacao.py).
+    """
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        pragma_profile: Optional[str] = None,
+    ) -> None:
+        self.__connection_string = connection_string or os.environ.get(
+            "DATABASE_URL", "sqlite:///storage.db"
+        )
+        self.__pragma_profile = pragma_profile or os.environ.get(
+            "SQLITE_PRAGMA_PROFILE", DEFAULT_PRAGMA_PROFILE
+        )
         self.__engine = None
-        self.session = None
+        self.__session_factory = None
+        self.__local = threading.local()
 
     def connect_to_db(self):
         try:
@@ -15,6 +46,10 @@ class DBConnectionHandler:
                 echo=False,
                 pool_pre_ping=True,
             )
+            if self.__engine.dialect.name == "sqlite":
+                aplicar_perfil_pragmas(self.__engine, self.__pragma_profile)
+            instalar_instrumentacao(self.__engine)
+            self.__session_factory = scoped_session(sessionmaker(bind=self.__engine))
             with self.__engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
             print(" Conexão com banco estabelecida")
@@ -26,15 +61,22 @@ class DBConnectionHandler:
             self.connect_to_db()
         return self.__engine
 
+    @property
+    def session(self):
+        """Sessão da thread atual, ou None fora de um bloco `with`."""
+        if self.__session_factory is None or not self.__session_factory.registry.has():
+            return None
+        return self.__session_factory()
+
     def __enter__(self):
         if self.__engine is None:
             raise RuntimeError(
                 "Engine não inicializado."
-                "Chame connect_to_be() antes de usar o context manager."
+                "Chame connect_to_db() antes de usar o context manager."
             )
         try:
-            session_maker = sessionmaker(bind=self.__engine)
-            self.session = session_maker()
+            self.__session_factory()
+            self.__local.depth = getattr(self.__local, "depth", 0) + 1
             return self
         except Exception as e:
             raise RuntimeError(f"Erro ao criar sessão: {e}") from e
@@ -44,11 +86,12 @@ class DBConnectionHandler:
         Gerencia o fechamento da sessão e tratamento de exceções.
             - Se houve exceção: faz rollback
             - Se não houve exceção: faz commit (opcional, depende do uso)
-            - Sempre fecha a sessão
+            - Fecha e descarta a sessão da thread ao sair do bloco mais externo
         """
         if self.session is None:
             return False
 
+        self.__local.depth -= 1
         try:
             if exc_type is not None:
                 print(f" Erro detectado: {exc_type.__name__}: {exc_val}")
@@ -62,10 +105,11 @@ class DBConnectionHandler:
             print(f" Erro ao finalizar sessão: {close_error}")
             return False
         finally:
-            try:
-                self.session.close()
-            except Exception as e:
-                print(f"  Erro ao fechar sessão: {e}")
+            if self.__local.depth == 0:
+                try:
+                    self.__session_factory.remove()
+                except Exception as e:
+                    print(f"  Erro ao fechar sessão: {e}")
         return False
 
 
@@ -1,7 +1,10 @@
+import threading
+
 import pytest
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
-from .connection import db_connection_handler
+from .connection import DBConnectionHandler, db_connection_handler
 
 
 @pytest.mark.skip(reason="interacao com o banco")
@@ -13,3 +16,75 @@ def test_connect_to_db():
 
     assert db_engine is not None
     assert isinstance(db_engine, Engine)
+
+
+def test_sessao_isolada_por_thread(tmp_path):
+    handler = DBConnectionHandler(f"sqlite:///{tmp_path / 'threads.db'}")
+    handler.connect_to_db()
+
+    barreira = threading.Barrier(2)
+    sessoes = {}
+
+    def usar_sessao(nome):
+        with handler as database:
+            barreira.wait()
+            sessoes[nome] = database.session
+            barreira.wait()
+
+    threads = [
+        threading.Thread(target=usar_sessao, args=(nome,)) for nome in ("a", "b")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sessoes["a"] is not None
+    assert sessoes["b"] is not None
+    assert sessoes["a"] is not sessoes["b"]
+    assert handler.session is None
+
+
+def test_sessao_aninhada_reutilizada(tmp_path):
+    handler = DBConnectionHandler(f"sqlite:///{tmp_path / 'aninhada.db'}")
+    handler.connect_to_db()
+
+    with handler as externo:
+        sessao_externa = externo.session
+        with handler as interno:
+            assert interno.session is sessao_externa
+        assert externo.session is sessao_externa
+
+    assert handler.session is None
+
+
+def test_perfil_pragmas_aplicado_em_cada_conexao(tmp_path):
+    handler = DBConnectionHandler(
+        f"sqlite:///{tmp_path / 'throughput.db'}", pragma_profile="throughput"
+    )
+    handler.connect_to_db()
+
+    with handler.get_engine().connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+
+
+def test_perfil_padrao_mantem_rollback_journal(tmp_path):
+    handler = DBConnectionHandler(
+        f"sqlite:///{tmp_path / 'padrao.db'}", pragma_profile="padrao"
+    )
+    handler.connect_to_db()
+
+    with handler.get_engine().connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+
+
+def test_perfil_pragmas_desconhecido(tmp_path):
+    handler = DBConnectionHandler(
+        f"sqlite:///{tmp_path / 'invalido.db'}", pragma_profile="turbo"
+    )
+
+    with pytest.raises(RuntimeError, match="Perfil de PRAGMA desconhecido"):
+        handler.connect_to_db()
@@ -0,0 +1,131 @@
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class MedicaoRequisicao:
+    """SQL executado durante uma requisição: quantidade, tempo total e a mais lenta."""
+
+    __slots__ = ("consultas", "tempo_db", "tempo_mais_lenta", "mais_lenta")
+
+    def __init__(self) -> None:
+        self.consultas = 0
+        self.tempo_db = 0.0
+        self.tempo_mais_lenta = 0.0
+        self.mais_lenta: Optional[str] = None
+
+    def registrar(self, sql: str, duracao: float) -> None:
+        self.consultas += 1
+        self.tempo_db += duracao
+        if duracao > self.tempo_mais_lenta:
+            self.tempo_mais_lenta = duracao
+            self.mais_lenta = sql
+
+
+# Medição da requisição em andamento. ContextVar em vez de threading.local:
+# cada thread do servidor tem o seu contexto, e fora de uma requisição o
+# valor é None e os listeners não medem nada.
+_medicao_atual: ContextVar[Optional[MedicaoRequisicao]] = ContextVar(
+    "medicao_sql", default=None
+)
+
+
+def iniciar_medicao() -> Token:
+    return _medicao_atual.set(MedicaoRequisicao())
+
+
+def encerrar_medicao(token: Token) -> Optional[MedicaoRequisicao]:
+    medicao = _medicao_atual.get()
+    _medicao_atual.reset(token)
+    return medicao
+
+
+def _antes_de_executar(
+    conn, cursor, statement, parameters, context, executemany
+):  # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
+    if context is not None and _medicao_atual.get() is not None:
+        context.inicio_instrumentacao = time.perf_counter()
+
+
+def _depois_de_executar(
+    conn, cursor, statement, parameters, context, executemany
+):  # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
+    medicao = _medicao_atual.get()
+    inicio = getattr(context, "inicio_instrumentacao", None)
+    if medicao is not None and inicio is not None:
+        medicao.registrar(statement, time.perf_counter() - inicio)
+
+
+def instalar_instrumentacao(engine: Engine) -> None:
+    """
+    Registra no engine os listeners que medem cada comando SQL.
+
+    O início fica no ExecutionContext do próprio comando, então um comando
+    que falha não deixa estado para trás. Comandos executemany (inserção em
+    lote) contam como um só.
+    """
+    if not event.contains(engine, "before_cursor_execute", _antes_de_executar):
+        event.listen(engine, "before_cursor_execute", _antes_de_executar)
+        event.listen(engine, "after_cursor_execute", _depois_de_executar)
+
+
+class EstatisticasSql:
+    """Totais de SQL por rota, acumulados desde o início do processo."""
+
+    def __init__(self) -> None:
+        self.__rotas: Dict[str, Dict] = {}
+        self.__lock = threading.Lock()
+
+    def registrar(self, rota: str, medicao: MedicaoRequisicao) -> None:
+        with self.__lock:
+            totais = self.__rotas.get(rota)
+            if totais is None:
+                totais = self.__rotas[rota] = {
+                    "requisicoes": 0,
+                    "consultas": 0,
+                    "consultas_max": 0,
+                    "tempo_db": 0.0,
+                    "tempo_mais_lenta": 0.0,
+                    "mais_lenta": None,
+                }
+            totais["requisicoes"] += 1
+            totais["consultas"] += medicao.consultas
+            totais["consultas_max"] = max(totais["consultas_max"], medicao.consultas)
+            totais["tempo_db"] += medicao.tempo_db
+            if medicao.tempo_mais_lenta > totais["tempo_mais_lenta"]:
+                totais["tempo_mais_lenta"] = medicao.tempo_mais_lenta
+                totais["mais_lenta"] = medicao.mais_lenta
+
+    def estatisticas(self) -> Dict[str, Dict]:
+        """
+        Por rota: requisições, consultas (total e por requisição, média e
+        máxima, para achar N+1), tempo de banco total e médio em ms e a
+        consulta mais lenta.
+        """
+        with self.__lock:
+            rotas = {rota: dict(totais) for rota, totais in self.__rotas.items()}
+
+        return {
+            rota: {
+                "requisicoes": t["requisicoes"],
+                "consultas": t["consultas"],
+                "consultas_media": t["consultas"] / t["requisicoes"],
+                "consultas_max": t["consultas_max"],
+                "tempo_db_ms": t["tempo_db"] * 1000,
+                "tempo_db_medio_ms": t["tempo_db"] * 1000 / t["requisicoes"],
+                "mais_lenta_ms": t["tempo_mais_lenta"] * 1000,
+                "mais_lenta_sql": t["mais_lenta"],
+            }
+            for rota, t in rotas.items()
+        }
+
+    def limpar(self) -> None:
+        with self.__lock:
+            self.__rotas.clear()
+
+
+estatisticas_sql = EstatisticasSql()
@@ -0,0 +1,52 @@
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Perfis de PRAGMA aplicados em cada nova conexão do pool.
+#   - padrao: sem pragmas, comportamento padrão do SQLite (rollback journal)
+#   - durable: WAL com fsync a cada commit, para dados que não podem ser perdidos
+#   - throughput: WAL com fsync só no checkpoint, caches maiores e mmap
+PRAGMA_PROFILES: Dict[str, Dict[str, object]] = {
+    "padrao": {},
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+        "cache_size": -16000,
+        "temp_store": "MEMORY",
+        "mmap_size": 67108864,
+    },
+    "throughput": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -64000,
+        "temp_store": "MEMORY",
+        "mmap_size": 268435456,
+    },
+}
+
+DEFAULT_PRAGMA_PROFILE = "durable"
+
+
+def aplicar_perfil_pragmas(engine: Engine, perfil: str) -> None:
+    """Registra um listener que aplica o perfil em toda conexão nova do engine."""
+    if perfil not in PRAGMA_PROFILES:
+        raise ValueError(
+            f"Perfil de PRAGMA desconhecido: '{perfil}'. "
+            f"Opções: {', '.join(PRAGMA_PROFILES)}"
+        )
+
+    pragmas = PRAGMA_PROFILES[perfil]
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for nome, valor in pragmas.items():
+                cursor.execute(f"PRAGMA {nome}={valor}")
+        finally:
+            cursor.close()
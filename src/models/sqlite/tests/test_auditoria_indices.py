@@ -0,0 +1,120 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.models.sqlite.auditoria_indices import (
+    Achado,
+    auditar,
+    coluna_rowid,
+    encontrar_nao_usados,
+    encontrar_redundantes,
+    gerar_migracao,
+    indices_usados,
+    ler_indices,
+)
+
+SCHEMA_PATH = Path(__file__).resolve().parents[4] / "init" / "schema.sql"
+
+SCHEMA_TESTE = """
+CREATE TABLE conta(
+    id INTEGER PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE,
+    categoria TEXT NOT NULL,
+    saldo INTEGER NOT NULL
+);
+CREATE INDEX idx_email ON conta(email);
+CREATE INDEX idx_categoria ON conta(categoria);
+CREATE INDEX idx_categoria_saldo ON conta(categoria, saldo);
+CREATE INDEX idx_categoria_saldo_copia ON conta(categoria, saldo);
+CREATE INDEX idx_id_saldo ON conta(id, saldo);
+CREATE INDEX idx_saldo ON conta(saldo);
+CREATE INDEX idx_saldo_desc_categoria ON conta(saldo DESC, categoria);
+CREATE INDEX idx_positivos ON conta(categoria) WHERE saldo > 0;
+"""
+
+
+@pytest.fixture
+def conn():
+    conexao = sqlite3.connect(":memory:")
+    conexao.executescript(SCHEMA_TESTE)
+    yield conexao
+    conexao.close()
+
+
+def _redundantes(conn):
+    indices = ler_indices(conn, ["conta"])
+    return {
+        achado.indice: achado.tipo
+        for achado in encontrar_redundantes(
+            indices, {"conta": coluna_rowid(conn, "conta")}
+        )
+    }
+
+
+def test_aponta_duplicados_e_redundantes(conn):
+    assert _redundantes(conn) == {
+        "idx_email": "duplicado",
+        "idx_categoria": "redundante",
+        "idx_categoria_saldo_copia": "duplicado",
+        "idx_id_saldo": "redundante",
+    }
+
+
+def test_nao_aponta_prefixo_com_ordem_diferente(conn):
+    # idx_saldo é prefixo de (saldo DESC, categoria) só nas colunas, não na ordem
+    assert "idx_saldo" not in _redundantes(conn)
+
+
+def test_indices_unicos_e_parciais_nunca_sao_removidos(conn):
+    achados = _redundantes(conn)
+
+    assert not any(nome.startswith("sqlite_autoindex") for nome in achados)
+    assert "idx_positivos" not in achados
+
+
+def test_indices_usados_pelo_plano(conn):
+    usados = indices_usados(
+        conn,
+        [
+            ("SELECT id FROM conta WHERE categoria = ? AND saldo > ?", ("a", 1)),
+            ("SELECT id FROM conta WHERE email = ?", ("x@y.com",)),
+        ],
+    )
+    indices = ler_indices(conn, ["conta"])
+
+    nao_usados = {achado.indice for achado in encontrar_nao_usados(indices, usados)}
+
+    # Com duas cópias do mesmo índice o planner usa uma delas
+    assert usados & {"idx_categoria_saldo", "idx_categoria_saldo_copia"}
+    assert "sqlite_autoindex_conta_1" in usados
+    assert {"idx_saldo", "idx_id_saldo", "idx_positivos"} <= nao_usados
+    assert not any(nome.startswith("sqlite_autoindex") for nome in nao_usados)
+
+
+def test_gerar_migracao_so_remove_tipos_pedidos():
+    achados = [
+        Achado("duplicado", "conta", "idx_email", "mesmas colunas"),
+        Achado("nao_usado", "conta", "idx_saldo", "sem uso"),
+        Achado("ausente_no_banco", "conta", "ix_nome", "declarado"),
+    ]
+
+    script = gerar_migracao(achados, "007_remover.sql")
+
+    assert script.startswith("-- Migração 007:")
+    assert "DROP INDEX IF EXISTS idx_email;" in script
+    assert "idx_saldo" not in script
+    assert "ix_nome" not in script
+    assert "DROP INDEX IF EXISTS idx_saldo;" in gerar_migracao(
+        achados, "007_remover.sql", ("duplicado", "nao_usado")
+    )
+
+
+def test_schema_atual_nao_tem_indices_duplicados_nem_nao_usados(tmp_path):
+    caminho = tmp_path / "storage.db"
+    with sqlite3.connect(caminho) as conexao:
+        conexao.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+
+    tipos = {achado.tipo for achado in auditar(caminho)}
+
+    assert not tipos & {"duplicado", "redundante", "nao_usado", "fora_do_modelo"}
@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.models.sqlite.settings.instrumentacao import (
+    EstatisticasSql,
+    MedicaoRequisicao,
+    encerrar_medicao,
+    iniciar_medicao,
+    instalar_instrumentacao,
+)
+
+
+@pytest.fixture(name="engine")
+def fixture_engine():
+    engine = create_engine("sqlite://")
+    instalar_instrumentacao(engine)
+    instalar_instrumentacao(engine)  # idempotente: não duplica os listeners
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+    yield engine
+    engine.dispose()
+
+
+def test_mede_os_comandos_da_requisicao(engine):
+    token = iniciar_medicao()
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+        conn.execute(text("INSERT INTO t VALUES (:x)"), [{"x": 2}, {"x": 3}])
+        conn.execute(text("SELECT * FROM t")).all()
+    medicao = encerrar_medicao(token)
+
+    # executemany conta como um comando
+    assert medicao.consultas == 3
+    assert medicao.tempo_db > 0
+    assert medicao.tempo_mais_lenta <= medicao.tempo_db
+    assert medicao.mais_lenta is not None
+
+
+def test_fora_de_requisicao_nao_mede(engine):
+    with engine.begin() as conn:
+        conn.execute(text("SELECT 1"))
+
+    token = iniciar_medicao()
+    assert encerrar_medicao(token).consultas == 0
+
+
+def test_comando_com_erro_nao_conta(engine):
+    token = iniciar_medicao()
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM tabela_inexistente"))
+        conn.execute(text("SELECT 1"))
+    medicao = encerrar_medicao(token)
+
+    assert medicao.consultas == 1
+    assert medicao.mais_lenta == "SELECT 1"
+
+
+def test_estatisticas_por_rota():
+    estatisticas = EstatisticasSql()
+    for consultas, duracao in ((1, 0.002), (5, 0.010)):
+        medicao = MedicaoRequisicao()
+        for _ in range(consultas):
+            medicao.registrar(f"SELECT {consultas}", duracao / consultas)
+        estatisticas.registrar("GET /fisica", medicao)
+
+    rota = estatisticas.estatisticas()["GET /fisica"]
+
+    assert rota["requisicoes"] == 2
+    assert rota["consultas"] == 6
+    assert rota["consultas_media"] == 3
+    assert rota["consultas_max"] == 5
+    assert rota["tempo_db_ms"] == pytest.approx(12)
+    assert rota["tempo_db_medio_ms"] == pytest.approx(6)
+    assert rota["mais_lenta_ms"] == pytest.approx(2)
+    assert rota["mais_lenta_sql"] == "SELECT 1"
+
+    estatisticas.limpar()
+    assert not estatisticas.estatisticas()
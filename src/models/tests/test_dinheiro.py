@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+import pytest
+
+from src.models.dinheiro import para_centavos, para_reais
+from src.models.sqlite.entities.tipos import Centavos
+
+
+@pytest.mark.parametrize(
+    "valor, esperado",
+    [
+        (Decimal("10.50"), 1050),
+        (Decimal("0.01"), 1),
+        ("1234.5", 123450),
+        (100, 10000),
+        (0.1, 10),
+        (0.29, 29),
+    ],
+)
+def test_para_centavos(valor, esperado):
+    assert para_centavos(valor) == esperado
+
+
+@pytest.mark.parametrize(
+    "valor", [Decimal("0.001"), "1.005", "abc", None, float("nan"), "Infinity"]
+)
+def test_para_centavos_rejeita_valores_invalidos(valor):
+    with pytest.raises(ValueError):
+        para_centavos(valor)
+
+
+def test_para_reais_tem_duas_casas():
+    assert para_reais(1050) == Decimal("10.50")
+    assert str(para_reais(1050)) == "10.50"
+    assert str(para_reais(0)) == "0.00"
+
+
+def test_centavos_converte_na_fronteira_com_o_banco():
+    tipo = Centavos()
+
+    assert tipo.process_bind_param(Decimal("99.99"), None) == 9999
+    assert tipo.process_bind_param(None, None) is None
+    assert tipo.process_result_value(9999, None) == Decimal("99.99")
+    # AVG devolve REAL no SQLite
+    assert tipo.process_result_value(333333.3333, None) == Decimal("3333.33")
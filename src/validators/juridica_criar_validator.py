@@ -1,12 +1,15 @@
 import re
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, Union
 
 from pydantic import BaseModel, EmailStr, Field, ValidationError, field_validator
+from pydantic_core import from_json
 
 from src.errors.error_types.http_bad_request import HttpBadRequestError
 from src.views.http_types.http_request import HttpRequest
 
+LIMITE_ITENS_LOTE = 5000
+
 
 class PessoaJuridicaCriarSchema(BaseModel):
     nome_fantasia: str = Field(
@@ -21,13 +24,17 @@ class PessoaJuridicaCriarSchema(BaseModel):
         ge=0, le=200, description="Tempo de atividade da empresa entre 0 e 200 anos"
     )
 
-    faturamento: Decimal = Field(ge=0, description="Saldo inicial não negativa")
+    faturamento: Decimal = Field(
+        ge=0, decimal_places=2, description="Saldo inicial não negativa"
+    )
 
     categoria: str = Field(
         min_length=1, max_length=100, description="Categoria da empresa"
     )
 
-    saldo: Decimal = Field(ge=0, description="Saldo inicial não negativo")
+    saldo: Decimal = Field(
+        ge=0, decimal_places=2, description="Saldo inicial não negativo"
+    )
 
     @field_validator("celular")
     @classmethod
@@ -65,18 +72,83 @@ class PessoaJuridicaCriarSchema(BaseModel):
         validate_assignment = True
 
 
-def juridica_criar_validator(http_request: HttpRequest) -> Dict:
+def validar_pessoa_juridica(
+    dados: Union[PessoaJuridicaCriarSchema, Dict],
+) -> PessoaJuridicaCriarSchema:
+    """
+    Contrato único de validação para criar uma conta: um schema já validado
+    é devolvido como está; um dict (chamada direta, fora das rotas) passa
+    pelo schema aqui.
+    """
+    if isinstance(dados, PessoaJuridicaCriarSchema):
+        return dados
     try:
-        # Valida e converte para o schema Pydantic
-        validated_data = PessoaJuridicaCriarSchema(**http_request.body)
+        return PessoaJuridicaCriarSchema.model_validate(dados)
+    except ValidationError as e:
+        raise _erro_de_validacao(e) from e
+
 
-        return validated_data.model_dump()
+def juridica_criar_validator(http_request: HttpRequest) -> PessoaJuridicaCriarSchema:
+    if http_request.raw_body is None:
+        return validar_pessoa_juridica(http_request.body)
+    try:
+        # Com o corpo em bytes, o pydantic-core faz parse e validação de uma vez
+        return PessoaJuridicaCriarSchema.model_validate_json(http_request.raw_body)
     except ValidationError as e:
-        errors = []
-        for error in e.errors():
-            field = error["loc"][0]
-            message = error["msg"]
-            errors.append(f"{field}: {message}")
-
-        error_message = "; ".join(errors)
-        raise HttpBadRequestError(message=error_message, name="Bad Request") from e
+        raise _erro_de_validacao(e) from e
+
+
+def _erro_de_validacao(e: ValidationError) -> HttpBadRequestError:
+    errors = []
+    for error in e.errors():
+        # Erros do corpo inteiro (JSON inválido, não é objeto) vêm sem loc
+        field = error["loc"][0] if error["loc"] else "body"
+        message = error["msg"]
+        errors.append(f"{field}: {message}")
+
+    error_message = "; ".join(errors)
+    return HttpBadRequestError(message=error_message, name="Bad Request")
+
+
+def juridica_criar_lote_validator(
+    http_request: HttpRequest,
+) -> List[Union[PessoaJuridicaCriarSchema, HttpBadRequestError]]:
+    """
+    Valida todos os itens do lote, sem parar no primeiro erro.
+
+    Retorna uma lista do mesmo tamanho do corpo: o schema validado de cada
+    item ou o HttpBadRequestError que ele gerou. Só o formato do corpo
+    (lista não vazia, até LIMITE_ITENS_LOTE itens) invalida o lote inteiro.
+    """
+    itens = http_request.body
+    if http_request.raw_body is not None:
+        try:
+            itens = from_json(http_request.raw_body)
+        except ValueError as e:
+            raise HttpBadRequestError(
+                message=f"JSON inválido: {e}", name="Bad Request"
+            ) from e
+    if not isinstance(itens, list) or not itens:
+        raise HttpBadRequestError(
+            message="O corpo deve ser uma lista não vazia", name="Bad Request"
+        )
+    if len(itens) > LIMITE_ITENS_LOTE:
+        raise HttpBadRequestError(
+            message=f"O lote aceita no máximo {LIMITE_ITENS_LOTE} itens",
+            name="Bad Request",
+        )
+
+    resultado: List[Union[PessoaJuridicaCriarSchema, HttpBadRequestError]] = []
+    for item in itens:
+        if not isinstance(item, dict):
+            resultado.append(
+                HttpBadRequestError(
+                    message="Cada item deve ser um objeto", name="Bad Request"
+                )
+            )
+            continue
+        try:
+            resultado.append(validar_pessoa_juridica(item))
+        except HttpBadRequestError as error:
+            resultado.append(error)
+    return resultado
@@ -3,7 +3,11 @@ from decimal import Decimal
 import pytest
 
 from src.errors.error_types.http_bad_request import HttpBadRequestError
-from src.validators.fisica_criar_validator import fisica_criar_validator
+from src.validators.fisica_criar_validator import (
+    LIMITE_ITENS_LOTE,
+    fisica_criar_lote_validator,
+    fisica_criar_validator,
+)
 from src.views.http_types.http_request import HttpRequest
 
 
@@ -22,13 +26,13 @@ def test_validator_sucesso():
 
     result = fisica_criar_validator(http_request)
 
-    assert result["nome_completo"] == "Dr. Shaun Murphy"
-    assert result["email"] == "shaun@gmail.com"
-    assert result["celular"] == "32903191239"
-    assert result["idade"] == 25
-    assert result["renda_mensal"] == Decimal("10000.00")
-    assert result["categoria"] == "Saúde"
-    assert result["saldo"] == Decimal("50000.00")
+    assert result.nome_completo == "Dr. Shaun Murphy"
+    assert result.email == "shaun@gmail.com"
+    assert result.celular == "32903191239"
+    assert result.idade == 25
+    assert result.renda_mensal == Decimal("10000.00")
+    assert result.categoria == "Saúde"
+    assert result.saldo == Decimal("50000.00")
 
 
 def test_validator_celular_sem_formatacao():
@@ -45,7 +49,7 @@ def test_validator_celular_sem_formatacao():
     )
 
     result = fisica_criar_validator(http_request)
-    assert result["celular"] == "32903191239"
+    assert result.celular == "32903191239"
 
 
 def test_validator_email_invalido():
@@ -67,6 +71,25 @@ def test_validator_email_invalido():
     assert "email" in str(exc_info.value).lower()
 
 
+def test_validator_saldo_com_fracao_de_centavo():
+    http_request = HttpRequest(
+        body={
+            "nome_completo": "Dr. Shaun Murphy",
+            "email": "shaun@gmail.com",
+            "celular": "32903191239",
+            "idade": 25,
+            "renda_mensal": "10000.00",
+            "categoria": "Saúde",
+            "saldo": "50000.005",
+        }
+    )
+
+    with pytest.raises(HttpBadRequestError) as exc_info:
+        fisica_criar_validator(http_request)
+
+    assert "saldo" in str(exc_info.value)
+
+
 def test_validator_idade_menor_18():
     http_request = HttpRequest(
         body={
@@ -256,3 +279,76 @@ def test_validator_categoria_vazia():
         fisica_criar_validator(http_request)
 
     assert "categoria" in str(exc_info.value).lower()
+
+
+def test_lote_validator_valida_todos_os_itens():
+    valido = {
+        "nome_completo": "Dr. Shaun Murphy",
+        "email": "shaun@gmail.com",
+        "celular": "(32) 9 0319-1239",
+        "idade": 25,
+        "renda_mensal": "10000.00",
+        "categoria": "Saúde",
+        "saldo": "50000.00",
+    }
+    http_request = HttpRequest(body=[valido, {**valido, "idade": 10}, "texto"])
+
+    resultado = fisica_criar_lote_validator(http_request)
+
+    assert resultado[0].celular == "32903191239"
+    assert isinstance(resultado[1], HttpBadRequestError)
+    assert "idade" in resultado[1].message
+    assert isinstance(resultado[2], HttpBadRequestError)
+    assert resultado[2].message == "Cada item deve ser um objeto"
+
+
+@pytest.mark.parametrize("body", [None, {}, [], {"nome_completo": "A"}])
+def test_lote_validator_corpo_invalido(body):
+    with pytest.raises(HttpBadRequestError, match="lista não vazia"):
+        fisica_criar_lote_validator(HttpRequest(body=body))
+
+
+def test_lote_validator_limite_de_itens():
+    with pytest.raises(HttpBadRequestError, match="no máximo"):
+        fisica_criar_lote_validator(HttpRequest(body=[{}] * (LIMITE_ITENS_LOTE + 1)))
+
+
+def test_validator_corpo_em_bytes():
+    http_request = HttpRequest(
+        raw_body=(
+            b'{"nome_completo": "Dr. Shaun Murphy", "email": "shaun@gmail.com",'
+            b' "celular": "(32) 9 0319-1239", "idade": 25, "renda_mensal": 10000.5,'
+            b' "categoria": "Sa\xc3\xbade", "saldo": "50000.00"}'
+        )
+    )
+
+    result = fisica_criar_validator(http_request)
+
+    assert result.celular == "32903191239"
+    assert result.categoria == "Saúde"
+    assert result.renda_mensal == Decimal("10000.50")
+    assert result.saldo == Decimal("50000.00")
+
+
+@pytest.mark.parametrize("raw_body", [b"", b"{", b"[1, 2]", b'"texto"'])
+def test_validator_corpo_em_bytes_invalido(raw_body):
+    with pytest.raises(HttpBadRequestError) as exc_info:
+        fisica_criar_validator(HttpRequest(raw_body=raw_body))
+
+    assert exc_info.value.message.startswith("body: ")
+
+
+def test_lote_validator_corpo_em_bytes():
+    http_request = HttpRequest(
+        raw_body=b'[{"nome_completo": "Dr. Shaun Murphy"}, 1]',
+    )
+
+    resultado = fisica_criar_lote_validator(http_request)
+
+    assert "email" in resultado[0].message
+    assert resultado[1].message == "Cada item deve ser um objeto"
+
+
+def test_lote_validator_json_invalido():
+    with pytest.raises(HttpBadRequestError, match="JSON inválido"):
+        fisica_criar_lote_validator(HttpRequest(raw_body=b"[{"))
@@ -22,13 +22,13 @@ def test_validator_sucesso():
 
     result = juridica_criar_validator(http_request)
 
-    assert result["nome_fantasia"] == "Hospital Geral Dr. Waldemar Alcântara"
-    assert result["email_corporativo"] == "hoswaldemaralcantara@gmail.com"
-    assert result["celular"] == "22912301232"
-    assert result["idade"] == 20
-    assert result["faturamento"] == Decimal("100000.00")
-    assert result["categoria"] == "Saúde"
-    assert result["saldo"] == Decimal("120000.00")
+    assert result.nome_fantasia == "Hospital Geral Dr. Waldemar Alcântara"
+    assert result.email_corporativo == "hoswaldemaralcantara@gmail.com"
+    assert result.celular == "22912301232"
+    assert result.idade == 20
+    assert result.faturamento == Decimal("100000.00")
+    assert result.categoria == "Saúde"
+    assert result.saldo == Decimal("120000.00")
 
 
 def test_validator_celular_sem_formatacao():
@@ -46,7 +46,7 @@ def test_validator_celular_sem_formatacao():
 
     result = juridica_criar_validator(http_request)
 
-    assert result["celular"] == "22912301232"
+    assert result.celular == "22912301232"
 
 
 def test_validator_idade_zero():
@@ -64,7 +64,7 @@ def test_validator_idade_zero():
 
     result = juridica_criar_validator(http_request)
 
-    assert result["idade"] == 0
+    assert result.idade == 0
 
 
 def test_validator_email_corporativo_invalido():
@@ -274,3 +274,23 @@ def test_validator_categoria_vazia():
         juridica_criar_validator(http_request)
 
     assert "categoria" in str(exc_info.value).lower()
+
+
+def test_validator_corpo_em_bytes():
+    http_request = HttpRequest(
+        raw_body=(
+            b'{"nome_fantasia": "Hospital Geral", "email_corporativo": "hg@gmail.com",'
+            b' "celular": "(22) 9 1230-1232", "idade": 20, "faturamento": 100000.00,'
+            b' "categoria": "Sa\xc3\xbade", "saldo": 120000.00}'
+        )
+    )
+
+    result = juridica_criar_validator(http_request)
+
+    assert result.celular == "22912301232"
+    assert result.faturamento == Decimal("100000.00")
+
+
+def test_validator_corpo_em_bytes_invalido():
+    with pytest.raises(HttpBadRequestError, match="^body: "):
+        juridica_criar_validator(HttpRequest(raw_body=b"{"))
@@ -0,0 +1,54 @@
+from src.errors.error_handler import handle_errors
+
+from .http_types.http_request import HttpRequest
+from .http_types.http_response import HttpResponse
+from .interfaces.async_view_interface import AsyncViewInterface
+from .paginacao import extrair_busca, extrair_paginacao
+
+# As views abaixo servem pessoa física e jurídica: recebem o controller
+# assíncrono do lado correspondente (PessoaFisicaConsultaAsyncController ou
+# PessoaJuridicaConsultaAsyncController), que têm os mesmos métodos.
+
+
+class ListarAsyncViews(AsyncViewInterface):
+    def __init__(self, controller) -> None:
+        self.__controller = controller
+
+    async def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            limite, apos_id = extrair_paginacao(http_request.param)
+            body_response = await self.__controller.listar(limite, apos_id)
+
+            return HttpResponse(status_code=200, body=body_response)
+
+        except Exception as error:
+            return handle_errors(error)
+
+
+class BuscarAsyncViews(AsyncViewInterface):
+    def __init__(self, controller) -> None:
+        self.__controller = controller
+
+    async def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            termo, limite, deslocamento = extrair_busca(http_request.param)
+            body_response = await self.__controller.buscar(termo, limite, deslocamento)
+
+            return HttpResponse(status_code=200, body=body_response)
+
+        except Exception as error:
+            return handle_errors(error)
+
+
+class RelatorioAsyncViews(AsyncViewInterface):
+    def __init__(self, controller) -> None:
+        self.__controller = controller
+
+    async def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            body_response = await self.__controller.relatorio_por_categoria()
+
+            return HttpResponse(status_code=200, body=body_response)
+
+        except Exception as error:
+            return handle_errors(error)
@@ -0,0 +1,24 @@
+from src.controllers.interfaces.fisica_buscar_controller import (
+    PessoaFisicaBuscarControllerInterface,
+)
+from src.errors.error_handler import handle_errors
+
+from .http_types.http_request import HttpRequest
+from .http_types.http_response import HttpResponse
+from .interfaces.view_interface import ViewInterface
+from .paginacao import extrair_busca
+
+
+class PessoaFisicaBuscarViews(ViewInterface):
+    def __init__(self, controller: PessoaFisicaBuscarControllerInterface) -> None:
+        self.__controller = controller
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            termo, limite, deslocamento = extrair_busca(http_request.param)
+            body_response = self.__controller.buscar(termo, limite, deslocamento)
+
+            return HttpResponse(status_code=200, body=body_response)
+
+        except Exception as error:
+            return handle_errors(error)
@@ -0,0 +1,26 @@
+from src.controllers.interfaces.fisica_criar_lote_controller import (
+    PessoaFisicaCriarLoteControllerInterface,
+)
+from src.errors.error_handler import handle_errors
+from src.validators.fisica_criar_validator import fisica_criar_lote_validator
+
+from .http_types.http_request import HttpRequest
+from .http_types.http_response import HttpResponse
+from .interfaces.view_interface import ViewInterface
+
+
+class PessoaFisicaCriarLoteView(ViewInterface):
+    def __init__(self, controller: PessoaFisicaCriarLoteControllerInterface) -> None:
+        self.__controller = controller
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        """201 se todos os itens foram criados, 207 se algum falhou."""
+        try:
+            itens = fisica_criar_lote_validator(http_request)
+            body_response = self.__controller.criar_lote(itens)
+            data = body_response["data"]
+            status_code = 201 if data["count"] == data["total"] else 207
+            return HttpResponse(status_code=status_code, body=body_response)
+
+        except Exception as error:
+            return handle_errors(error)
@@ -0,0 +1,22 @@
+from src.controllers.interfaces.fisica_relatorio_controller import (
+    PessoaFisicaRelatorioControllerInterface,
+)
+from src.errors.error_handler import handle_errors
+
+from .http_types.http_request import HttpRequest
+from .http_types.http_response import HttpResponse
+from .interfaces.view_interface import ViewInterface
+
+
+class PessoaFisicaRelatorioViews(ViewInterface):
+    def __init__(self, controller: PessoaFisicaRelatorioControllerInterface) -> None:
+        self.__controller = controller
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            body_response = self.__controller.relatorio_por_categoria()
+
+            return HttpResponse(status_code=200, body=body_response)
+
+        except Exception as error:
+            return handle_errors(error)
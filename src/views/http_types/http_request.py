@@ -2,6 +2,10 @@ from typing import Dict
 
 
 class HttpRequest:
-    def __init__(self, body: Dict = None, param: Dict = None) -> None:  # type: ignore
+    def __init__(
+        self, body: Dict = None, param: Dict = None, raw_body: bytes = None  # type: ignore
+    ) -> None:
         self.body = body
         self.param = param
+        # Corpo ainda em bytes: os validators fazem o parse e a validação juntos
+        self.raw_body = raw_body
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from src.views.http_types.http_request import HttpRequest
+from src.views.http_types.http_response import HttpResponse
+
+
+class AsyncViewInterface(ABC):
+
+    @abstractmethod
+    async def handle(self, http_request: HttpRequest) -> HttpResponse:
+        pass
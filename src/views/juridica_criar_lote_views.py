@@ -0,0 +1,26 @@
+from src.controllers.interfaces.juridica_criar_lote_controller import (
+    PessoaJuridicaCriarLoteControllerInterface,
+)
+from src.errors.error_handler import handle_errors
+from src.validators.juridica_criar_validator import juridica_criar_lote_validator
+
+from .http_types.http_request import HttpRequest
+from .http_types.http_response import HttpResponse
+from .interfaces.view_interface import ViewInterface
+
+
+class PessoaJuridicaCriarLoteView(ViewInterface):
+    def __init__(self, controller: PessoaJuridicaCriarLoteControllerInterface) -> None:
+        self.__controller = controller
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        """201 se todos os itens foram criados, 207 se algum falhou."""
+        try:
+            itens = juridica_criar_lote_validator(http_request)
+            body_response = self.__controller.criar_lote(itens)
+            data = body_response["data"]
+            status_code = 201 if data["count"] == data["total"] else 207
+            return HttpResponse(status_code=status_code, body=body_response)
+
+        except Exception as error:
+            return handle_errors(error)
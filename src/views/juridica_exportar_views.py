@@ -0,0 +1,26 @@
+from src.controllers.interfaces.juridica_exportar_controller import (
+    PessoaJuridicaExportarControllerInterface,
+)
+from src.errors.error_handler import handle_errors
+
+from .http_types.http_request import HttpRequest
+from .http_types.http_response import HttpResponse
+from .interfaces.view_interface import ViewInterface
+
+
+class PessoaJuridicaExportarViews(ViewInterface):
+    def __init__(self, controller: PessoaJuridicaExportarControllerInterface) -> None:
+        self.__controller = controller
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        O body da resposta é um gerador de dicts, consumido pela rota
+        enquanto a resposta é transmitida (uma linha NDJSON por registro).
+        """
+        try:
+            body_response = self.__controller.exportar()
+
+            return HttpResponse(status_code=200, body=body_response)  # type: ignore
+
+        except Exception as error:
+            return handle_errors(error)
@@ -6,6 +6,7 @@ from src.errors.error_handler import handle_errors
 from .http_types.http_request import HttpRequest
 from .http_types.http_response import HttpResponse
 from .interfaces.view_interface import ViewInterface
+from .paginacao import extrair_paginacao
 
 
 class PessoaJuridicaListaView(ViewInterface):
@@ -14,7 +15,8 @@ class PessoaJuridicaListaView(ViewInterface):
 
     def handle(self, http_request: HttpRequest) -> HttpResponse:
         try:
-            body_response = self.__controller.listar()
+            limite, apos_id = extrair_paginacao(http_request.param)
+            body_response = self.__controller.listar(limite, apos_id)
 
             return HttpResponse(status_code=200, body=body_response)  # type: ignore
 
@@ -0,0 +1,22 @@
+from src.controllers.interfaces.juridica_relatorio_controller import (
+    PessoaJuridicaRelatorioControllerInterface,
+)
+from src.errors.error_handler import handle_errors
+
+from .http_types.http_request import HttpRequest
+from .http_types.http_response import HttpResponse
+from .interfaces.view_interface import ViewInterface
+
+
+class PessoaJuridicaRelatorioViews(ViewInterface):
+    def __init__(self, controller: PessoaJuridicaRelatorioControllerInterface) -> None:
+        self.__controller = controller
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            body_response = self.__controller.relatorio_por_categoria()
+
+            return HttpResponse(status_code=200, body=body_response)
+
+        except Exception as error:
+            return handle_errors(error)
@@ -0,0 +1,74 @@
+from typing import Dict, Optional, Tuple
+
+from src.errors.error_types.http_bad_request import HttpBadRequestError
+
+LIMITE_PADRAO = 50
+LIMITE_MAXIMO = 500
+
+
+def extrair_paginacao(param: Optional[Dict]) -> Tuple[int, Optional[int]]:
+    """
+    Lê `limit` e `after_id` da query string.
+
+    Retorna (limite, apos_id). Sem `limit` usa LIMITE_PADRAO; sem `after_id`
+    começa do início da tabela.
+    """
+    param = param or {}
+
+    limite = _limite(param)
+
+    apos_id = _inteiro(param.get("after_id"), "after_id", None)
+    if apos_id is not None and apos_id < 0:
+        raise HttpBadRequestError(
+            message="'after_id' não pode ser negativo", name="Bad Request"
+        )
+
+    return limite, apos_id
+
+
+def extrair_busca(param: Optional[Dict]) -> Tuple[str, int, int]:
+    """
+    Lê `q`, `limit` e `cursor` da query string da busca por nome.
+
+    Retorna (termo, limite, deslocamento). O resultado é ordenado por
+    relevância, não por id, então o cursor é a posição do próximo resultado
+    (o `next_cursor` da página anterior) e não um id.
+    """
+    param = param or {}
+
+    termo = (param.get("q") or "").strip()
+    if not termo:
+        raise HttpBadRequestError(
+            message="Parâmetro 'q' é obrigatório", name="Bad Request"
+        )
+
+    limite = _limite(param)
+
+    deslocamento = _inteiro(param.get("cursor"), "cursor", 0)
+    if deslocamento < 0:
+        raise HttpBadRequestError(
+            message="'cursor' não pode ser negativo", name="Bad Request"
+        )
+
+    return termo, limite, deslocamento
+
+
+def _limite(param: Dict) -> int:
+    limite = _inteiro(param.get("limit"), "limit", LIMITE_PADRAO)
+    if not 1 <= limite <= LIMITE_MAXIMO:
+        raise HttpBadRequestError(
+            message=f"'limit' deve estar entre 1 e {LIMITE_MAXIMO}",
+            name="Bad Request",
+        )
+    return limite
+
+
+def _inteiro(valor, nome: str, padrao: Optional[int]) -> Optional[int]:
+    if valor is None or valor == "":
+        return padrao
+    try:
+        return int(valor)
+    except (TypeError, ValueError) as exception:
+        raise HttpBadRequestError(
+            message=f"'{nome}' deve ser um número inteiro", name="Bad Request"
+        ) from exception
@@ -0,0 +1,52 @@
+from typing import Dict
+
+from src.controllers.interfaces.fisica_buscar_controller import (
+    PessoaFisicaBuscarControllerInterface,
+)
+from src.views.fisica_buscar_views import PessoaFisicaBuscarViews
+from src.views.http_types.http_request import HttpRequest
+
+
+class MockPessoaFisicaBuscarController(PessoaFisicaBuscarControllerInterface):
+    def __init__(self):
+        self.chamadas = []
+
+    def buscar(self, termo: str, limite: int = 50, deslocamento: int = 0) -> Dict:
+        self.chamadas.append((termo, limite, deslocamento))
+        return {
+            "data": {
+                "type": "Pessoa Física",
+                "count": 0,
+                "attributes": [],
+                "next_cursor": None,
+            }
+        }
+
+
+def test_handle():
+    controller = MockPessoaFisicaBuscarController()
+    view = PessoaFisicaBuscarViews(controller)
+
+    response = view.handle(
+        HttpRequest(param={"q": " harvey ", "limit": "10", "cursor": "20"})
+    )
+
+    assert response.status_code == 200
+    assert controller.chamadas == [("harvey", 10, 20)]
+
+
+def test_handle_sem_termo():
+    view = PessoaFisicaBuscarViews(MockPessoaFisicaBuscarController())
+
+    response = view.handle(HttpRequest(param={"q": "  "}))
+
+    assert response.status_code == 400
+    assert "'q'" in response.body["errors"][0]["detail"]
+
+
+def test_handle_cursor_invalido():
+    view = PessoaFisicaBuscarViews(MockPessoaFisicaBuscarController())
+
+    response = view.handle(HttpRequest(param={"q": "harvey", "cursor": "-1"}))
+
+    assert response.status_code == 400
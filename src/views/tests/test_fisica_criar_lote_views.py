@@ -0,0 +1,56 @@
+from typing import Dict, List, Union
+
+from src.controllers.interfaces.fisica_criar_lote_controller import (
+    PessoaFisicaCriarLoteControllerInterface,
+)
+from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.validators.fisica_criar_validator import PessoaFisicaCriarSchema
+from src.views.fisica_criar_lote_views import PessoaFisicaCriarLoteView
+from src.views.http_types.http_request import HttpRequest
+
+PESSOA = {
+    "nome_completo": "Walter White",
+    "email": "walterwhite@gmail.com",
+    "celular": "(88) 9 1231-2123",
+    "idade": 50,
+    "renda_mensal": "4000000",
+    "categoria": "Quimico",
+    "saldo": "5000000",
+}
+
+
+class MockPessoaFisicaCriarLoteController(PessoaFisicaCriarLoteControllerInterface):
+    def criar_lote(
+        self, itens: List[Union[PessoaFisicaCriarSchema, HttpBadRequestError]]
+    ) -> Dict:
+        criados = sum(1 for item in itens if isinstance(item, PessoaFisicaCriarSchema))
+        return {"data": {"count": criados, "total": len(itens), "results": []}}
+
+
+def test_handle_todos_criados():
+    view = PessoaFisicaCriarLoteView(MockPessoaFisicaCriarLoteController())
+
+    response = view.handle(HttpRequest(body=[PESSOA, PESSOA]))
+
+    assert response.status_code == 201
+
+
+def test_handle_resultado_parcial():
+    view = PessoaFisicaCriarLoteView(MockPessoaFisicaCriarLoteController())
+
+    response = view.handle(HttpRequest(body=[PESSOA, {**PESSOA, "email": "x"}]))
+
+    assert response.status_code == 207
+
+
+def test_handle_corpo_invalido():
+    view = PessoaFisicaCriarLoteView(MockPessoaFisicaCriarLoteController())
+
+    response = view.handle(HttpRequest(body={"nome_completo": "Walter"}))
+
+    assert response.status_code == 400
+    assert response.body == {
+        "errors": [
+            {"title": "Bad Request", "detail": "O corpo deve ser uma lista não vazia"}
+        ]
+    }
@@ -5,16 +5,21 @@ from src.controllers.interfaces.fisica_criar_controller import (
     PessoaFisicaCriarControllerInterface,
 )
 from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.validators.fisica_criar_validator import PessoaFisicaCriarSchema
 from src.views.fisica_criar_views import PessoaFisicaCriarView
 from src.views.http_types.http_request import HttpRequest
 from src.views.http_types.http_response import HttpResponse
 
 
 class MockPessoaFisicaCriarController(PessoaFisicaCriarControllerInterface):
-    def criar(self, pessoa_data: Dict) -> Dict:
+    def criar(self, pessoa_data: PessoaFisicaCriarSchema) -> Dict:
         return {
             "success": True,
-            "data": {"type": "Pessoa Física", "count": 1, "attributes": pessoa_data},
+            "data": {
+                "type": "Pessoa Física",
+                "count": 1,
+                "attributes": pessoa_data.model_dump(),
+            },
         }
 
 
@@ -0,0 +1,40 @@
+from typing import Dict, Iterator
+
+from src.controllers.interfaces.fisica_exportar_controller import (
+    PessoaFisicaExportarControllerInterface,
+)
+from src.views.fisica_exportar_views import PessoaFisicaExportarViews
+from src.views.http_types.http_request import HttpRequest
+from src.views.http_types.http_response import HttpResponse
+
+
+class MockPessoaFisicaExportarController(PessoaFisicaExportarControllerInterface):
+    def exportar(self) -> Iterator[Dict]:
+        yield {"id": 1, "nome_completo": "Jesse Pinkman"}
+        yield {"id": 2, "nome_completo": "Walter White"}
+
+
+class MockPessoaFisicaExportarControllerError(PessoaFisicaExportarControllerInterface):
+    def exportar(self) -> Iterator[Dict]:
+        raise RuntimeError("banco indisponível")
+
+
+def test_handle():
+    view = PessoaFisicaExportarViews(MockPessoaFisicaExportarController())
+
+    response = view.handle(HttpRequest())
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == 200
+    assert [registro["id"] for registro in response.body] == [1, 2]
+
+
+def test_handle_error():
+    view = PessoaFisicaExportarViews(MockPessoaFisicaExportarControllerError())
+
+    response = view.handle(HttpRequest())
+
+    assert response.status_code == 500
+    assert response.body == {
+        "errors": [{"title": "Server Error", "detail": "banco indisponível"}]
+    }
@@ -1,5 +1,7 @@
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional
+
+import pytest
 
 from src.controllers.interfaces.fisica_listar_controller import (
     PessoaFisicaListarControllerInterface,
@@ -11,7 +13,7 @@ from src.views.http_types.http_response import HttpResponse
 
 
 class MockPessoaFisicaListarController(PessoaFisicaListarControllerInterface):
-    def listar(self) -> Dict:
+    def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
         return {
             "data": {
                 "type": "Pessoa Física",
@@ -41,7 +43,7 @@ class MockPessoaFisicaListarController(PessoaFisicaListarControllerInterface):
 
 
 class MockPessoaFisicaListaControllerError(PessoaFisicaListarControllerInterface):
-    def listar(self) -> Dict:
+    def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
         raise HttpNotFoundError(
             message="Erro nenhuma pessoa física cadastrada", name="Not Found"
         )
@@ -74,3 +76,32 @@ def test_handle_empty_list():
             {"title": "Not Found", "detail": "Erro nenhuma pessoa física cadastrada"}
         ]
     }
+
+
+def test_handle_repassa_paginacao():
+    class MockControllerPaginacao(MockPessoaFisicaListarController):
+        recebido = None
+
+        def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
+            MockControllerPaginacao.recebido = (limite, apos_id)
+            return super().listar(limite, apos_id)
+
+    view = PessoaFisicaListarViews(MockControllerPaginacao())
+
+    response = view.handle(HttpRequest(param={"limit": "2", "after_id": "7"}))
+
+    assert response.status_code == 200
+    assert MockControllerPaginacao.recebido == (2, 7)
+
+
+@pytest.mark.parametrize(
+    "param",
+    [{"limit": "abc"}, {"limit": "0"}, {"limit": "501"}, {"after_id": "-1"}],
+)
+def test_handle_paginacao_invalida(param):
+    view = PessoaFisicaListarViews(MockPessoaFisicaListarController())
+
+    response = view.handle(HttpRequest(param=param))
+
+    assert response.status_code == 400
+    assert response.body["errors"][0]["title"] == "Bad Request"
@@ -0,0 +1,38 @@
+from typing import Dict
+
+from src.controllers.interfaces.fisica_relatorio_controller import (
+    PessoaFisicaRelatorioControllerInterface,
+)
+from src.views.fisica_relatorio_views import PessoaFisicaRelatorioViews
+from src.views.http_types.http_request import HttpRequest
+
+
+class MockPessoaFisicaRelatorioController(PessoaFisicaRelatorioControllerInterface):
+    def relatorio_por_categoria(self) -> Dict:
+        return {
+            "data": {"type": "Relatório Pessoa Física", "count": 0, "attributes": []}
+        }
+
+
+class MockPessoaFisicaRelatorioControllerError(
+    PessoaFisicaRelatorioControllerInterface
+):
+    def relatorio_por_categoria(self) -> Dict:
+        raise RuntimeError("banco indisponível")
+
+
+def test_handle():
+    view = PessoaFisicaRelatorioViews(MockPessoaFisicaRelatorioController())
+
+    response = view.handle(HttpRequest())
+
+    assert response.status_code == 200
+    assert response.body["data"]["type"] == "Relatório Pessoa Física"
+
+
+def test_handle_error():
+    view = PessoaFisicaRelatorioViews(MockPessoaFisicaRelatorioControllerError())
+
+    response = view.handle(HttpRequest())
+
+    assert response.status_code == 500
@@ -5,16 +5,21 @@ from src.controllers.interfaces.juridica_criar_controller import (
     PessoaJuridicaCriarControllerInterface,
 )
 from src.errors.error_types.http_bad_request import HttpBadRequestError
+from src.validators.juridica_criar_validator import PessoaJuridicaCriarSchema
 from src.views.http_types.http_request import HttpRequest
 from src.views.http_types.http_response import HttpResponse
 from src.views.juridica_criar_views import PessoaJuridicaCriarViews
 
 
 class MockPessoaJuridicaCriarController(PessoaJuridicaCriarControllerInterface):
-    def criar(self, pessoa_data: Dict) -> Dict:
+    def criar(self, pessoa_data: PessoaJuridicaCriarSchema) -> Dict:
         return {
             "success": True,
-            "data": {"type": "Pessoa Jurídica", "count": 1, "attributes": pessoa_data},
+            "data": {
+                "type": "Pessoa Jurídica",
+                "count": 1,
+                "attributes": pessoa_data.model_dump(),
+            },
         }
 
 
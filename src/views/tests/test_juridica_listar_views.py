@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional
 
 from src.controllers.interfaces.juridica_listar_controller import (
     PessoaJuridicaListarControllerInterface,
@@ -11,7 +11,7 @@ from src.views.juridica_listar_views import PessoaJuridicaListaView
 
 
 class MockPessoaJuridicaListarController(PessoaJuridicaListarControllerInterface):
-    def listar(self) -> Dict:
+    def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
         return {
             "data": {
                 "type": "Pessoa Jurídica",
@@ -41,7 +41,7 @@ class MockPessoaJuridicaListarController(PessoaJuridicaListarControllerInterface
 
 
 class MockPessoaJuridicaListarControllerError(PessoaJuridicaListarControllerInterface):
-    def listar(self) -> Dict:
+    def listar(self, limite: int = 50, apos_id: Optional[int] = None) -> Dict:
         raise HttpNotFoundError(
             message="Erro nenhuma pessoa jurídica cadastrada", name="Not Found"
         )
@@ -74,3 +74,16 @@ def test_handle_empty_list():
             {"title": "Not Found", "detail": "Erro nenhuma pessoa jurídica cadastrada"}
         ]
     }
+
+
+def test_handle_paginacao_invalida():
+    view = PessoaJuridicaListaView(MockPessoaJuridicaListarController())
+
+    response = view.handle(HttpRequest(param={"after_id": "x"}))
+
+    assert response.status_code == 400
+    assert response.body == {
+        "errors": [
+            {"title": "Bad Request", "detail": "'after_id' deve ser um número inteiro"}
+        ]
+    }